@@ -1,8 +1,7 @@
 """
-Privacy blueprint — /privacy/data-summary, /privacy/export, /privacy/delete-all.
+Privacy blueprint — /privacy/data-summary, /privacy/export, /privacy/import, /privacy/delete-all.
 """
 
-import json
 import logging
 from datetime import datetime, timezone
 from flask import Blueprint, Response, request, jsonify, stream_with_context
@@ -94,110 +93,83 @@ def data_summary():
 @privacy_bp.route('/privacy/export', methods=['GET'])
 @require_session
 def export_data():
-    """Export all user data as a streaming JSON download."""
-
-    user_data_tables = [
-        "episodes", "semantic_concepts", "semantic_relationships",
-        "user_traits", "threads", "autobiography",
-        "scheduled_items", "persistent_tasks", "lists", "list_items",
-        "list_events", "identity_vectors", "identity_events",
-        "place_fingerprints", "cognitive_reflexes", "curiosity_threads",
-        "interaction_log", "cortex_iterations", "routing_decisions",
-        "procedural_memory", "topics", "user_tool_preferences",
-        "documents", "document_chunks", "watched_folders",
-    ]
+    """
+    Export all user data as a streaming, compressed NDJSON download.
+
+    Query params:
+        compression: gzip (default), zstd (falls back to gzip without zstandard), none
+        resume: token from the last checkpoint record of an interrupted export
+    """
+    from services.export_service import (
+        ExportError, ExportService, FILE_SUFFIXES, MIMETYPES, USER_DATA_TABLES,
+        parse_resume_token, resolve_compression,
+    )
 
     store_patterns = [
         "working_memory:*", "gist:*", "fact:*",
         "identity_state:*", "spark_state:*", "focus_session:*",
     ]
 
-    MAX_EXPORT_ROWS = 10000
-    FETCH_BATCH = 500  # Rows fetched per iteration — keeps memory bounded
+    try:
+        compression = resolve_compression(request.args.get("compression"))
+        resume = request.args.get("resume") or None
+        if resume:
+            parse_resume_token(resume)   # reject a bad token before the stream starts
+    except ExportError as e:
+        return jsonify({"error": str(e)}), 400
 
     def generate():
         from services.database_service import get_shared_db_service
         from services.memory_client import MemoryClientService
 
-        db = get_shared_db_service()
-        store = MemoryClientService.create_connection()
+        exporter = ExportService(get_shared_db_service())
+        yield from exporter.stream(
+            list(USER_DATA_TABLES),
+            compression=compression,
+            resume=resume,
+            memory_store=MemoryClientService.create_connection(),
+            store_patterns=store_patterns,
+        )
 
-        exported_at = datetime.now(timezone.utc).isoformat()
-        yield f'{{"exported_at": {json.dumps(exported_at)}, "tables": {{'
+    response = Response(
+        stream_with_context(generate()),
+        mimetype=MIMETYPES[compression],
+    )
+    response.headers["Content-Disposition"] = (
+        f"attachment; filename=chalie-export.ndjson{FILE_SUFFIXES[compression]}"
+    )
+    return response
 
-        first_table = True
-        for table in user_data_tables:
-            if not first_table:
-                yield ','
-            first_table = False
 
-            yield json.dumps(table) + ': '
-            try:
-                with db.connection() as conn:
-                    cursor = conn.cursor()
-                    cursor.execute(f"SELECT COUNT(*) FROM {table}")
-                    total_count = cursor.fetchone()[0]
-                    cursor.execute(f"SELECT * FROM {table} LIMIT {MAX_EXPORT_ROWS}")
-                    columns = [desc[0] for desc in cursor.description]
-
-                    yield (
-                        f'{{"count": {total_count}, '
-                        f'"columns": {json.dumps(columns)}, '
-                        f'"rows": ['
-                    )
-
-                    first_row = True
-                    exported = 0
-                    while True:
-                        batch = cursor.fetchmany(FETCH_BATCH)
-                        if not batch:
-                            break
-                        for row in batch:
-                            if not first_row:
-                                yield ','
-                            first_row = False
-                            yield json.dumps(_serialize_row(dict(zip(columns, row))))
-                            exported += 1
-
-                    suffix = ']'
-                    if total_count > MAX_EXPORT_ROWS:
-                        suffix += f', "truncated": true, "exported_rows": {exported}'
-                    yield suffix + '}'
-                    cursor.close()
+@privacy_bp.route('/privacy/import', methods=['POST'])
+@require_session
+def import_data():
+    """Bulk-restore an /privacy/export stream (gzip, zstd or plain NDJSON request body).
 
-            except Exception:
-                yield '{"count": 0, "error": "table not found or empty"}'
+    Only user-data tables are restored, and only into tables that are still
+    empty; refused tables and unwritten embeddings are listed in the response.
+    """
+    from services.export_service import ExportError, import_ndjson
 
-        # ── MemoryStore keys — single-pass export via export_matching ──
-        # export_matching() scans each keyspace once and applies all patterns
-        # simultaneously, returning {key: {type, value}} in O(n) time.
-        # This replaces the previous O(n×m×5) pattern of keys() + type() per key.
-        yield '}, "memory_store": '
-        try:
-            import re as _re
-            all_entries = store.export_matching(store_patterns)
-
-            # Group results by pattern for the same JSON shape as before
-            compiled = [(p, _re.compile(p.replace("*", ".*").replace("?", "."))) for p in store_patterns]
-            by_pattern = {p: {} for p in store_patterns}
-            for key, entry in all_entries.items():
-                for pattern, rx in compiled:
-                    if rx.fullmatch(key):
-                        by_pattern[pattern][key] = entry["value"]
-                        break
-
-            yield json.dumps(by_pattern)
-        except Exception:
-            yield '{}'
+    try:
+        from services.database_service import get_shared_db_service
+        result = import_ndjson(get_shared_db_service(), request.stream)
+    except ExportError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        logger.error(f"[REST API] privacy/import error: {e}", exc_info=True)
+        return jsonify({"error": "Failed to import data"}), 500
 
-        yield '}'
+    # Resident in-process indexes were built from the pre-import tables
+    try:
+        from services.concept_index import get_concept_index
+        from services.topic_classifier_service import get_topic_cache
+        get_concept_index().invalidate()
+        get_topic_cache().invalidate()
+    except Exception as e:
+        logger.warning(f"[REST API] Failed to invalidate memory indexes: {e}")
 
-    response = Response(
-        stream_with_context(generate()),
-        mimetype='application/json',
-    )
-    response.headers["Content-Disposition"] = "attachment; filename=chalie-export.json"
-    return response
+    return jsonify(result), 200
 
 
 @privacy_bp.route('/privacy/delete-all', methods=['DELETE'])
@@ -222,6 +194,7 @@ def delete_all():
             # Threads
             "thread:*", "active_thread:*",
             "thread_conv:*", "thread_conv_index:*",
+            "thread_conv_signals:*", "thread_conv_pos:*", "thread_conv_dirty",
 
             # Identity & context
             "identity_state:*",
@@ -279,13 +252,29 @@ def delete_all():
             if keys:
                 store.delete(*keys)
 
+        # Persisted MemoryStore keys: rewrite the snapshot and truncate the
+        # journal now, so deleted working memory doesn't stay on disk until
+        # the next periodic snapshot
+        try:
+            from services.memory_store_persistence import get_persistence
+            persistence = get_persistence()
+            if persistence is not None:
+                persistence.snapshot()
+        except Exception as e:
+            logger.warning(f"[REST API] Failed to snapshot MemoryStore after delete: {e}")
+
         # Delete all user data from SQLite tables.
         # PRAGMA foreign_keys=OFF lets us delete in any order without FK constraint
         # errors — re-enabled immediately after. interaction_log is cleared here;
         # the audit entry below is written into the freshly-emptied table.
+        # Write-behind rows and access counts still queued for these tables
+        # are dropped, and new ones held back, until the truncate commits —
+        # otherwise a later flush would re-insert deleted interactions.
+        from services.access_tracker import suspend_access_tracking
+        from services.write_behind_queue import suspend_write_behind
         db = get_shared_db_service()
         truncate_failures = []
-        with db.connection() as conn:
+        with suspend_write_behind(db), suspend_access_tracking(db), db.connection() as conn:
             cursor = conn.cursor()
             cursor.execute("PRAGMA foreign_keys=OFF")
             for table in [
@@ -332,6 +321,15 @@ def delete_all():
             cursor.execute("PRAGMA foreign_keys=ON")
             cursor.close()
 
+        # Drop resident in-process indexes built from the truncated tables
+        try:
+            from services.concept_index import get_concept_index
+            from services.topic_classifier_service import get_topic_cache
+            get_concept_index().invalidate()
+            get_topic_cache().invalidate()
+        except Exception as e:
+            logger.warning(f"[REST API] Failed to invalidate memory indexes: {e}")
+
         # Audit trail — log the deletion event AFTER truncation so it persists
         try:
             from services.interaction_log_service import InteractionLogService
@@ -1,5 +1,5 @@
 """
-System blueprint — /health, /metrics, /system/status, /system/observability/* endpoints.
+System blueprint — /health, /metrics, /metrics/latency, /system/status, /system/observability/* endpoints.
 """
 
 import logging
@@ -97,14 +97,36 @@ def metrics_endpoint():
     """Metrics dashboard endpoint."""
     try:
         from services.metrics_service import MetricsService
+        from services.database_service import get_database_stats, get_statement_cache_stats
+        from services.write_behind_queue import get_write_behind_stats
+        from services.access_tracker import get_access_tracking_stats
         metrics = MetricsService()
         data = metrics.get_dashboard_data()
+        data['statement_cache'] = get_statement_cache_stats()
+        data['database'] = get_database_stats()
+        data['write_behind'] = get_write_behind_stats()
+        data['access_tracking'] = get_access_tracking_stats()
         return jsonify(data), 200
     except Exception as e:
         logger.error(f"[REST API] Metrics error: {e}")
         return jsonify({"error": "Failed to retrieve metrics"}), 500
 
 
+@system_bp.route('/metrics/latency', methods=['GET'])
+@require_session
+def metrics_latency():
+    """Per-operation latency percentiles (p50/p95/p99) since process start."""
+    try:
+        from services.metrics_service import MetricsService
+        return jsonify({
+            'generated_at': datetime.now(timezone.utc).isoformat(),
+            'operations': MetricsService().get_latency_summary(),
+        }), 200
+    except Exception as e:
+        logger.error(f"[REST API] Metrics latency error: {e}")
+        return jsonify({"error": "Failed to retrieve latency metrics"}), 500
+
+
 @system_bp.route('/system/status', methods=['GET'])
 @require_session
 def system_status():
@@ -601,6 +623,21 @@ def observability_self_model():
         return jsonify({"error": "Failed to retrieve self-model"}), 500
 
 
+@system_bp.route('/system/observability/jobs', methods=['GET'])
+@require_session
+def observability_jobs():
+    """Background job scheduler: per-job run counts, wall and CPU time."""
+    try:
+        from services.job_scheduler_service import get_job_scheduler
+        return jsonify({
+            'generated_at': datetime.now(timezone.utc).isoformat(),
+            'jobs': get_job_scheduler().get_stats(),
+        }), 200
+    except Exception as e:
+        logger.error(f"[REST API] observability/jobs error: {e}")
+        return jsonify({"error": "Failed to retrieve job stats"}), 500
+
+
 @system_bp.route('/system/observability/capability-gaps', methods=['GET'])
 @require_session
 def observability_capability_gaps():
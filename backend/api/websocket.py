@@ -7,6 +7,7 @@ Protocol:
   → Client sends:  {"type": "act_steer", "text": "..."}
   → Client sends:  {"type": "resume", "last_seq": N}
   ← Server sends:  {"type": "status", "stage": "...", "seq": N}
+  ← Server sends:  {"type": "delta", "text": "...", "offset": N, "index": N, "stream_id": "...", "seq": N}
   ← Server sends:  {"type": "message", "text": "...", "actions?": [...], ..., "seq": N}
   ← Server sends:  {"type": "act_narration", "text": "...", "step": N, "seq": N}
   ← Server sends:  {"type": "card", "html": "...", ..., "seq": N}
@@ -42,8 +43,22 @@ def _next_seq():
 
 
 def _buffer_event(event: dict):
-    """Store event in catch-up buffer for reconnect replay."""
+    """Store event in catch-up buffer for reconnect replay.
+
+    Deltas of one streamed response are merged into a single entry (text from
+    the earliest buffered offset, seq of the latest delta) so a long generation
+    can't evict everything else, while a reconnecting client still receives
+    the partial response it missed.
+    """
     with _catchup_lock:
+        if event.get('type') == 'delta':
+            stream_id = event.get('stream_id')
+            for i in range(len(_catchup_buffer) - 1, -1, -1):
+                prev = _catchup_buffer[i]
+                if prev.get('type') == 'delta' and prev.get('stream_id') == stream_id:
+                    del _catchup_buffer[i]
+                    event = dict(event, text=prev['text'] + event['text'], offset=prev['offset'])
+                    break
         _catchup_buffer.append(event)
 
 
@@ -367,6 +382,19 @@ def _handle_chat(ws, store, msg, active_request=None):
                     _buffer_event(done_evt)
                     _send_json(ws, done_evt)
                     break
+                if parsed.get('type') == 'delta':
+                    seq = _next_seq()
+                    delta_evt = {
+                        "type": "delta",
+                        "text": parsed.get("text", ""),
+                        "offset": parsed.get("offset", 0),
+                        "index": parsed.get("index", 0),
+                        "stream_id": request_id,
+                        "seq": seq,
+                    }
+                    _buffer_event(delta_evt)
+                    _send_json(ws, delta_evt)
+                    continue  # Partial response — keep listening for the final output
                 if parsed.get('type') == 'close':
                     seq = _next_seq()
                     done_evt = {"type": "done", "duration_ms": int((time.time() - start_time) * 1000), "seq": seq}
@@ -279,20 +279,21 @@ if __name__ == "__main__":
     from services import PromptQueue, DatabaseService, SchemaService
     from workers import digest_worker, memory_chunker_worker, episodic_memory_worker, semantic_consolidation_worker, rest_api_worker, tool_worker
     from services.config_service import ConfigService
-    from services.idle_consolidation_service import idle_consolidation_process
-    from services.decay_engine_service import decay_engine_worker
-    from services.growth_pattern_service import growth_pattern_worker
-    from services.topic_stability_regulator_service import topic_stability_regulator_worker
+    from services.idle_consolidation_service import register_idle_consolidation_job
+    from services.decay_engine_service import register_decay_engine_job
+    from services.growth_pattern_service import register_growth_pattern_job
+    from services.topic_stability_regulator_service import register_topic_stability_regulator_job
     from services.cognitive_drift_engine import cognitive_drift_worker
-    from services.routing_stability_regulator_service import routing_stability_regulator_worker
-    from services.routing_reflection_service import routing_reflection_worker
-    from services.experience_assimilation_service import experience_assimilation_worker
-    from services.thread_expiry_service import thread_expiry_worker
-    from services.scheduler_service import scheduler_worker
-    from services.autobiography_service import autobiography_synthesis_worker
-    from services.curiosity_pursuit_service import curiosity_pursuit_worker
+    from services.routing_stability_regulator_service import register_routing_stability_regulator_job
+    from services.routing_reflection_service import register_routing_reflection_job
+    from services.experience_assimilation_service import register_experience_assimilation_job
+    from services.thread_expiry_service import register_thread_expiry_job
+    from services.scheduler_service import register_scheduler_job
+    from services.autobiography_service import register_autobiography_synthesis_job
+    from services.curiosity_pursuit_service import register_curiosity_pursuit_job
+    from services.job_scheduler_service import get_job_scheduler, job_scheduler_worker
     from workers.persistent_task_worker import persistent_task_worker, run_immediate_task
-    from workers.document_worker import process_document_job, document_purge_worker
+    from workers.document_worker import process_document_job, register_document_purge_job
 
     # Ensure encryption key
     from services.encryption_key_service import get_encryption_key
@@ -347,25 +348,29 @@ if __name__ == "__main__":
     manager = WorkerManager()
 
     # Register service workers (all run as daemon threads)
-    manager.register_service("idle-consolidation-service", idle_consolidation_process)
-    manager.register_service("decay-engine-service", decay_engine_worker)
-    manager.register_service("growth-pattern-service", growth_pattern_worker)
-    manager.register_service("topic-stability-regulator-service", topic_stability_regulator_worker)
     manager.register_service("cognitive-drift-engine", cognitive_drift_worker)
-    manager.register_service("routing-stability-regulator-service", routing_stability_regulator_worker)
-    manager.register_service("routing-reflection-service", routing_reflection_worker)
     manager.register_service("rest-api-worker-1", rest_api_worker)
-    manager.register_service("experience-assimilation-service", experience_assimilation_worker)
-    manager.register_service("thread-expiry-service", thread_expiry_worker)
-    manager.register_service("scheduler-service", scheduler_worker)
-    manager.register_service("autobiography-synthesis-service", autobiography_synthesis_worker)
-    manager.register_service("curiosity-pursuit-service", curiosity_pursuit_worker)
     manager.register_service("persistent-task-worker", persistent_task_worker)
-    manager.register_service("document-purge-service", document_purge_worker)
 
-    # Moment enrichment service
-    from services.moment_enrichment_service import moment_enrichment_worker
-    manager.register_service("moment-enrichment-service", moment_enrichment_worker)
+    # Periodic background jobs share one timer-wheel scheduler
+    scheduler = get_job_scheduler()
+    register_idle_consolidation_job(scheduler)
+    register_decay_engine_job(scheduler)
+    register_growth_pattern_job(scheduler)
+    register_topic_stability_regulator_job(scheduler)
+    register_routing_stability_regulator_job(scheduler)
+    register_routing_reflection_job(scheduler)
+    register_experience_assimilation_job(scheduler)
+    register_thread_expiry_job(scheduler)
+    register_scheduler_job(scheduler)
+    register_autobiography_synthesis_job(scheduler)
+    register_curiosity_pursuit_job(scheduler)
+    register_document_purge_job(scheduler)
+
+    # Moment enrichment job
+    from services.moment_enrichment_service import register_moment_enrichment_job
+    register_moment_enrichment_job(scheduler)
+    manager.register_service("job-scheduler-service", job_scheduler_worker)
 
     # Background LLM worker
     from workers.background_llm_worker import background_llm_worker
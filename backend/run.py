@@ -19,31 +19,38 @@ import os
 import sys
 import logging
 
+# Ensure backend/ is on the Python path
+_backend_dir = os.path.dirname(os.path.abspath(__file__))
+if _backend_dir not in sys.path:
+    sys.path.insert(0, _backend_dir)
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
 # Force numpy to fully initialize before any background thread imports it.
 # Python's import system isn't fully thread-safe for nested imports — concurrent
 # first-imports of numpy from multiple threads cause a circular import in
 # numpy._typing (NDArray not yet available from the partially-initialized module),
 # which poisons sys.modules and makes every subsequent embedding call fail with
 # "maximum recursion depth exceeded".
+# The other heavy imports must complete in the main thread for the same reason.
+# Only the configured embedding backend's stack is loaded (the onnx backend
+# never imports torch); if the backend can't be resolved, torch is preloaded.
+_preload_modules = ('torch', 'transformers')
 try:
-    import numpy  # noqa: F401
-    import torch  # noqa: F401
-    import transformers  # noqa: F401
-    # These heavy imports must complete in the main thread before any background
-    # thread tries to import them. Python's import system isn't fully thread-safe
-    # for complex nested imports — concurrent first-imports from multiple threads
-    # cause circular import errors in numpy._typing that poison sys.modules.
+    from services.config_service import ConfigService as _ConfigService
+    from services.embedding_service import backend_modules as _backend_modules
+    _preload_modules = _backend_modules(_ConfigService.get_agent_config_view("semantic-memory"))
 except Exception as _e:
-    import sys as _sys
-    print(f"[BOOT] CRITICAL: import failed: {_e}", file=_sys.stderr, flush=True)
+    logger.warning(f"[BOOT] Embedding backend lookup failed, preloading torch: {_e}")
 
-# Ensure backend/ is on the Python path
-_backend_dir = os.path.dirname(os.path.abspath(__file__))
-if _backend_dir not in sys.path:
-    sys.path.insert(0, _backend_dir)
-
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
+try:
+    import importlib
+    import numpy  # noqa: F401
+    for _module in _preload_modules:
+        importlib.import_module(_module)
+except Exception as _e:
+    logger.critical(f"[BOOT] CRITICAL: import failed: {_e}")
 
 
 # ─── Default Tool Auto-Install ───────────────────────────────────────────────
@@ -210,6 +217,10 @@ def main():
         config["models_dir"] = args.models_dir
     runtime_config.set(config)
 
+    # Restore persisted MemoryStore keys before any worker touches the store
+    from services.memory_store_persistence import enable_persistence
+    enable_persistence()
+
     # Ensure encryption key
     from services.encryption_key_service import get_encryption_key
     get_encryption_key()
@@ -220,11 +231,11 @@ def main():
     def _preload_embedding_model():
         try:
             logger.info("[System] Preloading embedding model (background)...")
-            from services.embedding_service import get_embedding_service, _get_st_model
+            from services.embedding_service import get_embedding_service, _get_model
             svc = get_embedding_service()
-            _get_st_model(svc.model_name)
-            # Warm the inference path — first encode() triggers PyTorch graph
-            # compilation. Throwaway call here so the user never hits that delay.
+            _get_model(svc.model_name, svc.backend)
+            # Warm the inference path — first encode() triggers graph compilation
+            # (PyTorch or ONNX Runtime). Throwaway call so the user never hits that delay.
             svc.generate_embedding("warmup")
             logger.info("[System] Embedding model ready (inference warm)")
         except Exception as e:
@@ -282,6 +293,15 @@ def main():
     logger.info("Checking for pending database migrations...")
     database_service.run_pending_migrations()
 
+    # Group-commit append-only audit writes (interaction_log, routing_decisions, ...)
+    # on one writer thread; needs the schema in place, flushes again at exit.
+    from services.write_behind_queue import enable_write_behind
+    enable_write_behind(database_service)
+
+    # Retrieval only records episode/concept hits; a flusher applies them in batches
+    from services.access_tracker import enable_access_tracking
+    enable_access_tracking(database_service)
+
     # Initialize API key
     try:
         from services.settings_service import SettingsService
@@ -295,52 +315,42 @@ def main():
     from consumer import WorkerManager, ToolScannerThread
 
     # Import worker functions
-    from services.idle_consolidation_service import idle_consolidation_process
-    from services.decay_engine_service import decay_engine_worker
-    from services.growth_pattern_service import growth_pattern_worker
-    from services.topic_stability_regulator_service import topic_stability_regulator_worker
     from services.cognitive_drift_engine import cognitive_drift_worker
-    from services.routing_stability_regulator_service import routing_stability_regulator_worker
-    from services.routing_reflection_service import routing_reflection_worker
-    from services.experience_assimilation_service import experience_assimilation_worker
-    from services.thread_expiry_service import thread_expiry_worker
     from services.episodic_memory_observer import episodic_memory_observer_worker
-    from services.scheduler_service import scheduler_worker
-    from services.autobiography_service import autobiography_synthesis_worker
-    from services.curiosity_pursuit_service import curiosity_pursuit_worker
     from workers.persistent_task_worker import persistent_task_worker
-    from workers.document_worker import document_purge_worker
+    from services.job_scheduler_service import get_job_scheduler, job_scheduler_worker
 
     # Initialize worker manager
     manager = WorkerManager()
 
     # Register service workers
-    manager.register_service("idle-consolidation-service", idle_consolidation_process)
-    manager.register_service("decay-engine-service", decay_engine_worker)
-    manager.register_service("growth-pattern-service", growth_pattern_worker)
-    manager.register_service("topic-stability-regulator-service", topic_stability_regulator_worker)
     manager.register_service("cognitive-drift-engine", cognitive_drift_worker)
-    manager.register_service("routing-stability-regulator-service", routing_stability_regulator_worker)
-    manager.register_service("routing-reflection-service", routing_reflection_worker)
-    manager.register_service("experience-assimilation-service", experience_assimilation_worker)
-    manager.register_service("thread-expiry-service", thread_expiry_worker)
     manager.register_service("episodic-memory-observer", episodic_memory_observer_worker)
-    manager.register_service("scheduler-service", scheduler_worker)
-    manager.register_service("autobiography-synthesis-service", autobiography_synthesis_worker)
-    manager.register_service("curiosity-pursuit-service", curiosity_pursuit_worker)
     manager.register_service("persistent-task-worker", persistent_task_worker)
-    manager.register_service("document-purge-service", document_purge_worker)
-
-    from workers.folder_watcher_worker import folder_watcher_worker
-    manager.register_service("folder-watcher-service", folder_watcher_worker)
 
-    # Moment enrichment service
-    from services.moment_enrichment_service import moment_enrichment_worker
-    manager.register_service("moment-enrichment-service", moment_enrichment_worker)
-
-    # Self-model service (interoception — epistemic, operational, capability awareness)
-    from services.self_model_service import self_model_worker
-    manager.register_service("self-model-service", self_model_worker)
+    # Periodic background jobs share one timer-wheel scheduler and worker pool
+    scheduler = get_job_scheduler()
+    for module_path, func_name in (
+        ("services.idle_consolidation_service", "register_idle_consolidation_job"),
+        ("services.decay_engine_service", "register_decay_engine_job"),
+        ("services.growth_pattern_service", "register_growth_pattern_job"),
+        ("services.topic_stability_regulator_service", "register_topic_stability_regulator_job"),
+        ("services.routing_stability_regulator_service", "register_routing_stability_regulator_job"),
+        ("services.routing_reflection_service", "register_routing_reflection_job"),
+        ("services.experience_assimilation_service", "register_experience_assimilation_job"),
+        ("services.thread_expiry_service", "register_thread_expiry_job"),
+        ("services.scheduler_service", "register_scheduler_job"),
+        ("services.autobiography_service", "register_autobiography_synthesis_job"),
+        ("services.curiosity_pursuit_service", "register_curiosity_pursuit_job"),
+        ("workers.document_worker", "register_document_purge_job"),
+        ("workers.folder_watcher_worker", "register_folder_watcher_job"),
+        ("services.moment_enrichment_service", "register_moment_enrichment_job"),
+        # Self-model (interoception — epistemic, operational, capability awareness)
+        ("services.self_model_service", "register_self_model_job"),
+        ("services.memory_store_persistence", "register_memory_snapshot_job"),
+    ):
+        _try_register_job(scheduler, module_path, func_name)
+    manager.register_service("job-scheduler-service", job_scheduler_worker)
 
     # Background LLM worker
     from workers.background_llm_worker import background_llm_worker
@@ -409,6 +419,16 @@ def main():
     manager.run()
 
 
+def _try_register_job(scheduler, module_path, func_name):
+    """Try to import and register a scheduler job, logging failure gracefully."""
+    try:
+        import importlib
+        mod = importlib.import_module(module_path)
+        getattr(mod, func_name)(scheduler)
+    except Exception as e:
+        logger.warning(f"[Startup] {func_name} failed: {e}")
+
+
 def _try_register(manager, name, module_path, func_name):
     """Try to import and register a service, logging failure gracefully."""
     try:
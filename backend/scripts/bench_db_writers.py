@@ -0,0 +1,95 @@
+"""
+Benchmark — concurrent writers: thread-local connections vs. the serialized writer.
+
+THREADS worker threads each commit WRITES small INSERTs against one database:
+
+  thread-local — `with db.connection() as conn: conn.execute(...)` (every
+                 thread has its own connection and fights for the SQLite
+                 writer lock through busy_timeout sleeps)
+  writer       — db.execute(...) (jobs queued to the one writer connection)
+
+Reports total throughput, per-write latency p50/p99/max and failed writes
+(`database is locked` after busy_timeout), plus the open connection count.
+
+Usage:
+    cd backend && python scripts/bench_db_writers.py
+    cd backend && python scripts/bench_db_writers.py --threads 32 --writes 200
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from services.database_service import DatabaseService, get_database_stats
+
+INSERT = "INSERT INTO events (thread, n, payload) VALUES (?, ?, ?)"
+
+
+def run(name, db, threads, writes, write_fn):
+    latencies = []
+    failures = []
+    lock = threading.Lock()
+    start_gate = threading.Barrier(threads + 1)
+
+    def worker(tid):
+        local = []
+        errors = 0
+        start_gate.wait()
+        for n in range(writes):
+            t0 = time.perf_counter()
+            try:
+                write_fn(db, (tid, n, "x" * 200))
+            except Exception:
+                errors += 1
+            local.append((time.perf_counter() - t0) * 1000)
+        with lock:
+            latencies.extend(local)
+            failures.append(errors)
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for t in workers:
+        t.start()
+    start_gate.wait()
+    t0 = time.perf_counter()
+    for t in workers:
+        t.join()
+    wall = time.perf_counter() - t0
+
+    latencies.sort()
+    print(f"{name:12s} {len(latencies) / wall:8.0f} writes/s  p50={statistics.median(latencies):6.2f}ms  "
+          f"p99={latencies[int(len(latencies) * 0.99) - 1]:8.2f}ms  max={latencies[-1]:8.2f}ms  "
+          f"failed={sum(failures)}  open thread connections={get_database_stats()['thread_connections']}")
+
+
+def thread_local_write(db, params):
+    with db.connection() as conn:
+        conn.execute(INSERT, params)
+
+
+def writer_write(db, params):
+    db.execute(INSERT, params)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    parser.add_argument('--threads', type=int, default=16)
+    parser.add_argument('--writes', type=int, default=300)
+    args = parser.parse_args()
+
+    for name, fn in (('thread-local', thread_local_write), ('writer', writer_write)):
+        with tempfile.TemporaryDirectory() as tmp:
+            db = DatabaseService(os.path.join(tmp, 'bench.db'))
+            with db.connection() as conn:
+                conn.execute("CREATE TABLE events (id INTEGER PRIMARY KEY, thread INTEGER, n INTEGER, payload TEXT)")
+            run(name, db, args.threads, args.writes, fn)
+            db.close_pool()
+
+
+if __name__ == '__main__':
+    main()
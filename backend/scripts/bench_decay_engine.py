@@ -0,0 +1,229 @@
+"""
+Benchmark — episodic decay: per-row Python loop vs. chunked set-based UPDATE.
+
+Builds a throwaway SQLite database of synthetic episodes (mixed ages,
+durability tags and reliability labels, ~5% soft-deleted), copies it once per
+variant, then decays it with:
+
+  legacy     — fetch every eligible row, math.exp() in Python, one
+               UPDATE ... WHERE id = ? per row, all in one transaction
+  set-based  — DecayEngineService._decay_in_chunks with _EPISODIC_DECAY_SQL
+               (registered exp()/multiplier functions, one UPDATE per rowid chunk)
+
+Writer-lock hold is reported two ways:
+
+  txn hold   — duration of each write transaction the variant commits
+  probe      — a thread committing a one-row write on its own connection every
+               few ms; its wait is what any other writer (the chat path) sees.
+               SQLite's busy handler backs off up to 100ms between retries, so
+               the probe can also miss short gaps between chunks.
+
+Usage:
+    cd backend && python scripts/bench_decay_engine.py
+    cd backend && python scripts/bench_decay_engine.py --episodes 100000 --chunk 2000
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import shutil
+import sqlite3
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from services.database_service import DatabaseService
+from services.decay_engine_service import (
+    RELIABILITY_DECAY_MULTIPLIER, _EPISODIC_DECAY_SQL, DecayEngineService,
+)
+
+RATE = 0.05
+LEGACY_SELECT = """
+    SELECT id, activation_score,
+           (CAST(strftime('%s', 'now') AS REAL) - CAST(strftime('%s', COALESCE(last_accessed_at, created_at)) AS REAL)) / 3600.0 AS hours_since,
+           json_extract(salience_factors, '$.source') AS sf_source,
+           json_extract(salience_factors, '$.durability') AS sf_durability,
+           COALESCE(reliability, 'reliable') AS reliability
+    FROM episodes
+    WHERE deleted_at IS NULL
+      AND activation_score > 0.1
+      AND COALESCE(last_accessed_at, created_at) < datetime('now', '-1 hour')
+"""
+
+
+def build(path, n, seed=7):
+    rng = random.Random(seed)
+    factors = [
+        (0.85, {}),
+        (0.05, {'source': 'tool_reflection', 'durability': 'transient'}),
+        (0.05, {'source': 'tool_reflection', 'durability': 'evolving'}),
+        (0.05, {'durability': 'cron_tool'}),
+    ]
+    factor_json = [json.dumps(f) for _, f in factors]
+    factor_weights = [w for w, _ in factors]
+    reliabilities = ['reliable', 'uncertain', 'contradicted', 'superseded', None]
+
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("""
+        CREATE TABLE episodes (
+            id TEXT PRIMARY KEY, created_at TEXT, last_accessed_at TEXT, deleted_at TEXT,
+            activation_score REAL DEFAULT 1.0, salience_factors TEXT DEFAULT '{}',
+            reliability TEXT DEFAULT 'reliable'
+        )
+    """)
+    conn.execute("CREATE INDEX idx_episodes_activation ON episodes(activation_score DESC) WHERE deleted_at IS NULL")
+    conn.execute("CREATE TABLE probe (id INTEGER PRIMARY KEY, at REAL)")
+    for start in range(0, n, 50000):
+        rows = []
+        for i in range(start, min(n, start + 50000)):
+            hours = rng.uniform(0.0, 720.0)
+            rows.append((
+                f"ep-{i}",
+                f"-{hours:.3f} hours",
+                '2026-01-01' if rng.random() < 0.05 else None,
+                rng.uniform(0.1, 1.0),
+                rng.choices(factor_json, weights=factor_weights)[0],
+                rng.choices(reliabilities, weights=[80, 8, 5, 2, 5])[0],
+            ))
+        conn.executemany(
+            "INSERT INTO episodes (id, created_at, deleted_at, activation_score, salience_factors, reliability) "
+            "VALUES (?, datetime('now', ?), ?, ?, ?, ?)",
+            rows,
+        )
+        conn.commit()
+    conn.close()
+
+
+def legacy_decay(db):
+    """The pre-set-based loop, verbatim in behaviour."""
+    with db.connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(LEGACY_SELECT)
+        updated = 0
+        for episode_id, activation, hours, source, durability, reliability in cursor.fetchall():
+            rate = RATE
+            if source == 'tool_reflection':
+                if durability == 'transient':
+                    rate = RATE * 2.0
+                elif durability == 'evolving':
+                    rate = RATE * 1.5
+            if durability == 'cron_tool':
+                rate = RATE * 3.0
+            rate *= RELIABILITY_DECAY_MULTIPLIER.get(reliability, 1.0)
+            new_activation = max(0.1, activation * math.exp(-rate * hours))
+            if abs(new_activation - activation) > 0.0001:
+                cursor.execute("UPDATE episodes SET activation_score = ? WHERE id = ?", (new_activation, episode_id))
+                updated += 1
+        return updated
+
+
+def set_based_decay(db, chunk):
+    engine = DecayEngineService()
+    engine.episodic_decay_rate = RATE
+    engine.decay_chunk_rows = chunk
+    return engine._decay_in_chunks(db, 'episodes', _EPISODIC_DECAY_SQL, {'rate': RATE})
+
+
+class TimedDatabaseService(DatabaseService):
+    """Records how long each connection() block / write() job (one transaction) takes."""
+
+    def __init__(self, db_path):
+        super().__init__(db_path)
+        self.holds = []
+
+    @contextmanager
+    def connection(self):
+        start = time.perf_counter()
+        with super().connection() as conn:
+            yield conn
+        self.holds.append((time.perf_counter() - start) * 1000)
+
+    def write(self, fn, label=None, timeout=None):
+        def timed(conn):
+            start = time.perf_counter()
+            try:
+                return fn(conn)
+            finally:
+                self.holds.append((time.perf_counter() - start) * 1000)
+        return super().write(timed, label, timeout)
+
+
+class WriterProbe(threading.Thread):
+    """Commits a tiny write every interval and records how long each one waited."""
+
+    def __init__(self, path, interval=0.005):
+        super().__init__(daemon=True)
+        self.path = path
+        self.interval = interval
+        self.latencies = []
+        self.stop = threading.Event()
+
+    def run(self):
+        conn = sqlite3.connect(self.path, timeout=600, isolation_level=None)
+        while not self.stop.is_set():
+            start = time.perf_counter()
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("INSERT INTO probe (at) VALUES (?)", (start,))
+            conn.execute("COMMIT")
+            self.latencies.append((time.perf_counter() - start) * 1000)
+            time.sleep(self.interval)
+        conn.close()
+
+
+def run_variant(name, path, fn):
+    db = TimedDatabaseService(path)
+    probe = WriterProbe(path)
+    probe.start()
+    time.sleep(0.05)
+    start = time.perf_counter()
+    updated = fn(db)
+    wall = time.perf_counter() - start
+    probe.stop.set()
+    probe.join()
+    db.close_pool()
+
+    latencies = sorted(probe.latencies)
+    p99 = latencies[int(len(latencies) * 0.99) - 1] if len(latencies) >= 100 else latencies[-1]
+    print(f"{name:10s} wall={wall:7.2f}s  updated={updated:8d}  "
+          f"txns={len(db.holds):4d}  max txn hold={max(db.holds):8.1f}ms  "
+          f"probe p50={statistics.median(latencies):6.1f}ms  p99={p99:8.1f}ms  max={latencies[-1]:8.1f}ms")
+    with sqlite3.connect(path) as conn:
+        return conn.execute("SELECT id, activation_score FROM episodes ORDER BY rowid").fetchall()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    parser.add_argument('--episodes', type=int, default=1_000_000)
+    parser.add_argument('--chunk', type=int, default=5000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        base = os.path.join(tmp, 'base.db')
+        t0 = time.perf_counter()
+        build(base, args.episodes)
+        print(f"Built {args.episodes} episodes in {time.perf_counter() - t0:.1f}s")
+
+        results = {}
+        for name, fn in (('legacy', legacy_decay),
+                         ('set-based', lambda db: set_based_decay(db, args.chunk))):
+            path = os.path.join(tmp, f'{name}.db')
+            shutil.copy(base, path)
+            results[name] = run_variant(name, path, fn)
+
+        # The variants run seconds apart, so hours_since drifts a little and rows
+        # right at the 1-hour eligibility edge can differ — report the bulk too.
+        diffs = sorted(abs(a[1] - b[1]) for a, b in zip(results['legacy'], results['set-based']))
+        print(f"|legacy - set-based| activation: p99={diffs[int(len(diffs) * 0.99) - 1]:.2e}  "
+              f"max={diffs[-1]:.2e}  rows > 1e-3: {sum(d > 1e-3 for d in diffs)}")
+
+
+if __name__ == '__main__':
+    main()
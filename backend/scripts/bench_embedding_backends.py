@@ -0,0 +1,127 @@
+"""
+Benchmark — embedding backends (torch vs. onnx fp32 vs. onnx int8).
+
+Each backend runs in its own subprocess so RSS and load time aren't polluted
+by the others (importing torch alone costs hundreds of MB). Reports:
+
+  load     — import + model load time, and RSS after load
+  latency  — single-text encode p50/p95 (what a cache miss on the hot path costs)
+  batch    — texts/sec encoding BATCH texts at a time (what the micro-batcher runs)
+  parity   — min/mean cosine of each onnx variant against torch on the same corpus
+
+Run scripts/export_embedding_onnx.py first.
+
+Usage:
+    cd backend && python scripts/bench_embedding_backends.py
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+BACKENDS = {
+    'torch': {'type': 'torch'},
+    'onnx-fp32': {'type': 'onnx', 'quantized': False},
+    'onnx-int8': {'type': 'onnx', 'quantized': True},
+}
+BATCH = 32
+WORDS = ("memory topic user remembers the trip dentist coffee report revenue "
+         "reminder tomorrow weekend project deadline garden music friend").split()
+
+
+def corpus(n: int, seed: int = 7):
+    rng = random.Random(seed)
+    return [" ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 60))) for _ in range(n)]
+
+
+def worker(name: str, model_name: str, out_path: str, texts: int) -> None:
+    import numpy as np
+    import psutil
+
+    process = psutil.Process()
+    rss_before = process.memory_info().rss
+
+    start = time.perf_counter()
+    import services.embedding_service as embedding_module
+    backend = BACKENDS[name]
+    if backend['type'] == 'onnx':
+        model = embedding_module._get_onnx_model(model_name, backend['quantized'])
+        if model is None:
+            sys.exit(f"{name}: ONNX export not found — run scripts/export_embedding_onnx.py")
+    else:
+        model = embedding_module._get_st_model(model_name)
+    model.encode(["warmup"], normalize_embeddings=True)
+    load_s = time.perf_counter() - start
+    rss_loaded = process.memory_info().rss
+
+    sample = corpus(texts)
+    latencies = []
+    for text in sample[:200]:
+        t0 = time.perf_counter()
+        model.encode([text], normalize_embeddings=True)
+        latencies.append((time.perf_counter() - t0) * 1000)
+
+    t0 = time.perf_counter()
+    embeddings = model.encode(sample, normalize_embeddings=True, batch_size=BATCH)
+    throughput = len(sample) / (time.perf_counter() - t0)
+
+    np.save(out_path, np.asarray(embeddings, dtype=np.float32))
+    print(json.dumps({
+        'load_s': load_s,
+        'rss_mb': rss_loaded / 1048576,
+        'rss_delta_mb': (rss_loaded - rss_before) / 1048576,
+        'p50_ms': statistics.median(latencies),
+        'p95_ms': statistics.quantiles(latencies, n=20)[-1],
+        'texts_per_s': throughput,
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    parser.add_argument('--model', default='all-mpnet-base-v2')
+    parser.add_argument('--texts', type=int, default=1000)
+    parser.add_argument('--worker', choices=sorted(BACKENDS), help=argparse.SUPPRESS)
+    parser.add_argument('--out', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        worker(args.worker, args.model, args.out, args.texts)
+        return
+
+    import numpy as np
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in BACKENDS:
+            out = os.path.join(tmp, f"{name}.npy")
+            proc = subprocess.run(
+                [sys.executable, __file__, '--worker', name, '--out', out,
+                 '--model', args.model, '--texts', str(args.texts)],
+                capture_output=True, text=True,
+            )
+            if proc.returncode != 0:
+                print(f"{name:10s} skipped: {(proc.stderr or proc.stdout or 'failed').strip().splitlines()[-1]}")
+                continue
+            results[name] = json.loads(proc.stdout.strip().splitlines()[-1])
+            results[name]['embeddings'] = np.load(out)
+
+    for name, r in results.items():
+        line = (f"{name:10s} load={r['load_s']:6.1f}s  rss={r['rss_mb']:7.0f}MB "
+                f"(+{r['rss_delta_mb']:.0f})  p50={r['p50_ms']:6.1f}ms  p95={r['p95_ms']:6.1f}ms  "
+                f"batch={r['texts_per_s']:7.1f} texts/s")
+        if name != 'torch' and 'torch' in results:
+            cosines = (results['torch']['embeddings'] * r['embeddings']).sum(axis=1)
+            line += f"  cosine min={cosines.min():.4f} mean={cosines.mean():.4f}"
+        print(line)
+
+
+if __name__ == '__main__':
+    main()
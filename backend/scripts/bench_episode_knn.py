@@ -0,0 +1,132 @@
+"""
+Benchmark — topic-scoped episode KNN: filtered search vs. post-filtered top-k.
+
+Builds a throwaway SQLite database per size with synthetic episodes spread
+over topics (a few large, many small, ~5% soft-deleted), then compares:
+
+  legacy   — `episodes_vec MATCH ? AND k = ?` with topic/deleted_at applied
+             afterwards (the pre-filtering-aware query)
+  filtered — EpisodicRetrievalService._vector_search
+
+Reports recall@k against exact brute-force neighbours and mean/p95 latency.
+Needs sqlite-vec and numpy; 1M rows takes a few GB of disk and several minutes.
+
+Usage:
+    cd backend && python scripts/bench_episode_knn.py --sizes 10000 100000 1000000
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from services.database_service import DatabaseService, DictCursor
+from services.episodic_retrieval_service import EpisodicRetrievalService
+
+LEGACY_QUERY = """
+    SELECT e.id, v.distance AS vector_distance
+    FROM episodes e
+    JOIN episodes_vec v ON v.rowid = e.rowid
+    WHERE v.embedding MATCH ? AND k = ?
+      AND e.deleted_at IS NULL AND e.topic = ?
+    ORDER BY v.distance
+"""
+
+
+def _topic_sizes(n):
+    """A few big topics and a long tail of small ones."""
+    big = [f"big-{i}" for i in range(4)]
+    tail = [f"topic-{i}" for i in range(max(1, n // 200))]
+    weights = [0.1] * len(big) + [0.6 / len(tail)] * len(tail)
+    return big + tail, weights
+
+
+def build(db, n, dims, rng):
+    topics, weights = _topic_sizes(n)
+    vectors = rng.standard_normal((n, dims), dtype=np.float32)
+    assigned = random.choices(topics, weights=weights, k=n)
+    deleted = rng.random(n) < 0.05
+
+    with db.connection() as conn:
+        conn.execute("""
+            CREATE TABLE episodes (
+                id TEXT PRIMARY KEY, intent TEXT, context TEXT, action TEXT, emotion TEXT,
+                outcome TEXT, gist TEXT, salience REAL, freshness REAL, topic TEXT,
+                created_at TEXT, activation_score REAL, last_accessed_at TEXT,
+                salience_factors TEXT, open_loops TEXT, reliability TEXT, deleted_at TEXT
+            )
+        """)
+        conn.execute("CREATE INDEX idx_episodes_topic ON episodes(topic) WHERE deleted_at IS NULL")
+        conn.execute(f"CREATE VIRTUAL TABLE episodes_vec USING vec0(embedding float[{dims}])")
+        for start in range(0, n, 10000):
+            end = min(n, start + 10000)
+            conn.executemany(
+                "INSERT INTO episodes (rowid, id, topic, deleted_at) VALUES (?, ?, ?, ?)",
+                [(i + 1, f"ep-{i}", assigned[i], '2026-01-01' if deleted[i] else None)
+                 for i in range(start, end)],
+            )
+            conn.executemany(
+                "INSERT INTO episodes_vec (rowid, embedding) VALUES (?, ?)",
+                [(i + 1, vectors[i].tobytes()) for i in range(start, end)],
+            )
+    return vectors, np.array(assigned), deleted, topics
+
+
+def run(n, dims, queries, k):
+    rng = np.random.default_rng(7)
+    random.seed(7)
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DatabaseService(os.path.join(tmp, "bench.db"))
+        vectors, topics_arr, deleted, topics = build(db, n, dims, rng)
+        svc = EpisodicRetrievalService(db, config={'embedding_dimensions': dims})
+
+        stats = {'legacy': ([], []), 'filtered': ([], [])}
+        with db.connection() as conn:
+            cursor = DictCursor(conn.cursor())
+            for _ in range(queries):
+                topic = random.choice(topics)
+                query = rng.standard_normal(dims, dtype=np.float32)
+                mask = (topics_arr == topic) & ~deleted
+                candidates = np.nonzero(mask)[0]
+                dist = np.linalg.norm(vectors[candidates] - query, axis=1)
+                truth = {f"ep-{i}" for i in candidates[np.argsort(dist)[:k]]}
+                if not truth:
+                    continue
+
+                start = time.perf_counter()
+                cursor.execute(LEGACY_QUERY, [query.tobytes(), k, topic])
+                legacy = {row['id'] for row in cursor.fetchall()}
+                stats['legacy'][0].append((time.perf_counter() - start) * 1000)
+                stats['legacy'][1].append(len(legacy & truth) / len(truth))
+
+                start = time.perf_counter()
+                filtered = {row['id'] for row in svc._vector_search(cursor, query.tobytes(), topic, k)}
+                stats['filtered'][0].append((time.perf_counter() - start) * 1000)
+                stats['filtered'][1].append(len(filtered & truth) / len(truth))
+        db.close_pool()
+
+    for name, (latencies, recalls) in stats.items():
+        print(f"{n:>9,} {name:>9}  recall@{k}={np.mean(recalls):.3f}  "
+              f"mean={np.mean(latencies):7.2f}ms  p95={np.percentile(latencies, 95):7.2f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000])
+    parser.add_argument('--dims', type=int, default=256)
+    parser.add_argument('--queries', type=int, default=50)
+    parser.add_argument('-k', type=int, default=20)
+    args = parser.parse_args()
+
+    for n in args.sizes:
+        run(n, args.dims, args.queries, args.k)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,165 @@
+"""
+Benchmark — streaming NDJSON export and bulk import on a large database.
+
+Builds a throwaway SQLite database of synthetic episodes (text columns of
+mixed length plus a 768-float embedding per row in episodes_vec, ~5 KB/row)
+until it reaches --size-mb, then measures:
+
+  export   — ExportService.stream() for each compression, consumed as fast
+             as possible; throughput is database MB/s and rows/s, plus the
+             output size and the longest single page read (= the longest a
+             read transaction is held open)
+  import   — import_ndjson() of the gzip export into an empty copy of the
+             schema; rows/s and the longest writer transaction
+
+episodes_vec is a plain BLOB table here (sqlite-vec may not be installed);
+the export reads it with the same rowid point lookups it uses for vec0.
+
+Usage:
+    cd backend && python scripts/bench_export.py
+    cd backend && python scripts/bench_export.py --size-mb 200 --page 2000
+"""
+
+import argparse
+import io
+import os
+import random
+import struct
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from services.database_service import DatabaseService
+from services.export_service import ExportService, import_ndjson, zstandard
+
+SCHEMA = [
+    """CREATE TABLE episodes (
+        id TEXT PRIMARY KEY, intent TEXT, context TEXT, action TEXT, emotion TEXT,
+        outcome TEXT, gist TEXT, salience REAL, activation_score REAL,
+        created_at TEXT DEFAULT CURRENT_TIMESTAMP, deleted_at TEXT
+    )""",
+    "CREATE TABLE episodes_vec (embedding BLOB)",
+]
+WORDS = ("memory user prefers morning coffee project deadline meeting travel "
+         "reminder weekend garden recipe budget family music reading").split()
+
+
+def build(path, size_mb, seed=11):
+    rng = random.Random(seed)
+    db = DatabaseService(path)
+    with db.connection() as conn:
+        for sql in SCHEMA:
+            conn.execute(sql)
+
+    def text(lo, hi):
+        return " ".join(rng.choices(WORDS, k=rng.randint(lo, hi)))
+
+    rows = 0
+    target = size_mb * 1024 * 1024
+    while os.path.getsize(path) < target:
+        batch = []
+        vectors = []
+        for _ in range(5000):
+            rows += 1
+            batch.append((
+                f"ep-{rows}", text(5, 30), text(50, 200), text(10, 60), text(2, 8),
+                text(10, 60), text(5, 20), rng.uniform(1, 10), rng.uniform(0.1, 2.0),
+            ))
+            vectors.append((rows, struct.pack('768f', *(rng.random() for _ in range(768)))))
+        with db.connection() as conn:
+            conn.executemany(
+                "INSERT INTO episodes (id, intent, context, action, emotion, outcome, gist, salience, activation_score) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", batch,
+            )
+            conn.executemany("INSERT INTO episodes_vec (rowid, embedding) VALUES (?, ?)", vectors)
+    with db.connection() as conn:
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    db.close_pool()
+    return rows
+
+
+class TimedExportService(ExportService):
+    """Records how long each page read (one read transaction) takes."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.page_ms = []
+
+    def _read_page(self, *args):
+        start = time.perf_counter()
+        try:
+            return super()._read_page(*args)
+        finally:
+            self.page_ms.append((time.perf_counter() - start) * 1000)
+
+
+class TimedDatabaseService(DatabaseService):
+    """Records how long each write() job (one writer transaction) takes."""
+
+    def __init__(self, db_path):
+        super().__init__(db_path)
+        self.holds = []
+
+    def write(self, fn, label=None, timeout=None):
+        def timed(conn):
+            start = time.perf_counter()
+            try:
+                return fn(conn)
+            finally:
+                self.holds.append((time.perf_counter() - start) * 1000)
+        return super().write(timed, label, timeout)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    parser.add_argument('--size-mb', type=int, default=1024)
+    parser.add_argument('--page', type=int, default=1000)
+    parser.add_argument('--batch', type=int, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, 'source.db')
+        t0 = time.perf_counter()
+        rows = build(source, args.size_mb)
+        db_mb = os.path.getsize(source) / 1024 / 1024
+        print(f"Built {rows} episodes ({db_mb:.0f} MB) in {time.perf_counter() - t0:.1f}s")
+
+        db = DatabaseService(source)
+        gzip_payload = None
+        compressions = ['none', 'gzip'] + (['zstd'] if zstandard is not None else [])
+        for compression in compressions:
+            exporter = TimedExportService(db, page_rows=args.page)
+            out = io.BytesIO() if compression == 'gzip' else None
+            size = 0
+            start = time.perf_counter()
+            for chunk in exporter.stream(['episodes'], compression=compression):
+                size += len(chunk)
+                if out is not None:
+                    out.write(chunk)
+            wall = time.perf_counter() - start
+            if out is not None:
+                gzip_payload = out.getvalue()
+            print(f"export {compression:5s} wall={wall:6.1f}s  {db_mb / wall:6.1f} MB/s  {rows / wall:8.0f} rows/s  "
+                  f"out={size / 1024 / 1024:7.0f} MB  pages={len(exporter.page_ms)}  "
+                  f"max page read={max(exporter.page_ms):6.1f}ms")
+        if zstandard is None:
+            print("export zstd  skipped (zstandard not installed)")
+        db.close_pool()
+
+        target = TimedDatabaseService(os.path.join(tmp, 'target.db'))
+        with target.connection() as conn:
+            for sql in SCHEMA:
+                conn.execute(sql)
+        start = time.perf_counter()
+        result = import_ndjson(target, io.BytesIO(gzip_payload), batch_rows=args.batch)
+        wall = time.perf_counter() - start
+        print(f"import gzip  wall={wall:6.1f}s  {db_mb / wall:6.1f} MB/s  {result['rows'] / wall:8.0f} rows/s  "
+              f"embeddings={result['embeddings']}  txns={len(target.holds)}  "
+              f"max txn hold={max(target.holds):6.1f}ms")
+        target.close_pool()
+
+
+if __name__ == '__main__':
+    main()
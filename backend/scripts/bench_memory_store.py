@@ -0,0 +1,69 @@
+"""
+Micro-benchmark — MemoryStore list operations.
+
+  handoff  — one producer rpush()es timestamps, one consumer brpop()s them;
+             reports the push→pop latency (what BackgroundLLMProxy waits on)
+  queue    — lpush/brpop and rpush/lpop throughput on a list holding 100k items
+
+Usage:
+    cd backend && python scripts/bench_memory_store.py
+"""
+
+import os
+import statistics
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from services.memory_store import MemoryStore
+
+
+def bench_handoff(store, rounds=200):
+    latencies = []
+    ready = threading.Event()
+
+    def consumer():
+        ready.set()
+        for _ in range(rounds):
+            _, sent = store.brpop('bench:handoff', timeout=5)
+            latencies.append((time.perf_counter() - float(sent)) * 1000)
+
+    thread = threading.Thread(target=consumer)
+    thread.start()
+    ready.wait()
+    for _ in range(rounds):
+        time.sleep(0.002)  # let the consumer block before each push
+        store.rpush('bench:handoff', repr(time.perf_counter()))
+    thread.join()
+
+    latencies.sort()
+    print(f"handoff   mean={statistics.mean(latencies):7.3f}ms  "
+          f"p50={latencies[len(latencies) // 2]:7.3f}ms  "
+          f"p99={latencies[int(len(latencies) * 0.99)]:7.3f}ms")
+
+
+def bench_queue(store, depth=100000, ops=50000):
+    for i in range(depth):
+        store.rpush('bench:queue', i)
+
+    start = time.perf_counter()
+    for i in range(ops):
+        store.lpush('bench:queue', i)
+        store.brpop('bench:queue', 1)
+    elapsed = time.perf_counter() - start
+    print(f"lpush+brpop {2 * ops / elapsed:12,.0f} ops/s  (depth {depth:,})")
+
+    start = time.perf_counter()
+    for i in range(ops):
+        store.rpush('bench:queue', i)
+        store.lpop('bench:queue')
+    elapsed = time.perf_counter() - start
+    print(f"rpush+lpop  {2 * ops / elapsed:12,.0f} ops/s  (depth {depth:,})")
+
+
+if __name__ == '__main__':
+    store = MemoryStore()
+    bench_handoff(store)
+    bench_queue(store)
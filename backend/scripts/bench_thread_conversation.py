@@ -0,0 +1,53 @@
+"""
+Micro-benchmark — ThreadConversationService exchange updates vs. thread length.
+
+  add_memory_chunk — update an exchange by id (what the memory chunker does
+                     twice per exchange); should stay flat as the thread grows
+  add_response     — update the latest exchange
+
+MAX_EXCHANGES is raised per run so the thread really holds that many exchanges.
+
+Usage:
+    cd backend && python scripts/bench_thread_conversation.py
+"""
+
+import os
+import random
+import sys
+import time
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from services.memory_store import MemoryStore
+from services.thread_conversation_service import ThreadConversationService
+
+CHUNK = {'gists': [{'content': 'g', 'type': 'fact'}], 'facts': [{'key': 'k'}]}
+
+
+def bench(length: int, updates: int = 2000):
+    store = MemoryStore()
+    with patch('services.thread_conversation_service.MemoryClientService.create_connection',
+               return_value=store):
+        service = ThreadConversationService()
+    service.MAX_EXCHANGES = length
+
+    ids = [service.add_exchange('bench', 'topic', {'message': f'm{i}'}) for i in range(length)]
+    targets = [random.choice(ids) for _ in range(updates)]
+
+    start = time.perf_counter()
+    for eid in targets:
+        service.add_memory_chunk('bench', eid, CHUNK)
+    chunk_us = (time.perf_counter() - start) / updates * 1e6
+
+    start = time.perf_counter()
+    for _ in range(updates):
+        service.add_response('bench', 'reply', 0.1)
+    response_us = (time.perf_counter() - start) / updates * 1e6
+
+    print(f"exchanges={length:6,}  add_memory_chunk={chunk_us:8.1f}us  add_response={response_us:8.1f}us")
+
+
+if __name__ == '__main__':
+    for length in (50, 500, 5000):
+        bench(length)
@@ -0,0 +1,140 @@
+"""
+Export the sentence embedding model to ONNX for the onnx embedding backend.
+
+Writes into <models_dir>/<model_name>/:
+  model.onnx            — fp32 transformer graph (token embeddings out)
+  model_quantized.onnx  — int8 dynamically quantized copy (unless --no-quantize)
+  tokenizer files       — so the backend loads the tokenizer without network
+  embedding_meta.json   — base_model, max_seq_length, dimensions
+
+Pooling and normalization stay in Python (OnnxEmbeddingModel), exactly as
+sentence-transformers does it, so the graph is just the transformer.
+
+After exporting, both graphs are checked against the torch model: every
+embedding must have cosine >= --min-cosine with its torch counterpart, or the
+script exits non-zero.
+
+Needs the torch stack plus the `onnx` package (for quantization):
+    pip install onnx
+
+Usage:
+    cd backend && python scripts/export_embedding_onnx.py
+    cd backend && python scripts/export_embedding_onnx.py --model all-mpnet-base-v2 --min-cosine 0.98
+"""
+
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from services.embedding_service import (
+    EMBEDDING_META_FILE, ONNX_MODEL_FILE, ONNX_QUANTIZED_FILE, _load_onnx_model,
+)
+from services.onnx_inference_service import resolve_models_dir
+
+PARITY_TEXTS = [
+    "hello",
+    "What did I say about the trip to Lisbon last spring?",
+    "Remind me to call the dentist tomorrow at 9am.",
+    "The quarterly report shows revenue up 12% while costs stayed flat, "
+    "mostly thanks to the new subscription tier launched in March.",
+    "I prefer tea over coffee in the morning",
+    "¿Dónde está la estación de tren más cercana?",
+    "def fibonacci(n): return n if n < 2 else fibonacci(n - 1) + fibonacci(n - 2)",
+    "a " * 500,   # longer than max_seq_length — exercises truncation
+]
+
+
+def export(st_model, out_dir: Path, opset: int) -> None:
+    import torch
+
+    transformer = st_model[0].auto_model.eval()
+    tokenizer = st_model.tokenizer
+    sample = tokenizer(["export sample", "a second, longer export sample"],
+                       padding=True, return_tensors="pt")
+    inputs = ("input_ids", "attention_mask")
+    dynamic = {name: {0: "batch", 1: "sequence"} for name in inputs}
+    dynamic["token_embeddings"] = {0: "batch", 1: "sequence"}
+
+    class _TokenEmbeddings(torch.nn.Module):
+        def __init__(self, model):
+            super().__init__()
+            self.model = model
+
+        def forward(self, input_ids, attention_mask):
+            return self.model(input_ids=input_ids, attention_mask=attention_mask)[0]
+
+    with torch.no_grad():
+        torch.onnx.export(
+            _TokenEmbeddings(transformer),
+            tuple(sample[name] for name in inputs),
+            str(out_dir / ONNX_MODEL_FILE),
+            input_names=list(inputs),
+            output_names=["token_embeddings"],
+            dynamic_axes=dynamic,
+            opset_version=opset,
+        )
+    tokenizer.save_pretrained(str(out_dir))
+
+
+def quantize(out_dir: Path) -> None:
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    quantize_dynamic(
+        str(out_dir / ONNX_MODEL_FILE),
+        str(out_dir / ONNX_QUANTIZED_FILE),
+        weight_type=QuantType.QInt8,
+    )
+
+
+def check_parity(st_model, out_dir: Path, quantized: bool, min_cosine: float) -> bool:
+    reference = st_model.encode(PARITY_TEXTS, normalize_embeddings=True)
+    candidate = _load_onnx_model(out_dir, quantized=quantized).encode(
+        PARITY_TEXTS, normalize_embeddings=True)
+    cosines = (reference * candidate).sum(axis=1)
+    label = ONNX_QUANTIZED_FILE if quantized else ONNX_MODEL_FILE
+    print(f"{label:22s} cosine vs torch: min={cosines.min():.5f}  mean={cosines.mean():.5f}")
+    return bool(cosines.min() >= min_cosine)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    parser.add_argument('--model', default='all-mpnet-base-v2')
+    parser.add_argument('--models-dir', default=resolve_models_dir())
+    parser.add_argument('--opset', type=int, default=17)
+    parser.add_argument('--no-quantize', action='store_true')
+    parser.add_argument('--min-cosine', type=float, default=0.98)
+    args = parser.parse_args()
+
+    from sentence_transformers import SentenceTransformer
+
+    st_model = SentenceTransformer(args.model)
+    out_dir = Path(args.models_dir) / args.model
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    export(st_model, out_dir, args.opset)
+    if not args.no_quantize:
+        quantize(out_dir)
+
+    with open(out_dir / EMBEDDING_META_FILE, 'w') as f:
+        json.dump({
+            'base_model': args.model if '/' in args.model else f'sentence-transformers/{args.model}',
+            'max_seq_length': st_model.max_seq_length,
+            'dimensions': st_model.get_sentence_embedding_dimension(),
+            'quantized': not args.no_quantize,
+        }, f, indent=2)
+    print(f"Exported {args.model} to {out_dir}")
+
+    ok = check_parity(st_model, out_dir, quantized=False, min_cosine=args.min_cosine)
+    if not args.no_quantize:
+        ok = check_parity(st_model, out_dir, quantized=True, min_cosine=args.min_cosine) and ok
+    if not ok:
+        print(f"Parity check FAILED (min cosine < {args.min_cosine})")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,352 @@
+"""
+Access Tracker — deferred, coalesced access bookkeeping for retrieval.
+
+Every episodic retrieval used to reconsolidate each returned episode inline:
+an access_count/last_accessed_at UPDATE, an activation_score recompute, a
+salience_factors rewrite for tool_reflection episodes and a salience boost,
+each its own transaction on the user-facing path. Semantic retrieval did the
+same for concept access counts.
+
+Retrieval now only records (id, hits, salience boost) in memory via
+record_episode_access() / record_concept_access(). A flusher thread wakes
+every flush interval, swaps out the accumulated maps and applies them with
+one `UPDATE ... FROM (VALUES ...)` per table, in a single transaction on
+the database writer thread.
+Repeated hits on the same row between flushes collapse into one row of the
+VALUES list, so a hot episode costs one write per interval, not one per hit.
+
+- Bounded memory: once max_pending_ids distinct rows are pending, the
+  recording thread flushes itself (caller-runs back-pressure).
+- Failures: a failed flush is logged and counted; those access counts are
+  dropped (they only feed ranking heuristics).
+- Shutdown: close() (registered with atexit) stops the flusher and applies
+  whatever is still pending.
+- Delete-all: suspended() drops pending hits and ignores new ones while the
+  tables are cleared.
+
+When disabled (or for any other database, e.g. in tests) the same batched
+statements run synchronously — still one transaction per retrieval call.
+
+Configured in connections.json under database.access_tracking. Entry point:
+enable_access_tracking() called once at startup from run.py.
+"""
+
+import atexit
+import logging
+import threading
+from contextlib import contextmanager, nullcontext
+import time
+from typing import Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+LOG_PREFIX = "[ACCESS TRACKER]"
+
+_FLUSH_INTERVAL = 1.0
+_MAX_PENDING_IDS = 5000
+# Rows per VALUES list (3 bound parameters each, well under SQLite's limit)
+_VALUES_CHUNK = 300
+
+# activation_score follows EpisodicStorageService._update_activation_score:
+# 1.0 + access_count * 0.1 + recency, where recency is 1.0 for a row accessed now.
+_EPISODE_ACCESS_SQL = """
+    UPDATE episodes
+    SET access_count = COALESCE(access_count, 0) + hits.column2,
+        last_accessed_at = datetime('now'),
+        activation_score = 2.0 + (COALESCE(access_count, 0) + hits.column2) * 0.1,
+        salience = MIN(10, salience + hits.column3),
+        salience_factors = CASE
+            WHEN json_extract(salience_factors, '$.source') = 'tool_reflection'
+            THEN json_set(salience_factors, '$.retrieval_count',
+                          COALESCE(json_extract(salience_factors, '$.retrieval_count'), 0) + hits.column2)
+            ELSE salience_factors
+        END,
+        updated_at = datetime('now')
+    FROM (VALUES {values}) AS hits
+    WHERE episodes.id = hits.column1
+"""
+
+_CONCEPT_ACCESS_SQL = """
+    UPDATE semantic_concepts
+    SET access_count = access_count + hits.column2,
+        last_accessed_at = datetime('now'),
+        updated_at = datetime('now')
+    FROM (VALUES {values}) AS hits
+    WHERE semantic_concepts.id = hits.column1
+      AND semantic_concepts.deleted_at IS NULL
+"""
+
+
+def _metrics():
+    from services.metrics_registry import get_metrics_registry
+    return get_metrics_registry()
+
+
+def apply_access_batch(db_service, episodes: Dict[str, List[float]], concepts: Dict[str, int]) -> None:
+    """
+    Apply coalesced access counts in one transaction on the database writer.
+
+    Args:
+        db_service: DatabaseService to write to
+        episodes: {episode_id: [hits, salience_boost]}
+        concepts: {concept_id: hits}
+    """
+    episode_rows = [(eid, int(hits), boost) for eid, (hits, boost) in episodes.items()]
+    concept_rows = list(concepts.items())
+    if not episode_rows and not concept_rows:
+        return
+
+    def write_batch(conn):
+        for sql, rows, width in ((_EPISODE_ACCESS_SQL, episode_rows, 3), (_CONCEPT_ACCESS_SQL, concept_rows, 2)):
+            for start in range(0, len(rows), _VALUES_CHUNK):
+                chunk = rows[start:start + _VALUES_CHUNK]
+                placeholder = "(" + ", ".join("?" * width) + ")"
+                conn.execute(
+                    sql.format(values=", ".join([placeholder] * len(chunk))),
+                    [value for row in chunk for value in row],
+                )
+
+    db_service.write(write_batch, label="access batch")
+
+
+class AccessTracker:
+    """In-memory accumulator of episode/concept hits for one DatabaseService."""
+
+    def __init__(
+        self,
+        db_service,
+        flush_interval: float = _FLUSH_INTERVAL,
+        max_pending_ids: int = _MAX_PENDING_IDS,
+    ):
+        self.db_service = db_service
+        self.flush_interval = flush_interval
+        self.max_pending_ids = max(1, int(max_pending_ids))
+
+        self._episodes: Dict[str, List[float]] = {}
+        self._concepts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        # Held across swap + write so flushes apply in order
+        self._write_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self._suspended = False
+
+        self.hits_recorded = 0
+        self.rows_written = 0
+        self.failed_flushes = 0
+        self.flushes = 0
+        self.backpressure_flushes = 0
+
+    # ── Recording side ─────────────────────────────────────────
+
+    def accepts(self, db_service) -> bool:
+        """True when access for db_service should be accumulated here."""
+        return not self._closed and getattr(db_service, 'db_path', None) == self.db_service.db_path
+
+    def record_episodes(self, episode_ids: Iterable[str], salience_boost: float) -> None:
+        with self._lock:
+            if self._suspended:
+                return
+            for episode_id in episode_ids:
+                entry = self._episodes.get(episode_id)
+                if entry is None:
+                    self._episodes[episode_id] = [1, salience_boost]
+                else:
+                    entry[0] += 1
+                    entry[1] += salience_boost
+                self.hits_recorded += 1
+            pending = len(self._episodes) + len(self._concepts)
+        self._check_backpressure(pending)
+
+    def record_concepts(self, concept_ids: Iterable[str]) -> None:
+        with self._lock:
+            if self._suspended:
+                return
+            for concept_id in concept_ids:
+                self._concepts[concept_id] = self._concepts.get(concept_id, 0) + 1
+                self.hits_recorded += 1
+            pending = len(self._episodes) + len(self._concepts)
+        self._check_backpressure(pending)
+
+    def _check_backpressure(self, pending: int) -> None:
+        if pending >= self.max_pending_ids:
+            self.backpressure_flushes += 1
+            self.flush()
+
+    # ── Writer side ────────────────────────────────────────────
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, daemon=True, name="access-tracker")
+        self._thread.start()
+        logger.info(f"{LOG_PREFIX} Enabled (flush every {self.flush_interval}s, max {self.max_pending_ids} ids)")
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"{LOG_PREFIX} Flush loop error: {e}")
+
+    def flush(self) -> int:
+        """Apply everything recorded so far and wait for the write. Returns rows written."""
+        with self._write_lock:
+            with self._lock:
+                if not self._episodes and not self._concepts:
+                    return 0
+                episodes, self._episodes = self._episodes, {}
+                concepts, self._concepts = self._concepts, {}
+
+            rows = len(episodes) + len(concepts)
+            start = time.perf_counter()
+            try:
+                apply_access_batch(self.db_service, episodes, concepts)
+            except Exception as e:
+                self.failed_flushes += 1
+                logger.error(f"{LOG_PREFIX} Dropped access counts for {rows} rows: {e}")
+                return 0
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self.flushes += 1
+            self.rows_written += rows
+
+        registry = _metrics()
+        registry.increment('access_tracker.flushes')
+        registry.increment('access_tracker.rows_written', rows)
+        registry.observe('access_tracker.flush', elapsed_ms)
+        return rows
+
+    def close(self) -> None:
+        """Stop the flusher and apply whatever is still pending."""
+        self._closed = True
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        written = self.flush()
+        if written:
+            logger.info(f"{LOG_PREFIX} Flushed {written} rows on shutdown")
+
+    @contextmanager
+    def suspended(self):
+        """Discard pending hits and ignore new ones until the block exits."""
+        with self._write_lock:
+            with self._lock:
+                self._suspended = True
+                self._episodes = {}
+                self._concepts = {}
+            try:
+                yield
+            finally:
+                with self._lock:
+                    self._suspended = False
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._episodes) + len(self._concepts)
+
+    def stats(self) -> dict:
+        return {
+            'pending': self.pending(),
+            'hits_recorded': self.hits_recorded,
+            'rows_written': self.rows_written,
+            'flushes': self.flushes,
+            'failed_flushes': self.failed_flushes,
+            'backpressure_flushes': self.backpressure_flushes,
+        }
+
+
+# ── Module-level tracker ───────────────────────────────────────
+
+_tracker: Optional[AccessTracker] = None
+
+
+def get_access_tracker() -> Optional[AccessTracker]:
+    """The active tracker, or None when access tracking is synchronous."""
+    return _tracker
+
+
+def enable_access_tracking(db_service=None) -> Optional[AccessTracker]:
+    """Start the access tracker for the shared database if enabled in connections.json."""
+    global _tracker
+    if _tracker is not None:
+        return _tracker
+
+    from services.config_service import ConfigService
+    config = ConfigService.connections().get("database", {}).get("access_tracking", {})
+    if not config.get("enabled", False):
+        return None
+
+    if db_service is None:
+        from services.database_service import get_shared_db_service
+        db_service = get_shared_db_service()
+
+    tracker = AccessTracker(
+        db_service,
+        flush_interval=config.get("flush_interval_seconds", _FLUSH_INTERVAL),
+        max_pending_ids=config.get("max_pending_ids", _MAX_PENDING_IDS),
+    )
+    tracker.start()
+    atexit.register(tracker.close)
+    _tracker = tracker
+    return tracker
+
+
+def _route(db_service) -> Optional[AccessTracker]:
+    tracker = _tracker
+    if tracker is not None and tracker.accepts(db_service):
+        return tracker
+    return None
+
+
+def record_episode_access(db_service, episode_ids: List[str], salience_boost: float) -> None:
+    """Record one retrieval hit per episode (access count, activation, salience boost)."""
+    if not episode_ids:
+        return
+    tracker = _route(db_service)
+    if tracker is not None:
+        tracker.record_episodes(episode_ids, salience_boost)
+        return
+    episodes: Dict[str, List[float]] = {}
+    for episode_id in episode_ids:
+        hits, boost = episodes.get(episode_id, (0, 0.0))
+        episodes[episode_id] = [hits + 1, boost + salience_boost]
+    apply_access_batch(db_service, episodes, {})
+
+
+def record_concept_access(db_service, concept_ids: List[str]) -> None:
+    """Record one retrieval hit per concept (access_count, last_accessed_at)."""
+    if not concept_ids:
+        return
+    tracker = _route(db_service)
+    if tracker is not None:
+        tracker.record_concepts(concept_ids)
+        return
+    concepts: Dict[str, int] = {}
+    for concept_id in concept_ids:
+        concepts[concept_id] = concepts.get(concept_id, 0) + 1
+    apply_access_batch(db_service, {}, concepts)
+
+
+def flush_access_tracking(db_service=None) -> int:
+    """Apply pending access counts now so a following read sees them."""
+    tracker = _tracker
+    if tracker is None or (db_service is not None and not tracker.accepts(db_service)):
+        return 0
+    return tracker.flush()
+
+
+def suspend_access_tracking(db_service=None):
+    """Context manager: drop pending hits and ignore new ones (no-op when synchronous)."""
+    tracker = _tracker
+    if tracker is None or (db_service is not None and not tracker.accepts(db_service)):
+        return nullcontext()
+    return tracker.suspended()
+
+
+def get_access_tracking_stats() -> dict:
+    """Pending rows and flush counters ({'enabled': False} when synchronous)."""
+    tracker = _tracker
+    if tracker is None:
+        return {'enabled': False}
+    return {'enabled': True, **tracker.stats()}
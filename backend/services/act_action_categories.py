@@ -39,3 +39,19 @@ ACTION_FATIGUE_COSTS: MappingProxyType = MappingProxyType({
     'recall': 1.0,
     'associate': 1.0,
 })
+
+# ── Serial actions: mutate state that a later action in the same batch may
+#    read (lists, schedules, tasks, documents, focus). ActLoopService never
+#    runs these concurrently with any other action in the batch ────────────
+SERIAL_ACTIONS: frozenset = frozenset({
+    'memorize', 'memory_write', 'schedule', 'focus', 'list', 'moment',
+    'persistent_task', 'emit_card', 'document',
+})
+
+# ── Chain outputs: scalar result keys an innate skill hands to later actions
+#    in the same batch via output chaining. Other innate skills return text
+#    only. External tools are not listed: their result dicts can carry any
+#    key, so ActLoopService treats their outputs as open-ended ──────────────
+ACTION_CHAIN_OUTPUTS: MappingProxyType = MappingProxyType({
+    'emit_card': frozenset({'tool_name'}),
+})
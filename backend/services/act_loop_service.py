@@ -8,6 +8,7 @@ base cost, and fatigue grows non-linearly with iteration depth.
 import re
 import time
 import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from typing import List, Dict, Any, Optional, Tuple
 import logging
 
@@ -30,12 +31,124 @@ def _strip_tool_markers(text: str) -> str:
     return text.strip()
 
 
-from services.act_action_categories import ACTION_FATIGUE_COSTS
+from services.act_action_categories import (
+    ACTION_FATIGUE_COSTS, ACTION_CHAIN_OUTPUTS, READ_ACTIONS, SERIAL_ACTIONS,
+)
+from services.innate_skills.registry import ALL_SKILL_NAMES
+
+# Read-only skills that may run side by side, even several of the same type
+_PARALLEL_READS: frozenset = READ_ACTIONS | frozenset({'read'})
 
 # Actions that never block the ACT loop — dispatched to background threads.
 # Their results aren't needed for subsequent iteration reasoning.
 FIRE_AND_FORGET: frozenset = frozenset({'memorize', 'focus'})
 
+# Independent actions in one batch run concurrently on a small shared pool.
+# Each dispatch enforces its own per-action timeout (the handler runs on its
+# own daemon thread), so a worker is normally back within per_action_timeout.
+# The grace period guards against a dispatcher that fails to return at all;
+# such a hung worker can't be cancelled, so the pool it occupies is retired
+# and later ACT loops get a fresh one instead of queueing behind it.
+_ACT_POOL_SIZE = 4
+_ACTION_TIMEOUT_GRACE = 5.0
+
+_act_pool: Optional[ThreadPoolExecutor] = None
+_act_pool_lock = threading.Lock()
+_act_worker_state = threading.local()
+
+
+def get_act_pool() -> ThreadPoolExecutor:
+    """Get or create the process-wide ACT action pool."""
+    global _act_pool
+    if _act_pool is None:
+        with _act_pool_lock:
+            if _act_pool is None:
+                _act_pool = ThreadPoolExecutor(
+                    max_workers=_ACT_POOL_SIZE,
+                    thread_name_prefix="act-action",
+                    initializer=_mark_act_worker,
+                )
+    return _act_pool
+
+
+def _retire_act_pool(pool: ThreadPoolExecutor) -> None:
+    """Stop handing new work to a pool with hung workers (queued work still runs)."""
+    global _act_pool
+    with _act_pool_lock:
+        if _act_pool is pool:
+            _act_pool = None
+    pool.shutdown(wait=False)
+
+
+def _mark_act_worker():
+    _act_worker_state.in_pool = True
+
+
+def _act_worker_state_in_pool() -> bool:
+    # A skill that runs its own ACT batch must not wait on the pool it occupies
+    return getattr(_act_worker_state, 'in_pool', False)
+
+
+def _build_action_dependencies(actions: List[Dict[str, Any]], indexes: List[int]) -> Dict[int, set]:
+    """
+    Map each action index to the earlier indexes it must wait for.
+
+    j depends on an earlier i when:
+    - either is a SERIAL_ACTIONS action (stateful — keeps batch order),
+    - i declares a chain output that j leaves empty (output chaining),
+    - i is an external tool (open-ended outputs — any param j leaves empty
+      may be filled from it) and j is not a read, or
+    - both call the same external tool (tools keep per-tool state).
+    """
+    deps = {}
+    for pos, j in enumerate(indexes):
+        type_j = actions[j].get('type', '')
+        deps[j] = set()
+        for i in indexes[:pos]:
+            type_i = actions[i].get('type', '')
+            if type_i in SERIAL_ACTIONS or type_j in SERIAL_ACTIONS:
+                deps[j].add(i)
+            elif any(not actions[j].get(key) for key in ACTION_CHAIN_OUTPUTS.get(type_i, ())):
+                deps[j].add(i)
+            elif type_i not in ALL_SKILL_NAMES and type_j not in _PARALLEL_READS:
+                deps[j].add(i)
+            elif type_i == type_j and type_j not in _PARALLEL_READS:
+                deps[j].add(i)
+    return deps
+
+
+def _transitive_dependencies(deps: Dict[int, set], indexes: List[int]) -> Dict[int, List[int]]:
+    """Map each index to all of its direct and indirect dependencies, in batch order."""
+    closure: Dict[int, set] = {}
+    for j in indexes:  # indexes are in batch order, so every dependency is already closed
+        ancestors = set(deps[j])
+        for i in deps[j]:
+            ancestors |= closure[i]
+        closure[j] = ancestors
+    return {j: sorted(ancestors) for j, ancestors in closure.items()}
+
+
+def _not_run_result(action: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        'action_type': action.get('type', 'unknown'),
+        'status': 'skipped',
+        'result': "Action not started: the ACT pool was busy past the timeout",
+        'execution_time': 0.0,
+        'confidence': 0.0,
+        'notes': '',
+    }
+
+
+def _timeout_result(action: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+    return {
+        'action_type': action.get('type', 'unknown'),
+        'status': 'timeout',
+        'result': f"Action exceeded {timeout}s timeout",
+        'execution_time': timeout,
+        'confidence': 0.0,
+        'notes': '',
+    }
+
 
 class ActLoopService:
     """Manages ACT loop with fatigue-based termination and concurrent execution."""
@@ -273,9 +386,20 @@ class ActLoopService:
 
     def execute_actions(self, topic: str, actions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
-        Execute actions via dispatcher. Multiple actions run sequentially with output chaining.
-        Fire-and-forget actions (memorize, focus) dispatch to background threads and return
-        a synthetic success immediately — they never block the next iteration.
+        Execute actions via dispatcher, running independent actions concurrently.
+
+        A dependency graph is built from each action's declared chain outputs
+        (ACTION_CHAIN_OUTPUTS) and the params a later action leaves open, plus
+        ordering barriers for stateful actions (SERIAL_ACTIONS), for non-read
+        actions after an external tool (whose outputs aren't declared) and
+        for repeated calls to the same external tool. Actions whose dependencies are done
+        start immediately on a bounded pool; everything else waits. Output
+        chaining only sees the outputs of an action's direct and transitive
+        dependencies — those are guaranteed to have finished, so what gets
+        chained never depends on how fast independent siblings happen to run.
+
+        Fire-and-forget actions (memorize, focus) dispatch to background threads and
+        return a synthetic success immediately — they never block the next iteration.
 
         Args:
             topic: Current conversation topic
@@ -291,8 +415,8 @@ class ActLoopService:
             from services.act_dispatcher_service import ActDispatcherService
             self._dispatcher = ActDispatcherService(timeout=self.per_action_timeout)
 
-        results = []
-        accumulated = {}  # outputs from completed actions, keyed by downstream param name
+        results: List[Optional[Dict[str, Any]]] = [None] * len(actions)
+        pending = []  # indexes of blocking actions, in original order
 
         for i, action in enumerate(actions):
             action_type = action.get('type', '')
@@ -301,46 +425,116 @@ class ActLoopService:
             if action_type in FIRE_AND_FORGET:
                 enriched = {**self.context_extras, **action}
                 self._dispatch_async(topic, enriched)
-                results.append({
+                results[i] = {
                     'action_type': action_type,
                     'status': 'success',
                     'result': '(running in background)',
                     'execution_time': 0.0,
                     'confidence': 0.92,
                     'notes': 'fire-and-forget',
-                })
+                }
                 logging.debug(f"[MODE:ACT] [ACT LOOP] Step {i+1}/{len(actions)} → {action_type} (fire-and-forget)")
                 continue
+            pending.append(i)
+
+        deps = _build_action_dependencies(actions, pending)
+        sources = _transitive_dependencies(deps, pending)
+
+        if len(pending) < 2 or all(deps[j] for j in pending[1:]) or _act_worker_state_in_pool():
+            # Nothing can overlap — run in order on this thread
+            for i in pending:
+                results[i] = self._run_action(topic, actions, results, i, sources[i])
+            return results
+
+        pool = get_act_pool()
+        running = {}  # future -> index
+        remaining = list(pending)
+        done = set()
+        requeued = set()
+
+        while remaining or running:
+            for i in [j for j in remaining if deps[j] <= done]:
+                remaining.remove(i)
+                running[pool.submit(self._run_action, topic, actions, results, i, sources[i])] = i
+
+            finished, _ = wait(
+                running, timeout=self.per_action_timeout + _ACTION_TIMEOUT_GRACE,
+                return_when=FIRST_COMPLETED,
+            )
+            if not finished:
+                # Dispatcher's own timeout should have fired — don't wait forever.
+                # Only actions that actually started are timed out; ones still
+                # queued behind the stuck workers are requeued once, then
+                # reported as not run.
+                hung = 0
+                for future, i in running.items():
+                    if future.cancel():
+                        if i in requeued:
+                            results[i] = _not_run_result(actions[i])
+                            done.add(i)
+                        else:
+                            requeued.add(i)
+                            remaining.append(i)
+                    elif future.done():
+                        results[i] = future.result()
+                        done.add(i)
+                    else:
+                        hung += 1
+                        results[i] = _timeout_result(actions[i], self.per_action_timeout)
+                        done.add(i)
+                running.clear()
+                remaining.sort()
+                if hung:
+                    logging.warning(
+                        f"[MODE:ACT] [ACT LOOP] {hung} action(s) still running past the "
+                        f"{self.per_action_timeout}s timeout — retiring the ACT pool"
+                    )
+                    _retire_act_pool(pool)
+                    pool = get_act_pool()
+                continue
 
-            # Enrich action params with context_extras as defaults, then accumulated outputs
-            enriched = {**self.context_extras, **action}
-            for field, value in accumulated.items():
-                if not enriched.get(field):
-                    enriched[field] = value
-
-            logging.debug(f"[MODE:ACT] [ACT LOOP] Step {i+1}/{len(actions)} → {action.get('type', 'unknown')}")
-            result = self._dispatcher.dispatch_action(topic, enriched)
-            results.append(result)
+            for future in finished:
+                i = running.pop(future)
+                results[i] = future.result()  # re-raises dispatcher exceptions
+                done.add(i)
 
-            logging.info(
-                f"[MODE:ACT] [ACT LOOP] Action {result['action_type']}: "
-                f"{result['status']} ({result['execution_time']:.2f}s)"
-            )
-            # Log result content for schedule actions and for any error/unexpected results
-            result_str = str(result.get('result', ''))
-            if result['action_type'] == 'schedule' or result_str.startswith('Error:'):
-                logging.info(
-                    f"[MODE:ACT] [ACT LOOP] {result['action_type']} result: {result_str!r:.200}"
-                )
+        return results
 
-            # Generic output chaining: merge all scalar values from successful dict
-            # results into accumulated context for downstream actions (P6 fix)
-            if result.get("status") == "success" and isinstance(result.get("result"), dict):
-                for key, value in result["result"].items():
+    def _run_action(self, topic: str, actions: List[Dict[str, Any]],
+                    results: List[Optional[Dict[str, Any]]], i: int,
+                    sources: List[int]) -> Dict[str, Any]:
+        """Dispatch actions[i] with context extras and outputs chained from its dependencies."""
+        action = actions[i]
+
+        # Generic output chaining: scalar values from successful dict results
+        # of the actions this one depends on fill params it left empty (P6 fix)
+        accumulated = {}
+        for earlier in (results[k] for k in sources):
+            if earlier and earlier.get("status") == "success" and isinstance(earlier.get("result"), dict):
+                for key, value in earlier["result"].items():
                     if isinstance(value, (str, int, float, bool)) and key not in ('status', 'card_emitted'):
                         accumulated[key] = value
 
-        return results
+        # Enrich action params with context_extras as defaults, then accumulated outputs
+        enriched = {**self.context_extras, **action}
+        for field, value in accumulated.items():
+            if not enriched.get(field):
+                enriched[field] = value
+
+        logging.debug(f"[MODE:ACT] [ACT LOOP] Step {i+1}/{len(actions)} → {action.get('type', 'unknown')}")
+        result = self._dispatcher.dispatch_action(topic, enriched)
+
+        logging.info(
+            f"[MODE:ACT] [ACT LOOP] Action {result['action_type']}: "
+            f"{result['status']} ({result['execution_time']:.2f}s)"
+        )
+        # Log result content for schedule actions and for any error/unexpected results
+        result_str = str(result.get('result', ''))
+        if result['action_type'] == 'schedule' or result_str.startswith('Error:'):
+            logging.info(
+                f"[MODE:ACT] [ACT LOOP] {result['action_type']} result: {result_str!r:.200}"
+            )
+        return result
 
     def _dispatch_async(self, topic: str, action: Dict[str, Any]) -> None:
         """Dispatch an action to a background daemon thread (fire-and-forget)."""
@@ -581,49 +581,31 @@ class AutobiographyService:
         )
 
 
-def autobiography_synthesis_worker(shared_state=None) -> None:
+def register_autobiography_synthesis_job(scheduler) -> None:
     """
-    Background worker: periodically synthesize autobiography.
+    Register periodic autobiography synthesis on the job scheduler.
 
-    Infinite loop: sleeps 6 hours, checks should_synthesize(), runs if needed.
-
-    Args:
-        shared_state: Optional shared state dict (for consumer integration)
+    Checks every 5 minutes; synthesizes at most every 6 hours, and only when
+    should_synthesize() says there is enough new material.
     """
-    logger.info("[AUTOBIOGRAPHY] Worker started")
+    from services.database_service import get_lightweight_db_service
 
     synthesis_interval = 6 * 3600  # 6 hours
     check_interval = 300  # Check every 5 minutes if synthesis needed
 
-    try:
-        from services.database_service import get_lightweight_db_service
-
-        db = get_lightweight_db_service()
-        service = AutobiographyService(db)
-
-        last_synthesis = time.time()
-
-        while True:
-            try:
-                time.sleep(check_interval)
-
-                # Check if it's time to attempt synthesis
-                if time.time() - last_synthesis < synthesis_interval:
-                    continue
+    service = AutobiographyService(get_lightweight_db_service())
+    last_synthesis = [time.time()]
 
-                # Check if synthesis is needed and run if so
-                if service.should_synthesize():
-                    logger.info("[AUTOBIOGRAPHY] Synthesis threshold met, running synthesis...")
-                    if service.synthesize():
-                        last_synthesis = time.time()
-                    # else: lock held by another worker, will retry next interval
+    def _check_and_synthesize():
+        # Check if it's time to attempt synthesis
+        if time.time() - last_synthesis[0] < synthesis_interval:
+            return
 
-            except KeyboardInterrupt:
-                logger.info("[AUTOBIOGRAPHY] Worker shutting down...")
-                break
-            except Exception as e:
-                logger.error(f"[AUTOBIOGRAPHY] Worker error: {e}", exc_info=True)
-                time.sleep(60)
+        # Check if synthesis is needed and run if so
+        if service.should_synthesize():
+            logger.info("[AUTOBIOGRAPHY] Synthesis threshold met, running synthesis...")
+            if service.synthesize():
+                last_synthesis[0] = time.time()
+            # else: lock held by another worker, will retry next interval
 
-    except Exception as e:
-        logger.error(f"[AUTOBIOGRAPHY] Worker initialization failed: {e}", exc_info=True)
+    scheduler.add_job("autobiography-synthesis", _check_and_synthesize, interval=check_interval)
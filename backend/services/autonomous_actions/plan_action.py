@@ -306,7 +306,9 @@ class PlanAction(AutonomousAction):
         """Count how many distinct conversations mention this topic (last 7 days)."""
         try:
             from services.database_service import get_shared_db_service
+            from services.write_behind_queue import flush_pending
             db = get_shared_db_service()
+            flush_pending(db)
             with db.connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
@@ -40,6 +40,7 @@ from services.episodic_retrieval_service import EpisodicRetrievalService
 from services.embedding_service import EmbeddingService
 from services.background_llm_queue import create_background_llm_proxy
 from services.database_service import get_lightweight_db_service
+from services.write_behind_queue import flush_pending
 
 logger = logging.getLogger(__name__)
 
@@ -651,6 +652,7 @@ class CognitiveDriftEngine:
                 return None
 
         try:
+            flush_pending(self.db_service)
             with self.db_service.connection() as conn:
                 cursor = conn.cursor()
 
@@ -0,0 +1,398 @@
+"""
+Concept Index — resident in-memory vector index for semantic concepts.
+
+Holds every live concept embedding in one contiguous float32 matrix with
+parallel arrays for the hybrid-score signals (strength, activation, utility,
+confidence, reliability). SemanticRetrievalService scores the whole store with
+a single matrix-vector product and an argpartition top-k instead of reloading
+and unpacking every vec blob from SQLite per query.
+
+The index loads lazily on first search and is then kept current by the writers
+(SemanticStorageService on create/strengthen, DecayEngineService after each
+semantic decay pass, which also drops concepts soft-deleted since the last
+load). A full reload still happens after _MAX_STALENESS seconds so writers
+that bypass the storage layer (drift nudges, uncertainty tagging) are
+eventually reflected.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Full reload interval — safety net for writers that don't notify the index
+_MAX_STALENESS = 600
+
+# Initial row capacity; grows by doubling so appends are amortised O(1)
+_INITIAL_CAPACITY = 256
+
+_CONCEPT_COLUMNS = (
+    'id', 'concept_name', 'concept_type', 'definition',
+    'abstraction_level', 'domain', 'strength', 'activation_score',
+    'access_count', 'consolidation_count', 'confidence', 'source_episodes',
+    'verification_status', 'context_constraints', 'examples',
+    'first_learned_at', 'last_accessed_at', 'last_reinforced_at',
+    'utility_score', 'decay_resistance', 'created_at', 'updated_at',
+    'reliability',
+)
+
+
+# Attributes _reset() initialises; swapped in as a unit after a reload
+_ARRAY_STATE = (
+    '_dimensions', '_size', '_ids', '_positions', '_meta', '_matrix',
+    '_strength', '_activation', '_utility', '_confidence', '_reliability',
+)
+
+
+def _value_or(value, default: float) -> float:
+    """Numeric column value, or default when NULL/missing (0.0 stays 0.0)."""
+    return default if value is None else value
+
+
+def _normalize(vec: np.ndarray) -> np.ndarray:
+    """L2-normalise a vector; zero vectors stay zero (similarity 0)."""
+    norm = np.linalg.norm(vec)
+    if norm == 0:
+        return vec
+    return vec / norm
+
+
+class ConceptIndex:
+    """Matrix-backed concept store with incremental updates (thread-safe)."""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        # Serialises full reloads; held without _lock so searches keep going
+        self._load_lock = threading.Lock()
+        self._reset(dimensions=0, capacity=0)
+        self._loaded_at: Optional[float] = None
+        self._db_path: Optional[str] = None
+
+    def _reset(self, dimensions: int, capacity: int):
+        self._dimensions = dimensions
+        self._size = 0
+        self._ids: List[str] = []
+        self._positions: Dict[str, int] = {}
+        self._meta: List[dict] = []
+        self._matrix = np.zeros((capacity, dimensions), dtype=np.float32)
+        self._strength = np.zeros(capacity, dtype=np.float32)
+        self._activation = np.zeros(capacity, dtype=np.float32)
+        self._utility = np.zeros(capacity, dtype=np.float32)
+        self._confidence = np.zeros(capacity, dtype=np.float32)
+        self._reliability = np.empty(capacity, dtype=object)
+
+    def __len__(self) -> int:
+        return self._size
+
+    # ── Loading ──────────────────────────────────────────────────
+
+    def _state(self, db_path) -> str:
+        """'fresh', 'stale' (usable, due a reload) or 'missing' for db_path."""
+        with self._lock:
+            if self._loaded_at is None or db_path != self._db_path:
+                return 'missing'
+            if time.time() - self._loaded_at >= _MAX_STALENESS:
+                return 'stale'
+            return 'fresh'
+
+    def ensure_loaded(self, db_service) -> None:
+        """Load from SQLite if never loaded, stale, or bound to another database.
+
+        While a stale index is being reloaded by one caller, others keep
+        searching the current arrays instead of waiting for the reload.
+        """
+        db_path = getattr(db_service, 'db_path', None)
+        state = self._state(db_path)
+        if state == 'fresh':
+            return
+        if not self._load_lock.acquire(blocking=(state == 'missing')):
+            return  # another thread is already reloading
+        try:
+            if self._state(db_path) != 'fresh':
+                self.load(db_service)
+        finally:
+            self._load_lock.release()
+
+    def load(self, db_service) -> int:
+        """Rebuild the index from semantic_concepts + semantic_concepts_vec.
+
+        Returns:
+            Number of concepts indexed
+        """
+        with db_service.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT
+                    sc.id, sc.concept_name, sc.concept_type, sc.definition,
+                    sc.abstraction_level, sc.domain, sc.strength, sc.activation_score,
+                    sc.access_count, sc.consolidation_count, sc.confidence, sc.source_episodes,
+                    sc.verification_status, sc.context_constraints, sc.examples,
+                    sc.first_learned_at, sc.last_accessed_at, sc.last_reinforced_at,
+                    sc.utility_score, sc.decay_resistance, sc.created_at, sc.updated_at,
+                    COALESCE(sc.reliability, 'reliable') AS reliability,
+                    v.embedding
+                FROM semantic_concepts sc
+                JOIN semantic_concepts_vec v ON v.rowid = sc.rowid
+                WHERE sc.deleted_at IS NULL
+            """)
+            rows = cursor.fetchall()
+            cursor.close()
+
+        rows = [r for r in rows if isinstance(r[23], (bytes, bytearray)) and r[23]]
+
+        # Build the new arrays on a private instance, then swap them in, so
+        # searches only wait for the swap, not for the rebuild
+        with self._lock:
+            dimensions = len(rows[0][23]) // 4 if rows else self._dimensions
+        staged = ConceptIndex()
+        staged._reset(dimensions, max(_INITIAL_CAPACITY, len(rows)))
+        if rows:
+            # One frombuffer over the concatenated blobs instead of N struct.unpack calls
+            block = np.frombuffer(b''.join(r[23] for r in rows), dtype=np.float32)
+            block = block.reshape(len(rows), dimensions)
+            norms = np.linalg.norm(block, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            staged._matrix[:len(rows)] = block / norms
+
+            for i, row in enumerate(rows):
+                meta = dict(zip(_CONCEPT_COLUMNS, row[:23]))
+                meta['id'] = str(meta['id'])
+                staged._ids.append(meta['id'])
+                staged._positions[meta['id']] = i
+                staged._meta.append(meta)
+                staged._set_scalars(i, meta)
+            staged._size = len(rows)
+
+        with self._lock:
+            for name in _ARRAY_STATE:
+                setattr(self, name, getattr(staged, name))
+            self._loaded_at = time.time()
+            self._db_path = getattr(db_service, 'db_path', None)
+
+        logger.debug(f"[CONCEPT INDEX] Loaded {len(rows)} concepts ({dimensions}d)")
+        return len(rows)
+
+    def invalidate(self) -> None:
+        """Force a full reload on the next search."""
+        with self._lock:
+            self._loaded_at = None
+
+    # ── Incremental updates ──────────────────────────────────────
+
+    def _set_scalars(self, pos: int, meta: dict):
+        # Same defaults the per-query scorer used for missing signals
+        self._strength[pos] = _value_or(meta.get('strength'), 0.5)
+        self._activation[pos] = _value_or(meta.get('activation_score'), 0.0)
+        self._utility[pos] = _value_or(meta.get('utility_score'), 0.0)
+        self._confidence[pos] = _value_or(meta.get('confidence'), 0.5)
+        self._reliability[pos] = meta.get('reliability') or 'reliable'
+
+    def _grow(self):
+        capacity = max(_INITIAL_CAPACITY, len(self._strength) * 2)
+        matrix = np.zeros((capacity, self._dimensions), dtype=np.float32)
+        matrix[:self._size] = self._matrix[:self._size]
+        self._matrix = matrix
+        for name in ('_strength', '_activation', '_utility', '_confidence'):
+            arr = np.zeros(capacity, dtype=np.float32)
+            arr[:self._size] = getattr(self, name)[:self._size]
+            setattr(self, name, arr)
+        reliability = np.empty(capacity, dtype=object)
+        reliability[:self._size] = self._reliability[:self._size]
+        self._reliability = reliability
+
+    def upsert(self, concept: dict, embedding) -> None:
+        """Insert or replace a concept row. No-op until the index has loaded."""
+        if embedding is None:
+            return
+        with self._lock:
+            if self._loaded_at is None:
+                return
+            if isinstance(embedding, (bytes, bytearray)):
+                vec = np.frombuffer(embedding, dtype=np.float32)
+            else:
+                vec = np.asarray(embedding, dtype=np.float32)
+            if self._dimensions == 0:
+                self._reset(len(vec), _INITIAL_CAPACITY)
+            if len(vec) != self._dimensions:
+                logger.warning(
+                    f"[CONCEPT INDEX] Dimension mismatch ({len(vec)} != {self._dimensions}), reloading"
+                )
+                self.invalidate()
+                return
+
+            concept_id = str(concept['id'])
+            meta = {col: concept.get(col) for col in _CONCEPT_COLUMNS}
+            meta['id'] = concept_id
+            meta['reliability'] = meta.get('reliability') or 'reliable'
+
+            pos = self._positions.get(concept_id)
+            if pos is None:
+                if self._size == len(self._strength):
+                    self._grow()
+                pos = self._size
+                self._size += 1
+                self._ids.append(concept_id)
+                self._meta.append(meta)
+                self._positions[concept_id] = pos
+            else:
+                self._meta[pos] = meta
+
+            self._matrix[pos] = _normalize(vec)
+            self._set_scalars(pos, meta)
+
+    def update_fields(self, concept_id: str, **fields) -> None:
+        """Patch metadata and scored signals for an indexed concept."""
+        with self._lock:
+            pos = self._positions.get(str(concept_id))
+            if pos is None:
+                return
+            meta = self._meta[pos]
+            meta.update(fields)
+            self._set_scalars(pos, meta)
+
+    def remove(self, concept_id: str) -> None:
+        """Drop a concept (swap-with-last keeps the matrix contiguous)."""
+        with self._lock:
+            pos = self._positions.pop(str(concept_id), None)
+            if pos is None:
+                return
+            last = self._size - 1
+            if pos != last:
+                moved_id = self._ids[last]
+                self._ids[pos] = moved_id
+                self._meta[pos] = self._meta[last]
+                self._matrix[pos] = self._matrix[last]
+                for arr in (self._strength, self._activation, self._utility,
+                            self._confidence, self._reliability):
+                    arr[pos] = arr[last]
+                self._positions[moved_id] = pos
+            self._ids.pop()
+            self._meta.pop()
+            self._size = last
+
+    def refresh_scalars(self, db_service) -> int:
+        """Re-read scored columns (no embedding blobs) after a bulk write.
+
+        Used by the decay engine after its set-based UPDATE so the index picks
+        up new strengths without reloading the matrix. Indexed concepts that
+        are no longer live (soft-deleted since the last load) are dropped.
+
+        Returns:
+            Number of indexed concepts refreshed
+        """
+        with self._lock:
+            if self._loaded_at is None:
+                return 0
+
+        with db_service.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT id, strength, activation_score, utility_score, confidence,
+                       COALESCE(reliability, 'reliable'), updated_at
+                FROM semantic_concepts
+                WHERE deleted_at IS NULL
+            """)
+            rows = cursor.fetchall()
+            cursor.close()
+
+        refreshed = 0
+        with self._lock:
+            live = {str(row[0]) for row in rows}
+            for concept_id in [cid for cid in self._ids if cid not in live]:
+                self.remove(concept_id)
+
+            for concept_id, strength, activation, utility, confidence, reliability, updated_at in rows:
+                pos = self._positions.get(str(concept_id))
+                if pos is None:
+                    continue
+                meta = self._meta[pos]
+                meta.update({
+                    'strength': strength,
+                    'activation_score': activation,
+                    'utility_score': utility,
+                    'confidence': confidence,
+                    'reliability': reliability,
+                    'updated_at': updated_at,
+                })
+                self._set_scalars(pos, meta)
+                refreshed += 1
+        return refreshed
+
+    # ── Search ───────────────────────────────────────────────────
+
+    def search(self, query_embedding, weights: Dict[str, float], limit: int,
+               min_confidence: float = 0.0) -> List[Dict[str, Any]]:
+        """
+        Score every concept with the hybrid formula and return the top `limit`.
+
+        hybrid = (w_sim * cos + w_str * strength + w_act * activation
+                  + w_util * utility + w_conf * confidence) / sum(w)
+
+        Concepts below min_confidence are excluded before ranking.
+
+        Returns:
+            Concept dicts (copies) with hybrid_score and vector_similarity,
+            sorted by hybrid_score descending
+        """
+        if limit <= 0:
+            return []
+
+        query = np.asarray(query_embedding, dtype=np.float32)
+        query = _normalize(query)
+
+        with self._lock:
+            n = self._size
+            if n == 0 or len(query) != self._dimensions:
+                return []
+
+            similarity = self._matrix[:n] @ query
+            np.clip(similarity, 0.0, 1.0, out=similarity)
+
+            total_weight = sum(weights.values()) or 1.0
+            scores = (
+                weights.get('vector_similarity', 0) * similarity
+                + weights.get('strength', 0) * self._strength[:n]
+                + weights.get('activation_score', 0) * self._activation[:n]
+                + weights.get('utility_score', 0) * self._utility[:n]
+                + weights.get('confidence', 0) * self._confidence[:n]
+            ) / total_weight
+
+            candidates = np.flatnonzero(self._confidence[:n] >= min_confidence)
+            if candidates.size == 0:
+                return []
+
+            k = min(limit, candidates.size)
+            candidate_scores = scores[candidates]
+            if k < candidates.size:
+                top = np.argpartition(-candidate_scores, k - 1)[:k]
+            else:
+                top = np.arange(candidates.size)
+            top = top[np.argsort(-candidate_scores[top], kind='stable')]
+
+            results = []
+            for idx in candidates[top]:
+                concept = dict(self._meta[idx])
+                concept['embedding'] = None  # Embeddings stay resident in the matrix
+                concept['hybrid_score'] = float(scores[idx])
+                concept['vector_similarity'] = float(similarity[idx])
+                results.append(concept)
+            return results
+
+
+# Process-wide singleton
+_concept_index = None
+_concept_index_lock = threading.Lock()
+
+
+def get_concept_index() -> ConceptIndex:
+    """Get or create the ConceptIndex singleton."""
+    global _concept_index
+    if _concept_index is None:
+        with _concept_index_lock:
+            if _concept_index is None:
+                _concept_index = ConceptIndex()
+    return _concept_index
@@ -1,10 +1,88 @@
 import json
 import logging
+import os
+import threading
+import time
 from pathlib import Path
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
 
 logger = logging.getLogger(__name__)
 
+# Parsed config/prompt files are cached per path and re-validated against their
+# mtime at most every _STAT_INTERVAL seconds, so hot-path lookups do no I/O.
+_STAT_INTERVAL = 1.0
+
+
+def _freeze(obj):
+    """Recursively convert parsed JSON into read-only mappings and tuples."""
+    if isinstance(obj, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(v) for v in obj)
+    return obj
+
+
+def _thaw(obj):
+    """Mutable deep copy of a frozen structure (callers may mutate freely)."""
+    if isinstance(obj, MappingProxyType):
+        return {k: _thaw(v) for k, v in obj.items()}
+    if isinstance(obj, tuple):
+        return [_thaw(v) for v in obj]
+    return obj
+
+
+def _file_signature(path: str):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+class _FileRegistry:
+    """Process-wide cache of parsed files keyed by (kind, path).
+
+    `generation` increments on every (re)parse and on clear(), so derived
+    caches (resolved agent configs, concatenated prompts) can key on it.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[tuple, list] = {}  # (kind, path) → [signature, value, checked_at]
+        self.generation = 0
+
+    def get(self, kind: str, path: str, parse):
+        key = (kind, path)
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None and now - entry[2] < _STAT_INTERVAL:
+            return entry[1]
+
+        signature = _file_signature(path)
+        if entry is not None and entry[0] == signature:
+            entry[2] = now
+            return entry[1]
+
+        value = parse(path)
+        with self._lock:
+            self._entries[key] = [signature, value, now]
+            self.generation += 1
+        if entry is not None:
+            logger.info(f"[ConfigService] Reloaded changed file {path}")
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.generation += 1
+
+
+_registry = _FileRegistry()
+
+# Provider-resolved agent configs: {agent_name: ((file_gen, provider_gen), frozen_config)}
+_resolved_configs: Dict[str, tuple] = {}
+
 
 class ConfigService:
     CONFIGS_DIR         = Path(__file__).resolve().parent.parent / "configs"
@@ -13,19 +91,43 @@ class ConfigService:
     AGENTS_CONFIGS      = CONFIGS_DIR / "agents"
 
     @staticmethod
-    def load_json(file_path: str) -> Dict[str, Any]:
-        """Load JSON configuration file."""
+    def _parse_json(file_path: str):
         with open(file_path, 'r') as f:
-            return json.load(f)
+            return _freeze(json.load(f))
 
     @staticmethod
-    def load_text(file_path: str) -> str:
-        """Load text file content."""
+    def _parse_text(file_path: str) -> str:
         path = Path(file_path)
         if not path.exists():
             return ""
         return path.read_text().strip()
 
+    @staticmethod
+    def load_json(file_path: str) -> Dict[str, Any]:
+        """Load JSON configuration file (cached; returns a mutable copy)."""
+        return _thaw(ConfigService.load_json_view(file_path))
+
+    @staticmethod
+    def load_json_view(file_path: str) -> Mapping[str, Any]:
+        """Load JSON configuration file as a shared read-only mapping (no copy)."""
+        return _registry.get('json', str(file_path), ConfigService._parse_json)
+
+    @staticmethod
+    def load_text(file_path: str) -> str:
+        """Load text file content (cached)."""
+        return _registry.get('text', str(file_path), ConfigService._parse_text)
+
+    @staticmethod
+    def generation() -> int:
+        """Counter bumped whenever any cached config/prompt file is (re)parsed."""
+        return _registry.generation
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop all cached files and resolved configs (next access re-reads disk)."""
+        _registry.clear()
+        _resolved_configs.clear()
+
     @staticmethod
     def connections() -> Dict[str, Any]:
         """Load connections config (topic/queue names for MemoryStore key prefixes).
@@ -97,18 +199,30 @@ class ConfigService:
     def get_agent_config(agent_name: str) -> Dict[str, Any]:
         return ConfigService.load_json(str(ConfigService.AGENTS_CONFIGS / (agent_name + ".json")))
 
+    @staticmethod
+    def get_agent_config_view(agent_name: str) -> Mapping[str, Any]:
+        """Read-only agent config shared across callers (no parse, no copy)."""
+        return ConfigService.load_json_view(str(ConfigService.AGENTS_CONFIGS / (agent_name + ".json")))
+
     @staticmethod
     def resolve_agent_config(agent_name: str) -> Dict[str, Any]:
         """Load agent config and resolve any provider references.
 
         Checks DB for job assignment first, then uses JSON provider resolution.
+        Results are memoized per agent, keyed on the config file generation and
+        the ProviderCacheService generation; each call returns a mutable copy.
         """
+        from services.provider_cache_service import ProviderCacheService
+
+        cached = _resolved_configs.get(agent_name)
+        if cached is not None and cached[0] == (ConfigService.generation(), ProviderCacheService.get_generation()):
+            return _thaw(cached[1])
+
         config = ConfigService.get_agent_config(agent_name)
+        lookup_ok = True
 
         # Check if there's a DB-level job assignment (via cached service)
         try:
-            from services.provider_cache_service import ProviderCacheService
-
             assignment_provider = ProviderCacheService.get_job_assignment(agent_name)
             if assignment_provider:
                 config['provider'] = assignment_provider
@@ -123,8 +237,15 @@ class ConfigService:
                                    f"falling back to '{fallback_name}'")
         except Exception as e:
             logger.warning(f"[ConfigService] Job assignment lookup failed for '{agent_name}': {e}")
+            lookup_ok = False
 
-        return ConfigService.resolve_provider(config)
+        result = ConfigService.resolve_provider(config)
+
+        # Don't pin a degraded resolution (e.g. DB briefly unavailable)
+        if lookup_ok:
+            key = (ConfigService.generation(), ProviderCacheService.get_generation())
+            _resolved_configs[agent_name] = (key, _freeze(result))
+        return result
 
     @staticmethod
     def get_agent_prompt(agent_name: str) -> str:
@@ -32,6 +32,11 @@ class ContextAssemblyService:
         'concepts': 0.6
     }
 
+    # Per-source retrieval deadline (seconds), counted from when the source
+    # starts running. A source that misses it is omitted from this turn's
+    # context (with a warning) rather than delaying the response.
+    DEFAULT_SOURCE_TIMEOUT = 2.0
+
     def __init__(self, config: dict):
         """
         Initialize context assembly service.
@@ -42,10 +47,12 @@ class ContextAssemblyService:
                 - max_context_tokens: approximate token budget
                 - max_working_memory_turns: turns for working memory
                 - max_gists: max gists to retrieve
+                - retrieval_source_timeout: per-source deadline in seconds
         """
         self.config = config
         self.weights = config.get('context_weights', self.DEFAULT_WEIGHTS)
         self.max_context_tokens = config.get('max_context_tokens', 4000)
+        self.source_timeout = config.get('retrieval_source_timeout', self.DEFAULT_SOURCE_TIMEOUT)
 
     def assemble(
         self,
@@ -55,16 +62,21 @@ class ContextAssemblyService:
         thread_id: str = None,
         recent_visible_context: list = None,
         message_embedding=None,
+        timings: Dict[str, float] = None,
     ) -> Dict[str, str]:
         """
         Assemble context from all memory types.
 
+        Memory sources are retrieved concurrently (see RetrievalExecutor), each
+        bounded by retrieval_source_timeout.
+
         Args:
             prompt: User's current prompt
             topic: Current conversation topic
             act_history: Previous ACT loop history
             thread_id: Optional thread ID for working memory retrieval
             recent_visible_context: Optional last exchanges from expired thread
+            timings: Optional dict that receives per-source retrieval times (ms)
 
         Returns:
             Dict with context sections:
@@ -78,17 +90,27 @@ class ContextAssemblyService:
                 'total_tokens_est': int
             }
         """
-        sections = {}
+        from services.retrieval_executor import RetrievalExecutor
 
         # Use thread_id for working memory if available
         wm_identifier = thread_id if thread_id else topic
-        sections['working_memory'] = self._get_working_memory(wm_identifier)
-        sections['moments'] = self._get_moments(prompt)
-        sections['facts'] = self._get_facts(topic)
-        sections['gists'] = self._get_gists(topic)
-        sections['episodes'] = self._get_episodes(prompt, topic, act_history, message_embedding=message_embedding)
-        sections['procedural'] = self._get_procedural_hints(topic)
-        sections['concepts'] = self._get_concepts(prompt, topic, act_history, message_embedding=message_embedding)
+
+        executor = RetrievalExecutor(default_timeout=self.source_timeout)
+        executor.submit('working_memory', self._get_working_memory, wm_identifier, default="")
+        executor.submit('moments', self._get_moments, prompt, default="")
+        executor.submit('facts', self._get_facts, topic, default="")
+        executor.submit('gists', self._get_gists, topic,
+                        default="No previous conversation context available")
+        executor.submit('episodes', self._get_episodes, prompt, topic, act_history,
+                        message_embedding=message_embedding, default="")
+        executor.submit('procedural', self._get_procedural_hints, topic, default="")
+        executor.submit('concepts', self._get_concepts, prompt, topic, act_history,
+                        message_embedding=message_embedding, default="")
+        executor.submit('self_awareness', self._get_self_awareness, default="")
+        sections = executor.collect()
+
+        if timings is not None:
+            timings.update(executor.timings)
 
         # Inject recent visible context from previous session (visual continuity bridge)
         if recent_visible_context:
@@ -100,17 +122,6 @@ class ContextAssemblyService:
         else:
             sections['previous_session'] = ""
 
-        # Self-awareness (interoception — only when noteworthy)
-        try:
-            from services.self_model_service import SelfModelService
-            service = SelfModelService()
-            if service.has_noteworthy_state():
-                sections['self_awareness'] = service.format_for_prompt()
-            else:
-                sections['self_awareness'] = ""
-        except Exception:
-            sections['self_awareness'] = ""
-
         # Estimate total tokens
         total_tokens = sum(self._estimate_tokens(s) for s in sections.values() if isinstance(s, str))
         sections['total_tokens_est'] = total_tokens
@@ -121,6 +132,17 @@ class ContextAssemblyService:
 
         return sections
 
+    def _get_self_awareness(self) -> str:
+        """Self-awareness (interoception — only when noteworthy)."""
+        try:
+            from services.self_model_service import SelfModelService
+            service = SelfModelService()
+            if service.has_noteworthy_state():
+                return service.format_for_prompt()
+            return ""
+        except Exception:
+            return ""
+
     def _get_working_memory(self, identifier: str) -> str:
         """Retrieve working memory context. Accepts thread_id or topic."""
         try:
@@ -2,14 +2,37 @@
 Cortex Iteration Service - Batch logging of ACT loop iterations.
 
 Responsibility: Write iteration data to SQLite in batches for reflection analysis.
+Rows go through the write-behind queue, so the ACT loop never waits on the commit.
 """
 
 import uuid
 import json
 from typing import List, Dict, Any
 from services.database_service import DatabaseService
+from services.write_behind_queue import flush_pending, write_behind_many
 import logging
 
+_INSERT_ITERATION_SQL = """
+    INSERT INTO cortex_iterations (
+        id,
+        loop_id, topic, exchange_id, session_id,
+        iteration_number, started_at, completed_at, execution_time_ms,
+        chosen_mode, chosen_confidence, alternative_paths,
+        iteration_cost, diminishing_cost, uncertainty_cost,
+        action_base_cost, total_cost, cumulative_cost,
+        efficiency_score, expected_confidence_gain, task_value, future_leverage, effort_estimate, effort_multiplier, iteration_penalty, exploration_bonus, net_value,
+        decision_override, overridden_mode, termination_reason,
+        actions_executed, action_count, action_success_count,
+        frontal_cortex_response, config_snapshot
+    ) VALUES (
+        ?,
+        ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
+        ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
+        ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
+        ?
+    )
+"""
+
 
 class CortexIterationService:
     """Manages batch logging of cortex iteration data."""
@@ -40,6 +63,7 @@ class CortexIterationService:
         bonus_dict = {action: 0.0 for action in current_actions}
 
         try:
+            flush_pending(self.db_service)
             with self.db_service.connection() as conn:
                 cursor = conn.cursor()
 
@@ -138,69 +162,49 @@ class CortexIterationService:
             return
 
         try:
-            with self.db_service.connection() as conn:
-                cursor = conn.cursor()
-
-                for iteration in iterations:
-                    cursor.execute("""
-                        INSERT INTO cortex_iterations (
-                            id,
-                            loop_id, topic, exchange_id, session_id,
-                            iteration_number, started_at, completed_at, execution_time_ms,
-                            chosen_mode, chosen_confidence, alternative_paths,
-                            iteration_cost, diminishing_cost, uncertainty_cost,
-                            action_base_cost, total_cost, cumulative_cost,
-                            efficiency_score, expected_confidence_gain, task_value, future_leverage, effort_estimate, effort_multiplier, iteration_penalty, exploration_bonus, net_value,
-                            decision_override, overridden_mode, termination_reason,
-                            actions_executed, action_count, action_success_count,
-                            frontal_cortex_response, config_snapshot
-                        ) VALUES (
-                            ?,
-                            ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
-                            ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
-                            ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
-                            ?
-                        )
-                    """, (
-                        str(uuid.uuid4()),
-                        loop_id,
-                        topic,
-                        exchange_id,
-                        session_id,
-                        iteration['iteration_number'],
-                        iteration['started_at'],
-                        iteration['completed_at'],
-                        iteration['execution_time_ms'],
-                        iteration['chosen_mode'],
-                        iteration.get('chosen_confidence', 0.5),
-                        json.dumps(iteration.get('alternative_paths', [])),
-                        iteration.get('iteration_cost', 0.0),
-                        iteration.get('diminishing_cost', 0.0),
-                        iteration.get('uncertainty_cost', 0.0),
-                        iteration.get('action_base_cost', 0.0),
-                        iteration.get('total_cost', 0.0),
-                        iteration.get('cumulative_cost', 0.0),
-                        iteration.get('efficiency_score', 0.0),
-                        iteration.get('expected_confidence_gain', 0.0),
-                        iteration.get('task_value', 0.0),
-                        iteration.get('future_leverage', 0.0),
-                        iteration.get('effort_estimate', 'medium'),
-                        iteration.get('effort_multiplier', 1.2),
-                        iteration.get('iteration_penalty', 1.0),
-                        iteration.get('exploration_bonus', 0.0),
-                        iteration.get('net_value', 0.0),
-                        iteration.get('decision_override', False),
-                        iteration.get('overridden_mode'),
-                        iteration.get('termination_reason'),
-                        json.dumps(iteration.get('actions_executed', [])),
-                        iteration.get('action_count', 0),
-                        iteration.get('action_success_count', 0),
-                        json.dumps(iteration.get('frontal_cortex_response', {})),
-                        json.dumps(iteration.get('config_snapshot', {}))
-                    ))
-
-                # Note: commit handled by context manager
-                logging.info(f"[ITERATION LOG] Logged {len(iterations)} iterations for loop {loop_id}")
+            rows = [
+                (
+                    str(uuid.uuid4()),
+                    loop_id,
+                    topic,
+                    exchange_id,
+                    session_id,
+                    iteration['iteration_number'],
+                    iteration['started_at'],
+                    iteration['completed_at'],
+                    iteration['execution_time_ms'],
+                    iteration['chosen_mode'],
+                    iteration.get('chosen_confidence', 0.5),
+                    json.dumps(iteration.get('alternative_paths', [])),
+                    iteration.get('iteration_cost', 0.0),
+                    iteration.get('diminishing_cost', 0.0),
+                    iteration.get('uncertainty_cost', 0.0),
+                    iteration.get('action_base_cost', 0.0),
+                    iteration.get('total_cost', 0.0),
+                    iteration.get('cumulative_cost', 0.0),
+                    iteration.get('efficiency_score', 0.0),
+                    iteration.get('expected_confidence_gain', 0.0),
+                    iteration.get('task_value', 0.0),
+                    iteration.get('future_leverage', 0.0),
+                    iteration.get('effort_estimate', 'medium'),
+                    iteration.get('effort_multiplier', 1.2),
+                    iteration.get('iteration_penalty', 1.0),
+                    iteration.get('exploration_bonus', 0.0),
+                    iteration.get('net_value', 0.0),
+                    iteration.get('decision_override', False),
+                    iteration.get('overridden_mode'),
+                    iteration.get('termination_reason'),
+                    json.dumps(iteration.get('actions_executed', [])),
+                    iteration.get('action_count', 0),
+                    iteration.get('action_success_count', 0),
+                    json.dumps(iteration.get('frontal_cortex_response', {})),
+                    json.dumps(iteration.get('config_snapshot', {}))
+                )
+                for iteration in iterations
+            ]
+            write_behind_many(self.db_service, _INSERT_ITERATION_SQL, rows)
+
+            logging.info(f"[ITERATION LOG] Logged {len(iterations)} iterations for loop {loop_id}")
 
         except Exception as e:
             logging.error(f"[ITERATION LOG] Failed to log iterations: {e}")
@@ -11,7 +11,6 @@ proactive candidate for delivery to the user.
 import json
 import os
 import time
-import random
 import logging
 from datetime import datetime, timezone
 from typing import Optional, Dict
@@ -35,26 +34,6 @@ class CuriosityPursuitService:
         self.cycle_interval = cycle_interval
         self.jitter = 0.3  # ±30%
 
-    def run(self, shared_state: Optional[dict] = None) -> None:
-        """Main service loop."""
-        logger.info(f"{LOG_PREFIX} Service started (cycle={self.cycle_interval}s)")
-
-        while True:
-            try:
-                # Sleep with jitter
-                jitter_factor = 1.0 + random.uniform(-self.jitter, self.jitter)
-                sleep_time = self.cycle_interval * jitter_factor
-                time.sleep(sleep_time)
-
-                self.run_once()
-
-            except KeyboardInterrupt:
-                logger.info(f"{LOG_PREFIX} Service shutting down...")
-                break
-            except Exception as e:
-                logger.error(f"{LOG_PREFIX} Cycle error: {e}", exc_info=True)
-                time.sleep(300)  # 5min backoff on error
-
     def _are_workers_idle(self) -> bool:
         """Check if main worker queues are empty (avoid competing with user-facing work)."""
         try:
@@ -553,9 +532,8 @@ class CuriosityPursuitService:
         return dot / (norm_a * norm_b)
 
 
-def curiosity_pursuit_worker(shared_state=None):
-    """Module-level wrapper for threading."""
-    logging.basicConfig(level=logging.INFO)
+def register_curiosity_pursuit_job(scheduler) -> None:
+    """Register jittered exploration cycles on the job scheduler."""
     try:
         config = ConfigService.resolve_agent_config("cognitive-drift")
         cycle_interval = config.get('curiosity_pursuit_interval', 21600)
@@ -563,4 +541,7 @@ def curiosity_pursuit_worker(shared_state=None):
         cycle_interval = 21600
 
     service = CuriosityPursuitService(cycle_interval=cycle_interval)
-    service.run(shared_state)
+    scheduler.add_job(
+        "curiosity-pursuit", service.run_once,
+        interval=service.cycle_interval, jitter=service.jitter,
+    )
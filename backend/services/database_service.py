@@ -1,18 +1,43 @@
 """
-Database Service — SQLite connection management with thread-local connections.
+Database Service — SQLite connection management.
 
 Replaces the PostgreSQL/SQLAlchemy implementation with sqlite3 + sqlite-vec + FTS5.
-Each thread gets its own connection via threading.local(). WAL mode enables
-concurrent reads during writes.
+WAL mode enables concurrent reads during writes. Three kinds of connection:
+
+- Writer: one connection per database owned by a dedicated thread, fed by a
+  job queue. write()/submit_write()/execute()/executemany() run there in
+  order, so writes never fight each other for SQLite's writer lock (no
+  busy_timeout sleeps). Every job's queue wait and execution time is recorded
+  per statement.
+- Readers: a bounded pool of `mode=ro` connections for read() and
+  fetch_all_ro(). They only see committed data.
+- Thread-local: connection()/get_session()/fetch_all() keep a read-write
+  connection per thread for existing mixed read/write blocks. They are
+  tracked and closed once their thread has exited, so short-lived worker
+  threads don't leak file descriptors.
+
+Writes made inside connection()/get_session() blocks still take SQLite's
+writer lock directly and can wait in busy_timeout alongside the writer
+thread. Only the paths that call write()/execute()/executemany() are
+serialized: write-behind flushes, access-tracker batches, decay chunks
+and bulk import.
 """
 
+import atexit
 import logging
 import os
+import queue
+import re
 import sqlite3
 import threading
+import time
 import uuid
+from collections import OrderedDict
+from concurrent.futures import Future
 from contextlib import contextmanager
 from pathlib import Path
+from typing import Any, Callable, Optional
+from urllib.parse import quote
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +64,20 @@ _DEFAULT_DB_PATH = str(Path(__file__).resolve().parent.parent / "data" / "chalie
 # ── Thread-local storage for connections ────────────────────────
 _local = threading.local()
 
+# Thread-local connections by thread ident: (thread, connection), reaped when the thread exits
+_thread_connections: dict = {}
+_thread_connections_lock = threading.Lock()
+
+# Prepared statements kept per connection by sqlite3 (default is 128)
+_CACHED_STATEMENTS = 512
+
+# Read-only connections per database
+_READER_POOL_SIZE = int(os.environ.get("CHALIE_DB_READERS", "4"))
+# Writer thread exits (and closes its connection) after this long without jobs
+_WRITER_IDLE_SECONDS = 60.0
+# Distinct statement labels kept in the timing table
+_STATEMENT_STATS_MAX = 256
+
 # ── Singleton DatabaseService ───────────────────────────────────
 _shared_db_service = None
 _shared_lock = threading.Lock()
@@ -64,6 +103,72 @@ def get_shared_db_service() -> 'DatabaseService':
 get_lightweight_db_service = get_shared_db_service
 
 
+# ── Named-parameter statement cache ─────────────────────────────
+_NAMED_PARAM = re.compile(r':(\w+)')
+_STATEMENT_CACHE_SIZE = 1024
+
+
+class _StatementCache:
+    """
+    LRU of compiled named-parameter statements, keyed by SQL text.
+
+    Each entry holds the SQL with :name placeholders rewritten to ? and the
+    ordered tuple of parameter names, so repeat executions skip the regex pass
+    and bind params with a single list build.
+    """
+
+    def __init__(self, maxsize: int = _STATEMENT_CACHE_SIZE):
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+    def compile(self, sql: str) -> tuple:
+        """Return (positional_sql, param_names) for a :name-style statement."""
+        with self._lock:
+            entry = self._entries.get(sql)
+            if entry is not None:
+                self._entries.move_to_end(sql)
+                self.hits += 1
+                return entry
+            self.misses += 1
+
+        names = tuple(_NAMED_PARAM.findall(sql))
+        entry = (_NAMED_PARAM.sub('?', sql), names)
+
+        with self._lock:
+            self._entries[sql] = entry
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+        return entry
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'max_size': self._maxsize,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_statement_cache = _StatementCache()
+
+
+def get_statement_cache_stats() -> dict:
+    """Size and hit rate of the SessionProxy statement cache."""
+    return _statement_cache.stats()
+
+
 class SessionProxy:
     """
     Lightweight shim that mimics SQLAlchemy session.execute(text("SQL"), params).
@@ -85,16 +190,10 @@ class SessionProxy:
         sql = str(sql_or_text)
 
         if params and isinstance(params, dict):
-            # Convert :name params to ? positional params
-            import re
-            ordered_params = []
-            def _replace(match):
-                key = match.group(1)
-                ordered_params.append(params[key])
-                return '?'
-            sql = re.sub(r':(\w+)', _replace, sql)
+            # Convert :name params to ? positional params (compiled once per SQL text)
+            sql, names = _statement_cache.compile(sql)
             cursor = self._conn.cursor()
-            cursor.execute(sql, ordered_params)
+            cursor.execute(sql, [params[name] for name in names])
         else:
             cursor = self._conn.cursor()
             if params:
@@ -191,8 +290,323 @@ class DictCursor:
         return (dict(row) for row in self._cursor)
 
 
+def _open_connection(db_path: str, read_only: bool = False) -> sqlite3.Connection:
+    """Open a configured connection (WAL, pragmas, sqlite-vec)."""
+    if read_only:
+        conn = sqlite3.connect(
+            f"file:{quote(db_path)}?mode=ro", uri=True, timeout=30,
+            cached_statements=_CACHED_STATEMENTS, check_same_thread=False,
+        )
+        conn.execute("PRAGMA query_only=ON")
+    else:
+        # check_same_thread=False so the reaper can close a dead thread's connection
+        conn = sqlite3.connect(
+            db_path, timeout=30, cached_statements=_CACHED_STATEMENTS, check_same_thread=False,
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA foreign_keys=ON")
+        conn.execute("PRAGMA synchronous=NORMAL")
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA busy_timeout=15000")
+    conn.execute("PRAGMA temp_store=MEMORY")
+
+    # Load sqlite-vec extension
+    try:
+        conn.enable_load_extension(True)
+        import sqlite_vec
+        sqlite_vec.load(conn)
+    except Exception as e:
+        logger.warning(f"[DB] sqlite-vec not available: {e}")
+    return conn
+
+
+def _reap_thread_connections() -> int:
+    """Close thread-local connections whose thread has exited. Returns how many are still open."""
+    with _thread_connections_lock:
+        dead = [ident for ident, (thread, _) in _thread_connections.items() if not thread.is_alive()]
+        conns = [_thread_connections.pop(ident)[1] for ident in dead]
+        remaining = len(_thread_connections)
+    for conn in conns:
+        try:
+            conn.close()
+        except Exception:
+            pass
+    if conns:
+        logger.debug(f"[DB] Closed {len(conns)} connections of exited threads")
+    return remaining
+
+
+# ── Statement timings ───────────────────────────────────────────
+_STATEMENT_VERB = re.compile(r'^\s*(\w+)')
+_STATEMENT_TABLE = re.compile(r'\b(?:INTO|UPDATE|FROM)\s+(\w+)', re.IGNORECASE)
+
+
+def _statement_label(sql: str) -> str:
+    """'UPDATE episodes SET ...' → 'UPDATE EPISODES' (a bounded key for timings)."""
+    verb = _STATEMENT_VERB.match(sql)
+    table = _STATEMENT_TABLE.search(sql)
+    return " ".join(m.group(1) for m in (verb, table) if m).upper() or "SQL"
+
+
+class _StatementTimings:
+    """Per-statement count, queue wait and execution time (ms) for writer jobs."""
+
+    def __init__(self, maxsize: int = _STATEMENT_STATS_MAX):
+        self._entries: dict = {}
+        self._lock = threading.Lock()
+        self._maxsize = maxsize
+
+    def record(self, label: str, wait_ms: float, exec_ms: float) -> None:
+        with self._lock:
+            entry = self._entries.get(label)
+            if entry is None:
+                if len(self._entries) >= self._maxsize:
+                    label = 'other'
+                entry = self._entries.setdefault(label, [0, 0.0, 0.0, 0.0, 0.0])
+            entry[0] += 1
+            entry[1] += wait_ms
+            entry[2] = max(entry[2], wait_ms)
+            entry[3] += exec_ms
+            entry[4] = max(entry[4], exec_ms)
+
+        from services.metrics_registry import get_metrics_registry
+        registry = get_metrics_registry()
+        registry.observe('db.write.wait', wait_ms)
+        registry.observe('db.write.exec', exec_ms)
+
+    def snapshot(self, top: int = 20) -> dict:
+        """The top statements by total execution time."""
+        with self._lock:
+            items = sorted(self._entries.items(), key=lambda kv: kv[1][3], reverse=True)[:top]
+        return {
+            label: {
+                'count': count,
+                'avg_wait_ms': round(wait_total / count, 3),
+                'max_wait_ms': round(wait_max, 3),
+                'avg_exec_ms': round(exec_total / count, 3),
+                'max_exec_ms': round(exec_max, 3),
+            }
+            for label, (count, wait_total, wait_max, exec_total, exec_max) in items
+        }
+
+
+class _ReaderPool:
+    """Bounded pool of read-only connections to one database file."""
+
+    def __init__(self, db_path: str, size: int = _READER_POOL_SIZE):
+        self.db_path = db_path
+        self.size = max(1, size)
+        self._idle: list = []
+        self._open = 0
+        self._cond = threading.Condition()
+        self.acquisitions = 0
+        self.waits = 0
+
+    def acquire(self) -> sqlite3.Connection:
+        with self._cond:
+            self.acquisitions += 1
+            if not self._idle and self._open >= self.size:
+                self.waits += 1
+                start = time.perf_counter()
+                while not self._idle and self._open >= self.size:
+                    self._cond.wait()
+                from services.metrics_registry import get_metrics_registry
+                get_metrics_registry().observe('db.read.wait', (time.perf_counter() - start) * 1000)
+            if self._idle:
+                return self._idle.pop()
+            self._open += 1
+        try:
+            if not os.path.exists(self.db_path):
+                # mode=ro can't create the file; a first-ever read sees an empty database
+                sqlite3.connect(self.db_path).close()
+            return _open_connection(self.db_path, read_only=True)
+        except Exception:
+            with self._cond:
+                self._open -= 1
+                self._cond.notify()
+            raise
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        try:
+            conn.rollback()   # end the read transaction so WAL checkpoints can progress
+        except Exception:
+            conn.close()
+            conn = None
+        with self._cond:
+            if conn is None:
+                self._open -= 1
+            else:
+                self._idle.append(conn)
+            self._cond.notify()
+
+    def close(self) -> None:
+        """Close idle connections (checked-out ones are closed by their next release)."""
+        with self._cond:
+            idle, self._idle = self._idle, []
+            self._open -= len(idle)
+        for conn in idle:
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {
+                'size': self.size,
+                'open': self._open,
+                'in_use': self._open - len(self._idle),
+                'acquisitions': self.acquisitions,
+                'waits': self.waits,
+            }
+
+
+class _Writer:
+    """
+    The single writing connection for one database, owned by its own thread.
+
+    Jobs are fn(conn) callables run in submission order; each is its own
+    transaction (commit on return, rollback on exception) and its result or
+    exception is delivered through a Future. The thread starts on the first
+    job and exits after _WRITER_IDLE_SECONDS without work.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._jobs: "queue.Queue" = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._conn: Optional[sqlite3.Connection] = None
+        self.timings = _StatementTimings()
+        self.jobs_done = 0
+        self.jobs_failed = 0
+
+    def submit(self, fn: Callable[[sqlite3.Connection], Any], label: str) -> Future:
+        future = Future()
+        if threading.current_thread() is self._thread:
+            # Re-entrant write from inside a job: run it in that job's transaction
+            try:
+                future.set_result(fn(self._conn))
+            except Exception as e:
+                future.set_exception(e)
+            return future
+
+        with self._lock:
+            self._jobs.put((fn, label, future, time.perf_counter()))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True, name="db-writer")
+                self._thread.start()
+        return future
+
+    def _run(self) -> None:
+        while True:
+            try:
+                job = self._jobs.get(timeout=_WRITER_IDLE_SECONDS)
+            except queue.Empty:
+                job = None
+            if job is None:
+                # Idle or asked to stop: exit unless work arrived meanwhile
+                with self._lock:
+                    if self._jobs.empty():
+                        self._exit()
+                        return
+                continue
+
+            fn, label, future, enqueued = job
+            if not future.set_running_or_notify_cancel():
+                continue
+            started = time.perf_counter()
+            try:
+                if self._conn is None:
+                    self._conn = _open_connection(self.db_path)
+                result = fn(self._conn)
+                self._conn.commit()
+            except BaseException as e:
+                self.jobs_failed += 1
+                try:
+                    self._conn.rollback()
+                except Exception:
+                    pass
+                future.set_exception(e)
+            else:
+                self.jobs_done += 1
+                future.set_result(result)
+            self.timings.record(label, (started - enqueued) * 1000, (time.perf_counter() - started) * 1000)
+
+    def _exit(self) -> None:
+        """Runs on the writer thread with _lock held."""
+        self._thread = None
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+            self._conn = None
+
+    def stop(self, timeout: float = 10) -> None:
+        """Finish queued jobs, then stop the thread (a later submit starts a new one)."""
+        with self._lock:
+            thread = self._thread
+            if thread is None:
+                return
+            self._jobs.put(None)
+        thread.join(timeout=timeout)
+
+    def stats(self) -> dict:
+        return {
+            'queued': self._jobs.qsize(),
+            'running': self._thread is not None,
+            'jobs_done': self.jobs_done,
+            'jobs_failed': self.jobs_failed,
+            'statements': self.timings.snapshot(),
+        }
+
+
+# One writer and one reader pool per database file, shared by every DatabaseService
+_writers: dict = {}
+_reader_pools: dict = {}
+_engines_lock = threading.Lock()
+
+
+def _get_writer(db_path: str) -> _Writer:
+    writer = _writers.get(db_path)
+    if writer is None:
+        with _engines_lock:
+            writer = _writers.setdefault(db_path, _Writer(db_path))
+    return writer
+
+
+def _get_reader_pool(db_path: str) -> _ReaderPool:
+    pool = _reader_pools.get(db_path)
+    if pool is None:
+        with _engines_lock:
+            pool = _reader_pools.setdefault(db_path, _ReaderPool(db_path))
+    return pool
+
+
+def _shutdown_engines() -> None:
+    """Drain writer queues at exit. Registered on import, so atexit runs it after
+    the write-behind and access-tracker shutdown flushes that feed the writer."""
+    for writer in list(_writers.values()):
+        writer.stop()
+    for pool in list(_reader_pools.values()):
+        pool.close()
+
+
+atexit.register(_shutdown_engines)
+
+
+def get_database_stats() -> dict:
+    """Writer queues and statement timings, reader pools, open thread-local connections."""
+    return {
+        'thread_connections': _reap_thread_connections(),
+        'writers': {path: writer.stats() for path, writer in list(_writers.items())},
+        'reader_pools': {path: pool.stats() for path, pool in list(_reader_pools.items())},
+    }
+
+
 class DatabaseService:
-    """Manages SQLite connections with thread-local isolation and WAL mode."""
+    """Manages SQLite connections: serialized writer, read-only pool, thread-local legacy connections."""
 
     def __init__(self, db_path: str = None):
         self.db_path = db_path or get_db_path()
@@ -211,25 +625,15 @@ class DatabaseService:
                 except Exception:
                     pass
 
-            conn = sqlite3.connect(self.db_path, timeout=30)
-            conn.row_factory = sqlite3.Row
-            conn.execute("PRAGMA journal_mode=WAL")
-            conn.execute("PRAGMA foreign_keys=ON")
-            conn.execute("PRAGMA busy_timeout=15000")
-            conn.execute("PRAGMA synchronous=NORMAL")
-            conn.execute("PRAGMA temp_store=MEMORY")
-
-            # Load sqlite-vec extension
-            try:
-                conn.enable_load_extension(True)
-                import sqlite_vec
-                sqlite_vec.load(conn)
-            except Exception as e:
-                logger.warning(f"[DB] sqlite-vec not available: {e}")
+            _reap_thread_connections()
+            conn = _open_connection(self.db_path)
+            thread = threading.current_thread()
+            with _thread_connections_lock:
+                _thread_connections[thread.ident] = (thread, conn)
 
             _local.conn = conn
             _local.db_path = self.db_path
-            logger.debug(f"[DB] New connection for thread {threading.current_thread().name}")
+            logger.debug(f"[DB] New connection for thread {thread.name}")
 
         return conn
 
@@ -255,21 +659,71 @@ class DatabaseService:
             conn.rollback()
             raise
 
-    def execute(self, sql, params=None):
-        """Execute a write statement (INSERT/UPDATE/DELETE) with auto-commit."""
+    @contextmanager
+    def read(self):
+        """
+        Pooled read-only connection for SELECT-only blocks.
+
+        Runs on its own connection, so it doesn't see writes still uncommitted
+        in this thread's connection() block.
+        """
+        pool = _get_reader_pool(self.db_path)
+        conn = pool.acquire()
+        try:
+            yield conn
+        finally:
+            pool.release(conn)
+
+    def submit_write(self, fn: Callable[[sqlite3.Connection], Any], label: str = None) -> Future:
+        """
+        Queue fn(conn) on the database's writer thread; it runs in its own transaction.
+
+        Returns a Future with fn's return value (or its exception).
+        """
+        local = getattr(_local, 'conn', None)
+        if local is not None and _local.db_path == self.db_path and local.in_transaction:
+            # Inside an open connection() write block the writer would wait on
+            # this thread's own lock — join the caller's transaction instead.
+            future = Future()
+            try:
+                future.set_result(fn(local))
+            except Exception as e:
+                future.set_exception(e)
+            return future
+        return _get_writer(self.db_path).submit(fn, label or getattr(fn, '__qualname__', 'write'))
+
+    def write(self, fn: Callable[[sqlite3.Connection], Any], label: str = None, timeout: float = None):
+        """Run fn(conn) on the writer thread and wait for its result."""
+        return self.submit_write(fn, label).result(timeout)
+
+    def execute(self, sql, params=None) -> int:
+        """Execute a write statement (INSERT/UPDATE/DELETE) on the writer. Returns rowcount."""
+        def run(conn):
+            cursor = conn.execute(sql) if params is None else conn.execute(sql, params)
+            return cursor.rowcount
+        return self.write(run, label=_statement_label(sql))
+
+    def executemany(self, sql, rows) -> int:
+        """Execute one write statement for many rows in a single writer transaction."""
+        return self.write(lambda conn: conn.executemany(sql, rows).rowcount, label=_statement_label(sql))
+
+    def fetch_all(self, sql, params=None):
+        """Execute a SELECT and return all rows as list[dict].
+
+        Runs on this thread's connection, so it sees writes still uncommitted
+        in an enclosing connection() block.
+        """
         with self.connection() as conn:
-            cursor = conn.cursor()
+            cursor = DictCursor(conn.cursor())
             try:
-                if params is None:
-                    cursor.execute(sql)
-                else:
-                    cursor.execute(sql, params)
+                cursor.execute(sql, params)
+                return cursor.fetchall()
             finally:
                 cursor.close()
 
-    def fetch_all(self, sql, params=None):
-        """Execute a SELECT and return all rows as list[dict]."""
-        with self.connection() as conn:
+    def fetch_all_ro(self, sql, params=None):
+        """fetch_all() on a pooled read-only connection (committed data only)."""
+        with self.read() as conn:
             cursor = DictCursor(conn.cursor())
             try:
                 cursor.execute(sql, params)
@@ -297,6 +751,8 @@ class DatabaseService:
         """Close the thread-local connection if it exists."""
         conn = getattr(_local, 'conn', None)
         if conn:
+            with _thread_connections_lock:
+                _thread_connections.pop(threading.get_ident(), None)
             try:
                 conn.close()
             except Exception:
@@ -1,14 +1,12 @@
 """
 Decay Engine Service - Unified periodic decay scheduler across all memory types.
 
-Background service that periodically decays episodic activation scores and
-semantic concept strength. Follows IdleConsolidationService pattern.
+Periodically decays episodic activation scores and semantic concept strength.
+Runs as a job on the shared job scheduler (see job_scheduler_service).
 """
 
-import time
 import math
 import logging
-from typing import Optional
 
 from .memory_client import MemoryClientService
 from .config_service import ConfigService
@@ -22,6 +20,82 @@ RELIABILITY_DECAY_MULTIPLIER = {
     'superseded':  3.0,
 }
 
+# tool_reflection episodes decay faster the less durable their content is
+DURABILITY_DECAY_MULTIPLIER = {
+    'transient': 2.0,
+    'evolving':  1.5,
+}
+CRON_TOOL_DECAY_MULTIPLIER = 3.0
+
+# Rowid span covered by one decay transaction
+_DECAY_CHUNK_ROWS = 5000
+
+_HOURS_SINCE_ACCESS = (
+    "(CAST(strftime('%s', 'now') AS REAL)"
+    " - CAST(strftime('%s', COALESCE(last_accessed_at, created_at)) AS REAL)) / 3600.0"
+)
+
+_EPISODIC_ACTIVATION = f"""MAX(0.1, activation_score * exp(
+            -:rate
+            * durability_multiplier(json_extract(salience_factors, '$.source'),
+                                    json_extract(salience_factors, '$.durability'))
+            * reliability_multiplier(reliability)
+            * {_HOURS_SINCE_ACCESS}
+        ))"""
+
+_EPISODIC_DECAY_SQL = f"""
+    UPDATE episodes
+    SET activation_score = {_EPISODIC_ACTIVATION}
+    WHERE rowid BETWEEN :lo AND :hi
+      AND deleted_at IS NULL
+      AND activation_score > 0.1
+      AND COALESCE(last_accessed_at, created_at) < datetime('now', '-1 hour')
+      AND ABS({_EPISODIC_ACTIVATION} - activation_score) > 0.0001
+"""
+
+_SEMANTIC_DECAY_SQL = """
+    UPDATE semantic_concepts
+    SET strength = MAX(
+            0.2,
+            strength - :rate * (1.0 - COALESCE(decay_resistance, 0.5)) * reliability_multiplier(reliability)
+        ),
+        updated_at = datetime('now')
+    WHERE rowid BETWEEN :lo AND :hi
+      AND deleted_at IS NULL
+      AND strength > 0.2
+      AND last_accessed_at < datetime('now', '-1 hour')
+"""
+
+
+def reliability_multiplier(reliability) -> float:
+    """Decay multiplier for a reliability label (NULL counts as reliable)."""
+    return RELIABILITY_DECAY_MULTIPLIER.get(reliability or 'reliable', 1.0)
+
+
+def durability_multiplier(source, durability) -> float:
+    """Decay multiplier from an episode's salience_factors source/durability."""
+    if durability == 'cron_tool':
+        return CRON_TOOL_DECAY_MULTIPLIER
+    if source == 'tool_reflection':
+        return DURABILITY_DECAY_MULTIPLIER.get(durability, 1.0)
+    return 1.0
+
+
+def _sql_exp(x):
+    return None if x is None else math.exp(x)
+
+
+def register_decay_functions(conn) -> None:
+    """
+    Register the decay math on a SQLite connection so decay runs as plain UPDATEs.
+
+    exp() is only built into SQLite when compiled with math functions, so it is
+    always registered here. All three are deterministic.
+    """
+    conn.create_function('exp', 1, _sql_exp, deterministic=True)
+    conn.create_function('reliability_multiplier', 1, reliability_multiplier, deterministic=True)
+    conn.create_function('durability_multiplier', 2, durability_multiplier, deterministic=True)
+
 
 class DecayEngineService:
     """Background service that applies decay to all memory types periodically."""
@@ -40,9 +114,11 @@ class DecayEngineService:
             episodic_config = ConfigService.get_agent_config("episodic-memory")
             self.episodic_decay_rate = episodic_config.get('episodic_decay_rate', 0.05)
             self.semantic_decay_rate = episodic_config.get('semantic_decay_rate', 0.03)
+            self.decay_chunk_rows = max(1, int(episodic_config.get('decay_chunk_rows', _DECAY_CHUNK_ROWS)))
         except Exception:
             self.episodic_decay_rate = 0.05
             self.semantic_decay_rate = 0.03
+            self.decay_chunk_rows = _DECAY_CHUNK_ROWS
 
         logger.info(
             f"[DECAY ENGINE] Initialized "
@@ -51,45 +127,33 @@ class DecayEngineService:
             f"semantic_rate={self.semantic_decay_rate})"
         )
 
-    def run(self, shared_state: Optional[dict] = None) -> None:
-        """
-        Main service loop - periodically runs decay cycles.
-
-        Args:
-            shared_state: Optional shared state dict (for consumer integration)
-        """
-        logger.info("[DECAY ENGINE] Service started")
-
-        while True:
-            try:
-                time.sleep(self.decay_interval)
-
-                # Self-regulation: check memory richness before decaying
-                try:
-                    from services.self_model_service import SelfModelService
-                    richness = SelfModelService().get_memory_richness()
-                    if richness < 0.1:
-                        logger.debug(f"[DECAY ENGINE] Richness {richness:.2f} < 0.1, skipping cycle")
-                        continue
-                except Exception:
-                    richness = 1.0  # fail-open: run decay if telemetry unavailable
-
-                logger.info("[DECAY ENGINE] Running decay cycle...")
-                self.run_decay_cycle(richness=richness)
+    def run_scheduled_cycle(self) -> None:
+        """Job entry point: gate on memory richness, then run one decay cycle."""
+        # Self-regulation: check memory richness before decaying
+        try:
+            from services.self_model_service import SelfModelService
+            richness = SelfModelService().get_memory_richness()
+            if richness < 0.1:
+                logger.debug(f"[DECAY ENGINE] Richness {richness:.2f} < 0.1, skipping cycle")
+                return
+        except Exception:
+            richness = 1.0  # fail-open: run decay if telemetry unavailable
 
-            except KeyboardInterrupt:
-                logger.info("[DECAY ENGINE] Service shutting down...")
-                break
-            except Exception as e:
-                logger.error(f"[DECAY ENGINE] Error: {e}", exc_info=True)
-                logger.info("[DECAY ENGINE] Waiting 1 minute before retry...")
-                time.sleep(60)
+        logger.info("[DECAY ENGINE] Running decay cycle...")
+        self.run_decay_cycle(richness=richness)
 
     def run_decay_cycle(self, richness: float = 1.0):
         """Run one full decay cycle across all memory types.
 
         When richness < 0.3, only essential sub-cycles run (episodic + traits).
         """
+        # Land pending retrieval hits first so just-accessed memories aren't decayed
+        try:
+            from .access_tracker import flush_access_tracking
+            flush_access_tracking()
+        except Exception as e:
+            logger.warning(f"[DECAY ENGINE] Access tracker flush failed: {e}")
+
         episodic_count = self._decay_episodic()
         trait_stats = self._decay_user_traits()
 
@@ -114,14 +178,40 @@ class DecayEngineService:
             f"threads={thread_dormancy} dormancy-applied"
         )
 
+    def _decay_in_chunks(self, db_service, table: str, sql: str, params: dict) -> int:
+        """
+        Run a set-based decay UPDATE over table one rowid range at a time.
+
+        Each range is its own short job on the database writer, so a cycle over a
+        large table never holds the writer lock for more than one chunk.
+
+        Returns:
+            Number of rows updated
+        """
+        with db_service.read() as conn:
+            low, high = conn.execute(f"SELECT MIN(rowid), MAX(rowid) FROM {table}").fetchone()
+        if low is None:
+            return 0
+
+        def decay_chunk(conn, chunk_params):
+            register_decay_functions(conn)
+            return conn.execute(sql, chunk_params).rowcount
+
+        updated = 0
+        for start in range(low, high + 1, self.decay_chunk_rows):
+            chunk_params = {**params, 'lo': start, 'hi': start + self.decay_chunk_rows - 1}
+            updated += db_service.write(lambda conn: decay_chunk(conn, chunk_params), label=f"decay {table}")
+        return updated
+
     def _decay_episodic(self) -> int:
         """
         Apply exponential decay to episodic activation scores.
 
-        Formula: activation_score = activation_score * exp(-decay_rate * hours_since_access)
+        Formula: activation_score = MAX(0.1, activation_score * exp(-rate * hours_since_access))
+        where rate = episodic_decay_rate * durability multiplier * reliability multiplier.
 
-        SQLite lacks EXP(), so we fetch eligible rows, compute decay in Python,
-        then batch-UPDATE.
+        Runs as chunked set-based UPDATEs using the SQL functions from
+        register_decay_functions().
 
         Returns:
             Number of episodes updated
@@ -132,78 +222,12 @@ class DecayEngineService:
             db_service = get_lightweight_db_service()
 
             try:
-                with db_service.connection() as conn:
-                    cursor = conn.cursor()
-
-                    # Fetch episodes eligible for decay (activation > floor, older than 1 hour)
-                    cursor.execute("""
-                        SELECT id, activation_score,
-                               (CAST(strftime('%s', 'now') AS REAL) - CAST(strftime('%s', COALESCE(last_accessed_at, created_at)) AS REAL)) / 3600.0 AS hours_since,
-                               json_extract(salience_factors, '$.source') AS sf_source,
-                               json_extract(salience_factors, '$.durability') AS sf_durability,
-                               COALESCE(reliability, 'reliable') AS reliability
-                        FROM episodes
-                        WHERE deleted_at IS NULL
-                          AND activation_score > 0.1
-                          AND COALESCE(last_accessed_at, created_at) < datetime('now', '-1 hour')
-                    """)
-                    rows = cursor.fetchall()
-
-                    updated = 0
-                    durability_updated = 0
-                    cron_tool_updated = 0
-
-                    for row in rows:
-                        episode_id, activation_score, hours_since, sf_source, sf_durability, reliability = row
-
-                        # Determine effective decay rate
-                        rate = self.episodic_decay_rate
-
-                        # Durability-based accelerated decay for tool_reflection episodes
-                        if sf_source == 'tool_reflection':
-                            if sf_durability == 'transient':
-                                rate = self.episodic_decay_rate * 2.0
-                                durability_updated += 1
-                            elif sf_durability == 'evolving':
-                                rate = self.episodic_decay_rate * 1.5
-                                durability_updated += 1
-
-                        # 3x accelerated decay for cron_tool episodes
-                        if sf_durability == 'cron_tool':
-                            rate = self.episodic_decay_rate * 3.0
-                            cron_tool_updated += 1
-
-                        # Reliability multiplier: contradicted/uncertain memories decay faster
-                        rate *= RELIABILITY_DECAY_MULTIPLIER.get(reliability, 1.0)
-
-                        # Compute new activation: activation * exp(-rate * hours)
-                        new_activation = max(0.1, activation_score * math.exp(-rate * hours_since))
-
-                        if abs(new_activation - activation_score) > 0.0001:
-                            cursor.execute("""
-                                UPDATE episodes
-                                SET activation_score = ?
-                                WHERE id = ?
-                            """, (new_activation, episode_id))
-                            updated += 1
-
-                    if durability_updated > 0:
-                        logger.info(
-                            f"[DECAY ENGINE] Applied durability-based decay to "
-                            f"{durability_updated} tool_reflection episodes"
-                        )
-
-                    if cron_tool_updated > 0:
-                        logger.info(
-                            f"[DECAY ENGINE] Applied 3x decay to "
-                            f"{cron_tool_updated} cron_tool episodes"
-                        )
-
-                    cursor.close()
-
-                    if updated > 0:
-                        logger.info(f"[DECAY ENGINE] Decayed {updated} episodic activation scores")
-                    return updated
+                updated = self._decay_in_chunks(
+                    db_service, 'episodes', _EPISODIC_DECAY_SQL, {'rate': self.episodic_decay_rate},
+                )
+                if updated > 0:
+                    logger.info(f"[DECAY ENGINE] Decayed {updated} episodic activation scores")
+                return updated
 
             except Exception as e:
                 logger.error(f"[DECAY ENGINE] Episodic decay failed: {e}")
@@ -219,7 +243,7 @@ class DecayEngineService:
         """
         Apply decay to semantic concept strength, respecting decay_resistance.
 
-        Formula: strength = MAX(0.2, strength - (decay_rate * (1 - decay_resistance)))
+        Formula: strength = MAX(0.2, strength - (decay_rate * (1 - decay_resistance) * reliability multiplier))
 
         Returns:
             Number of concepts updated
@@ -230,38 +254,19 @@ class DecayEngineService:
             db_service = get_lightweight_db_service()
 
             try:
-                with db_service.connection() as conn:
-                    cursor = conn.cursor()
-
-                    # Batch update: decay strength respecting decay_resistance and reliability.
-                    # Reliability multiplier is embedded in SQL via CASE to keep this a
-                    # single-pass batch UPDATE (avoids a costly row-by-row Python loop).
-                    cursor.execute("""
-                        UPDATE semantic_concepts
-                        SET strength = MAX(
-                            0.2,
-                            strength - (
-                                ? * (1.0 - COALESCE(decay_resistance, 0.5)) *
-                                CASE COALESCE(reliability, 'reliable')
-                                    WHEN 'uncertain'    THEN 1.5
-                                    WHEN 'contradicted' THEN 2.0
-                                    WHEN 'superseded'   THEN 3.0
-                                    ELSE 1.0
-                                END
-                            )
-                        ),
-                        updated_at = datetime('now')
-                        WHERE deleted_at IS NULL
-                          AND strength > 0.2
-                          AND last_accessed_at < datetime('now', '-1 hour')
-                    """, (self.semantic_decay_rate,))
-
-                    updated = cursor.rowcount
-                    cursor.close()
-
-                    if updated > 0:
-                        logger.info(f"[DECAY ENGINE] Decayed {updated} semantic concept strengths")
-                    return updated
+                updated = self._decay_in_chunks(
+                    db_service, 'semantic_concepts', _SEMANTIC_DECAY_SQL, {'rate': self.semantic_decay_rate},
+                )
+
+                if updated > 0:
+                    logger.info(f"[DECAY ENGINE] Decayed {updated} semantic concept strengths")
+                    # Keep the resident retrieval index in step without reloading embeddings
+                    try:
+                        from .concept_index import get_concept_index
+                        get_concept_index().refresh_scalars(db_service)
+                    except Exception as e:
+                        logger.warning(f"[DECAY ENGINE] Concept index refresh failed: {e}")
+                return updated
 
             except Exception as e:
                 logger.error(f"[DECAY ENGINE] Semantic decay failed: {e}")
@@ -396,12 +401,8 @@ class DecayEngineService:
             return 0
 
 
-def decay_engine_worker(shared_state=None):
-    """
-    Module-level wrapper for threading.
-    Instantiates the service inside the child process.
-    """
-    # Read config inside child process
+def register_decay_engine_job(scheduler) -> None:
+    """Register the periodic decay cycle on the job scheduler."""
     try:
         episodic_config = ConfigService.get_agent_config("episodic-memory")
         decay_interval = episodic_config.get('decay_interval_seconds', 1800)
@@ -409,4 +410,4 @@ def decay_engine_worker(shared_state=None):
         decay_interval = 1800
 
     service = DecayEngineService(decay_interval=decay_interval)
-    service.run(shared_state)
+    scheduler.add_job("decay-engine", service.run_scheduled_cycle, interval=decay_interval)
@@ -4,9 +4,30 @@ Unified Embedding Service — Single source of truth for all vector embeddings.
 Uses sentence-transformers (all-mpnet-base-v2) — pure Python, no external service required.
 All outputs are L2-normalized for cosine similarity via dot product.
 
-Embeddings are cached in MemoryStore (1h TTL) keyed by text hash. Identical text
-never hits the model twice within the TTL window, regardless of which service
-requests it (reflex, topic classifier, context assembly, etc.).
+Embeddings are cached in two tiers keyed by text hash:
+- L1: a bounded in-process LRU of read-only arrays (float16 by default, which
+  halves memory; cosine error is ~1e-3, well below any threshold in use).
+- L2: MemoryStore (1h TTL, stored as float32 binary arrays — no JSON
+  round-trip, persisted across restarts under the `emb:` prefix).
+Identical text never hits the model twice within the TTL window, regardless of
+which service requests it (reflex, topic classifier, context assembly, etc.).
+Batch calls consult the cache too; only misses are sent to the model, in a
+single batched encode. Hit/miss/eviction counters: get_cache_stats().
+
+Cache misses from every caller go through a shared micro-batcher: a dispatcher
+thread gathers requests for up to `window_ms` (or `max_batch` texts) and runs
+one batched encode, so concurrent callers share SIMD throughput instead of
+serializing single-text encodes inside torch. sentence-transformers sorts each
+batch by length internally, so padding stays bucketed. window_ms = 0 disables
+batching (direct encode on the caller's thread).
+
+The model runs behind a pluggable backend ("embedding_backend" in config):
+- torch (default): sentence-transformers on PyTorch.
+- onnx: an exported graph of the same model on ONNX Runtime (optionally int8
+  dynamically quantized), with the tokenizer shared with the ONNX classifiers.
+  Export with scripts/export_embedding_onnx.py; if the export is missing the
+  service falls back to torch. scripts/bench_embedding_backends.py compares
+  parity, latency, throughput and RSS of the two.
 
 Model downloads automatically from HuggingFace on first run (~438MB, cached locally).
 """
@@ -14,9 +35,14 @@ Model downloads automatically from HuggingFace on first run (~438MB, cached loca
 import hashlib
 import json
 import logging
+import queue
 import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from pathlib import Path
 import numpy as np
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from services.config_service import ConfigService
 
@@ -26,10 +52,37 @@ logger = logging.getLogger(__name__)
 _st_model = None
 _st_model_lock = threading.Lock()
 
+# Singleton ONNX model; False records a failed load so we don't retry per call
+_onnx_model = None
+_onnx_model_lock = threading.Lock()
+
 # Cache TTL — 1 hour covers all request-scoped reuse and short-term repeats
 _CACHE_TTL = 3600
 _CACHE_PREFIX = 'emb:'
 
+# L1 defaults — overridable via semantic-memory config "embedding_cache"
+_L1_MAX_ENTRIES = 20000
+_L1_DTYPE = 'float16'
+
+# Micro-batching defaults — overridable via semantic-memory config "embedding_batching"
+_BATCH_WINDOW_MS = 5
+_BATCH_MAX_TEXTS = 64
+_ENCODE_BATCH_SIZE = 32
+
+# Backend defaults — overridable via semantic-memory config "embedding_backend"
+_BACKEND_DEFAULTS = {'type': 'torch', 'quantized': True, 'threads': 0}
+
+# Modules each backend needs imported on the main thread at boot (see run.py)
+BACKEND_IMPORTS = {
+    'torch': ('torch', 'transformers'),
+    'onnx': ('onnxruntime', 'transformers'),
+}
+
+# Files written by scripts/export_embedding_onnx.py into <models_dir>/<model_name>/
+EMBEDDING_META_FILE = 'embedding_meta.json'
+ONNX_MODEL_FILE = 'model.onnx'
+ONNX_QUANTIZED_FILE = 'model_quantized.onnx'
+
 
 def _get_st_model(model_name: str = 'all-mpnet-base-v2'):
     """Get or create the sentence-transformers model (singleton, thread-safe)."""
@@ -53,11 +106,342 @@ def _get_st_model(model_name: str = 'all-mpnet-base-v2'):
     return _st_model
 
 
+class OnnxEmbeddingModel:
+    """ONNX Runtime counterpart of SentenceTransformer.encode().
+
+    Runs the exported transformer graph and reproduces the sentence-transformers
+    head: mean pooling over the attention mask, then optional L2 normalization.
+    Texts are sorted by length before batching so padding stays bucketed.
+    """
+
+    def __init__(self, session, tokenizer, max_seq_length: int = 384):
+        self.session = session
+        self.tokenizer = tokenizer
+        self.max_seq_length = max_seq_length
+        self._input_names = {inp.name for inp in session.get_inputs()}
+
+    def encode(self, texts, normalize_embeddings: bool = False,
+               batch_size: int = _ENCODE_BATCH_SIZE, **_):
+        single = isinstance(texts, str)
+        if single:
+            texts = [texts]
+        order = sorted(range(len(texts)), key=lambda i: -len(texts[i]))
+        pooled: List[Optional[np.ndarray]] = [None] * len(texts)
+
+        for start in range(0, len(order), batch_size):
+            idx = order[start:start + batch_size]
+            encoded = self.tokenizer(
+                [texts[i] for i in idx],
+                padding=True,
+                truncation=True,
+                max_length=self.max_seq_length,
+                return_tensors="np",
+            )
+            feed = {
+                name: np.asarray(encoded[name], dtype=np.int64)
+                for name in ('input_ids', 'attention_mask', 'token_type_ids')
+                if name in self._input_names and name in encoded
+            }
+            token_embeddings = self.session.run(None, feed)[0]
+            mask = np.asarray(encoded['attention_mask'], dtype=np.float32)[..., None]
+            sums = (token_embeddings * mask).sum(axis=1)
+            counts = np.clip(mask.sum(axis=1), 1e-9, None)
+            for i, vec in zip(idx, sums / counts):
+                pooled[i] = vec
+
+        if not pooled:
+            return np.empty((0, 0), dtype=np.float32)
+        embeddings = np.stack(pooled).astype(np.float32)
+        if normalize_embeddings:
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            embeddings /= np.clip(norms, 1e-12, None)
+        return embeddings[0] if single else embeddings
+
+
+def _onnx_model_dir(model_name: str) -> Path:
+    from services.onnx_inference_service import resolve_models_dir
+    return Path(resolve_models_dir()) / model_name
+
+
+def _load_onnx_model(model_dir: Path, quantized: bool = True, threads: int = 0) -> OnnxEmbeddingModel:
+    """Build an OnnxEmbeddingModel from an exported model directory."""
+    with open(model_dir / EMBEDDING_META_FILE) as f:
+        meta = json.load(f)
+
+    onnx_path = model_dir / ONNX_MODEL_FILE
+    if quantized and (model_dir / ONNX_QUANTIZED_FILE).exists():
+        onnx_path = model_dir / ONNX_QUANTIZED_FILE
+    if not onnx_path.exists():
+        raise FileNotFoundError(f"no {onnx_path.name} in {model_dir}")
+
+    import onnxruntime as ort
+    from services.onnx_inference_service import _get_shared_tokenizer
+
+    opts = ort.SessionOptions()
+    opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    if threads:
+        opts.intra_op_num_threads = int(threads)
+    session = ort.InferenceSession(
+        str(onnx_path),
+        sess_options=opts,
+        providers=["CPUExecutionProvider"],
+    )
+    tokenizer = _get_shared_tokenizer(meta['base_model'], model_dir)
+    logger.info(f"[EMBEDDING] ONNX model ready: {model_dir.name}/{onnx_path.name}")
+    return OnnxEmbeddingModel(session, tokenizer, meta.get('max_seq_length', 384))
+
+
+def _get_onnx_model(model_name: str, quantized: bool = True, threads: int = 0):
+    """Get or load the ONNX embedding model (singleton). None if unavailable."""
+    global _onnx_model
+    if _onnx_model is not None:
+        return _onnx_model or None
+    with _onnx_model_lock:
+        if _onnx_model is None:
+            model_dir = _onnx_model_dir(model_name)
+            try:
+                _onnx_model = _load_onnx_model(model_dir, quantized, threads)
+            except Exception as e:
+                logger.warning(
+                    f"[EMBEDDING] ONNX backend unavailable ({e}) — falling back to torch. "
+                    f"Export with scripts/export_embedding_onnx.py into {model_dir}"
+                )
+                _onnx_model = False
+    return _onnx_model or None
+
+
+def _backend_settings(config: Optional[dict] = None) -> dict:
+    """Merge the "embedding_backend" config section over the defaults."""
+    return {**_BACKEND_DEFAULTS, **(config or {}).get('embedding_backend', {})}
+
+
+def backend_modules(config: Optional[dict] = None) -> Tuple[str, ...]:
+    """Heavy modules the configured backend needs (imported at boot by run.py)."""
+    return BACKEND_IMPORTS.get(_backend_settings(config)['type'], BACKEND_IMPORTS['torch'])
+
+
+def _get_model(model_name: str, backend: Optional[dict] = None):
+    """Model object with a SentenceTransformer-style encode() for the backend."""
+    backend = backend or _BACKEND_DEFAULTS
+    if backend.get('type') == 'onnx':
+        model = _get_onnx_model(model_name, backend.get('quantized', True), backend.get('threads', 0))
+        if model is not None:
+            return model
+    return _get_st_model(model_name)
+
+
 def _cache_key(text: str) -> str:
     """Deterministic cache key from text content."""
     return _CACHE_PREFIX + hashlib.sha256(text.encode('utf-8')).hexdigest()[:16]
 
 
+class EmbeddingCache:
+    """Bounded, thread-safe LRU of embeddings keyed by _cache_key(text).
+
+    Vectors are held read-only in `dtype` and widened to float32 on the way
+    out. Counters are cumulative since process start (or reset_stats()).
+    """
+
+    def __init__(self, max_entries: int = _L1_MAX_ENTRIES, dtype: str = _L1_DTYPE):
+        self.max_entries = max(0, int(max_entries))
+        self.dtype = np.dtype(dtype)
+        self._entries: 'OrderedDict[str, np.ndarray]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.l2_hits = 0
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        with self._lock:
+            vec = self._entries.get(key)
+            if vec is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return vec
+
+    def put(self, key: str, embedding, from_l2: bool = False) -> np.ndarray:
+        """Insert (or refresh) an entry; returns the stored read-only array.
+
+        from_l2 marks a promotion from MemoryStore, counted as an L2 hit.
+        """
+        vec = np.array(embedding, dtype=self.dtype, copy=True)
+        vec.flags.writeable = False
+        with self._lock:
+            if from_l2:
+                self.l2_hits += 1
+            if self.max_entries == 0:
+                return vec
+            self._entries[key] = vec
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return vec
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            size = len(self._entries)
+            lookups = self.hits + self.misses
+            return {
+                'entries': size,
+                'max_entries': self.max_entries,
+                'dtype': self.dtype.name,
+                'bytes': sum(v.nbytes for v in self._entries.values()),
+                'hits': self.hits,
+                'misses': self.misses,
+                'l2_hits': self.l2_hits,
+                'evictions': self.evictions,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+_l1_cache: Optional[EmbeddingCache] = None
+_l1_cache_lock = threading.Lock()
+
+
+def _get_l1_cache(config: Optional[dict] = None) -> EmbeddingCache:
+    """Process-wide L1 cache (shared by every EmbeddingService instance)."""
+    global _l1_cache
+    if _l1_cache is not None:
+        return _l1_cache
+    with _l1_cache_lock:
+        if _l1_cache is None:
+            settings = (config or {}).get('embedding_cache', {})
+            _l1_cache = EmbeddingCache(
+                max_entries=settings.get('max_entries', _L1_MAX_ENTRIES),
+                dtype=settings.get('dtype', _L1_DTYPE),
+            )
+    return _l1_cache
+
+
+def get_cache_stats() -> Dict[str, float]:
+    """Hit/miss/eviction counters for the embedding cache (for tuning)."""
+    return _get_l1_cache().stats()
+
+
+class EmbeddingBatcher:
+    """Coalesces concurrent encode requests into batched model calls.
+
+    submit() returns a Future resolving to an (n, dim) float32 array for the
+    submitted texts. The dispatcher blocks for the first request, then keeps
+    collecting until the window closes or max_batch texts are pending.
+    Duplicate texts within a batch are encoded once.
+    """
+
+    def __init__(self, model_name: str, window_ms: float = _BATCH_WINDOW_MS,
+                 max_batch: int = _BATCH_MAX_TEXTS, backend: Optional[dict] = None):
+        self.model_name = model_name
+        self.backend = backend or dict(_BACKEND_DEFAULTS)
+        self.window = max(0.0, float(window_ms)) / 1000.0
+        self.max_batch = max(1, int(max_batch))
+        self._queue: 'queue.Queue[tuple]' = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self.batches = 0
+        self.texts = 0
+
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        model = _get_model(self.model_name, self.backend)
+        return np.asarray(
+            model.encode(texts, normalize_embeddings=True, batch_size=_ENCODE_BATCH_SIZE),
+            dtype=np.float32,
+        )
+
+    def submit(self, texts: List[str]) -> Future:
+        future: Future = Future()
+        if self.window == 0:
+            try:
+                future.set_result(self._encode(texts))
+            except Exception as e:
+                future.set_exception(e)
+            return future
+        self._ensure_started()
+        self._queue.put((texts, future))
+        return future
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        """Blocking convenience wrapper around submit()."""
+        return self.submit(texts).result()
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, daemon=True, name="embedding-batcher"
+                )
+                self._thread.start()
+
+    def _gather(self) -> List[tuple]:
+        requests = [self._queue.get()]
+        pending = len(requests[0][0])
+        deadline = time.monotonic() + self.window
+        while pending < self.max_batch:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                request = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            requests.append(request)
+            pending += len(request[0])
+        return requests
+
+    def _run(self) -> None:
+        while True:
+            requests = self._gather()
+            unique: Dict[str, int] = {}
+            for texts, _ in requests:
+                for text in texts:
+                    unique.setdefault(text, len(unique))
+            try:
+                embeddings = self._encode(list(unique))
+            except Exception as e:
+                for _, future in requests:
+                    future.set_exception(e)
+                continue
+            self.batches += 1
+            self.texts += len(unique)
+            for texts, future in requests:
+                future.set_result(embeddings[[unique[t] for t in texts]])
+
+
+_batcher: Optional[EmbeddingBatcher] = None
+_batcher_lock = threading.Lock()
+
+
+def _get_batcher(model_name: str, config: Optional[dict] = None) -> EmbeddingBatcher:
+    """Process-wide micro-batcher (one per process, like the model itself)."""
+    global _batcher
+    if _batcher is not None:
+        return _batcher
+    with _batcher_lock:
+        if _batcher is None:
+            settings = (config or {}).get('embedding_batching', {})
+            _batcher = EmbeddingBatcher(
+                model_name,
+                window_ms=settings.get('window_ms', _BATCH_WINDOW_MS),
+                max_batch=settings.get('max_batch', _BATCH_MAX_TEXTS),
+                backend=_backend_settings(config),
+            )
+    return _batcher
+
+
 def _get_store():
     """Lazy import to avoid circular imports at module load time."""
     from services.memory_client import MemoryClientService
@@ -79,44 +463,60 @@ def get_embedding_service() -> 'EmbeddingService':
 class EmbeddingService:
     """Unified embedding service using sentence-transformers (no external service required).
 
-    All single-text methods check MemoryStore before computing. Cache is keyed by
-    sha256(text)[:16] with a 1-hour TTL. Batch embeddings bypass the cache (bulk
-    operations like document chunking don't benefit from per-text caching).
+    The model runs on the configured backend (torch or onnx); see module docstring.
+
+    Every method checks the in-process LRU, then MemoryStore, before computing.
+    Cache is keyed by sha256(text)[:16] with a 1-hour TTL in MemoryStore.
+    Batch embeddings look up each text and send only the misses to the model.
     """
 
     def __init__(self, config: dict = None):
         self.config = config or ConfigService.resolve_agent_config("semantic-memory")
         self.embedding_dimensions = self.config.get('embedding_dimensions', 768)
         self.model_name = self.config.get('embedding_model', 'all-mpnet-base-v2')
-
-    def _cache_get(self, text: str) -> Optional[list]:
-        """Check MemoryStore for a cached embedding. Returns list or None."""
+        self.backend = _backend_settings(self.config)
+        self._l1 = _get_l1_cache(self.config)
+        self._batcher = _get_batcher(self.model_name, self.config)
+
+    def _cache_get(self, text: str, key: Optional[str] = None) -> Optional[np.ndarray]:
+        """Check L1 then MemoryStore. Returns a read-only array or None."""
+        key = key or _cache_key(text)
+        cached = self._l1.get(key)
+        if cached is not None:
+            return cached
         try:
             store = _get_store()
-            raw = store.get(_cache_key(text))
-            if raw is not None:
-                return json.loads(raw)
+            cached = store.get_obj(key)
+            if isinstance(cached, np.ndarray):
+                self._l1.put(key, cached, from_l2=True)
+                cached.flags.writeable = False
+                return cached   # full float32 precision on an L2 hit
         except Exception:
             pass  # Cache miss — compute normally
         return None
 
-    def _cache_put(self, text: str, embedding: list) -> None:
-        """Store embedding in MemoryStore with TTL."""
+    def _cache_put(self, text: str, embedding: np.ndarray, key: Optional[str] = None) -> None:
+        """Store embedding in L1 and in MemoryStore with TTL.
+
+        Only L1 is narrowed to its dtype; MemoryStore keeps float32 so the
+        persisted copy does not lose precision.
+        """
+        key = key or _cache_key(text)
+        self._l1.put(key, embedding)
         try:
             store = _get_store()
-            store.set(_cache_key(text), json.dumps(embedding), ex=_CACHE_TTL)
+            store.set_obj(key, np.asarray(embedding, dtype=np.float32), ex=_CACHE_TTL)
         except Exception:
             pass  # Non-fatal — next call will just recompute
 
-    def generate_embedding(self, text: str) -> list:
-        """Single embedding → list (for SQLite storage). L2-normalized. Cached."""
+    def _embed_np(self, text: str) -> np.ndarray:
+        """Cached single embedding as a fresh, writable float32 array."""
         cached = self._cache_get(text)
         if cached is not None:
-            return cached
+            return cached.astype(np.float32)
 
         try:
-            model = _get_st_model(self.model_name)
-            embedding = model.encode(text, normalize_embeddings=True).tolist()
+            embedding = self._batcher.encode([text])[0]
             self._cache_put(text, embedding)
             return embedding
 
@@ -124,38 +524,43 @@ class EmbeddingService:
             logger.error(f"[EMBEDDING] Generation failed: {e}")
             raise
 
+    def generate_embedding(self, text: str) -> list:
+        """Single embedding → list (for SQLite storage). L2-normalized. Cached."""
+        return self._embed_np(text).tolist()
+
     def generate_embedding_np(self, text: str) -> np.ndarray:
         """Single embedding → numpy array (for cosine similarity math). L2-normalized. Cached."""
-        cached = self._cache_get(text)
-        if cached is not None:
-            return np.array(cached, dtype=np.float32)
-
-        try:
-            model = _get_st_model(self.model_name)
-            embedding = model.encode(text, normalize_embeddings=True)
-            embedding_list = embedding.tolist()
-            self._cache_put(text, embedding_list)
-            return np.array(embedding, dtype=np.float32)
-
-        except Exception as e:
-            logger.error(f"[EMBEDDING] Generation failed: {e}")
-            raise
+        return self._embed_np(text)
 
     def generate_embeddings_batch(self, texts: List[str]) -> List[np.ndarray]:
-        """Batch embed → list of numpy arrays. L2-normalized.
+        """Batch embed → list of numpy arrays. L2-normalized. Cached.
 
-        Batch operations (document chunking, bulk consolidation) bypass per-text
-        caching — the overhead of N cache lookups + JSON serialization would negate
-        the benefit for large batches.
+        Each text is looked up in the cache first; the remaining unique misses
+        are encoded in one batched call and written back to the cache.
         """
         if not texts:
             return []
 
-        try:
-            model = _get_st_model(self.model_name)
-            embeddings = model.encode(texts, normalize_embeddings=True, batch_size=32)
-            return [np.array(emb, dtype=np.float32) for emb in embeddings]
-
-        except Exception as e:
-            logger.error(f"[EMBEDDING] Batch generation failed: {e}")
-            raise
+        keys = [_cache_key(text) for text in texts]
+        results: Dict[str, np.ndarray] = {}
+        missing: Dict[str, str] = {}
+        for text, key in zip(texts, keys):
+            if key in results or key in missing:
+                continue
+            cached = self._cache_get(text, key)
+            if cached is not None:
+                results[key] = cached
+            else:
+                missing[key] = text
+
+        if missing:
+            try:
+                embeddings = self._batcher.encode(list(missing.values()))
+            except Exception as e:
+                logger.error(f"[EMBEDDING] Batch generation failed: {e}")
+                raise
+            for (key, text), emb in zip(missing.items(), embeddings):
+                self._cache_put(text, emb, key)
+                results[key] = emb
+
+        return [np.array(results[key], dtype=np.float32) for key in keys]
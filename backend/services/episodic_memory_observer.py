@@ -4,13 +4,17 @@ Episodic Memory Observer — periodic thread scanner for episodic consolidation.
 Replaces the queue-push-and-poll pattern where every enriched exchange enqueued
 a job that polled readiness and requeued up to 10 times with exponential backoff.
 
-Instead, this observer scans active threads every 60 seconds, computes topic
-signal density from memory_chunk enrichments, and triggers consolidation when
-density is sufficient. This eliminates redundant jobs, retry machinery, and
-race conditions from multiple jobs targeting the same topic.
+Instead, this observer wakes every 60 seconds, computes topic signal density
+from memory_chunk enrichments, and triggers consolidation when density is
+sufficient. This eliminates redundant jobs, retry machinery, and race
+conditions from multiple jobs targeting the same topic.
 
 Design:
-  - 60s scan cycle, ~200ms budget per scan
+  - 60s cycle, ~200ms budget per cycle
+  - Change feed: ThreadConversationService keeps running signal counters per
+    thread and marks threads dirty when they move; a cycle evaluates only
+    dirty threads plus those whose idle-timeout/recheck time has come due
+    (in-process min-heap). The first cycle after start seeds from a full scan.
   - Signal density: weighted composite from gists, facts, traits, emotion
   - Consolidation requires density >= threshold AND 3+ enriched exchanges
   - Idle timeout (10min) as data loss prevention fallback
@@ -19,12 +23,16 @@ Design:
   - Richness gate: skips scan on cold systems (richness < 0.05)
 """
 
-import json
+import heapq
 import logging
 import time
-import threading
 
 from services.memory_client import MemoryClientService
+from services.thread_conversation_service import (
+    ThreadConversationService,
+    add_chunk_signals,
+    empty_signals,
+)
 
 logger = logging.getLogger(__name__)
 LOG_PREFIX = "[EPISODIC OBSERVER]"
@@ -51,6 +59,17 @@ SAT_TRAITS = 3
 SAT_EMOTION = 3
 
 
+def density_from_signals(signals: dict) -> float:
+    """Signal density from running thread signals (see compute_signal_density)."""
+    score = (
+        WEIGHT_GISTS * min(1.0, signals['gists'] / SAT_GISTS)
+        + WEIGHT_FACTS * min(1.0, signals['facts'] / SAT_FACTS)
+        + WEIGHT_TRAITS * min(1.0, signals['traits'] / SAT_TRAITS)
+        + WEIGHT_EMOTION * min(1.0, len(signals['emotions']) / SAT_EMOTION)
+    )
+    return round(score, 3)
+
+
 class EpisodicMemoryObserver:
     """Periodic thread scanner that triggers episodic consolidation based on signal density."""
 
@@ -58,6 +77,11 @@ class EpisodicMemoryObserver:
         self.scan_interval = scan_interval
         self.density_threshold = density_threshold
         self.store = MemoryClientService.create_connection()
+        self.conversations = ThreadConversationService()
+        # Re-check times for threads that are idle-pending, busy or on cooldown
+        self._recheck_heap = []
+        self._recheck_due = {}
+        self._seeded = False
 
     def run(self, shared_state=None):
         """Main service loop — 60s scan cycle."""
@@ -84,87 +108,101 @@ class EpisodicMemoryObserver:
             time.sleep(self.scan_interval)
 
     def _scan_threads(self):
-        """Scan thread_conv:* keys, compute density, trigger if ready."""
+        """Evaluate dirty threads and threads whose re-check time has come due."""
         scan_start = time.time()
         scanned = 0
         triggered = 0
 
-        cursor = 0
-        while True:
-            # Budget check — break early if scan takes too long
+        candidates = self.conversations.pop_dirty_threads()
+        if not self._seeded:
+            # Fresh process: no heap yet, so look at every live conversation once
+            candidates.update(
+                key.split(":", 1)[1]
+                for key in self.store.scan_iter(match="thread_conv:*", count=500)
+            )
+            self._seeded = True
+
+        heap = self._recheck_heap
+        while heap and heap[0][0] <= scan_start:
+            due, thread_id = heapq.heappop(heap)
+            if self._recheck_due.get(thread_id) == due:
+                del self._recheck_due[thread_id]
+                candidates.add(thread_id)
+
+        pending = list(candidates)
+        for i, thread_id in enumerate(pending):
+            # Budget check — defer the rest to the next cycle via the dirty set
             elapsed_ms = (time.time() - scan_start) * 1000
             if elapsed_ms > SCAN_BUDGET_MS:
                 logger.warning(f"{LOG_PREFIX} Scan budget exceeded ({elapsed_ms:.0f}ms > {SCAN_BUDGET_MS}ms), "
-                               f"remaining threads deferred to next cycle")
+                               f"{len(pending) - i} threads deferred to next cycle")
+                self.conversations.mark_dirty(*pending[i:])
                 break
 
-            cursor, keys = self.store.scan(cursor, match="thread_conv:*", count=50)
-
-            for key in keys:
-                try:
-                    thread_id = key.split(":", 1)[1] if ":" in key else key
-                    scanned += 1
-
-                    # Skip if on cooldown (already consolidated recently)
-                    if self._is_on_cooldown(thread_id):
-                        continue
-
-                    # Skip if thread is busy (digest worker mid-response)
-                    if self._is_thread_busy(thread_id):
-                        continue
-
-                    # Read thread metadata
-                    thread_data = self.store.hgetall(f"thread:{thread_id}")
-                    if not thread_data:
-                        continue
-
-                    # Skip expired threads — thread_expiry handles those
-                    if thread_data.get("state") == "expired":
-                        continue
-
-                    topic = thread_data.get("current_topic", "general")
-
-                    # Get exchanges and filter enriched ones
-                    raw_exchanges = self.store.lrange(key, 0, -1)
-                    exchanges = []
-                    for raw in raw_exchanges:
-                        try:
-                            exchanges.append(json.loads(raw))
-                        except (json.JSONDecodeError, TypeError):
-                            continue
-
-                    enriched = [e for e in exchanges if e and e.get('memory_chunk')]
-
-                    if not enriched:
-                        continue
-
-                    # Compute signal density
-                    density = self.compute_signal_density(enriched)
-
-                    # Trigger condition 1: density + min enriched
-                    if density >= self.density_threshold and len(enriched) >= MIN_ENRICHED:
-                        self._trigger_consolidation(thread_id, topic, enriched)
-                        triggered += 1
-                        continue
-
-                    # Trigger condition 2: idle timeout (data loss prevention)
-                    last_activity = float(thread_data.get("last_activity", 0))
-                    idle_seconds = time.time() - last_activity if last_activity > 0 else 0
-                    if idle_seconds >= IDLE_TIMEOUT and len(enriched) > 0:
-                        self._trigger_consolidation(thread_id, topic, enriched)
-                        triggered += 1
-
-                except Exception as e:
-                    logger.debug(f"{LOG_PREFIX} Error scanning thread: {e}")
-                    continue
-
-            if cursor == 0:
-                break
+            scanned += 1
+            try:
+                if self._evaluate_thread(thread_id):
+                    triggered += 1
+            except Exception as e:
+                logger.debug(f"{LOG_PREFIX} Error scanning thread: {e}")
 
         if scanned > 0 or triggered > 0:
             logger.info(f"{LOG_PREFIX} Scan complete: {scanned} threads scanned, "
                         f"{triggered} consolidations triggered")
 
+    def _schedule_recheck(self, thread_id: str, due: float):
+        current = self._recheck_due.get(thread_id)
+        if current is None or due < current:
+            self._recheck_due[thread_id] = due
+            heapq.heappush(self._recheck_heap, (due, thread_id))
+
+    def _evaluate_thread(self, thread_id: str) -> bool:
+        """Decide whether one thread is ready for consolidation. Returns True if triggered."""
+        now = time.time()
+
+        # On cooldown (already consolidated recently) — look again when it lapses
+        cooldown_ttl = self.store.ttl(f"last_consolidation:{thread_id}")
+        if cooldown_ttl >= 0:
+            self._schedule_recheck(thread_id, now + max(cooldown_ttl, 1))
+            return False
+
+        # Thread busy (digest worker mid-response) — look again next cycle
+        if self._is_thread_busy(thread_id):
+            self._schedule_recheck(thread_id, now + self.scan_interval)
+            return False
+
+        # Read thread metadata
+        thread_data = self.store.hgetall(f"thread:{thread_id}")
+        if not thread_data:
+            return False
+
+        # Skip expired threads — thread_expiry handles those
+        if thread_data.get("state") == "expired":
+            return False
+
+        signals = self.conversations.get_signals(thread_id)
+        enriched = signals['enriched']
+        if enriched <= 0:
+            return False
+
+        topic = thread_data.get("current_topic", "general")
+
+        # Trigger condition 1: density + min enriched
+        density = density_from_signals(signals)
+        if density >= self.density_threshold and enriched >= MIN_ENRICHED:
+            self._trigger_consolidation(thread_id, topic, enriched)
+            return True
+
+        # Trigger condition 2: idle timeout (data loss prevention)
+        last_activity = float(thread_data.get("last_activity", 0))
+        if last_activity > 0:
+            idle_due = last_activity + IDLE_TIMEOUT
+            if now >= idle_due:
+                self._trigger_consolidation(thread_id, topic, enriched)
+                return True
+            self._schedule_recheck(thread_id, idle_due)
+        return False
+
     def compute_signal_density(self, exchanges: list) -> float:
         """Topic signal density from memory_chunk enrichments.
 
@@ -177,46 +215,12 @@ class EpisodicMemoryObserver:
         Returns:
             float in [0.0, 1.0]
         """
-        gist_count = 0
-        fact_count = 0
-        trait_count = 0
-        emotion_types = set()
-
+        signals = empty_signals()
         for exchange in exchanges:
-            chunk = exchange.get('memory_chunk', {})
-            if not chunk:
-                continue
-
-            # Count gists
-            gists = chunk.get('gists', [])
-            gist_count += len(gists)
-
-            # Count facts
-            facts = chunk.get('facts', [])
-            fact_count += len(facts)
-
-            # Count traits
-            traits = chunk.get('user_traits', [])
-            trait_count += len(traits)
-
-            # Collect distinct emotion types
-            emotion = chunk.get('emotion', {})
-            user_emotion = emotion.get('user', {}) if isinstance(emotion, dict) else {}
-            if isinstance(user_emotion, dict):
-                for emo_type, score in user_emotion.items():
-                    if isinstance(score, (int, float)) and score > 2:
-                        emotion_types.add(emo_type)
-
-        score = (
-            WEIGHT_GISTS * min(1.0, gist_count / SAT_GISTS)
-            + WEIGHT_FACTS * min(1.0, fact_count / SAT_FACTS)
-            + WEIGHT_TRAITS * min(1.0, trait_count / SAT_TRAITS)
-            + WEIGHT_EMOTION * min(1.0, len(emotion_types) / SAT_EMOTION)
-        )
-
-        return round(score, 3)
-
-    def _trigger_consolidation(self, thread_id: str, topic: str, exchanges: list):
+            add_chunk_signals(signals, exchange.get('memory_chunk', {}))
+        return density_from_signals(signals)
+
+    def _trigger_consolidation(self, thread_id: str, topic: str, exchange_count: int):
         """Trigger episodic memory consolidation via PromptQueue thread."""
         try:
             from workers.episodic_memory_worker import episodic_memory_worker
@@ -241,14 +245,10 @@ class EpisodicMemoryObserver:
             )
 
             logger.info(f"{LOG_PREFIX} Triggered consolidation for thread '{thread_id}' "
-                        f"(topic='{topic}', exchanges={len(exchanges)})")
+                        f"(topic='{topic}', exchanges={exchange_count})")
         except Exception as e:
             logger.warning(f"{LOG_PREFIX} Consolidation trigger failed: {e}")
 
-    def _is_on_cooldown(self, thread_id: str) -> bool:
-        """Check if thread was recently consolidated (dedup)."""
-        return self.store.get(f"last_consolidation:{thread_id}") is not None
-
     def _is_thread_busy(self, thread_id: str) -> bool:
         """Check if digest worker is currently processing this thread."""
         return self.store.get(f"thread_busy:{thread_id}") is not None
@@ -11,6 +11,7 @@ Episodic Retrieval Service - Episode query and hybrid search.
 Responsibility: Retrieval layer only (SRP).
 """
 
+import json
 import math
 import struct
 from datetime import datetime
@@ -21,6 +22,20 @@ from services.episodic_storage_service import EpisodicStorageService
 import logging
 
 
+# Columns every retrieval candidate carries (last_accessed_at feeds freshness)
+_EPISODE_COLUMNS = """e.id, e.intent, e.context, e.action, e.emotion, e.outcome, e.gist,
+           e.salience, e.freshness, e.topic, e.created_at, e.activation_score,
+           e.last_accessed_at, e.salience_factors, e.open_loops,
+           COALESCE(e.reliability, 'reliable') AS reliability"""
+
+# Filtered KNN tuning (see EpisodicRetrievalService._vector_search)
+_KNN_MAX_K = 4096               # sqlite-vec's upper bound on k
+_KNN_SLACK = 8                  # extra neighbours to absorb soft-deleted rows
+_KNN_TOPIC_OVERFETCH = 8        # first-pass k multiplier when filtering by topic
+_KNN_GROWTH = 4                 # k multiplier per widening pass
+_EXACT_SCAN_MAX_ROWS = 5000     # topics this small are scanned exactly
+
+
 class EpisodicRetrievalService:
     """Manages episode retrieval with hybrid search and scoring."""
 
@@ -117,14 +132,18 @@ class EpisodicRetrievalService:
 
         Retrieved memories get strengthened (salience boost), their
         last_accessed_at timestamp is updated, and access_count is incremented.
+        The writes are recorded with the access tracker, which coalesces them
+        and applies them off the request path (see services.access_tracker).
 
         Debounce: skips episodes reconsolidated within the last 10 minutes
-        to prevent the same episodes being UPDATE'd 15+ times per request chain.
+        to prevent the same episodes being reconsolidated 15+ times per request chain.
 
         Args:
             episodes: List of episode dicts to reconsolidate
         """
         debounce_minutes = self.config.get('reconsolidation_debounce_minutes', 10)
+        # Scale reconsolidation_boost from 0-1 range to 1-10 range
+        boost_scaled = self.reconsolidation_boost * 10
 
         # MemoryStore-based debounce check
         store = None
@@ -134,6 +153,7 @@ class EpisodicRetrievalService:
         except Exception:
             pass
 
+        accessed = []
         for episode in episodes:
             try:
                 episode_id = episode.get('id')
@@ -147,46 +167,33 @@ class EpisodicRetrievalService:
                     # Set debounce flag
                     store.set(debounce_key, "1", ex=debounce_minutes * 60)
 
-                # Use storage service's internal activation score update
-                # This increments access_count and updates last_accessed_at
-                self.storage_service._update_activation_score(episode_id)
+                accessed.append(episode_id)
 
-                # Touch-on-read: increment retrieval_count for tool_reflection episodes
-                salience_factors = episode.get('salience_factors', {})
-                if isinstance(salience_factors, str):
-                    import json as _json
-                    salience_factors = _json.loads(salience_factors)
-                if salience_factors.get('source') == 'tool_reflection':
+                # Touch-on-read: retrieval_count for tool_reflection episodes
+                # (persisted by the tracker's UPDATE; mirrored here for the caller)
+                salience_factors = episode.get('salience_factors')
+                if isinstance(salience_factors, dict) and salience_factors.get('source') == 'tool_reflection':
                     salience_factors['retrieval_count'] = salience_factors.get('retrieval_count', 0) + 1
-                    self.storage_service.update_episode(episode_id, {
-                        'salience_factors': salience_factors
-                    })
-
-                # Then apply salience boost (1-10 scale)
-                current_salience = episode.get('salience', 5)
-                # Scale reconsolidation_boost from 0-1 range to 1-10 range
-                boost_scaled = self.reconsolidation_boost * 10
-                new_salience = min(10, current_salience + boost_scaled)
-
-                self.storage_service.update_episode(episode_id, {
-                    'salience': new_salience
-                })
 
                 # Update in-memory episode dict for return value
-                episode['salience'] = new_salience
+                current_salience = episode.get('salience', 5)
+                episode['salience'] = min(10, current_salience + boost_scaled)
                 episode['last_accessed_at'] = datetime.now()
                 episode['access_count'] = episode.get('access_count', 0) + 1
 
-                logging.debug(
-                    f"Reconsolidated episode {episode_id}: "
-                    f"salience {current_salience} → {new_salience}, "
-                    f"access_count → {episode['access_count']}"
-                )
-
             except Exception as e:
                 logging.warning(f"Failed to reconsolidate episode {episode.get('id')}: {e}")
                 # Continue with other episodes even if one fails
 
+        if not accessed:
+            return
+        try:
+            from services.access_tracker import record_episode_access
+            record_episode_access(self.db_service, accessed, boost_scaled)
+            logging.debug(f"Reconsolidated {len(accessed)} episodes (salience +{boost_scaled})")
+        except Exception as e:
+            logging.warning(f"Failed to reconsolidate episodes: {e}")
+
     def _generate_embedding(self, text: str) -> List[float]:
         """
         Generate embedding vector using Ollama.
@@ -227,29 +234,11 @@ class EpisodicRetrievalService:
             with self.db_service.connection() as conn:
                 cursor = DictCursor(conn.cursor())
 
-                # Vector similarity search via sqlite-vec virtual table JOIN
-                # (include last_accessed_at for freshness calculation)
-                vector_query = """
-                    SELECT e.id, e.intent, e.context, e.action, e.emotion, e.outcome, e.gist,
-                           e.salience, e.freshness, e.topic, e.created_at, e.activation_score,
-                           e.last_accessed_at, e.salience_factors, e.open_loops,
-                           COALESCE(e.reliability, 'reliable') AS reliability,
-                           v.distance AS vector_distance
-                    FROM episodes e
-                    JOIN episodes_vec v ON v.rowid = e.rowid
-                    WHERE v.embedding MATCH ? AND k = ?
-                      AND e.deleted_at IS NULL
-                """
-                vector_params = [self._pack_embedding(query_embedding), limit]
-
-                if topic:
-                    vector_query += " AND e.topic = ?"
-                    vector_params.append(topic)
-
-                vector_query += " ORDER BY v.distance"
-
-                cursor.execute(vector_query, vector_params)
-                vector_results = cursor.fetchall()
+                # Vector similarity search, with topic/liveness filters applied
+                # inside the search rather than to a fixed top-k
+                vector_results = self._vector_search(
+                    cursor, self._pack_embedding(query_embedding), topic, limit
+                )
 
                 # Full-text search on gist and action via FTS5 (intent is now JSONB)
                 fts_query = """
@@ -290,6 +279,107 @@ class EpisodicRetrievalService:
             logging.error(f"Hybrid retrieval failed: {e}")
             return []
 
+    def _vector_search(self, cursor, query_blob: bytes, topic: Optional[str],
+                       limit: int) -> List[dict]:
+        """
+        Nearest live episodes (optionally within one topic), closest first.
+
+        vec0 has no filter pushdown for columns that live on `episodes`, so
+        filtering a fixed top-k throws most neighbours away when a topic is
+        set. Instead:
+        - small topics (≤ _EXACT_SCAN_MAX_ROWS live episodes) are scanned
+          exactly via the topic index and vec_distance_l2;
+        - otherwise k is widened geometrically until `limit` neighbours survive
+          the filters, the store is exhausted, or k hits sqlite-vec's cap —
+          at which point a topic search falls back to the exact scan.
+
+        Args:
+            cursor: DictCursor on an open connection
+            query_blob: Packed query embedding
+            topic: Optional topic filter
+            limit: Number of neighbours wanted
+
+        Returns:
+            Episode rows with a vector_distance column, ordered by distance
+        """
+        if topic:
+            cursor.execute(
+                "SELECT COUNT(*) AS n FROM episodes WHERE topic = ? AND deleted_at IS NULL",
+                [topic],
+            )
+            topic_rows = cursor.fetchone()['n']
+            if topic_rows == 0:
+                return []
+            if topic_rows <= _EXACT_SCAN_MAX_ROWS:
+                return self._exact_topic_scan(cursor, query_blob, topic, limit)
+
+        k = limit * _KNN_TOPIC_OVERFETCH if topic else limit + _KNN_SLACK
+        scanned = 0
+        results = []
+        while True:
+            k = min(k, _KNN_MAX_K)
+            cursor.execute(
+                "SELECT rowid, distance FROM episodes_vec WHERE embedding MATCH ? AND k = ? "
+                "ORDER BY distance",
+                [query_blob, k],
+            )
+            neighbours = cursor.fetchall()
+
+            # Only rows beyond the previous k are new (KNN prefixes are stable)
+            fresh = neighbours[scanned:]
+            scanned = len(neighbours)
+            if fresh:
+                results.extend(self._filter_neighbours(cursor, fresh, topic))
+
+            if len(results) >= limit or len(neighbours) < k:
+                break
+            if k >= _KNN_MAX_K:
+                if topic:
+                    return self._exact_topic_scan(cursor, query_blob, topic, limit)
+                break
+            k *= _KNN_GROWTH
+
+        return results[:limit]
+
+    @staticmethod
+    def _filter_neighbours(cursor, neighbours: list, topic: Optional[str]) -> List[dict]:
+        """Load the live (and on-topic) episodes among KNN rowids, keeping KNN order."""
+        distances = {row['rowid']: row['distance'] for row in neighbours}
+        query = f"""
+            SELECT e.rowid AS _rowid, {_EPISODE_COLUMNS}
+            FROM episodes e
+            WHERE e.rowid IN (SELECT value FROM json_each(?))
+              AND e.deleted_at IS NULL
+        """
+        params = [json.dumps(list(distances))]
+        if topic:
+            query += " AND e.topic = ?"
+            params.append(topic)
+        cursor.execute(query, params)
+
+        rows = cursor.fetchall()
+        for row in rows:
+            row['vector_distance'] = distances[row.pop('_rowid')]
+        rows.sort(key=lambda row: row['vector_distance'])
+        return rows
+
+    @staticmethod
+    def _exact_topic_scan(cursor, query_blob: bytes, topic: str, limit: int) -> List[dict]:
+        """Exact nearest neighbours within one topic (cost grows with topic size only)."""
+        cursor.execute(
+            f"""
+            SELECT {_EPISODE_COLUMNS},
+                   vec_distance_l2(v.embedding, ?) AS vector_distance
+            FROM episodes e
+            JOIN episodes_vec v ON v.rowid = e.rowid
+            WHERE e.topic = ? AND e.deleted_at IS NULL
+            ORDER BY vector_distance
+            LIMIT ?
+            """,
+            [query_blob, topic, limit],
+        )
+        return cursor.fetchall()
+
     def _merge_with_rrf(self, vector_results: list, fts_results: list,
                        k: int = 60) -> List[dict]:
         """
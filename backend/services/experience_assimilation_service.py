@@ -28,7 +28,6 @@ import hashlib
 import json
 import logging
 import time
-from typing import Optional
 
 from services.memory_client import MemoryClientService
 from services.config_service import ConfigService
@@ -69,29 +68,16 @@ class ExperienceAssimilationService:
             f"(interval={self.check_interval}s, max_sessions={self.max_sessions}/day)"
         )
 
-    def run(self, shared_state: Optional[dict] = None) -> None:
-        """Main service loop."""
-        logger.info(f"{LOG_PREFIX} Service started")
-
-        while True:
-            try:
-                time.sleep(self.check_interval)
-
-                if self._daily_sessions_exceeded():
-                    continue
-
-                # Self-regulation: skip when pending list is empty
-                if self.store.llen(PENDING_LIST_KEY) == 0:
-                    continue
+    def run_once(self) -> None:
+        """Job entry point: run one assimilation cycle if there is pending work."""
+        if self._daily_sessions_exceeded():
+            return
 
-                self._run_cycle()
+        # Self-regulation: skip when pending list is empty
+        if self.store.llen(PENDING_LIST_KEY) == 0:
+            return
 
-            except KeyboardInterrupt:
-                logger.info(f"{LOG_PREFIX} Service shutting down...")
-                break
-            except Exception as e:
-                logger.error(f"{LOG_PREFIX} Error: {e}", exc_info=True)
-                time.sleep(60)
+        self._run_cycle()
 
     def _daily_sessions_exceeded(self) -> bool:
         """Check if we've hit the daily session cap."""
@@ -317,7 +303,7 @@ class ExperienceAssimilationService:
             db_service.close_pool()
 
 
-def experience_assimilation_worker(shared_state: Optional[dict] = None):
-    """Entry point for run.py service registration."""
+def register_experience_assimilation_job(scheduler) -> None:
+    """Register the assimilation cycle on the job scheduler."""
     service = ExperienceAssimilationService()
-    service.run(shared_state)
+    scheduler.add_job("experience-assimilation", service.run_once, interval=service.check_interval)
@@ -0,0 +1,494 @@
+"""
+Export Service — streaming NDJSON export and bulk import of user data.
+
+/privacy/export used to build one JSON document with every table read
+through a single connection() held open for the whole HTTP stream, capped at
+10,000 rows per table. Large memory stores were silently truncated and a slow
+client pinned a read transaction that kept WAL checkpoints from completing.
+
+The export is now a sequence of newline-delimited JSON records, compressed
+as it is produced (gzip by default, zstd when `zstandard` is installed):
+
+    {"type": "header", "format": "chalie-export", "version": 1, ...}
+    {"type": "table", "table": "episodes", "columns": [...], "embeddings": true}
+    {"type": "row", "table": "episodes", "rowid": 1, "values": [...], "embedding": {"$b64": "..."}}
+    {"type": "checkpoint", "resume": "<token>", "rows": 1000}
+    ...
+    {"type": "memory_store", "entries": {...}}
+    {"type": "end", "rows": 123456}
+
+- Keyset paging: each table is read page_rows rows at a time with
+  `WHERE rowid > ? ORDER BY rowid LIMIT ?`, each page on a pooled read-only
+  connection that goes back to the pool before the page is yielded. No row
+  cap, and no read transaction outlives one page.
+- Binary columns and the sqlite-vec companion rows (`<table>_vec`, joined on
+  rowid) are exported as {"$b64": ...} instead of being dropped.
+- Resume: after every page a checkpoint record carries an opaque token;
+  passing it back as ?resume= restarts right after that page.
+- Import: import_ndjson() reads the same stream (compression detected from
+  the magic bytes) and writes rows in batches on the database writer, one
+  transaction per batch. Only USER_DATA_TABLES are restored, and only into
+  tables that are empty when the import reaches them, so rows keep their
+  rowid (and their embeddings) without overwriting local data. A resumed
+  export can be imported in its own call after the first part: its header
+  names the resume point, and the table it resumes may already hold the
+  rows up to that rowid. Embeddings
+  that can't be written are counted and reported, not silently dropped.
+  MemoryStore entries are exported for the user's benefit only — they are
+  caches with TTLs and are not restored.
+"""
+
+import base64
+import gzip
+import io
+import json
+import logging
+import zlib
+from datetime import datetime, timezone
+from typing import IO, Dict, Iterable, Iterator, List, Optional
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None  # zstd export/import unavailable — gzip still works
+
+logger = logging.getLogger(__name__)
+
+LOG_PREFIX = "[EXPORT]"
+
+EXPORT_FORMAT = "chalie-export"
+EXPORT_VERSION = 1
+
+# Tables /privacy/export writes and /privacy/import may restore. Credentials
+# and configuration (providers, tool_configs, settings, master_account,
+# schema_migrations) must never appear here.
+USER_DATA_TABLES = (
+    "episodes", "semantic_concepts", "semantic_relationships",
+    "user_traits", "threads", "autobiography",
+    "scheduled_items", "persistent_tasks", "lists", "list_items",
+    "list_events", "identity_vectors", "identity_events",
+    "place_fingerprints", "cognitive_reflexes", "curiosity_threads",
+    "interaction_log", "cortex_iterations", "routing_decisions",
+    "procedural_memory", "topics", "user_tool_preferences",
+    "documents", "document_chunks", "watched_folders",
+)
+
+# Final resume stage once every table has been exported
+MEMORY_STORE_STAGE = "$memory_store"
+
+_PAGE_ROWS = 1000
+_IMPORT_BATCH_ROWS = 1000
+# Compressed output is buffered to roughly this size before it is yielded
+_FLUSH_BYTES = 64 * 1024
+
+# Base64 embeddings barely compress; level 1 is ~1.5x faster than 6 for ~5% more bytes
+_GZIP_LEVEL = 1
+_ZSTD_LEVEL = 3
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+COMPRESSIONS = ("gzip", "zstd", "none")
+FILE_SUFFIXES = {"gzip": ".gz", "zstd": ".zst", "none": ""}
+MIMETYPES = {"gzip": "application/gzip", "zstd": "application/zstd", "none": "application/x-ndjson"}
+
+
+class ExportError(ValueError):
+    """Invalid export/import request (bad resume token, unknown compression, malformed stream)."""
+
+
+# ── Value encoding ─────────────────────────────────────────────
+
+def encode_value(value):
+    """Make a column value JSON-safe; binary becomes {"$b64": ...}."""
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return {"$b64": base64.b64encode(bytes(value)).decode("ascii")}
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def decode_value(value):
+    """Inverse of encode_value()."""
+    if isinstance(value, dict) and "$b64" in value:
+        return base64.b64decode(value["$b64"])
+    return value
+
+
+# ── Resume tokens ──────────────────────────────────────────────
+
+def make_resume_token(table: str, after_rowid: int) -> str:
+    payload = json.dumps({"v": EXPORT_VERSION, "table": table, "after": after_rowid}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode("ascii").rstrip("=")
+
+
+def parse_resume_token(token: str) -> Dict:
+    """Decode a resume token into {"table", "after"}. Raises ExportError if malformed."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if payload.get("v") != EXPORT_VERSION:
+            raise ValueError("unsupported version")
+        return {"table": str(payload["table"]), "after": int(payload["after"])}
+    except Exception as e:
+        raise ExportError(f"Invalid resume token: {e}") from None
+
+
+# ── Compression ────────────────────────────────────────────────
+
+def resolve_compression(requested: Optional[str]) -> str:
+    """Validate ?compression=; zstd falls back to gzip when zstandard is missing."""
+    compression = (requested or "gzip").lower()
+    if compression not in COMPRESSIONS:
+        raise ExportError(f"Unknown compression '{requested}' (expected one of {', '.join(COMPRESSIONS)})")
+    if compression == "zstd" and zstandard is None:
+        logger.info(f"{LOG_PREFIX} zstandard not installed — falling back to gzip")
+        return "gzip"
+    return compression
+
+
+def compress_stream(chunks: Iterable[bytes], compression: str) -> Iterator[bytes]:
+    """Compress an iterable of byte chunks incrementally, yielding ~_FLUSH_BYTES blocks."""
+    if compression == "none":
+        compressor = None
+    elif compression == "zstd":
+        compressor = zstandard.ZstdCompressor(level=_ZSTD_LEVEL).compressobj()
+    else:
+        compressor = zlib.compressobj(_GZIP_LEVEL, zlib.DEFLATED, 31)   # wbits 31 = gzip container
+
+    pending: List[bytes] = []
+    size = 0
+    for chunk in chunks:
+        out = chunk if compressor is None else compressor.compress(chunk)
+        if out:
+            pending.append(out)
+            size += len(out)
+        if size >= _FLUSH_BYTES:
+            yield b"".join(pending)
+            pending, size = [], 0
+    if compressor is not None:
+        pending.append(compressor.flush())
+    tail = b"".join(pending)
+    if tail:
+        yield tail
+
+
+def open_import_stream(stream: IO[bytes]) -> IO[bytes]:
+    """Wrap a (possibly compressed) byte stream in a decompressing reader."""
+    buffered = stream if hasattr(stream, "peek") else io.BufferedReader(stream)
+    magic = buffered.peek(4)[:4]
+    if magic.startswith(_GZIP_MAGIC):
+        return gzip.GzipFile(fileobj=buffered, mode="rb")
+    if magic == _ZSTD_MAGIC:
+        if zstandard is None:
+            raise ExportError("Export is zstd-compressed but zstandard is not installed")
+        return zstandard.ZstdDecompressor().stream_reader(buffered, read_across_frames=True)
+    return buffered
+
+
+# ── Export ─────────────────────────────────────────────────────
+
+class ExportService:
+    """Reads user-data tables page by page and renders them as NDJSON records."""
+
+    def __init__(self, db_service, page_rows: int = _PAGE_ROWS):
+        self.db_service = db_service
+        self.page_rows = max(1, int(page_rows))
+
+    def _existing_tables(self, tables: List[str]) -> Dict[str, bool]:
+        """{table: has_vec_companion} for the tables that exist in this database."""
+        with self.db_service.read() as conn:
+            names = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        return {t: f"{t}_vec" in names for t in tables if t in names}
+
+    def _read_page(self, table: str, after: int, with_vec: bool):
+        """One keyset page: (columns, rows, embeddings, vec_ok) on a short-lived read connection."""
+        with self.db_service.read() as conn:
+            cursor = conn.execute(
+                f"SELECT rowid, * FROM {table} WHERE rowid > ? ORDER BY rowid LIMIT ?",
+                (after, self.page_rows),
+            )
+            columns = [d[0] for d in cursor.description[1:]]
+            rows = cursor.fetchall()
+
+            embeddings = {}
+            vec_ok = with_vec
+            if with_vec and rows:
+                # Point lookups: vec0 serves rowid = ? directly, a range would scan
+                try:
+                    for row in rows:
+                        hit = conn.execute(f"SELECT embedding FROM {table}_vec WHERE rowid = ?", (row[0],)).fetchone()
+                        if hit is not None:
+                            embeddings[row[0]] = hit[0]
+                except Exception as e:
+                    logger.warning(f"{LOG_PREFIX} Skipping {table}_vec embeddings: {e}")
+                    embeddings, vec_ok = {}, False
+        return columns, rows, embeddings, vec_ok
+
+    def iter_records(
+        self,
+        tables: List[str],
+        resume: Optional[str] = None,
+        memory_store=None,
+        store_patterns: Optional[List[str]] = None,
+    ) -> Iterator[Dict]:
+        """Yield export records (dicts) in order, starting after the resume token if given."""
+        start_table, after = None, 0
+        if resume:
+            token = parse_resume_token(resume)
+            if token["table"] != MEMORY_STORE_STAGE and token["table"] not in tables:
+                raise ExportError(f"Resume token refers to unknown table '{token['table']}'")
+            start_table, after = token["table"], token["after"]
+
+        existing = self._existing_tables(tables)
+        yield {
+            "type": "header",
+            "format": EXPORT_FORMAT,
+            "version": EXPORT_VERSION,
+            "exported_at": datetime.now(timezone.utc).isoformat(),
+            "tables": [t for t in tables if t in existing],
+            "resumed_from": resume,
+        }
+
+        total = 0
+        skipping = start_table is not None
+        for table in tables:
+            if skipping:
+                if table != start_table:
+                    continue
+                skipping = False
+            else:
+                after = 0
+            if table not in existing:
+                continue
+
+            with_vec = existing[table]
+            header_sent = False
+            while True:
+                try:
+                    columns, rows, embeddings, vec_ok = self._read_page(table, after, with_vec)
+                except Exception as e:
+                    logger.warning(f"{LOG_PREFIX} Failed to read {table} after rowid {after}: {e}")
+                    yield {"type": "error", "table": table, "after": after, "error": "read failed"}
+                    break
+                if with_vec and not vec_ok:
+                    with_vec = False   # extension missing — stop trying for this table
+                if not header_sent:
+                    yield {"type": "table", "table": table, "columns": columns, "embeddings": with_vec}
+                    header_sent = True
+                if not rows:
+                    break
+
+                for row in rows:
+                    record = {
+                        "type": "row",
+                        "table": table,
+                        "rowid": row[0],
+                        "values": [encode_value(v) for v in tuple(row)[1:]],
+                    }
+                    if row[0] in embeddings:
+                        record["embedding"] = encode_value(embeddings[row[0]])
+                    yield record
+                after = rows[-1][0]
+                total += len(rows)
+                yield {"type": "checkpoint", "resume": make_resume_token(table, after), "rows": total}
+                if len(rows) < self.page_rows:
+                    break
+
+        yield {"type": "checkpoint", "resume": make_resume_token(MEMORY_STORE_STAGE, 0), "rows": total}
+
+        if memory_store is not None and store_patterns:
+            try:
+                entries = memory_store.export_matching(store_patterns)
+            except Exception as e:
+                logger.warning(f"{LOG_PREFIX} MemoryStore export failed: {e}")
+                entries = {}
+            yield {"type": "memory_store", "patterns": store_patterns, "entries": entries}
+
+        yield {"type": "end", "rows": total}
+
+    def iter_ndjson(self, tables: List[str], **kwargs) -> Iterator[bytes]:
+        """iter_records() rendered as UTF-8 NDJSON lines, one page per chunk."""
+        lines: List[str] = []
+        for record in self.iter_records(tables, **kwargs):
+            lines.append(json.dumps(record, separators=(",", ":"), default=str))
+            if record["type"] != "row":
+                yield ("\n".join(lines) + "\n").encode("utf-8")
+                lines = []
+        if lines:
+            yield ("\n".join(lines) + "\n").encode("utf-8")
+
+    def stream(self, tables: List[str], compression: str = "gzip", **kwargs) -> Iterator[bytes]:
+        """Compressed NDJSON export, ready to hand to a streaming HTTP response."""
+        return compress_stream(self.iter_ndjson(tables, **kwargs), compression)
+
+
+# ── Import ─────────────────────────────────────────────────────
+
+class _TableImport:
+    """Buffered inserts for one (initially empty) table and its _vec companion."""
+
+    def __init__(self, conn_columns: List[str], table: str, columns: List[str], has_vec: bool):
+        self.table = table
+        known = set(conn_columns)
+        # Columns the current schema no longer has are dropped
+        self.keep = [i for i, c in enumerate(columns) if c in known]
+        dropped = [c for c in columns if c not in known]
+        if dropped:
+            logger.warning(f"{LOG_PREFIX} {table}: ignoring unknown columns {dropped}")
+        names = ", ".join(["rowid"] + [columns[i] for i in self.keep])
+        marks = ", ".join("?" * (len(self.keep) + 1))
+        self.insert_sql = f"INSERT OR REPLACE INTO {table} ({names}) VALUES ({marks})"
+        # vec0 has no REPLACE conflict handling: clear the rowid, then insert
+        self.vec_delete_sql = f"DELETE FROM {table}_vec WHERE rowid = ?" if has_vec else None
+        self.vec_sql = f"INSERT INTO {table}_vec (rowid, embedding) VALUES (?, ?)" if has_vec else None
+        self.rows: List[tuple] = []
+        self.vectors: List[tuple] = []
+        # Embeddings in the stream with no _vec table to receive them
+        self.unattached = 0
+
+    def add(self, record: Dict) -> None:
+        values = record["values"]
+        self.rows.append((record["rowid"], *[decode_value(values[i]) for i in self.keep]))
+        if record.get("embedding") is not None:
+            if self.vec_sql:
+                self.vectors.append((record["rowid"], decode_value(record["embedding"])))
+            else:
+                self.unattached += 1
+
+
+def import_ndjson(
+    db_service,
+    stream: IO[bytes],
+    batch_rows: int = _IMPORT_BATCH_ROWS,
+    tables: Iterable[str] = USER_DATA_TABLES,
+) -> Dict:
+    """
+    Bulk-load an export produced by ExportService into db_service.
+
+    Only tables listed in `tables` that exist locally are restored, and a
+    table that already holds rows is refused rather than merged (exported
+    rowids would overwrite unrelated local rows). The one exception is the
+    table a resumed stream continues, which may already hold rows up to the
+    resume rowid (the earlier part of the same export). Rows are written in
+    batches of batch_rows, one writer transaction per batch. Returns
+    {"tables": {table: rows}, "rows", "embeddings", "embeddings_skipped",
+    "embedding_errors": {table: error}, "skipped_tables", "non_empty_tables"}.
+    """
+    batch_rows = max(1, int(batch_rows))
+    allowed = set(tables)
+    reader = open_import_stream(stream)
+
+    with db_service.read() as conn:
+        names = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+
+    counts: Dict[str, int] = {}
+    skipped: List[str] = []
+    non_empty: List[str] = []
+    started = set()
+    # {table: rowid} from a resumed header — earlier parts were imported up to there
+    resumed_after: Dict[str, int] = {}
+    embedding_errors: Dict[str, str] = {}
+    stats = {"embeddings": 0, "embeddings_skipped": 0}
+    current: Optional[_TableImport] = None
+
+    def flush(target: Optional[_TableImport]) -> None:
+        if target is None:
+            return
+        if target.unattached:
+            stats["embeddings_skipped"] += target.unattached
+            embedding_errors.setdefault(target.table, f"no {target.table}_vec table")
+            target.unattached = 0
+        if not target.rows:
+            return
+        rows, vectors = target.rows, target.vectors
+        target.rows, target.vectors = [], []
+
+        def write_batch(conn):
+            conn.executemany(target.insert_sql, rows)
+            if not vectors:
+                return 0, None
+            # Savepoint: a failed embedding write must not take the rows with it
+            conn.execute("SAVEPOINT import_vec")
+            try:
+                conn.executemany(target.vec_delete_sql, [(rowid,) for rowid, _ in vectors])
+                conn.executemany(target.vec_sql, vectors)
+                written, error = len(vectors), None
+            except Exception as e:
+                conn.execute("ROLLBACK TO import_vec")
+                written, error = 0, str(e)
+            conn.execute("RELEASE import_vec")
+            return written, error
+
+        written, error = db_service.write(write_batch, label=f"import {target.table}")
+        counts[target.table] = counts.get(target.table, 0) + len(rows)
+        stats["embeddings"] += written
+        stats["embeddings_skipped"] += len(vectors) - written
+        if error:
+            logger.warning(f"{LOG_PREFIX} {len(vectors)} {target.table}_vec embeddings not written: {error}")
+            embedding_errors.setdefault(target.table, error)
+
+    seen_header = False
+    for line_no, raw in enumerate(io.TextIOWrapper(reader, encoding="utf-8"), start=1):
+        if not raw.strip():
+            continue
+        try:
+            record = json.loads(raw)
+            kind = record["type"]
+        except Exception:
+            raise ExportError(f"Malformed record on line {line_no}") from None
+
+        if kind == "header":
+            if record.get("format") != EXPORT_FORMAT or record.get("version") != EXPORT_VERSION:
+                raise ExportError("Not a chalie-export v1 stream")
+            if record.get("resumed_from"):
+                token = parse_resume_token(record["resumed_from"])
+                resumed_after[token["table"]] = token["after"]
+            seen_header = True
+        elif not seen_header:
+            raise ExportError("Missing export header")
+        elif kind == "table":
+            flush(current)
+            table = record["table"]
+            current = None
+            if table not in allowed or table not in names:
+                if table not in skipped:
+                    skipped.append(table)
+                continue
+            if table in non_empty:
+                continue
+            with db_service.read() as conn:
+                table_columns = [row[1] for row in conn.execute(f"PRAGMA table_info({table})")]
+                # A resumed stream repeats the table record; only refuse rows
+                # that were there before this import started, other than the
+                # earlier part of the table this stream resumes
+                max_rowid = conn.execute(f"SELECT MAX(rowid) FROM {table}").fetchone()[0]
+                if (table not in started and max_rowid is not None
+                        and max_rowid > resumed_after.get(table, 0)):
+                    logger.warning(f"{LOG_PREFIX} Refusing to import into non-empty table {table}")
+                    non_empty.append(table)
+                    continue
+            started.add(table)
+            current = _TableImport(
+                table_columns, table, record["columns"],
+                has_vec=bool(record.get("embeddings")) and f"{table}_vec" in names,
+            )
+        elif kind == "row":
+            if current is None or current.table != record.get("table"):
+                continue   # table skipped (or row without its table header)
+            current.add(record)
+            if len(current.rows) >= batch_rows:
+                flush(current)
+
+    flush(current)
+    result = {
+        "tables": counts,
+        "rows": sum(counts.values()),
+        "embeddings": stats["embeddings"],
+        "embeddings_skipped": stats["embeddings_skipped"],
+        "embedding_errors": embedding_errors,
+        "skipped_tables": skipped,
+        "non_empty_tables": non_empty,
+    }
+    logger.info(f"{LOG_PREFIX} Imported {result['rows']} rows into {len(counts)} tables")
+    return result
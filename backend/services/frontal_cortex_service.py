@@ -9,7 +9,7 @@
 import re
 import time
 import json
-from typing import Optional
+from typing import Callable, Optional
 import logging
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -196,6 +196,113 @@ def _extract_response_from_broken_json(text: str) -> str | None:
     return segment if segment else None
 
 
+_JSON_ESCAPES = {'"': '"', '\\': '\\', '/': '/', 'b': '\b', 'f': '\f', 'n': '\n', 'r': '\r', 't': '\t'}
+_RESPONSE_KEY = re.compile(r'"response"\s*:\s*"')
+
+
+class ResponseFieldStreamer:
+    """
+    Incrementally extracts the user-facing 'response' string from a streamed
+    cortex generation and forwards decoded text to on_delta.
+
+    Cortex output is a JSON object, so raw tokens can't be shown to the user.
+    This scans for the "response" key, then decodes the string value character
+    by character (JSON escapes included) until its closing quote. Output that
+    doesn't start with '{' (after an optional code fence) is treated as prose
+    and forwarded as-is, mirroring the prose-recovery layer in generate_response.
+
+    The streamed text is a preview only — the parsed, validated response from
+    generate_response remains authoritative.
+    """
+
+    _DETECT, _SEEK, _VALUE, _PROSE, _DONE = range(5)
+
+    def __init__(self, on_delta: Callable[[str], None]):
+        self._on_delta = on_delta
+        self._state = self._DETECT
+        self._pending = ''  # raw text not yet consumed by the current state
+
+    def feed(self, chunk: str):
+        """Consume one raw chunk of LLM output."""
+        if self._state == self._DONE or not chunk:
+            return
+        if self._state == self._PROSE:
+            self._on_delta(chunk)
+            return
+
+        self._pending += chunk
+        if self._state == self._DETECT:
+            self._detect()
+        if self._state == self._SEEK:
+            match = _RESPONSE_KEY.search(self._pending)
+            if not match:
+                return
+            self._pending = self._pending[match.end():]
+            self._state = self._VALUE
+        if self._state == self._VALUE:
+            self._decode()
+
+    def _detect(self):
+        text = self._pending.lstrip()
+        if text.startswith('`'):
+            # Code fence: wait for the end of the opening fence line
+            if len(text) < 3 or '\n' not in text:
+                return
+            text = text.split('\n', 1)[1].lstrip()
+        if not text:
+            return
+        if text.startswith('{'):
+            self._state = self._SEEK
+            self._pending = text
+        else:
+            self._state = self._PROSE
+            self._pending = ''
+            self._on_delta(text)
+
+    def _decode(self):
+        raw = self._pending
+        out = []
+        i = 0
+        while i < len(raw):
+            ch = raw[i]
+            if ch == '"':
+                self._state = self._DONE
+                break
+            if ch != '\\':
+                out.append(ch)
+                i += 1
+                continue
+            if i + 1 >= len(raw):
+                break  # escape split across chunks
+            esc = raw[i + 1]
+            if esc != 'u':
+                # Unknown escapes (e.g. \$) drop the backslash, as the parser does
+                out.append(_JSON_ESCAPES.get(esc, esc))
+                i += 2
+                continue
+            if i + 6 > len(raw):
+                break
+            code = int(raw[i + 2:i + 6], 16) if all(c in '0123456789abcdefABCDEF' for c in raw[i + 2:i + 6]) else None
+            if code is None:
+                out.append(raw[i + 2:i + 6])
+                i += 6
+            elif 0xD800 <= code < 0xDC00:
+                # High surrogate: needs the following \uXXXX low surrogate
+                if i + 12 > len(raw):
+                    break
+                try:
+                    out.append(json.loads('"' + raw[i:i + 12] + '"'))
+                except json.JSONDecodeError:
+                    out.append('\ufffd')
+                i += 12
+            else:
+                out.append(chr(code))
+                i += 6
+        self._pending = raw[i:] if self._state == self._VALUE else ''
+        if out:
+            self._on_delta(''.join(out))
+
+
 class FrontalCortexService:
     """Service for generating contextual responses using LLM."""
 
@@ -222,6 +329,7 @@ class FrontalCortexService:
         thread_id: str = None,
         returning_from_silence: bool = False,
         inclusion_map: dict = None,
+        on_delta: Callable[[str], None] = None,
     ) -> dict:
         """
         Generate a response based on the prompt, classification, and history.
@@ -232,6 +340,8 @@ class FrontalCortexService:
             classification: Dict containing topic, confidence, etc.
             chat_history: List of previous exchanges
             act_history: Formatted ACT loop history (defaults to empty)
+            on_delta: Optional callback receiving the user-facing response text
+                incrementally while the LLM streams (see ResponseFieldStreamer)
 
         Returns:
             dict: {
@@ -262,7 +372,13 @@ class FrontalCortexService:
 
         # Generate response from LLM
         try:
-            response_text = self.llm.send_message(system_prompt, original_prompt).text
+            if on_delta is not None:
+                streamer = ResponseFieldStreamer(on_delta)
+                response_text = self.llm.send_message(
+                    system_prompt, original_prompt, stream=True, on_token=streamer.feed,
+                ).text
+            else:
+                response_text = self.llm.send_message(system_prompt, original_prompt).text
         except Exception as e:
             # Re-raise with context for upstream handling
             raise Exception(f"LLM generation failed: {str(e)}") from e
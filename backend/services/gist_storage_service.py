@@ -1,4 +1,3 @@
-import json
 import logging
 import time
 import uuid
@@ -119,11 +118,7 @@ class GistStorageService:
                 'created_at': current_time
             }
 
-            self.store.setex(
-                gist_key,
-                self.attention_span_seconds,
-                json.dumps(gist_data)
-            )
+            self.store.set_obj(gist_key, gist_data, ex=self.attention_span_seconds)
 
             index_key = self._get_gist_index_key(topic)
             self.store.zadd(index_key, {gist_id: current_time})
@@ -143,10 +138,10 @@ class GistStorageService:
             'response': response,
             'timestamp': current_time
         }
-        self.store.setex(
+        self.store.set_obj(
             self._get_last_message_key(topic),
-            self.attention_span_seconds,
-            json.dumps(last_message_data)
+            last_message_data,
+            ex=self.attention_span_seconds,
         )
 
         return stored_count
@@ -159,10 +154,10 @@ class GistStorageService:
         results = []
         for gist_id in gist_ids:
             gist_key = self._get_gist_key(topic, gist_id)
-            gist_json = self.store.get(gist_key)
+            gist_data = self.store.get_obj(gist_key)
 
-            if gist_json:
-                results.append((gist_id, json.loads(gist_json)))
+            if gist_data:
+                results.append((gist_id, gist_data))
             else:
                 # Clean up stale index entry (TTL expired on the gist key)
                 self.store.zrem(index_key, gist_id)
@@ -198,7 +193,7 @@ class GistStorageService:
     def _replace_gist(self, topic: str, old_id: str, new_data: Dict):
         """Replace an existing gist's data in-place (same ID, refreshed TTL)."""
         gist_key = self._get_gist_key(topic, old_id)
-        self.store.setex(gist_key, self.attention_span_seconds, json.dumps(new_data))
+        self.store.set_obj(gist_key, new_data, ex=self.attention_span_seconds)
         # Update score in index to current time
         index_key = self._get_gist_index_key(topic)
         self.store.zadd(index_key, {old_id: new_data['created_at']})
@@ -247,10 +242,9 @@ class GistStorageService:
         gists = []
         for gist_id in gist_ids:
             gist_key = self._get_gist_key(topic, gist_id)
-            gist_json = self.store.get(gist_key)
+            gist_data = self.store.get_obj(gist_key)
 
-            if gist_json:
-                gist_data = json.loads(gist_json)
+            if gist_data:
                 gists.append({
                     'content': gist_data['content'],
                     'type': gist_data['type'],
@@ -279,12 +273,12 @@ class GistStorageService:
             Dict with 'prompt' and 'response' or None
         """
         last_message_key = self._get_last_message_key(topic)
-        last_message_json = self.store.get(last_message_key)
+        last_message = self.store.get_obj(last_message_key)
 
-        if last_message_json:
+        if last_message:
             # Refresh TTL on read (touch-on-read)
             self.store.expire(last_message_key, self.attention_span_seconds)
-            return json.loads(last_message_json)
+            return last_message
 
         return None
 
@@ -368,7 +362,7 @@ class GistStorageService:
                 'created_at': current_time
             }
 
-            self.store.setex(gist_key, self.COLD_START_TTL, json.dumps(gist_data))
+            self.store.set_obj(gist_key, gist_data, ex=self.COLD_START_TTL)
             self.store.zadd(index_key, {gist_id: current_time})
 
         self.store.expire(index_key, self.COLD_START_TTL)
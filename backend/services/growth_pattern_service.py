@@ -20,7 +20,6 @@ by AdaptiveLayerService as growth reflections in the response prompt.
 
 import json
 import logging
-import time
 from datetime import datetime, timezone
 from typing import Optional
 
@@ -65,22 +64,6 @@ class GrowthPatternService:
         self.interval = interval
         logger.info(f"[GROWTH PATTERN] Initialized (interval={interval}s)")
 
-    def run(self, shared_state: Optional[dict] = None) -> None:
-        """Main service loop."""
-        logger.info("[GROWTH PATTERN] Service started")
-
-        while True:
-            try:
-                time.sleep(self.interval)
-                logger.info("[GROWTH PATTERN] Running growth cycle...")
-                self.run_growth_cycle()
-            except KeyboardInterrupt:
-                logger.info("[GROWTH PATTERN] Service shutting down...")
-                break
-            except Exception as e:
-                logger.error(f"[GROWTH PATTERN] Error: {e}", exc_info=True)
-                time.sleep(60)
-
     def run_growth_cycle(self) -> dict:
         """
         Run one full growth detection cycle.
@@ -371,10 +354,7 @@ class GrowthPatternService:
             pass  # Non-critical — logging failure should not interrupt the cycle
 
 
-def growth_pattern_worker(shared_state: Optional[dict] = None) -> None:
-    """
-    Module-level entry point for threading (run.py pattern).
-    Instantiates the service inside the child process.
-    """
+def register_growth_pattern_job(scheduler) -> None:
+    """Register the periodic growth detection cycle on the job scheduler."""
     service = GrowthPatternService(interval=DEFAULT_INTERVAL)
-    service.run(shared_state)
+    scheduler.add_job("growth-pattern", service.run_growth_cycle, interval=service.interval)
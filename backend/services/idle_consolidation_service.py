@@ -51,48 +51,26 @@ class IdleConsolidationService:
             f"(check_interval={check_interval}s, idle_threshold=900s)"
         )
 
-    def run(self, shared_state: Optional[dict] = None) -> None:
+    def run_idle_cycle(self) -> None:
         """
-        Main service loop - checks for idle state and triggers consolidation.
+        Job entry point — runs only when the scheduler's idle gate passes.
 
-        Args:
-            shared_state: Optional shared state dict (for consumer integration)
+        Triggers batch consolidation if 15 minutes have passed since the last one.
         """
-        logger.info("[IDLE CONSOLIDATION] Service started")
-
-        while True:
-            try:
-                # Sleep for check interval
-                time.sleep(self.check_interval)
-
-                # Check if workers are idle
-                if not self._are_workers_idle():
-                    logger.debug("[IDLE CONSOLIDATION] Workers not idle, skipping")
-                    continue
+        state = self.tracker.get_state()
+        time_since_last = time.time() - state['last_consolidation_time']
 
-                # Check if 1 hour has passed since last consolidation
-                state = self.tracker.get_state()
-                time_since_last = time.time() - state['last_consolidation_time']
-
-                if time_since_last >= 900:  # 15 minutes (fallback; primary trigger is episode-count)
-                    logger.info(
-                        f"[IDLE CONSOLIDATION] System idle for {time_since_last/60:.1f} minutes, "
-                        f"triggering batch consolidation"
-                    )
-                    self._trigger_consolidation()
-                else:
-                    logger.debug(
-                        f"[IDLE CONSOLIDATION] Idle but only {time_since_last/60:.1f} minutes "
-                        f"since last consolidation (need 15 min)"
-                    )
-
-            except KeyboardInterrupt:
-                logger.info("[IDLE CONSOLIDATION] Service shutting down...")
-                break
-            except Exception as e:
-                logger.error(f"[IDLE CONSOLIDATION] Error: {e}", exc_info=True)
-                logger.info("[IDLE CONSOLIDATION] Waiting 1 minute before retry...")
-                time.sleep(60)
+        if time_since_last >= 900:  # 15 minutes (fallback; primary trigger is episode-count)
+            logger.info(
+                f"[IDLE CONSOLIDATION] System idle for {time_since_last/60:.1f} minutes, "
+                f"triggering batch consolidation"
+            )
+            self._trigger_consolidation()
+        else:
+            logger.debug(
+                f"[IDLE CONSOLIDATION] Idle but only {time_since_last/60:.1f} minutes "
+                f"since last consolidation (need 15 min)"
+            )
 
     def _are_workers_idle(self) -> bool:
         """
@@ -355,11 +333,10 @@ class IdleConsolidationService:
             )
 
 
-def idle_consolidation_process(shared_state):
-    """Top-level entry point for thread spawn.
-
-    Creates the service instance inside the child process to avoid
-    pickling MemoryStore connections (which contain _thread.lock objects).
-    """
+def register_idle_consolidation_job(scheduler) -> None:
+    """Register the idle-gated consolidation check on the job scheduler."""
     service = IdleConsolidationService()
-    service.run(shared_state)
+    scheduler.add_job(
+        "idle-consolidation", service.run_idle_cycle,
+        interval=service.check_interval, idle_gate=service._are_workers_idle,
+    )
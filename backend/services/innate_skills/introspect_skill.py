@@ -155,7 +155,9 @@ def _get_recent_autonomous_actions(limit: int = 5) -> list:
     RELEVANT_TYPES = ('proactive_sent', 'cron_tool_executed', 'plan_proposed')
     try:
         from services.database_service import get_shared_db_service
+        from services.write_behind_queue import flush_pending
         db_service = get_shared_db_service()
+        flush_pending(db_service)
         placeholders = ','.join(['?'] * len(RELEVANT_TYPES))
         with db_service.connection() as conn:
             cursor = conn.cursor()
@@ -78,7 +78,9 @@ def _get_recent_iterations(topic: str, limit: int) -> List[Dict]:
     try:
         from services.database_service import get_shared_db_service
         from services.time_utils import parse_utc
+        from services.write_behind_queue import flush_pending
         db = get_shared_db_service()
+        flush_pending(db)
         with db.connection() as conn:
             cursor = conn.cursor()
             cursor.execute("""
@@ -175,7 +177,9 @@ def _analyze_act_strategies(topic: str) -> Optional[Dict]:
     try:
         from services.database_service import get_shared_db_service
         from services.time_utils import parse_utc
+        from services.write_behind_queue import flush_pending
         db = get_shared_db_service()
+        flush_pending(db)
 
         with db.connection() as conn:
             cursor = conn.cursor()
@@ -3,6 +3,9 @@ Interaction Log Service - Immutable audit trail of all raw events.
 
 Append-only SQLite-backed log of user inputs, classifications, and system responses.
 Follows EpisodicStorageService pattern (DatabaseService injection, get_connection/release_connection).
+
+Inserts go through the write-behind queue (off the caller's thread when enabled);
+the query methods flush it first so they always see this process's own events.
 """
 
 import json
@@ -11,6 +14,15 @@ import logging
 from datetime import datetime, timedelta, timezone
 from typing import List, Optional, Dict, Any
 from services.database_service import DatabaseService
+from services.write_behind_queue import flush_pending, write_behind
+
+_INSERT_EVENT_SQL = """
+    INSERT INTO interaction_log (
+        id, event_type, topic, exchange_id, session_id, source,
+        payload, metadata, thread_id
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
 
 
 # Activity-relevant event types (autonomous actions only, not conversation).
@@ -91,31 +103,20 @@ class InteractionLogService:
         try:
             event_id = str(uuid.uuid4())
 
-            with self.db_service.connection() as conn:
-                cursor = conn.cursor()
-
-                cursor.execute("""
-                    INSERT INTO interaction_log (
-                        id, event_type, topic, exchange_id, session_id, source,
-                        payload, metadata, thread_id
-                    )
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    event_id,
-                    event_type,
-                    topic,
-                    exchange_id,
-                    session_id,
-                    source,
-                    json.dumps(payload),
-                    json.dumps(metadata or {}),
-                    thread_id,
-                ))
-
-                cursor.close()
-
-                logging.info(f"[INTERACTION LOG] Logged {event_type} event {event_id} for topic '{topic}'")
-                return event_id
+            write_behind(self.db_service, _INSERT_EVENT_SQL, (
+                event_id,
+                event_type,
+                topic,
+                exchange_id,
+                session_id,
+                source,
+                json.dumps(payload),
+                json.dumps(metadata or {}),
+                thread_id,
+            ))
+
+            logging.info(f"[INTERACTION LOG] Logged {event_type} event {event_id} for topic '{topic}'")
+            return event_id
 
         except Exception as e:
             logging.error(f"[INTERACTION LOG] Failed to log event: {e}")
@@ -139,6 +140,7 @@ class InteractionLogService:
             List of event dicts ordered by created_at ascending
         """
         try:
+            flush_pending(self.db_service)
             with self.db_service.connection() as conn:
                 cursor = conn.cursor()
 
@@ -181,6 +183,7 @@ class InteractionLogService:
             List of event dicts ordered by created_at ascending
         """
         try:
+            flush_pending(self.db_service)
             with self.db_service.connection() as conn:
                 cursor = conn.cursor()
 
@@ -217,6 +220,7 @@ class InteractionLogService:
             List of user_input and system_response events in chronological order
         """
         try:
+            flush_pending(self.db_service)
             with self.db_service.connection() as conn:
                 cursor = conn.cursor()
 
@@ -262,6 +266,7 @@ class InteractionLogService:
         sql_cap = min((offset + limit) * 3, 1000)
 
         try:
+            flush_pending(self.db_service)
             with self.db_service.connection() as conn:
                 cursor = conn.cursor()
 
@@ -364,6 +369,7 @@ class InteractionLogService:
         try:
             since = datetime.now(timezone.utc) - timedelta(hours=since_hours)
             since_str = since.isoformat()
+            flush_pending(self.db_service)
 
             with self.db_service.connection() as conn:
                 cursor = conn.cursor()
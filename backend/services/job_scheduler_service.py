@@ -0,0 +1,381 @@
+"""
+Job Scheduler Service — one timer wheel for all periodic background work.
+
+Background services (decay, growth patterns, stability regulators, thread
+expiry, scheduled-item polling, folder scans, ...) used to each own a daemon
+thread sleeping on its own cadence. They now register jobs here instead:
+
+    scheduler = get_job_scheduler()
+    scheduler.add_job('decay-engine', service.run_scheduled_cycle, interval=1800)
+    scheduler.add_job('curiosity-pursuit', service.run_once, interval=21600, jitter=0.3)
+    scheduler.add_job('idle-consolidation', service.run_idle_cycle, interval=300,
+                      idle_gate=service._are_workers_idle)
+
+A single ticker thread drives a hierarchical timer wheel and sleeps until the
+next occupied slot, handing due jobs to a small worker pool. A job never
+overlaps itself: if its previous run is still going when it comes due, that
+firing is skipped. Latency-sensitive jobs (scheduled-item polling, thread
+expiry) run on their own small reserved pool so long LLM-backed jobs filling
+the shared pool can't delay user reminders. Per-job run counts, wall and CPU time are kept so
+get_stats() shows which background job is costing the most.
+
+Entry point: job_scheduler_worker(shared_state=None) registered in run.py.
+"""
+
+import logging
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+LOG_PREFIX = "[JOB SCHEDULER]"
+
+# Wheel geometry: 1s ticks, 4 levels of 64 slots → ~194 days of range.
+TICK_SECONDS = 1.0
+WHEEL_SLOTS = 64
+WHEEL_LEVELS = 4
+
+# Background jobs are mostly short DB/MemoryStore sweeps; a few LLM-backed
+# ones (curiosity, autobiography, routing reflection, ...) run for minutes and
+# can occupy every shared worker at once. Per-job overlap prevention keeps any
+# one job from holding more than one worker.
+_POOL_SIZE = 4
+# Reserved lane for latency_sensitive jobs — never shared with the slow ones
+_LATENCY_POOL_SIZE = 2
+
+
+class _Timer:
+    __slots__ = ('job', 'expires')
+
+    def __init__(self, job, expires: int):
+        self.job = job
+        self.expires = expires
+
+
+class TimerWheel:
+    """
+    Hierarchical timing wheel (Varghese & Lauck) keyed by integer ticks.
+
+    Level 0 has one slot per tick; each higher level covers WHEEL_SLOTS times
+    the span of the one below. A timer is filed in the lowest level whose span
+    covers its delay and is cascaded down as the wheel turns, so insertion and
+    per-tick work are O(1) regardless of how many timers are pending. Delays
+    beyond the wheel's range are parked at the far end and re-filed on expiry.
+    """
+
+    def __init__(self, slots: int = WHEEL_SLOTS, levels: int = WHEEL_LEVELS):
+        self.slots = slots
+        self.levels = levels
+        self.current = 0
+        self._wheels: List[List[List[_Timer]]] = [
+            [[] for _ in range(slots)] for _ in range(levels)
+        ]
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, job, expires: int) -> None:
+        """File a timer for `job` to fire at tick `expires` (at least one tick ahead)."""
+        self._place(_Timer(job, max(expires, self.current + 1)))
+        self._count += 1
+
+    def _place(self, timer: _Timer) -> None:
+        delay = timer.expires - self.current
+        span = self.slots
+        for level in range(self.levels):
+            if delay < span or level == self.levels - 1:
+                target = min(timer.expires, self.current + span - 1)
+                slot = (target // (span // self.slots)) % self.slots
+                self._wheels[level][slot].append(timer)
+                return
+            span *= self.slots
+
+    def advance(self, to_tick: int) -> list:
+        """Turn the wheel up to `to_tick` and return the jobs that came due, in order."""
+        due = []
+        while self.current < to_tick:
+            self.current += 1
+            tick = self.current
+
+            # Cascade higher levels whose slot boundary we just crossed
+            span = self.slots
+            for level in range(1, self.levels):
+                if tick % span:
+                    break
+                slot = (tick // span) % self.slots
+                bucket = self._wheels[level][slot]
+                self._wheels[level][slot] = []
+                for timer in bucket:
+                    self._place(timer)
+                span *= self.slots
+
+            slot = tick % self.slots
+            bucket = self._wheels[0][slot]
+            if not bucket:
+                continue
+            self._wheels[0][slot] = []
+            for timer in bucket:
+                if timer.expires > tick:
+                    # Parked beyond the wheel's range — re-file the remainder
+                    self._place(timer)
+                    continue
+                self._count -= 1
+                due.append(timer.job)
+        return due
+
+    def next_tick(self) -> Optional[int]:
+        """Earliest tick that needs attention (a due slot or a cascade), or None if empty."""
+        if not self._count:
+            return None
+        higher_pending = any(
+            bucket for wheel in self._wheels[1:] for bucket in wheel
+        )
+        for offset in range(1, self.slots + 1):
+            tick = self.current + offset
+            if self._wheels[0][tick % self.slots]:
+                return tick
+            if higher_pending and tick % self.slots == 0:
+                return tick
+        return self.current + self.slots
+
+
+class ScheduledJob:
+    """A registered periodic job and its run-time statistics."""
+
+    def __init__(
+        self,
+        name: str,
+        fn: Callable[[], None],
+        interval: float,
+        jitter: float = 0.0,
+        idle_gate: Optional[Callable[[], bool]] = None,
+        latency_sensitive: bool = False,
+    ):
+        self.name = name
+        self.fn = fn
+        self.interval = interval
+        self.jitter = jitter
+        self.idle_gate = idle_gate
+        self.latency_sensitive = latency_sensitive
+        self.cancelled = False
+        self.running = False
+        self.next_run: Optional[float] = None
+
+        self.runs = 0
+        self.failures = 0
+        self.skipped_overlap = 0
+        self.skipped_busy = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.last_ms = 0.0
+        self.cpu_ms = 0.0
+        self.last_run: Optional[float] = None
+        self.last_error: Optional[str] = None
+
+    def next_delay(self) -> float:
+        """Seconds until the next run, with ±jitter applied to the interval."""
+        if self.jitter:
+            return self.interval * (1.0 + random.uniform(-self.jitter, self.jitter))
+        return self.interval
+
+    def stats(self) -> dict:
+        return {
+            'interval': self.interval,
+            'latency_sensitive': self.latency_sensitive,
+            'running': self.running,
+            'runs': self.runs,
+            'failures': self.failures,
+            'skipped_overlap': self.skipped_overlap,
+            'skipped_busy': self.skipped_busy,
+            'avg_ms': round(self.total_ms / self.runs, 2) if self.runs else 0.0,
+            'max_ms': round(self.max_ms, 2),
+            'last_ms': round(self.last_ms, 2),
+            'total_ms': round(self.total_ms, 2),
+            'cpu_ms': round(self.cpu_ms, 2),
+            'last_run': self.last_run,
+            'next_run': self.next_run,
+            'last_error': self.last_error,
+        }
+
+
+class JobScheduler:
+    """
+    Runs registered periodic jobs off a single timer wheel.
+
+    Scheduling is fixed-rate: the next run is filed when a job is dispatched,
+    not when it finishes. An idle-gated job is only run when its gate returns
+    True at dispatch time; otherwise that firing counts as skipped_busy.
+    """
+
+    def __init__(
+        self,
+        tick: float = TICK_SECONDS,
+        pool_size: int = _POOL_SIZE,
+        latency_pool_size: int = _LATENCY_POOL_SIZE,
+    ):
+        self.tick = tick
+        self._origin = time.monotonic()
+        self._wheel = TimerWheel()
+        self._jobs: Dict[str, ScheduledJob] = {}
+        self._cond = threading.Condition()
+        self._stopped = False
+        self._pool = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix="job")
+        self._latency_pool = ThreadPoolExecutor(max_workers=latency_pool_size, thread_name_prefix="job-fast")
+
+    def _now_tick(self) -> int:
+        return int((time.monotonic() - self._origin) / self.tick)
+
+    def add_job(
+        self,
+        name: str,
+        fn: Callable[[], None],
+        interval: float,
+        jitter: float = 0.0,
+        initial_delay: Optional[float] = None,
+        idle_gate: Optional[Callable[[], bool]] = None,
+        latency_sensitive: bool = False,
+    ) -> None:
+        """
+        Register a periodic job, replacing any existing job with the same name.
+
+        Args:
+            name: Unique job name (used in logs and stats)
+            fn: Zero-argument callable run on a pool worker
+            interval: Seconds between runs
+            jitter: Fractional ± spread applied to every interval (0.3 = ±30%)
+            initial_delay: Seconds before the first run (defaults to one interval)
+            idle_gate: Optional callable; the run is skipped unless it returns True
+            latency_sensitive: Run on the reserved pool (short, user-visible jobs only)
+        """
+        job = ScheduledJob(name, fn, interval, jitter=jitter, idle_gate=idle_gate,
+                           latency_sensitive=latency_sensitive)
+        with self._cond:
+            existing = self._jobs.get(name)
+            if existing:
+                existing.cancelled = True
+            self._jobs[name] = job
+            self._schedule(job, job.next_delay() if initial_delay is None else initial_delay)
+            self._cond.notify()
+        logger.info(f"{LOG_PREFIX} Registered job '{name}' (interval={interval}s)")
+
+    def remove_job(self, name: str) -> bool:
+        """Cancel a job. An in-flight run is allowed to finish."""
+        with self._cond:
+            job = self._jobs.pop(name, None)
+            if not job:
+                return False
+            job.cancelled = True
+            return True
+
+    def get_stats(self) -> Dict[str, dict]:
+        """Per-job run-time statistics, keyed by job name."""
+        with self._cond:
+            return {name: job.stats() for name, job in self._jobs.items()}
+
+    def _schedule(self, job: ScheduledJob, delay: float) -> None:
+        # Caller holds self._cond
+        ticks = max(1, int(round(delay / self.tick)))
+        self._wheel.add(job, self._wheel.current + ticks)
+        job.next_run = time.time() + ticks * self.tick
+
+    def run_pending(self) -> int:
+        """Advance the wheel to now and dispatch every due job. Returns the dispatch count."""
+        with self._cond:
+            due = self._wheel.advance(self._now_tick())
+            dispatched = 0
+            for job in due:
+                if job.cancelled:
+                    continue
+                self._schedule(job, job.next_delay())
+                if job.running:
+                    job.skipped_overlap += 1
+                    logger.debug(f"{LOG_PREFIX} '{job.name}' still running, skipping this run")
+                    continue
+                job.running = True
+                pool = self._latency_pool if job.latency_sensitive else self._pool
+                pool.submit(self._execute, job)
+                dispatched += 1
+            return dispatched
+
+    def _execute(self, job: ScheduledJob) -> None:
+        try:
+            if job.idle_gate is not None:
+                try:
+                    idle = job.idle_gate()
+                except Exception as e:
+                    logger.debug(f"{LOG_PREFIX} Idle gate for '{job.name}' failed: {e}")
+                    idle = True  # fail-open, as the services' own checks did
+                if not idle:
+                    job.skipped_busy += 1
+                    return
+
+            job.last_run = time.time()
+            start = time.perf_counter()
+            cpu_start = time.thread_time()
+            try:
+                job.fn()
+                job.last_error = None
+            except Exception as e:
+                job.failures += 1
+                job.last_error = f"{type(e).__name__}: {e}"
+                logger.error(f"{LOG_PREFIX} Job '{job.name}' failed: {e}", exc_info=True)
+            finally:
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                job.cpu_ms += (time.thread_time() - cpu_start) * 1000
+                job.runs += 1
+                job.last_ms = elapsed_ms
+                job.total_ms += elapsed_ms
+                job.max_ms = max(job.max_ms, elapsed_ms)
+        finally:
+            job.running = False
+
+    def run(self) -> None:
+        """Ticker loop: sleep until the next occupied slot, then dispatch. Blocks."""
+        logger.info(
+            f"{LOG_PREFIX} Started ({len(self._jobs)} jobs, pool={self._pool._max_workers}, "
+            f"latency pool={self._latency_pool._max_workers})"
+        )
+        with self._cond:
+            self._stopped = False
+        while True:
+            self.run_pending()
+            with self._cond:
+                if self._stopped:
+                    break
+                next_tick = self._wheel.next_tick()
+                if next_tick is None:
+                    self._cond.wait()
+                else:
+                    timeout = self._origin + next_tick * self.tick - time.monotonic()
+                    if timeout > 0:
+                        # Small margin so float rounding never wakes us a tick early
+                        self._cond.wait(timeout + 0.001)
+
+    def stop(self) -> None:
+        """Stop the ticker loop after its current pass."""
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+
+
+_scheduler: Optional[JobScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_job_scheduler() -> JobScheduler:
+    """Get or create the process-wide job scheduler."""
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                _scheduler = JobScheduler()
+    return _scheduler
+
+
+def job_scheduler_worker(shared_state=None):
+    """Module-level entry point for run.py."""
+    get_job_scheduler().run()
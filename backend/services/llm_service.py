@@ -6,13 +6,17 @@ Usage:
     llm = create_llm_service(config)
     response = llm.send_message(system_prompt, user_message)
     text = response.text
+
+Streaming:
+    Pass stream=True with an on_token callback to receive text deltas as the
+    provider produces them. send_message still returns the complete LLMResponse.
 """
 
 import os
 import time
 import logging
 from dataclasses import dataclass
-from typing import Optional
+from typing import Callable, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -63,6 +67,35 @@ class LLMResponse:
     latency_ms: Optional[int] = None
 
 
+class _TokenSink:
+    """
+    Forwards streamed text to an on_token callback and records whether any
+    text reached it.
+
+    Once a consumer has seen part of a response, retrying or failing over would
+    deliver duplicate text, so providers convert mid-stream failures into
+    NonRetryableError via raise_if_partial().
+    """
+
+    def __init__(self, on_token: Optional[Callable[[str], None]]):
+        self._on_token = on_token
+        self.emitted = False
+
+    def __call__(self, text: str):
+        if not text:
+            return
+        self.emitted = True
+        if self._on_token:
+            self._on_token(text)
+
+    def raise_if_partial(self, provider: str, error: Exception):
+        """Raise NonRetryableError if the stream failed after emitting text."""
+        if self.emitted:
+            raise NonRetryableError(
+                f"{provider} stream interrupted after partial output: {error}"
+            ) from error
+
+
 def _call_with_retry(fn, max_retries=2, backoff=1.0):
     """Retry fn() up to max_retries times with exponential backoff.
 
@@ -106,14 +139,18 @@ class FallbackLLMService:
         self._primary = primary
         self._fallback = fallback
 
-    def send_message(self, system_prompt: str, user_message: str, stream: bool = False) -> LLMResponse:
+    def send_message(self, system_prompt: str, user_message: str, stream: bool = False,
+                     on_token: Optional[Callable[[str], None]] = None) -> LLMResponse:
+        sink = _TokenSink(on_token)
         try:
-            return self._primary.send_message(system_prompt, user_message, stream=stream)
+            return self._primary.send_message(system_prompt, user_message, stream=stream, on_token=sink)
         except RateLimitError:
             raise  # Rate limits propagate — fallback provider is likely also rate-limited
         except Exception as e:
+            if sink.emitted:
+                raise  # Consumer already saw partial output — a fallback would duplicate it
             logger.warning(f"Primary LLM failed, using fallback: {e}")
-            return self._fallback.send_message(system_prompt, user_message, stream=stream)
+            return self._fallback.send_message(system_prompt, user_message, stream=stream, on_token=on_token)
 
 
 def _build_service(config: dict):
@@ -235,9 +272,10 @@ class RefreshableLLMService:
             self._service = primary
             self._version = current_version
 
-    def send_message(self, system_prompt: str, user_message: str, stream: bool = False) -> LLMResponse:
+    def send_message(self, system_prompt: str, user_message: str, stream: bool = False,
+                     on_token: Optional[Callable[[str], None]] = None) -> LLMResponse:
         self._ensure_fresh()
-        return self._service.send_message(system_prompt, user_message, stream=stream)
+        return self._service.send_message(system_prompt, user_message, stream=stream, on_token=on_token)
 
 
 def create_refreshable_llm_service(agent_name: str) -> RefreshableLLMService:
@@ -270,25 +308,31 @@ class AnthropicService:
         self.model = config.get('model', 'claude-haiku-4-5-20251001')
         self.timeout = config.get('timeout', 120)
 
-    def send_message(self, system_prompt: str, user_message: str, stream: bool = False) -> LLMResponse:
-        if stream:
-            raise NotImplementedError("Streaming not yet supported")
-
+    def send_message(self, system_prompt: str, user_message: str, stream: bool = False,
+                     on_token: Optional[Callable[[str], None]] = None) -> LLMResponse:
         import anthropic
 
         api_key = _resolve_api_key(self._config)
         client = anthropic.Anthropic(api_key=api_key, timeout=self.timeout)
+        sink = _TokenSink(on_token)
 
         start_time = time.time()
 
+        request_kwargs = {
+            'model': self.model,
+            'max_tokens': self._MAX_TOKENS,
+            'system': system_prompt,
+            'messages': [{"role": "user", "content": user_message}],
+        }
+
         def _call():
             try:
-                return client.messages.create(
-                    model=self.model,
-                    max_tokens=self._MAX_TOKENS,
-                    system=system_prompt,
-                    messages=[{"role": "user", "content": user_message}],
-                )
+                if not stream:
+                    return client.messages.create(**request_kwargs)
+                with client.messages.stream(**request_kwargs) as message_stream:
+                    for text_delta in message_stream.text_stream:
+                        sink(text_delta)
+                    return message_stream.get_final_message()
             except anthropic.RateLimitError as e:
                 retry_after = None
                 if hasattr(e, 'response') and e.response is not None:
@@ -299,6 +343,9 @@ class AnthropicService:
                         except (ValueError, TypeError):
                             pass
                 raise RateLimitError(str(e), retry_after=retry_after, provider='anthropic') from e
+            except Exception as e:
+                sink.raise_if_partial('anthropic', e)
+                raise
 
         response = _call_with_retry(_call)
         latency_ms = int((time.time() - start_time) * 1000)
@@ -330,15 +377,14 @@ class OpenAIService:
         self.timeout = config.get('timeout', 120)
         self.format = config.get('format', 'text')
 
-    def send_message(self, system_prompt: str, user_message: str, stream: bool = False) -> LLMResponse:
-        if stream:
-            raise NotImplementedError("Streaming not yet supported")
-
+    def send_message(self, system_prompt: str, user_message: str, stream: bool = False,
+                     on_token: Optional[Callable[[str], None]] = None) -> LLMResponse:
         import openai as openai_mod
         from openai import OpenAI
 
         api_key = _resolve_api_key(self._config)
         client = OpenAI(api_key=api_key, timeout=self.timeout)
+        sink = _TokenSink(on_token)
 
         start_time = time.time()
 
@@ -352,9 +398,38 @@ class OpenAIService:
         if self.format == 'json':
             create_kwargs['response_format'] = {"type": "json_object"}
 
+        def _complete():
+            """Returns (content, finish_reason, model, prompt_tokens, completion_tokens)."""
+            if not stream:
+                response = client.chat.completions.create(**create_kwargs)
+                choice = response.choices[0]
+                return (choice.message.content, choice.finish_reason, response.model,
+                        response.usage.prompt_tokens, response.usage.completion_tokens)
+
+            parts = []
+            finish_reason = None
+            model = self.model
+            prompt_tokens = completion_tokens = None
+            chunks = client.chat.completions.create(
+                **create_kwargs, stream=True, stream_options={"include_usage": True},
+            )
+            for chunk in chunks:
+                model = chunk.model or model
+                if chunk.usage:
+                    prompt_tokens = chunk.usage.prompt_tokens
+                    completion_tokens = chunk.usage.completion_tokens
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    parts.append(delta)
+                    sink(delta)
+                finish_reason = chunk.choices[0].finish_reason or finish_reason
+            return ''.join(parts), finish_reason, model, prompt_tokens, completion_tokens
+
         def _call():
             try:
-                return client.chat.completions.create(**create_kwargs)
+                return _complete()
             except openai_mod.RateLimitError as e:
                 retry_after = None
                 if hasattr(e, 'response') and e.response is not None:
@@ -365,33 +440,35 @@ class OpenAIService:
                         except (ValueError, TypeError):
                             pass
                 raise RateLimitError(str(e), retry_after=retry_after, provider='openai') from e
+            except Exception as e:
+                sink.raise_if_partial('openai', e)
+                raise
 
-        response = _call_with_retry(_call)
+        content, finish_reason, model, prompt_tokens, completion_tokens = _call_with_retry(_call)
         latency_ms = int((time.time() - start_time) * 1000)
 
-        text = response.choices[0].message.content or ""
-        finish_reason = response.choices[0].finish_reason
+        text = content or ""
 
         if not text or not text.strip():
             logger.warning(
-                f"[OpenAIService] Empty response from model={response.model}, "
-                f"tokens={response.usage.prompt_tokens}+{response.usage.completion_tokens}, "
+                f"[OpenAIService] Empty response from model={model}, "
+                f"tokens={prompt_tokens}+{completion_tokens}, "
                 f"latency={latency_ms}ms, finish_reason={finish_reason}. "
-                f"Content was: {repr(response.choices[0].message.content)}"
+                f"Content was: {repr(content)}"
             )
         else:
             logger.info(
-                f"[OpenAIService] model={response.model}, "
-                f"tokens={response.usage.prompt_tokens}+{response.usage.completion_tokens}, "
+                f"[OpenAIService] model={model}, "
+                f"tokens={prompt_tokens}+{completion_tokens}, "
                 f"latency={latency_ms}ms"
             )
 
         return LLMResponse(
             text=text,
-            model=response.model,
+            model=model,
             provider='openai',
-            tokens_input=response.usage.prompt_tokens,
-            tokens_output=response.usage.completion_tokens,
+            tokens_input=prompt_tokens,
+            tokens_output=completion_tokens,
             latency_ms=latency_ms,
         )
 
@@ -404,10 +481,8 @@ class GeminiService:
         self.model = config.get('model', 'gemini-2.5-flash')
         self.format = config.get('format', 'text')
 
-    def send_message(self, system_prompt: str, user_message: str, stream: bool = False) -> LLMResponse:
-        if stream:
-            raise NotImplementedError("Streaming not yet supported")
-
+    def send_message(self, system_prompt: str, user_message: str, stream: bool = False,
+                     on_token: Optional[Callable[[str], None]] = None) -> LLMResponse:
         try:
             from google import genai
         except ImportError:
@@ -418,6 +493,7 @@ class GeminiService:
 
         api_key = _resolve_api_key(self._config)
         client = genai.Client(api_key=api_key)
+        sink = _TokenSink(on_token)
 
         start_time = time.time()
 
@@ -425,14 +501,34 @@ class GeminiService:
         if self.format == 'json':
             gen_config_kwargs['response_mime_type'] = 'application/json'
 
+        def _complete():
+            """Returns (text, usage_metadata, finish_reason)."""
+            request_kwargs = {
+                'model': self.model,
+                'contents': user_message,
+                'config': genai.types.GenerateContentConfig(**gen_config_kwargs),
+            }
+            if not stream:
+                response = client.models.generate_content(**request_kwargs)
+                return (response.text or "", getattr(response, 'usage_metadata', None),
+                        getattr(response, 'finish_reason', 'unknown'))
+
+            parts = []
+            usage = None
+            finish_reason = 'unknown'
+            for chunk in client.models.generate_content_stream(**request_kwargs):
+                if chunk.text:
+                    parts.append(chunk.text)
+                    sink(chunk.text)
+                usage = getattr(chunk, 'usage_metadata', None) or usage
+                finish_reason = getattr(chunk, 'finish_reason', None) or finish_reason
+            return ''.join(parts), usage, finish_reason
+
         def _call():
             try:
-                return client.models.generate_content(
-                    model=self.model,
-                    contents=user_message,
-                    config=genai.types.GenerateContentConfig(**gen_config_kwargs),
-                )
+                return _complete()
             except Exception as e:
+                sink.raise_if_partial('gemini', e)
                 # Gemini SDK raises google.api_core.exceptions.ResourceExhausted for 429
                 ename = type(e).__name__
                 if 'ResourceExhausted' in ename or '429' in str(e):
@@ -442,16 +538,13 @@ class GeminiService:
                     raise NonRetryableError(f"Gemini server error (no retry): {e}") from e
                 raise
 
-        response = _call_with_retry(_call)
+        text, usage, finish_reason = _call_with_retry(_call)
         latency_ms = int((time.time() - start_time) * 1000)
 
-        text = response.text if response.text else ""
         if not text:
-            finish_reason = getattr(response, 'finish_reason', 'unknown')
             logger.warning(f"[GeminiService] Empty response, finish_reason={finish_reason}")
             raise ValueError(f"Empty Gemini response (finish_reason={finish_reason})")
 
-        usage = getattr(response, 'usage_metadata', None)
         tokens_input = getattr(usage, 'prompt_token_count', None) if usage else None
         tokens_output = getattr(usage, 'candidates_token_count', None) if usage else None
 
@@ -2,45 +2,238 @@
 Memory Store — Thread-safe in-memory replacement for Redis.
 
 Implements the subset of redis.Redis API actually used by Chalie.
-All data is ephemeral — loss on restart is acceptable by design.
+Data is ephemeral unless a persistence journal is attached (see
+memory_store_persistence): every mutation then marks its key dirty so the
+journal can write it behind the hot path.
+
+Typed values: set_obj/get_obj and the *_obj list methods store Python objects
+(dicts, lists, tuples, NumPy arrays, bytes) without a JSON round-trip. Writes
+take a private copy (arrays become read-only); reads return a fresh copy of
+mutable containers, so callers can never alias stored state. The string API
+still works on typed keys and sees the JSON encoding of the value.
 
 Data structures:
 - STRING: dict[key] → (value, expiry_timestamp|None)
-- LIST: dict[key] → (list, expiry_timestamp|None)
+- LIST: dict[key] → (deque, expiry_timestamp|None)
 - HASH: dict[key] → (dict, expiry_timestamp|None)
 - SORTED SET: dict[key] → (SortedList, expiry_timestamp|None)
 
-Thread safety: one RLock per keyspace.
-TTL management: lazy eviction on read + background reaper every 60s.
+Thread safety: one RLock per keyspace. A pipeline takes the locks of every
+keyspace its commands touch once, in a fixed order, and runs the whole batch
+under them — so pipelines are atomic (MULTI/EXEC), and WATCHed keys are
+checked for modification under the same locks. Blocking pops (blpop/brpop) wait on a
+per-caller condition registered under each key they watch; pushes wake the
+waiters of that key immediately.
+Key index: every keyspace reports inserts/deletes to one sorted key index, so
+keys()/scan() with a literal prefix ("thread_conv:*") walk only the matching
+range in bounded batches, and scan() returns a real resumable cursor.
+TTL management: lazy eviction on read + an expiry min-heap; the background
+reaper pops only keys that are due instead of walking every keyspace.
 """
 
+import fnmatch
+import functools
+import heapq
+import itertools
 import json
 import logging
 import re
 import threading
 import time
-from collections import defaultdict
+from collections import OrderedDict, defaultdict, deque
+from itertools import islice
 from typing import Any, Dict, List, Optional, Tuple, Union
 
+from sortedcontainers import SortedList
+
 try:
-    from sortedcontainers import SortedList
+    import numpy as np
 except ImportError:
-    SortedList = None  # Graceful fallback — sorted set ops will raise
+    np = None
 
 logger = logging.getLogger(__name__)
 
+_IMMUTABLE_TYPES = (str, bytes, int, float, bool, type(None), frozenset)
+
+_REAP_INTERVAL = 10      # seconds between reaper passes
+_REAP_BATCH = 1000       # due keys handled per index-lock acquisition
+_INDEX_BATCH = 1000      # keys copied out of the index per lock acquisition
+_MAX_SCAN_CURSORS = 4096
+
+
+def _store_copy(value):
+    """Private copy of a typed value for storage."""
+    if isinstance(value, _IMMUTABLE_TYPES):
+        return value
+    if isinstance(value, dict):
+        return {k: _store_copy(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        items = [_store_copy(v) for v in value]
+        return items if isinstance(value, list) else tuple(items)
+    if isinstance(value, set):
+        return set(value)
+    if isinstance(value, bytearray):
+        return bytes(value)
+    if np is not None and isinstance(value, np.ndarray):
+        frozen = np.array(value, copy=True)
+        frozen.flags.writeable = False
+        return frozen
+    if np is not None and isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"MemoryStore cannot store values of type {type(value).__name__}")
+
+
+def _read_copy(value):
+    """Copy a stored typed value for a reader — only mutable containers are copied."""
+    if isinstance(value, dict):
+        return {k: _read_copy(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_read_copy(v) for v in value]
+    if isinstance(value, tuple):
+        return tuple(_read_copy(v) for v in value)
+    if isinstance(value, set):
+        return set(value)
+    return value  # immutable scalar, bytes or read-only array
+
+
+def _json_default(value):
+    if np is not None and isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if isinstance(value, bytes):
+        return value.decode('utf-8', errors='replace')
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _as_str(value) -> str:
+    """String-API view of a stored value (typed values read as JSON)."""
+    if type(value) is str:
+        return value
+    return json.dumps(value, default=_json_default)
+
+
+@functools.lru_cache(maxsize=256)
+def _glob_regex(pattern: str):
+    return re.compile(fnmatch.translate(pattern))
+
+
+def _glob_prefix(pattern: str) -> str:
+    """Literal prefix of a glob pattern (everything before the first wildcard)."""
+    for i, ch in enumerate(pattern):
+        if ch in "*?[":
+            return pattern[:i]
+    return pattern
+
+
+class _KeyIndex:
+    """
+    Sorted index of live keys across all keyspaces, plus an expiry min-heap.
+
+    A key present in several keyspaces is reference-counted. The heap holds at
+    most one pending entry per key (its earliest known expiry); when the reaper
+    pops an entry whose TTL was extended since, it re-files the live expiry.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self._keys = SortedList()
+        self._refs: Dict[str, int] = {}
+        self._expiries: List[Tuple[float, str]] = []
+        self._scheduled: Dict[str, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._refs)
+
+    def add(self, key: str):
+        with self.lock:
+            n = self._refs.get(key, 0)
+            if n == 0:
+                self._keys.add(key)
+            self._refs[key] = n + 1
+
+    def discard(self, key: str):
+        with self.lock:
+            n = self._refs.get(key, 0)
+            if n > 1:
+                self._refs[key] = n - 1
+            elif n == 1:
+                del self._refs[key]
+                self._keys.remove(key)
+
+    def schedule(self, expiry: float, key: str):
+        with self.lock:
+            current = self._scheduled.get(key)
+            if current is None or expiry < current:
+                self._scheduled[key] = expiry
+                heapq.heappush(self._expiries, (expiry, key))
+
+    def pop_due(self, now: float, limit: int) -> List[str]:
+        """Up to `limit` keys whose scheduled expiry has passed."""
+        due = []
+        with self.lock:
+            heap = self._expiries
+            while heap and heap[0][0] < now and len(due) < limit:
+                expiry, key = heapq.heappop(heap)
+                if self._scheduled.get(key) == expiry:
+                    del self._scheduled[key]
+                    due.append(key)
+        return due
+
+    def range_from(self, start: str, after: bool, limit: int) -> List[str]:
+        """Up to `limit` keys in sorted order, from start (exclusive when after)."""
+        with self.lock:
+            keys = self._keys
+            i = keys.bisect_right(start) if after else keys.bisect_left(start)
+            return list(keys[i:i + limit])
+
+
+class _Keyspace(dict):
+    """Keyspace dict that keeps the shared _KeyIndex in step with its keys."""
+
+    __slots__ = ("_index",)
+
+    def __init__(self, index: _KeyIndex):
+        super().__init__()
+        self._index = index
+
+    def __setitem__(self, key, entry):
+        if key not in self:
+            self._index.add(key)
+        dict.__setitem__(self, key, entry)
+        if entry[1] is not None:
+            self._index.schedule(entry[1], key)
+
+    def __delitem__(self, key):
+        dict.__delitem__(self, key)
+        self._index.discard(key)
+
+    def pop(self, key, *default):
+        if key in self:
+            entry = dict.__getitem__(self, key)
+            del self[key]
+            return entry
+        if default:
+            return default[0]
+        raise KeyError(key)
+
 
 class MemoryStore:
     """Thread-safe in-memory store with MemoryStore-compatible API."""
 
     def __init__(self):
-        # Keyspaces
-        self._strings: Dict[str, Tuple[Any, Optional[float]]] = {}
-        self._lists: Dict[str, Tuple[list, Optional[float]]] = {}
-        self._hashes: Dict[str, Tuple[dict, Optional[float]]] = {}
-        self._sorted_sets: Dict[str, Tuple[Any, Optional[float]]] = {}
-
-        self._sets: Dict[str, Tuple[set, Optional[float]]] = {}
+        # Keyspaces — all report to one sorted key / expiry index
+        self._index = _KeyIndex()
+        self._strings: Dict[str, Tuple[Any, Optional[float]]] = _Keyspace(self._index)
+        self._lists: Dict[str, Tuple[deque, Optional[float]]] = _Keyspace(self._index)
+        self._hashes: Dict[str, Tuple[dict, Optional[float]]] = _Keyspace(self._index)
+        self._sorted_sets: Dict[str, Tuple[Any, Optional[float]]] = _Keyspace(self._index)
+        self._sets: Dict[str, Tuple[set, Optional[float]]] = _Keyspace(self._index)
+
+        # scan() cursors: token → last key returned
+        self._cursor_lock = threading.Lock()
+        self._cursors: OrderedDict = OrderedDict()
+        self._cursor_ids = itertools.count(1)
 
         # Locks per keyspace
         self._str_lock = threading.RLock()
@@ -49,6 +242,16 @@ class MemoryStore:
         self._zset_lock = threading.RLock()
         self._set_lock = threading.RLock()
 
+        # Blocked list poppers: key → [Condition on _list_lock, ...]
+        self._list_waiters: Dict[str, List[threading.Condition]] = {}
+
+        # Optional persistence journal — any object with mark(key)
+        self._journal = None
+
+        # WATCHed keys: key → [modification count, number of watchers]
+        self._watch_lock = threading.Lock()
+        self._watched: Dict[str, list] = {}
+
         # Pub/Sub
         self._pubsub_lock = threading.RLock()
         self._channels: Dict[str, list] = defaultdict(list)  # channel → [queue.Queue, ...]
@@ -68,24 +271,75 @@ class MemoryStore:
         return time.time() + seconds
 
     def _reap_loop(self):
-        """Background daemon: scan and remove expired keys every 60s."""
+        """Background daemon: remove keys whose expiry has passed."""
         while True:
-            time.sleep(60)
+            time.sleep(_REAP_INTERVAL)
             try:
-                self._reap_keyspace(self._strings, self._str_lock)
-                self._reap_keyspace(self._lists, self._list_lock)
-                self._reap_keyspace(self._hashes, self._hash_lock)
-                self._reap_keyspace(self._sorted_sets, self._zset_lock)
-                self._reap_keyspace(self._sets, self._set_lock)
+                self._reap_expired()
             except Exception as e:
                 logger.debug(f"[MemoryStore] Reaper error: {e}")
 
-    def _reap_keyspace(self, store: dict, lock: threading.RLock):
+    def _reap_expired(self) -> int:
+        """Delete due keys from the expiry heap; re-file keys whose TTL moved."""
         now = time.time()
-        with lock:
-            expired = [k for k, (_, exp) in store.items() if exp is not None and now > exp]
-            for k in expired:
-                del store[k]
+        reaped = 0
+        while True:
+            due = self._index.pop_due(now, _REAP_BATCH)
+            if not due:
+                return reaped
+            for _, store, lock in self._keyspaces():
+                with lock:
+                    for key in due:
+                        entry = store.get(key)
+                        if entry is None or entry[1] is None:
+                            continue
+                        if now > entry[1]:
+                            del store[key]
+                            self._touch(key)
+                            reaped += 1
+                        else:
+                            self._index.schedule(entry[1], key)
+
+    def _is_live(self, key: str, now: float) -> bool:
+        # Lock-free: dict.get is atomic, and a racing write only moves the answer
+        # by one operation — the same guarantee a Redis SCAN gives.
+        for _, store, _ in self._keyspaces():
+            entry = store.get(key)
+            if entry is not None and (entry[1] is None or now <= entry[1]):
+                return True
+        return False
+
+    def _touch(self, key: str):
+        # Caller holds the lock of the keyspace being modified
+        journal = self._journal
+        if journal is not None:
+            journal.mark(key)
+        if self._watched:
+            watch = self._watched.get(key)
+            if watch is not None:
+                watch[0] += 1
+
+    def _watch(self, keys) -> Dict[str, int]:
+        with self._watch_lock:
+            versions = {}
+            for key in keys:
+                watch = self._watched.setdefault(key, [0, 0])
+                watch[1] += 1
+                versions[key] = watch[0]
+            return versions
+
+    def _unwatch(self, keys):
+        with self._watch_lock:
+            for key in keys:
+                watch = self._watched.get(key)
+                if watch is not None:
+                    watch[1] -= 1
+                    if watch[1] <= 0:
+                        del self._watched[key]
+
+    def _watch_changed(self, versions: Dict[str, int]) -> bool:
+        # Caller holds every keyspace lock, so no modification can be in flight
+        return any(self._watched[key][0] != version for key, version in versions.items())
 
     # ── Connection / health ────────────────────────────────────
 
@@ -103,8 +357,9 @@ class MemoryStore:
             val, expiry = entry
             if self._is_expired(expiry):
                 del self._strings[key]
+                self._touch(key)
                 return None
-            return val
+            return _as_str(val)
 
     def set(self, key: str, value: str, ex: Optional[int] = None, nx: bool = False):
         with self._str_lock:
@@ -113,11 +368,13 @@ class MemoryStore:
                 if not self._is_expired(expiry):
                     return False
             self._strings[key] = (str(value), self._expiry_from_seconds(ex))
+            self._touch(key)
             return True
 
     def setex(self, key: str, seconds: int, value: str):
         with self._str_lock:
             self._strings[key] = (str(value), self._expiry_from_seconds(seconds))
+            self._touch(key)
             return True
 
     def setnx(self, key: str, value: str) -> bool:
@@ -128,10 +385,12 @@ class MemoryStore:
             entry = self._strings.get(key)
             if entry is None or self._is_expired(entry[1]):
                 self._strings[key] = ("1", None)
+                self._touch(key)
                 return 1
             val, expiry = entry
             new_val = int(val) + 1
             self._strings[key] = (str(new_val), expiry)
+            self._touch(key)
             return new_val
 
     def decr(self, key: str) -> int:
@@ -139,42 +398,98 @@ class MemoryStore:
             entry = self._strings.get(key)
             if entry is None or self._is_expired(entry[1]):
                 self._strings[key] = ("-1", None)
+                self._touch(key)
                 return -1
             val, expiry = entry
             new_val = int(val) - 1
             self._strings[key] = (str(new_val), expiry)
+            self._touch(key)
             return new_val
 
+    def set_obj(self, key: str, value, ex: Optional[int] = None, nx: bool = False):
+        """Store a Python object under key (no str()/JSON coercion)."""
+        stored = _store_copy(value)
+        with self._str_lock:
+            if nx and key in self._strings:
+                _, expiry = self._strings[key]
+                if not self._is_expired(expiry):
+                    return False
+            self._strings[key] = (stored, self._expiry_from_seconds(ex))
+            self._touch(key)
+            return True
+
+    def get_obj(self, key: str):
+        """Return a copy of the object stored under key (strings come back as-is)."""
+        with self._str_lock:
+            entry = self._strings.get(key)
+            if entry is None:
+                return None
+            val, expiry = entry
+            if self._is_expired(expiry):
+                del self._strings[key]
+                self._touch(key)
+                return None
+        return _read_copy(val)
+
     # ── LIST operations ────────────────────────────────────────
 
-    def _get_list(self, key: str) -> Optional[list]:
+    def _get_list(self, key: str) -> Optional[deque]:
         entry = self._lists.get(key)
         if entry is None:
             return None
         lst, expiry = entry
         if self._is_expired(expiry):
             del self._lists[key]
+            self._touch(key)
             return None
         return lst
 
+    def _list_for_push(self, key: str) -> deque:
+        lst = self._get_list(key)
+        if lst is None:
+            lst = deque()
+            self._lists[key] = (lst, None)
+        return lst
+
+    def _wake_list_waiters(self, key: str):
+        # Caller holds _list_lock. Wake every waiter on the key — a waiter
+        # that loses the race to another popper simply waits again.
+        for waiter in self._list_waiters.get(key, ()):
+            waiter.notify()
+
+    @staticmethod
+    def _list_bounds(length: int, start: int, stop: int) -> Tuple[int, int]:
+        """Redis-style inclusive (start, stop) → half-open slice bounds within the list."""
+        if start < 0:
+            start = max(0, length + start)
+        if stop < 0:
+            stop = length + stop
+        return start, max(start, min(stop + 1, length))
+
+    def _list_slice(self, lst: deque, start: int, stop: int) -> list:
+        length = len(lst)
+        start, end = self._list_bounds(length, start, stop)
+        if start >= length - end:
+            # Tail-heavy range (e.g. lrange(key, -10, -1)) — walk from the right
+            tail = list(islice(reversed(lst), length - end, length - start))
+            tail.reverse()
+            return tail
+        return list(islice(lst, start, end))
+
     def rpush(self, key: str, *values) -> int:
         with self._list_lock:
-            lst = self._get_list(key)
-            if lst is None:
-                lst = []
-                self._lists[key] = (lst, None)
-            for v in values:
-                lst.append(str(v))
+            lst = self._list_for_push(key)
+            lst.extend(str(v) for v in values)
+            self._wake_list_waiters(key)
+            self._touch(key)
             return len(lst)
 
     def lpush(self, key: str, *values) -> int:
         with self._list_lock:
-            lst = self._get_list(key)
-            if lst is None:
-                lst = []
-                self._lists[key] = (lst, None)
-            for v in values:
-                lst.insert(0, str(v))
+            lst = self._list_for_push(key)
+            lst.extendleft(str(v) for v in values)
+            self._wake_list_waiters(key)
+            self._touch(key)
             return len(lst)
 
     def ltrim(self, key: str, start: int, stop: int):
@@ -182,13 +497,13 @@ class MemoryStore:
             lst = self._get_list(key)
             if lst is None:
                 return True
-            # Python slice: handle negative indexes (Redis-compatible semantics)
-            length = len(lst)
-            if start < 0:
-                start = max(0, length + start)
-            if stop < 0:
-                stop = length + stop
-            lst[:] = lst[start:stop + 1]
+            # Drop from both ends — O(removed), not O(len)
+            start, end = self._list_bounds(len(lst), start, stop)
+            for _ in range(len(lst) - end):
+                lst.pop()
+            for _ in range(start):
+                lst.popleft()
+            self._touch(key)
             return True
 
     def lrange(self, key: str, start: int, stop: int) -> list:
@@ -196,12 +511,7 @@ class MemoryStore:
             lst = self._get_list(key)
             if lst is None:
                 return []
-            length = len(lst)
-            if start < 0:
-                start = max(0, length + start)
-            if stop < 0:
-                stop = length + stop
-            return lst[start:stop + 1]
+            return [_as_str(v) for v in self._list_slice(lst, start, stop)]
 
     def llen(self, key: str) -> int:
         with self._list_lock:
@@ -213,7 +523,16 @@ class MemoryStore:
             lst = self._get_list(key)
             if not lst:
                 return None
-            return lst.pop(0)
+            self._touch(key)
+            return _as_str(lst.popleft())
+
+    def rpop(self, key: str) -> Optional[str]:
+        with self._list_lock:
+            lst = self._get_list(key)
+            if not lst:
+                return None
+            self._touch(key)
+            return _as_str(lst.pop())
 
     def lindex(self, key: str, index: int) -> Optional[str]:
         with self._list_lock:
@@ -221,7 +540,7 @@ class MemoryStore:
             if lst is None:
                 return None
             try:
-                return lst[index]
+                return _as_str(lst[index])
             except IndexError:
                 return None
 
@@ -231,36 +550,93 @@ class MemoryStore:
             if lst is None:
                 raise Exception("no such key")
             lst[index] = str(value)
+            self._touch(key)
             return True
 
-    def brpop(self, key: str, timeout: int = 0) -> Optional[Tuple[str, str]]:
-        """Blocking right-pop. Polls with sleep for simplicity."""
-        deadline = time.time() + timeout if timeout > 0 else None
-        while True:
-            with self._list_lock:
-                lst = self._get_list(key)
-                if lst:
-                    val = lst.pop()
-                    return (key, val)
-            if deadline and time.time() >= deadline:
+    def rpush_obj(self, key: str, *values) -> int:
+        """Append Python objects to a list (typed counterpart of rpush)."""
+        stored = [_store_copy(v) for v in values]
+        with self._list_lock:
+            lst = self._list_for_push(key)
+            lst.extend(stored)
+            self._wake_list_waiters(key)
+            self._touch(key)
+            return len(lst)
+
+    def lrange_obj(self, key: str, start: int, stop: int) -> list:
+        """Typed counterpart of lrange — copies of the stored objects."""
+        with self._list_lock:
+            lst = self._get_list(key)
+            if lst is None:
+                return []
+            items = self._list_slice(lst, start, stop)
+        return [_read_copy(v) for v in items]
+
+    def lindex_obj(self, key: str, index: int):
+        """Typed counterpart of lindex."""
+        with self._list_lock:
+            lst = self._get_list(key)
+            if lst is None:
                 return None
-            time.sleep(0.1)
+            try:
+                value = lst[index]
+            except IndexError:
+                return None
+        return _read_copy(value)
+
+    def lset_obj(self, key: str, index: int, value):
+        """Typed counterpart of lset."""
+        stored = _store_copy(value)
+        with self._list_lock:
+            lst = self._get_list(key)
+            if lst is None:
+                raise Exception("no such key")
+            lst[index] = stored
+            self._touch(key)
+            return True
+
+    def _blocking_pop(self, keys: list, timeout: float, left: bool):
+        """Pop from the first non-empty key, waiting up to timeout (0 = forever)."""
+        deadline = time.monotonic() + timeout if timeout > 0 else None
+        waiter = None
+        with self._list_lock:
+            try:
+                while True:
+                    for key in keys:
+                        lst = self._get_list(key)
+                        if lst:
+                            self._touch(key)
+                            return (key, _as_str(lst.popleft() if left else lst.pop()))
+
+                    if waiter is None:
+                        waiter = threading.Condition(self._list_lock)
+                        for key in keys:
+                            self._list_waiters.setdefault(key, []).append(waiter)
+
+                    remaining = None
+                    if deadline is not None:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            return None
+                    waiter.wait(remaining)
+            finally:
+                if waiter is not None:
+                    for key in keys:
+                        waiters = self._list_waiters.get(key)
+                        if waiters:
+                            waiters.remove(waiter)
+                            if not waiters:
+                                del self._list_waiters[key]
+
+    def brpop(self, key: str, timeout: int = 0) -> Optional[Tuple[str, str]]:
+        """Blocking right-pop. Returns (key, value), or None on timeout."""
+        return self._blocking_pop([key], timeout, left=False)
 
     def blpop(self, keys, timeout: int = 0):
         """Blocking left-pop from first non-empty key."""
         if isinstance(keys, str):
             keys = [keys]
-        deadline = time.time() + timeout if timeout > 0 else None
-        while True:
-            with self._list_lock:
-                for key in keys:
-                    lst = self._get_list(key)
-                    if lst:
-                        val = lst.pop(0)
-                        return (key, val)
-            if deadline and time.time() >= deadline:
-                return None
-            time.sleep(0.1)
+        return self._blocking_pop(list(keys), timeout, left=True)
 
     # ── HASH operations ────────────────────────────────────────
 
@@ -271,6 +647,7 @@ class MemoryStore:
         d, expiry = entry
         if self._is_expired(expiry):
             del self._hashes[key]
+            self._touch(key)
             return None
         return d
 
@@ -285,6 +662,7 @@ class MemoryStore:
                     d[str(k)] = str(v)
             elif field is not None:
                 d[str(field)] = str(value)
+            self._touch(key)
             return 1
 
     def hget(self, key: str, field: str) -> Optional[str]:
@@ -309,6 +687,8 @@ class MemoryStore:
                 if str(f) in d:
                     del d[str(f)]
                     count += 1
+            if count:
+                self._touch(key)
             return count
 
     def hincrby(self, key: str, field: str, amount: int = 1) -> int:
@@ -320,6 +700,7 @@ class MemoryStore:
             current = int(d.get(str(field), 0))
             new_val = current + amount
             d[str(field)] = str(new_val)
+            self._touch(key)
             return new_val
 
     def hexists(self, key: str, field: str) -> bool:
@@ -336,6 +717,7 @@ class MemoryStore:
         zset, expiry = entry
         if self._is_expired(expiry):
             del self._sorted_sets[key]
+            self._touch(key)
             return None
         return zset
 
@@ -353,6 +735,7 @@ class MemoryStore:
                 zset[:] = [(s, m) for s, m in zset if m != str(member)]
                 zset.append((float(score), str(member)))
             zset.sort(key=lambda x: x[0])
+            self._touch(key)
             return len(mapping)
 
     def zrange(self, key: str, start: int, stop: int, withscores: bool = False) -> list:
@@ -409,6 +792,7 @@ class MemoryStore:
             before = len(zset)
             member_set = {str(m) for m in members}
             zset[:] = [(s, m) for s, m in zset if m not in member_set]
+            self._touch(key)
             return before - len(zset)
 
     def zcard(self, key: str) -> int:
@@ -440,6 +824,7 @@ class MemoryStore:
                 max_score = float('inf')
             before = len(zset)
             zset[:] = [(s, m) for s, m in zset if not (float(min_score) <= s <= float(max_score))]
+            self._touch(key)
             return before - len(zset)
 
     # ── SET operations ─────────────────────────────────────────
@@ -451,6 +836,7 @@ class MemoryStore:
         s, expiry = entry
         if self._is_expired(expiry):
             del self._sets[key]
+            self._touch(key)
             return None
         return s
 
@@ -466,6 +852,7 @@ class MemoryStore:
                 if sv not in s:
                     s.add(sv)
                     added += 1
+            self._touch(key)
             return added
 
     def srem(self, key: str, *values) -> int:
@@ -479,6 +866,7 @@ class MemoryStore:
                 if sv in s:
                     s.discard(sv)
                     removed += 1
+            self._touch(key)
             return removed
 
     def smembers(self, key: str) -> set:
@@ -501,26 +889,12 @@ class MemoryStore:
     def delete(self, *keys) -> int:
         count = 0
         for key in keys:
-            with self._str_lock:
-                if key in self._strings:
-                    del self._strings[key]
-                    count += 1
-            with self._list_lock:
-                if key in self._lists:
-                    del self._lists[key]
-                    count += 1
-            with self._hash_lock:
-                if key in self._hashes:
-                    del self._hashes[key]
-                    count += 1
-            with self._zset_lock:
-                if key in self._sorted_sets:
-                    del self._sorted_sets[key]
-                    count += 1
-            with self._set_lock:
-                if key in self._sets:
-                    del self._sets[key]
-                    count += 1
+            for _, store, lock in self._keyspaces():
+                with lock:
+                    if key in store:
+                        del store[key]
+                        self._touch(key)
+                        count += 1
         return count
 
     def exists(self, key: str) -> bool:
@@ -559,6 +933,7 @@ class MemoryStore:
                 if key in store:
                     val, _ = store[key]
                     store[key] = (val, new_expiry)
+                    self._touch(key)
                     return True
         return False
 
@@ -577,40 +952,77 @@ class MemoryStore:
                     _, expiry = entry
                     if self._is_expired(expiry):
                         del store[key]
+                        self._touch(key)
                         continue
                     if expiry is None:
                         return -1
                     return max(0, int(expiry - time.time()))
         return -2
 
+    def _walk(self, pattern: str, start: Optional[str], limit: Optional[int]):
+        """
+        Walk the key index for pattern, resuming after `start` when given.
+
+        Only the range sharing the pattern's literal prefix is visited. Returns
+        (matching live keys, last key visited or None when the range is exhausted).
+        """
+        prefix = _glob_prefix(pattern)
+        regex = _glob_regex(pattern)
+        now = time.time()
+        matched = []
+        after = start is not None
+        position = start if after else prefix
+        visited = 0
+        while limit is None or visited < limit:
+            want = _INDEX_BATCH if limit is None else min(_INDEX_BATCH, limit - visited)
+            batch = self._index.range_from(position, after, want)
+            for key in batch:
+                if not key.startswith(prefix):
+                    return matched, None
+                if regex.match(key) and self._is_live(key, now):
+                    matched.append(key)
+            visited += len(batch)
+            if len(batch) < want:
+                return matched, None
+            position, after = batch[-1], True
+        return matched, position
+
     def keys(self, pattern: str = "*") -> list:
         """Return keys matching glob pattern."""
-        regex = re.compile(
-            pattern.replace("*", ".*").replace("?", ".").replace("[", "[")
-        )
-        result = set()
-        now = time.time()
-        for store, lock in [
-            (self._strings, self._str_lock),
-            (self._lists, self._list_lock),
-            (self._hashes, self._hash_lock),
-            (self._sorted_sets, self._zset_lock),
-            (self._sets, self._set_lock),
-        ]:
-            with lock:
-                for k, (_, expiry) in store.items():
-                    if (expiry is None or now <= expiry) and regex.fullmatch(k):
-                        result.add(k)
-        return list(result)
+        matched, _ = self._walk(pattern, None, None)
+        return matched
 
     def scan(self, cursor: int = 0, match: str = "*", count: int = 100) -> Tuple[int, list]:
-        """Simplified scan — returns all matching keys at once (cursor always 0)."""
-        matched = self.keys(match)
-        return (0, matched)
+        """
+        Incremental scan: visits up to `count` index entries per call.
+
+        Returns (next_cursor, keys); next_cursor is 0 once the walk is complete.
+        Every key that exists for the whole scan is returned exactly once.
+        """
+        start = None
+        if cursor:
+            with self._cursor_lock:
+                start = self._cursors.get(cursor)
+            if start is None:
+                return (0, [])  # Unknown or evicted cursor
+        matched, last = self._walk(match, start, max(1, count))
+        if last is None:
+            return (0, matched)
+        with self._cursor_lock:
+            token = next(self._cursor_ids)
+            self._cursors[token] = last
+            while len(self._cursors) > _MAX_SCAN_CURSORS:
+                self._cursors.popitem(last=False)
+        return (token, matched)
 
     def scan_iter(self, match: str = "*", count: int = 100):
-        """Iterate over keys matching pattern."""
-        return iter(self.keys(match))
+        """Iterate over keys matching pattern, one scan() batch at a time."""
+        cursor = 0
+        while True:
+            cursor, batch = self.scan(cursor, match=match, count=count)
+            yield from batch
+            if cursor == 0:
+                return
 
     # ── PUB/SUB ────────────────────────────────────────────────
 
@@ -637,6 +1049,11 @@ class MemoryStore:
     # ── PIPELINE ───────────────────────────────────────────────
 
     def pipeline(self, transaction: bool = True) -> 'PipelineProxy':
+        """
+        Batch commands. Every batch is atomic: holding the keyspace locks for
+        the whole batch is also the cheapest way to run it, so transaction=False
+        is accepted for compatibility but changes nothing.
+        """
         return PipelineProxy(self)
 
     def export_matching(self, patterns: list) -> dict:
@@ -661,12 +1078,12 @@ class MemoryStore:
         with self._str_lock:
             for k, (v, expiry) in self._strings.items():
                 if (expiry is None or now <= expiry) and _matches(k):
-                    result[k] = {"type": "string", "value": v}
+                    result[k] = {"type": "string", "value": _as_str(v)}
 
         with self._list_lock:
             for k, (v, expiry) in self._lists.items():
                 if (expiry is None or now <= expiry) and _matches(k):
-                    result[k] = {"type": "list", "value": list(v)}
+                    result[k] = {"type": "list", "value": [_as_str(item) for item in v]}
 
         with self._hash_lock:
             for k, (v, expiry) in self._hashes.items():
@@ -685,6 +1102,64 @@ class MemoryStore:
 
         return result
 
+    # ── Persistence support ────────────────────────────────────
+
+    def _keyspaces(self):
+        return (
+            ("string", self._strings, self._str_lock),
+            ("list", self._lists, self._list_lock),
+            ("hash", self._hashes, self._hash_lock),
+            ("zset", self._sorted_sets, self._zset_lock),
+            ("set", self._sets, self._set_lock),
+        )
+
+    def _export_key(self, key: str) -> list:
+        """
+        Point-in-time copy of every live entry under key: [(type, value, expiry)].
+
+        An empty list means the key no longer exists (a tombstone for the journal).
+        String-keyspace values are immutable by contract and are not copied.
+        """
+        entries = []
+        now = time.time()
+        for kind, store, lock in self._keyspaces():
+            with lock:
+                entry = store.get(key)
+                if entry is None:
+                    continue
+                val, expiry = entry
+                if expiry is not None and now > expiry:
+                    continue
+                if kind == "list":
+                    val = list(val)
+                elif kind == "hash":
+                    val = dict(val)
+                elif kind == "zset":
+                    val = list(val)
+                elif kind == "set":
+                    val = set(val)
+                entries.append((kind, val, expiry))
+        return entries
+
+    def _import_key(self, key: str, entries: list):
+        """Replace key with previously exported entries, dropping any already expired."""
+        now = time.time()
+        kinds = {kind: (val, expiry) for kind, val, expiry in entries}
+        for kind, store, lock in self._keyspaces():
+            with lock:
+                item = kinds.get(kind)
+                if item is None or (item[1] is not None and now > item[1]):
+                    store.pop(key, None)
+                    continue
+                val, expiry = item
+                if kind == "string":
+                    val = val if type(val) is str else _store_copy(val)
+                elif kind == "list":
+                    val = deque(val)
+                store[key] = (val, expiry)
+                if kind == "list":
+                    self._wake_list_waiters(key)
+
     # ── Type method (compatibility) ────────────────────────────
 
     def type(self, key: str) -> str:
@@ -754,38 +1229,121 @@ class PubSubProxy:
         self.unsubscribe(*list(self._subscribed_channels))
 
 
+class WatchError(Exception):
+    """A WATCHed key was modified before the transaction executed."""
+
+
+# Keyspace each pipelined command touches; anything else takes every keyspace lock
+_COMMAND_KEYSPACE = {}
+for _kind, _names in (
+    ("string", "get set setex setnx incr decr set_obj get_obj"),
+    ("list", "rpush lpush ltrim lrange llen lpop rpop lindex lset "
+             "rpush_obj lrange_obj lindex_obj lset_obj"),
+    ("hash", "hset hget hgetall hdel hincrby hexists"),
+    ("zset", "zadd zrange zrangebyscore zrevrange zrem zcard zscore zremrangebyscore"),
+    ("set", "sadd srem smembers sismember scard"),
+):
+    for _name in _names.split():
+        _COMMAND_KEYSPACE[_name] = _kind
+
+
 class PipelineProxy:
-    """Pipeline proxy (Redis-compatible API) — collects operations, executes sequentially on .execute()."""
+    """
+    Pipeline proxy (Redis-compatible API) — collects operations and runs them on .execute().
+
+    The batch runs under the locks of every keyspace it touches, each taken
+    once, so no other thread observes a partial pipeline. Per-command errors are
+    returned in the results list (Redis EXEC semantics — no rollback).
+
+    Optimistic transactions follow redis-py:
+
+        with store.pipeline() as pipe:
+            pipe.watch(key)
+            value = pipe.get(key)       # immediate while watching
+            pipe.multi()
+            pipe.set(key, new_value)    # buffered
+            pipe.execute()              # raises WatchError if key changed
+    """
 
     def __init__(self, store: MemoryStore):
         self._store = store
         self._commands: list = []
+        self._watching: Dict[str, int] = {}
+        self._buffering = True
 
     def __getattr__(self, name):
         if name.startswith('_'):
             raise AttributeError(name)
+        if not self._buffering:
+            return getattr(self._store, name)
 
         def _capture(*args, **kwargs):
             self._commands.append((name, args, kwargs))
             return self  # Allow chaining
         return _capture
 
+    def watch(self, *keys):
+        """Watch keys; commands run immediately until multi() is called."""
+        if self._commands:
+            raise RuntimeError("WATCH must be called before queueing commands")
+        new_keys = [k for k in keys if k not in self._watching]
+        self._watching.update(self._store._watch(new_keys))
+        self._buffering = False
+        return True
+
+    def multi(self):
+        """Start buffering commands for the transaction."""
+        self._buffering = True
+
+    def unwatch(self):
+        if self._watching:
+            self._store._unwatch(list(self._watching))
+            self._watching = {}
+        self._buffering = True
+        return True
+
+    def reset(self):
+        self.unwatch()
+        self._commands.clear()
+
+    def _locks_for(self, commands) -> list:
+        kinds = set()
+        for method_name, _, _ in commands:
+            kind = _COMMAND_KEYSPACE.get(method_name)
+            if kind is None or self._watching:
+                kinds = None
+                break
+            kinds.add(kind)
+        return [lock for kind, _, lock in self._store._keyspaces()
+                if kinds is None or kind in kinds]
+
     def execute(self) -> list:
+        commands, self._commands = self._commands, []
+        store = self._store
         results = []
-        for method_name, args, kwargs in self._commands:
-            method = getattr(self._store, method_name, None)
-            if method:
-                try:
-                    results.append(method(*args, **kwargs))
-                except Exception as e:
-                    results.append(e)
-            else:
-                results.append(None)
-        self._commands.clear()
+        locks = self._locks_for(commands)
+        for lock in locks:
+            lock.acquire()
+        try:
+            if self._watching and store._watch_changed(self._watching):
+                raise WatchError("Watched variable changed.")
+            for method_name, args, kwargs in commands:
+                method = getattr(store, method_name, None)
+                if method:
+                    try:
+                        results.append(method(*args, **kwargs))
+                    except Exception as e:
+                        results.append(e)
+                else:
+                    results.append(None)
+        finally:
+            for lock in reversed(locks):
+                lock.release()
+            self.unwatch()
         return results
 
     def __enter__(self):
         return self
 
     def __exit__(self, *args):
-        pass
+        self.reset()
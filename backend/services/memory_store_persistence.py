@@ -0,0 +1,376 @@
+"""
+Memory Store Persistence — snapshot + append-only journal for selected keys.
+
+MemoryStore is in-process, so a restart used to drop working memory, gists,
+facts, thread conversations, the embedding cache and the background LLM
+backlog. This module keeps keys under configured prefixes across restarts:
+
+- Journal: MemoryStore marks every mutated key dirty (a set add — no I/O on
+  the hot path). A flusher thread wakes every flush interval, exports the
+  current state of the dirty keys and appends it to `journal.log` as one
+  CRC-framed record, followed by a single fsync for the whole batch.
+- Snapshot: every snapshot interval all persisted keys are written to
+  `snapshot.bin` as independently zlib-compressed chunks (tmp file + fsync +
+  atomic rename), after which the journal is truncated.
+- Generations: each snapshot bumps a generation number stored in its header,
+  and every journal record carries the generation it was written under. A
+  crash between the snapshot rename and the journal truncate leaves records
+  older than the snapshot in the journal; boot skips them instead of rolling
+  keys back to older values.
+- Boot: snapshot chunks are decompressed on a thread pool, then the journal
+  is replayed in order. A torn journal tail (crash mid-append) is detected by
+  its CRC and cut off. Expiry timestamps are absolute, so TTLs carry over and
+  keys that expired while the server was down are dropped.
+
+Records are state (the key's full value), not operations, so replaying a key
+twice is harmless and the last record wins.
+
+Trust boundary: snapshot and journal payloads are pickle, and boot unpickles
+them, so anyone who can write to the data directory can run code in the
+server process. Keep the directory (data/memory_store, or
+CHALIE_MEMORY_STORE_DIR) private to the user running Chalie and never load
+files copied from elsewhere. Persistence is off by default for this reason.
+
+Configured in connections.json under memory.persistence. Entry points:
+enable_persistence() called once at startup from run.py, and
+register_memory_snapshot_job(scheduler) for the periodic snapshot.
+"""
+
+import atexit
+import logging
+import os
+import pickle
+import struct
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+LOG_PREFIX = "[MEMORY PERSIST]"
+
+_DEFAULT_DIR = str(Path(__file__).resolve().parent.parent / "data" / "memory_store")
+
+_DEFAULT_PREFIXES = (
+    "working_memory:",
+    "gist:",
+    "gist_index:",
+    "last_message:",
+    "fact:",
+    "fact_index:",
+    "thread_conv:",
+    "thread_conv_index:",
+    "thread_conv_signals:",
+    "thread_conv_pos:",
+    "thread_conv_dirty",
+    "emb:",
+    "reconsolidation:",
+    "reflex:",
+    "bg_llm:queue",
+)
+
+SNAPSHOT_FILE = "snapshot.bin"
+JOURNAL_FILE = "journal.log"
+
+_SNAPSHOT_MAGIC = b"CHMS2\n"
+_SNAPSHOT_MAGIC_V1 = b"CHMS1\n"  # pre-generation snapshots (generation 0)
+_GENERATION = struct.Struct("<Q")
+_FRAME = struct.Struct("<II")  # payload length, crc32
+_SNAPSHOT_CHUNK_KEYS = 2000
+_LOAD_WORKERS = 4
+
+
+def _encode_frame(payload: bytes) -> bytes:
+    return _FRAME.pack(len(payload), zlib.crc32(payload)) + payload
+
+
+def _read_frames(data: bytes, offset: int = 0):
+    """Yield (payload, end_offset) for each intact frame; stop at the first torn one."""
+    size = len(data)
+    while offset + _FRAME.size <= size:
+        length, crc = _FRAME.unpack_from(data, offset)
+        start = offset + _FRAME.size
+        end = start + length
+        if end > size:
+            return
+        payload = data[start:end]
+        if zlib.crc32(payload) != crc:
+            return
+        yield payload, end
+        offset = end
+
+
+def _fsync_dir(path: str) -> None:
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return  # Not supported on this platform — rename is still atomic
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class MemoryStorePersistence:
+    """Journal + snapshot persistence for one MemoryStore."""
+
+    def __init__(
+        self,
+        store,
+        directory: str = _DEFAULT_DIR,
+        prefixes: Iterable[str] = _DEFAULT_PREFIXES,
+        flush_interval: float = 1.0,
+    ):
+        self.store = store
+        self.directory = directory
+        self.prefixes = tuple(prefixes)
+        self.flush_interval = flush_interval
+
+        self._snapshot_path = os.path.join(directory, SNAPSHOT_FILE)
+        self._journal_path = os.path.join(directory, JOURNAL_FILE)
+
+        self._dirty: set = set()
+        self._dirty_lock = threading.Lock()
+        self._io_lock = threading.Lock()
+        self._journal = None
+        # Generation of the current snapshot; journal records are tagged with it
+        self._generation = 0
+        self._stop = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+
+    # ── Hot path ───────────────────────────────────────────────
+
+    def mark(self, key: str) -> None:
+        """Called by MemoryStore on every mutation; records the key if persisted."""
+        if key.startswith(self.prefixes):
+            with self._dirty_lock:
+                self._dirty.add(key)
+
+    # ── Lifecycle ──────────────────────────────────────────────
+
+    def start(self) -> int:
+        """Restore persisted state into the store, attach, and start the flusher."""
+        os.makedirs(self.directory, exist_ok=True)
+        started = time.monotonic()
+        restored = self.load()
+        self._journal = open(self._journal_path, "ab")
+        self.store._journal = self
+        self._flusher = threading.Thread(
+            target=self._flush_loop, daemon=True, name="memory-store-journal"
+        )
+        self._flusher.start()
+        logger.info(
+            f"{LOG_PREFIX} Restored {restored} keys from {self.directory} "
+            f"in {time.monotonic() - started:.2f}s"
+        )
+        return restored
+
+    def close(self) -> None:
+        """Detach from the store and take a final snapshot."""
+        self._stop.set()
+        if self.store._journal is self:
+            self.store._journal = None
+        try:
+            self.snapshot()
+        finally:
+            with self._io_lock:
+                if self._journal is not None:
+                    self._journal.close()
+                    self._journal = None
+
+    def _flush_loop(self) -> None:
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"{LOG_PREFIX} Journal flush failed: {e}")
+
+    # ── Writing ────────────────────────────────────────────────
+
+    def _take_dirty(self) -> set:
+        with self._dirty_lock:
+            dirty, self._dirty = self._dirty, set()
+        return dirty
+
+    def flush(self) -> int:
+        """Append the current state of every dirty key to the journal (one fsync)."""
+        with self._io_lock:
+            dirty = self._take_dirty()
+            if not dirty or self._journal is None:
+                return 0
+            records = [(key, self.store._export_key(key)) for key in dirty]
+            payload = pickle.dumps((self._generation, records), protocol=pickle.HIGHEST_PROTOCOL)
+            self._journal.write(_encode_frame(payload))
+            self._journal.flush()
+            os.fsync(self._journal.fileno())
+            return len(records)
+
+    def snapshot(self) -> int:
+        """Write a full snapshot of persisted keys, then truncate the journal."""
+        with self._io_lock:
+            # Anything marked from here on stays dirty and lands in the new
+            # journal; anything already journaled is covered by the snapshot.
+            self._take_dirty()
+            keys = set()
+            for prefix in self.prefixes:
+                keys.update(self.store.keys(prefix + "*"))
+            records = []
+            for key in keys:
+                entries = self.store._export_key(key)
+                if entries:
+                    records.append((key, entries))
+
+            generation = self._generation + 1
+            tmp_path = self._snapshot_path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(_SNAPSHOT_MAGIC)
+                f.write(_GENERATION.pack(generation))
+                for i in range(0, len(records), _SNAPSHOT_CHUNK_KEYS):
+                    chunk = records[i:i + _SNAPSHOT_CHUNK_KEYS]
+                    payload = zlib.compress(
+                        pickle.dumps(chunk, protocol=pickle.HIGHEST_PROTOCOL), 1
+                    )
+                    f.write(_encode_frame(payload))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self._snapshot_path)
+            _fsync_dir(self.directory)
+            # From here the on-disk journal is stale: its records predate
+            # `generation` and load() skips them even if the truncate is lost
+            self._generation = generation
+
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = open(self._journal_path, "wb")
+            return len(records)
+
+    # ── Loading ────────────────────────────────────────────────
+
+    def _apply(self, records) -> int:
+        applied = 0
+        for key, entries in records:
+            if key.startswith(self.prefixes):
+                self.store._import_key(key, entries)
+                applied += 1
+        return applied
+
+    def load(self) -> int:
+        """Replay snapshot then journal into the store. Returns keys restored."""
+        keys = set()
+        snapshot_generation = 0
+
+        try:
+            with open(self._snapshot_path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            data = b""
+        chunks = None
+        if data.startswith(_SNAPSHOT_MAGIC):
+            offset = len(_SNAPSHOT_MAGIC) + _GENERATION.size
+            (snapshot_generation,) = _GENERATION.unpack_from(data, len(_SNAPSHOT_MAGIC))
+            chunks = [p for p, _ in _read_frames(data, offset)]
+        elif data.startswith(_SNAPSHOT_MAGIC_V1):
+            chunks = [p for p, _ in _read_frames(data, len(_SNAPSHOT_MAGIC_V1))]
+        elif data:
+            logger.warning(f"{LOG_PREFIX} Ignoring unrecognised snapshot {self._snapshot_path}")
+        if chunks:
+            # zlib releases the GIL, so chunk decompression runs in parallel
+            with ThreadPoolExecutor(max_workers=_LOAD_WORKERS) as pool:
+                for records in pool.map(lambda p: pickle.loads(zlib.decompress(p)), chunks):
+                    self._apply(records)
+                    keys.update(k for k, _ in records)
+        self._generation = snapshot_generation
+
+        try:
+            with open(self._journal_path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            data = b""
+        valid_end = 0
+        stale = 0
+        for payload, end in _read_frames(data):
+            record = pickle.loads(payload)
+            # Pre-generation journals hold a bare record list (generation 0)
+            generation, records = record if isinstance(record, tuple) else (0, record)
+            valid_end = end
+            if generation < snapshot_generation:
+                stale += 1  # already covered by the snapshot
+                continue
+            self._apply(records)
+            keys.update(k for k, _ in records)
+        if stale:
+            logger.warning(f"{LOG_PREFIX} Skipped {stale} journal records older than the snapshot")
+        if valid_end < len(data):
+            logger.warning(
+                f"{LOG_PREFIX} Dropping {len(data) - valid_end} bytes of torn journal tail"
+            )
+            with open(self._journal_path, "r+b") as f:
+                f.truncate(valid_end)
+                os.fsync(f.fileno())
+
+        return sum(1 for k in keys if self.store.exists(k))
+
+
+# ── Startup wiring ─────────────────────────────────────────────
+
+_persistence: Optional[MemoryStorePersistence] = None
+
+
+def get_persistence() -> Optional[MemoryStorePersistence]:
+    """The active persistence layer, or None when disabled."""
+    return _persistence
+
+
+def enable_persistence(store=None) -> Optional[MemoryStorePersistence]:
+    """
+    Attach persistence to the shared MemoryStore if enabled in connections.json.
+
+    Must run before workers start writing so restored state is in place first.
+    Off by default: the files it loads are pickle (see the module docstring).
+    """
+    global _persistence
+    if _persistence is not None:
+        return _persistence
+
+    from services.config_service import ConfigService
+    config = ConfigService.connections().get("memory", {}).get("persistence", {})
+    if not config.get("enabled", False):
+        return None
+
+    if store is None:
+        from services.memory_client import MemoryClientService
+        store = MemoryClientService.create_connection()
+
+    persistence = MemoryStorePersistence(
+        store,
+        directory=os.environ.get("CHALIE_MEMORY_STORE_DIR", config.get("directory") or _DEFAULT_DIR),
+        prefixes=config.get("prefixes", _DEFAULT_PREFIXES),
+        flush_interval=config.get("flush_interval_seconds", 1.0),
+    )
+    try:
+        persistence.start()
+    except Exception as e:
+        logger.error(f"{LOG_PREFIX} Failed to start, continuing without persistence: {e}")
+        return None
+
+    atexit.register(persistence.close)
+    _persistence = persistence
+    return persistence
+
+
+def register_memory_snapshot_job(scheduler) -> None:
+    """Register the periodic snapshot on the job scheduler (no-op when disabled)."""
+    persistence = get_persistence()
+    if persistence is None:
+        return
+
+    from services.config_service import ConfigService
+    config = ConfigService.connections().get("memory", {}).get("persistence", {})
+    scheduler.add_job(
+        "memory-store-snapshot",
+        persistence.snapshot,
+        interval=config.get("snapshot_interval_seconds", 300),
+    )
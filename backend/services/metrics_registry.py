@@ -0,0 +1,240 @@
+"""
+Metrics Registry — in-process counters, gauges, latency histograms and traces.
+
+Every recording is O(1) and allocation-free on the hot path: a metric lives in
+one of a fixed number of lock stripes (chosen by name hash), so concurrent
+workers recording different operations rarely contend. Latency histograms use
+fixed log-linear buckets (HDR-style: 16 sub-buckets per power of two, ~6%
+relative error) over microseconds, so memory per operation is constant no
+matter how many samples are recorded. Per-request traces (span lists with
+parent links) are kept in a bounded ring; the oldest trace is dropped when
+the ring is full.
+
+Usage:
+    registry = get_metrics_registry()
+    registry.observe('classification', 12.7)         # milliseconds
+    registry.increment('requests_total')
+    registry.histogram_summary()['classification']   # {'p50_ms': ..., 'p99_ms': ...}
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+# Histogram geometry (values in whole microseconds)
+_SUB_BITS = 4
+_SUB_COUNT = 1 << _SUB_BITS            # 16 sub-buckets per power of two
+_LINEAR_LIMIT = _SUB_COUNT * 2         # values below this get exact buckets
+_MAX_SHIFT = 32                        # top bucket starts at ~19h
+_BUCKET_COUNT = _LINEAR_LIMIT + _MAX_SHIFT * _SUB_COUNT
+
+_STRIPES = 16
+_MAX_TRACES = 512
+_MAX_SPANS_PER_TRACE = 128
+
+
+def _bucket_index(micros: int) -> int:
+    if micros < _LINEAR_LIMIT:
+        return micros if micros > 0 else 0
+    shift = micros.bit_length() - (_SUB_BITS + 1)
+    if shift > _MAX_SHIFT:
+        return _BUCKET_COUNT - 1
+    return _LINEAR_LIMIT + (shift - 1) * _SUB_COUNT + ((micros >> shift) - _SUB_COUNT)
+
+
+def _bucket_midpoint(index: int) -> float:
+    """Representative value (µs) for a bucket — the middle of its range."""
+    if index < _LINEAR_LIMIT:
+        return float(index)
+    shift = (index - _LINEAR_LIMIT) // _SUB_COUNT + 1
+    sub = (index - _LINEAR_LIMIT) % _SUB_COUNT + _SUB_COUNT
+    low = sub << shift
+    return low + ((1 << shift) - 1) / 2.0
+
+
+class Histogram:
+    """Fixed-bucket latency histogram. Caller holds the stripe lock."""
+
+    __slots__ = ('counts', 'count', 'total', 'min', 'max')
+
+    def __init__(self):
+        self.counts = [0] * _BUCKET_COUNT
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = 0.0
+
+    def record(self, value_ms: float) -> None:
+        self.counts[_bucket_index(int(value_ms * 1000))] += 1
+        self.count += 1
+        self.total += value_ms
+        if self.min is None or value_ms < self.min:
+            self.min = value_ms
+        if value_ms > self.max:
+            self.max = value_ms
+
+    def quantiles(self, qs: List[float]) -> List[float]:
+        """Values (ms) at the given quantiles, clamped to the observed min/max."""
+        if not self.count:
+            return [0.0 for _ in qs]
+        targets = [max(1, int(q * self.count + 0.5)) for q in qs]
+        results = [None] * len(qs)
+        seen = 0
+        pending = sorted(range(len(qs)), key=lambda i: targets[i])
+        pos = 0
+        for index, bucket_count in enumerate(self.counts):
+            if not bucket_count:
+                continue
+            seen += bucket_count
+            while pos < len(pending) and targets[pending[pos]] <= seen:
+                value = _bucket_midpoint(index) / 1000.0
+                results[pending[pos]] = min(max(value, self.min), self.max)
+                pos += 1
+            if pos == len(pending):
+                break
+        return [r if r is not None else self.max for r in results]
+
+    def summary(self) -> Dict[str, float]:
+        p50, p95, p99 = self.quantiles([0.50, 0.95, 0.99])
+        return {
+            'count': self.count,
+            'avg_ms': round(self.total / self.count, 3) if self.count else 0.0,
+            'min_ms': round(self.min or 0.0, 3),
+            'max_ms': round(self.max, 3),
+            'p50_ms': round(p50, 3),
+            'p95_ms': round(p95, 3),
+            'p99_ms': round(p99, 3),
+        }
+
+
+class _Stripe:
+    __slots__ = ('lock', 'counters', 'gauges', 'histograms')
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counters: Dict[str, int] = {}
+        self.gauges: Dict[str, float] = {}
+        self.histograms: Dict[str, Histogram] = {}
+
+
+class MetricsRegistry:
+    """Process-wide metric storage. See module docstring."""
+
+    def __init__(self, stripes: int = _STRIPES, max_traces: int = _MAX_TRACES):
+        self._stripes = [_Stripe() for _ in range(stripes)]
+        self._traces: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._traces_lock = threading.Lock()
+        self._max_traces = max_traces
+        self.started_at = time.time()
+
+    def _stripe(self, name: str) -> _Stripe:
+        return self._stripes[hash(name) % len(self._stripes)]
+
+    # ── Counters / gauges / histograms ──────────────────────────
+
+    def increment(self, name: str, value: int = 1) -> None:
+        stripe = self._stripe(name)
+        with stripe.lock:
+            stripe.counters[name] = stripe.counters.get(name, 0) + value
+
+    def set_gauge(self, name: str, value: float) -> None:
+        stripe = self._stripe(name)
+        with stripe.lock:
+            stripe.gauges[name] = value
+
+    def observe(self, name: str, value_ms: float) -> None:
+        stripe = self._stripe(name)
+        with stripe.lock:
+            histogram = stripe.histograms.get(name)
+            if histogram is None:
+                histogram = stripe.histograms[name] = Histogram()
+            histogram.record(value_ms)
+
+    def counters(self) -> Dict[str, int]:
+        result = {}
+        for stripe in self._stripes:
+            with stripe.lock:
+                result.update(stripe.counters)
+        return result
+
+    def gauges(self) -> Dict[str, float]:
+        result = {}
+        for stripe in self._stripes:
+            with stripe.lock:
+                result.update(stripe.gauges)
+        return result
+
+    def histogram_summary(self, names: Optional[List[str]] = None) -> Dict[str, Dict[str, float]]:
+        """Per-operation count/avg/min/max/p50/p95/p99, optionally limited to `names`."""
+        result = {}
+        for stripe in self._stripes:
+            with stripe.lock:
+                for name, histogram in stripe.histograms.items():
+                    if names is None or name in names:
+                        result[name] = histogram.summary()
+        return result
+
+    # ── Traces ───────────────────────────────────────────────────
+
+    def start_trace(self, trace_id: str) -> None:
+        trace = {
+            'trace_id': trace_id,
+            'started_at': time.time(),
+            'timings': {},
+            'counters': {},
+            'spans': [],
+        }
+        with self._traces_lock:
+            self._traces[trace_id] = trace
+            while len(self._traces) > self._max_traces:
+                self._traces.popitem(last=False)
+
+    def add_span(self, trace_id: str, name: str, duration_ms: float,
+                 parent: Optional[str] = None) -> None:
+        """Attach a finished span to a trace (no-op if the trace was evicted)."""
+        with self._traces_lock:
+            trace = self._traces.get(trace_id)
+            if trace is None:
+                return
+            trace['timings'][name] = duration_ms
+            spans = trace['spans']
+            if len(spans) < _MAX_SPANS_PER_TRACE:
+                spans.append({'name': name, 'duration_ms': duration_ms, 'parent': parent})
+
+    def get_trace(self, trace_id: str) -> Optional[Dict[str, Any]]:
+        with self._traces_lock:
+            trace = self._traces.get(trace_id)
+            if trace is None:
+                return None
+            return {
+                **trace,
+                'timings': dict(trace['timings']),
+                'counters': dict(trace['counters']),
+                'spans': [dict(span) for span in trace['spans']],
+            }
+
+    def reset(self) -> None:
+        """Drop every metric and trace (tests and manual resets)."""
+        for stripe in self._stripes:
+            with stripe.lock:
+                stripe.counters.clear()
+                stripe.gauges.clear()
+                stripe.histograms.clear()
+        with self._traces_lock:
+            self._traces.clear()
+        self.started_at = time.time()
+
+
+_registry: Optional[MetricsRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Get or create the process-wide metrics registry."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = MetricsRegistry()
+    return _registry
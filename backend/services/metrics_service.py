@@ -1,24 +1,45 @@
 """
 Metrics Service - Structured metrics and per-request tracing.
 
-MemoryStore-backed counters and timing records with daily rollup keys.
+Thin facade over the in-process MetricsRegistry: counters, gauges, fixed-bucket
+latency histograms (p50/p95/p99 per operation) and a bounded ring of recent
+request traces. Recording is O(1) and memory stays flat under sustained load.
 No external dependencies required.
 """
 
 import time
-import json
 import uuid
-import logging
+import threading
+from contextlib import contextmanager
 from typing import Dict, Any, Optional
-from services.memory_client import MemoryClientService
+
+from services.metrics_registry import get_metrics_registry
+
+# Open spans on this thread — gives recorded timings a parent for span trees
+_span_stack = threading.local()
+
+# Operations always present on the dashboard, even before first use
+_DASHBOARD_COUNTERS = [
+    'requests_total', 'responses_total', 'errors_total',
+    'classifications_total', 'facts_extracted',
+    'memory_chunks_enqueued', 'episodes_generated'
+]
+_DASHBOARD_TIMINGS = [
+    'classification', 'response_generation',
+    'fact_extraction', 'context_assembly'
+]
+
+
+def _current_span() -> Optional[str]:
+    stack = getattr(_span_stack, 'names', None)
+    return stack[-1] if stack else None
 
 
 class MetricsService:
-    """Manages metrics collection with MemoryStore counters and timing records."""
+    """Records metrics into the process-wide registry."""
 
     def __init__(self):
-        """Initialize metrics service with MemoryStore connection."""
-        self.store = MemoryClientService.create_connection()
+        self.registry = get_metrics_registry()
 
     def start_trace(self) -> str:
         """
@@ -28,20 +49,11 @@ class MetricsService:
             trace_id: Unique trace identifier
         """
         trace_id = str(uuid.uuid4())[:8]
-        trace_key = f"trace:{trace_id}"
-
-        trace_data = {
-            'trace_id': trace_id,
-            'started_at': time.time(),
-            'timings': {},
-            'counters': {}
-        }
-
-        # Store trace with 1-hour TTL
-        self.store.setex(trace_key, 3600, json.dumps(trace_data))
+        self.registry.start_trace(trace_id)
         return trace_id
 
-    def record_timing(self, trace_id: str, operation: str, duration_ms: float):
+    def record_timing(self, trace_id: str, operation: str, duration_ms: float,
+                      parent: Optional[str] = None):
         """
         Record a timing measurement for a traced operation.
 
@@ -49,23 +61,52 @@ class MetricsService:
             trace_id: Trace identifier from start_trace()
             operation: Name of the operation (e.g., 'classification', 'response_generation')
             duration_ms: Duration in milliseconds
+            parent: Parent span name (defaults to the innermost open span())
+        """
+        self.registry.observe(operation, duration_ms)
+        if trace_id:
+            self.registry.add_span(trace_id, operation, duration_ms,
+                                   parent=parent or _current_span())
+
+    def record_timings(self, trace_id: str, timings: Dict[str, float], prefix: str = '',
+                       parent: Optional[str] = None):
         """
-        trace_key = f"trace:{trace_id}"
-        trace_json = self.store.get(trace_key)
+        Record several timing measurements for a trace.
 
-        if trace_json:
-            trace_data = json.loads(trace_json)
-            trace_data['timings'][operation] = duration_ms
-            self.store.setex(trace_key, 3600, json.dumps(trace_data))
+        Used for fan-out phases (e.g. per-source retrieval).
 
-        # Also record in daily rollup
-        day_key = time.strftime('%Y-%m-%d')
-        rollup_key = f"metrics:timing:{operation}:{day_key}"
+        Args:
+            trace_id: Trace identifier from start_trace()
+            timings: Mapping of operation name to duration in milliseconds
+            prefix: Optional prefix applied to every operation name (e.g. 'retrieval.')
+            parent: Parent span name for every timing
+        """
+        for operation, duration_ms in timings.items():
+            self.record_timing(trace_id, f"{prefix}{operation}", duration_ms, parent=parent)
 
-        pipe = self.store.pipeline()
-        pipe.rpush(rollup_key, str(duration_ms))
-        pipe.expire(rollup_key, 86400 * 7)  # 7-day retention
-        pipe.execute()
+    @contextmanager
+    def span(self, trace_id: str, operation: str):
+        """
+        Time a block as a span; timings recorded inside it become its children.
+
+        Usage:
+            with metrics.span(trace_id, 'context_assembly'):
+                ...
+        """
+        stack = getattr(_span_stack, 'names', None)
+        if stack is None:
+            stack = _span_stack.names = []
+        parent = stack[-1] if stack else None
+        stack.append(operation)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            stack.pop()
+            duration_ms = (time.perf_counter() - start) * 1000
+            self.registry.observe(operation, duration_ms)
+            if trace_id:
+                self.registry.add_span(trace_id, operation, duration_ms, parent=parent)
 
     def record_counter(self, metric_name: str, value: int = 1):
         """
@@ -75,74 +116,41 @@ class MetricsService:
             metric_name: Name of the metric (e.g., 'requests_total', 'errors_total')
             value: Value to increment by (default 1)
         """
-        day_key = time.strftime('%Y-%m-%d')
-        counter_key = f"metrics:counter:{metric_name}:{day_key}"
+        self.registry.increment(metric_name, value)
 
-        pipe = self.store.pipeline()
-        pipe.incrby(counter_key, value)
-        pipe.expire(counter_key, 86400 * 7)  # 7-day retention
-        pipe.execute()
+    def set_gauge(self, metric_name: str, value: float):
+        """Set a point-in-time gauge (e.g. queue depth)."""
+        self.registry.set_gauge(metric_name, value)
 
     def get_trace(self, trace_id: str) -> Optional[Dict[str, Any]]:
         """
-        Retrieve a trace by ID.
+        Retrieve a recent trace by ID.
 
         Args:
             trace_id: Trace identifier
 
         Returns:
-            Trace data dict or None
+            Trace data dict (timings + span list) or None if unknown or evicted
         """
-        trace_key = f"trace:{trace_id}"
-        trace_json = self.store.get(trace_key)
+        return self.registry.get_trace(trace_id)
 
-        if trace_json:
-            return json.loads(trace_json)
-        return None
+    def get_latency_summary(self) -> Dict[str, Dict[str, float]]:
+        """Per-operation count/avg/min/max and p50/p95/p99 latency in ms."""
+        return self.registry.histogram_summary()
 
     def get_dashboard_data(self) -> Dict[str, Any]:
         """
         Get aggregated metrics for dashboard display.
 
         Returns:
-            Dict with counters, timing averages, and recent activity
+            Dict with counters, gauges, and timing summaries since process start
         """
-        day_key = time.strftime('%Y-%m-%d')
+        counters = self.registry.counters()
         dashboard = {
-            'date': day_key,
-            'counters': {},
-            'timing_averages': {}
+            'date': time.strftime('%Y-%m-%d'),
+            'since': self.registry.started_at,
+            'counters': {**{name: 0 for name in _DASHBOARD_COUNTERS}, **counters},
+            'gauges': self.registry.gauges(),
+            'timing_averages': self.registry.histogram_summary(_DASHBOARD_TIMINGS),
         }
-
-        # Collect counters
-        counter_names = [
-            'requests_total', 'responses_total', 'errors_total',
-            'classifications_total', 'facts_extracted',
-            'memory_chunks_enqueued', 'episodes_generated'
-        ]
-
-        for name in counter_names:
-            counter_key = f"metrics:counter:{name}:{day_key}"
-            value = self.store.get(counter_key)
-            dashboard['counters'][name] = int(value) if value else 0
-
-        # Collect timing averages
-        timing_operations = [
-            'classification', 'response_generation',
-            'fact_extraction', 'context_assembly'
-        ]
-
-        for operation in timing_operations:
-            rollup_key = f"metrics:timing:{operation}:{day_key}"
-            values = self.store.lrange(rollup_key, 0, -1)
-
-            if values:
-                float_values = [float(v) for v in values]
-                dashboard['timing_averages'][operation] = {
-                    'count': len(float_values),
-                    'avg_ms': sum(float_values) / len(float_values),
-                    'min_ms': min(float_values),
-                    'max_ms': max(float_values)
-                }
-
         return dashboard
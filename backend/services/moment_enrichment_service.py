@@ -8,39 +8,24 @@ For each:
 3. Generates LLM summary when >= 2 gists collected
 4. Seals the moment when pinned_at + 4hrs has passed (rewrites file with enriched content)
 
-Entry point: moment_enrichment_worker(shared_state=None) registered in run.py.
+Entry point: register_moment_enrichment_job(scheduler) called from run.py.
 """
 
 import json
 import logging
-import time
 from datetime import datetime, timezone, timedelta
 
+from services.write_behind_queue import flush_pending
+
 logger = logging.getLogger(__name__)
 
 LOG_PREFIX = "[MOMENT ENRICHMENT]"
 _POLL_INTERVAL = 300  # 5 minutes
 
 
-def moment_enrichment_worker(shared_state=None):
-    """Module-level entry point for run.py."""
-    logging.basicConfig(level=logging.INFO)
-    logger.info(f"{LOG_PREFIX} Service started (poll interval: {_POLL_INTERVAL}s)")
-
-    next_tick = time.monotonic() + _POLL_INTERVAL
-    while True:
-        try:
-            now = time.monotonic()
-            sleep_secs = max(0, next_tick - now)
-            time.sleep(sleep_secs)
-            next_tick += _POLL_INTERVAL
-            _poll_and_enrich()
-        except KeyboardInterrupt:
-            logger.info(f"{LOG_PREFIX} Shutting down")
-            break
-        except Exception as e:
-            logger.error(f"{LOG_PREFIX} Poll cycle error: {e}")
-            next_tick = time.monotonic() + _POLL_INTERVAL
+def register_moment_enrichment_job(scheduler) -> None:
+    """Register the poll cycle on the job scheduler."""
+    scheduler.add_job("moment-enrichment", _poll_and_enrich, interval=_POLL_INTERVAL)
 
 
 def _poll_and_enrich():
@@ -132,6 +117,7 @@ def _collect_gists_from_interactions(db, topic, window_start, window_end):
     gists = []
 
     try:
+        flush_pending(db)
         with db.connection() as conn:
             cursor = conn.cursor()
 
@@ -1,10 +1,11 @@
 import logging
 import time
+from typing import Callable, Optional
 
 import requests
 import json
 import ollama
-from services.llm_service import LLMResponse, RateLimitError
+from services.llm_service import LLMResponse, RateLimitError, _TokenSink
 
 class OllamaService:
 
@@ -22,15 +23,21 @@ class OllamaService:
         self.format = config.get('format', 'json')
         self.max_retries = config.get('max_retries', 2)
 
-    def send_message(self, system_prompt: str, user_message: str, stream: bool = False) -> LLMResponse:
-        """Send a message to Ollama and return the response."""
+    def send_message(self, system_prompt: str, user_message: str, stream: bool = False,
+                     on_token: Optional[Callable[[str], None]] = None) -> LLMResponse:
+        """Send a message to Ollama and return the response.
+
+        With stream=True, text deltas are passed to on_token as Ollama emits
+        them; the complete response is still returned.
+        """
         url = f"{self.host}/api/generate"
+        sink = _TokenSink(on_token)
 
         payload = {
             "model": self.model,
             "prompt": user_message,
             "system": system_prompt,
-            "stream": False,
+            "stream": stream,
             "think": False,
             "raw": False,
             "keep_alive": self.keep_alive,
@@ -46,9 +53,9 @@ class OllamaService:
         last_exception = None
         for attempt in range(1 + self.max_retries):
             try:
-                response = requests.post(url, json=payload, timeout=self.timeout)
+                response = requests.post(url, json=payload, timeout=self.timeout, stream=stream)
                 response.raise_for_status()
-                data = response.json()
+                data = self._read_stream(response, sink) if stream else response.json()
                 return LLMResponse(
                     text=data['response'],
                     model=data.get('model', self.model),
@@ -57,6 +64,7 @@ class OllamaService:
                     tokens_output=data.get('eval_count'),
                 )
             except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+                sink.raise_if_partial('ollama', e)
                 last_exception = e
                 if attempt < self.max_retries:
                     backoff = 2 * (2 ** attempt)
@@ -87,6 +95,31 @@ class OllamaService:
                 else:
                     raise
 
+    @staticmethod
+    def _read_stream(response, sink) -> dict:
+        """Consume an NDJSON /api/generate stream, forwarding text to sink.
+
+        Returns the final chunk (which carries token counts) with 'response'
+        replaced by the full concatenated text.
+        """
+        parts = []
+        final = {}
+        for line in response.iter_lines():
+            if not line:
+                continue
+            chunk = json.loads(line)
+            if chunk.get('error'):
+                raise RuntimeError(f"Ollama stream error: {chunk['error']}")
+            text = chunk.get('response', '')
+            if text:
+                parts.append(text)
+                sink(text)
+            if chunk.get('done'):
+                final = chunk
+                break
+        final['response'] = ''.join(parts)
+        return final
+
     def generate_embedding(self, text: str, embedding_model: str = None, target_dimensions: int = None) -> list:
         """
         Generate embedding vector using sentence-transformers (no Ollama required).
@@ -642,6 +642,17 @@ _instance: Optional[OnnxInferenceService] = None
 _instance_lock = threading.Lock()
 
 
+def resolve_models_dir() -> str:
+    """Models directory: runtime config, then $MODELS_DIR, then backend/data/models."""
+    import runtime_config
+
+    _default = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "models")
+    return runtime_config.get(
+        "models_dir",
+        os.environ.get("MODELS_DIR", _default),
+    )
+
+
 def get_onnx_inference_service() -> OnnxInferenceService:
     """Get or create the singleton OnnxInferenceService."""
     global _instance
@@ -652,14 +663,7 @@ def get_onnx_inference_service() -> OnnxInferenceService:
         if _instance is not None:
             return _instance
 
-        import runtime_config
-
-        _default = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "models")
-        models_dir = runtime_config.get(
-            "models_dir",
-            os.environ.get("MODELS_DIR", _default),
-        )
-
+        models_dir = resolve_models_dir()
         _instance = OnnxInferenceService(models_dir)
         logger.info(f"{LOG_PREFIX} Initialized with models_dir={models_dir}")
         return _instance
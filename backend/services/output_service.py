@@ -1,5 +1,6 @@
 import json
 import logging
+import time
 import uuid
 from datetime import datetime, timezone
 from typing import Dict, Any, Optional, List
@@ -11,6 +12,58 @@ from .config_service import ConfigService
 logger = logging.getLogger(__name__)
 
 
+class ResponseStream:
+    """
+    Publishes incremental response text for one sync chat request.
+
+    Deltas go to the same sse:{uuid} channel as the final output id, as JSON
+    {"type": "delta", "text", "offset", "index"}. Text is coalesced for
+    FLUSH_INTERVAL seconds (the first delta is sent immediately) so a fast
+    model doesn't flood the channel with single-token messages. offset counts
+    UTF-16 code units, matching JavaScript string indexing on the client.
+    """
+
+    FLUSH_INTERVAL = 0.05
+
+    def __init__(self, store, sse_uuid: str):
+        self.store = store
+        self.channel = f"sse:{sse_uuid}"
+        self._buffer: List[str] = []
+        self._offset = 0
+        self._index = 0
+        self._last_flush = 0.0
+
+    def write(self, text: str) -> None:
+        """Queue text for the client, flushing if the coalescing window elapsed."""
+        if not text:
+            return
+        self._buffer.append(text)
+        if self._index == 0 or time.monotonic() - self._last_flush >= self.FLUSH_INTERVAL:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._buffer:
+            return
+        text = ''.join(self._buffer)
+        self._buffer = []
+        try:
+            self.store.publish(self.channel, json.dumps({
+                "type": "delta",
+                "text": text,
+                "offset": self._offset,
+                "index": self._index,
+            }))
+        except Exception as e:
+            logger.debug(f"[OutputService] Delta publish failed on '{self.channel}': {e}")
+        self._offset += len(text.encode('utf-16-le')) // 2
+        self._index += 1
+        self._last_flush = time.monotonic()
+
+    def close(self) -> None:
+        """Flush any text still held in the coalescing window."""
+        self.flush()
+
+
 class OutputService:
     """Service for managing output queue and storage with type-based routing."""
 
@@ -68,7 +121,7 @@ class OutputService:
         }
 
         # Store with 1-hour TTL
-        self.store.setex(f"output:{output_id}", 3600, json.dumps(output))
+        self.store.set_obj(f"output:{output_id}", output, ex=3600)
 
         meta = original_metadata or {}
         source = meta.get('source', '')
@@ -250,6 +303,18 @@ class OutputService:
         except Exception as e:
             logger.warning(f"Notification dispatch error: {e}")
 
+    def open_response_stream(self, sse_uuid: str) -> ResponseStream:
+        """
+        Open a delta stream to the waiting WebSocket chat request.
+
+        Args:
+            sse_uuid: The SSE request UUID the final output will be published to
+
+        Returns:
+            ResponseStream: call write() per text delta and close() when generation ends
+        """
+        return ResponseStream(self.store, sse_uuid)
+
     def enqueue_close_signal(self, sse_uuid: str) -> None:
         """
         Signal the waiting SSE connection to close with no text response.
@@ -302,7 +367,7 @@ class OutputService:
         }
 
         # Store with 1-hour TTL
-        self.store.setex(f"output:{output_id}", 3600, json.dumps(output))
+        self.store.set_obj(f"output:{output_id}", output, ex=3600)
 
         # Add to queue
         self.store.lpush(self.queue_name, output_id)
@@ -337,14 +402,12 @@ class OutputService:
             if isinstance(output_id, bytes):
                 output_id = output_id.decode()
 
-            output_data = self.store.get(f"output:{output_id}")
+            output = self.store.get_obj(f"output:{output_id}")
 
-            if not output_data:
+            if not output:
                 logger.warning(f"Output {output_id} expired or deleted, skipping")
                 continue
 
-            output = json.loads(output_data)
-
             # Filter by type if specified
             if output_type and output.get('type') != output_type:
                 logger.debug(f"Re-queuing output {output_id} (type={output.get('type')}, want={output_type})")
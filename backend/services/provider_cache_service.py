@@ -105,6 +105,23 @@ class ProviderCacheService:
             return {}
 
 
+    @staticmethod
+    def get_generation() -> int:
+        """
+        Current provider cache version (the MemoryStore counter bumped by invalidate()).
+
+        Cheap — no DB access. Derived caches such as ConfigService's resolved
+        agent configs key on this to notice provider or job-assignment changes.
+        """
+        try:
+            from services.memory_client import MemoryClientService
+            store = MemoryClientService.create_connection()
+            version = store.get("providers:cache_version")
+            return int(version) if version else 0
+        except Exception:
+            return ProviderCacheService._version or 0
+
+
     @staticmethod
     def get_job_assignment(job_name: str) -> Optional[str]:
         """
@@ -0,0 +1,196 @@
+"""
+Retrieval Executor — request-scoped concurrent fan-out for independent lookups.
+
+Phase B sources (gists, world state, working memory, episodes, concepts,
+moments, facts, procedural hints) don't depend on each other, yet each one
+costs a DB or MemoryStore round trip. RetrievalExecutor starts them together
+on a shared bounded thread pool, waits for each up to its own deadline, and
+records per-source wall times — so retrieval costs about as much as its
+slowest source instead of the sum of all of them.
+
+Usage:
+    executor = RetrievalExecutor(default_timeout=2.0)
+    executor.submit('gists', gist_storage.get_latest_gists, topic, default=[])
+    executor.submit('world_state', world_state_service.get_world_state, topic, default='')
+    results = executor.collect()          # {'gists': [...], 'world_state': '...'}
+    executor.timings                      # {'gists': 12.4, 'world_state': 31.0}
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+LOG_PREFIX = "[RETRIEVAL]"
+
+# Bounded: retrieval is I/O-light (SQLite + MemoryStore), so a handful of
+# workers covers every source of one request plus some cross-request overlap.
+_POOL_SIZE = 8
+
+_pool: Optional[ThreadPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+# Marks pool worker threads so nested fan-outs run inline instead of waiting
+# on the pool from inside it (which could exhaust workers and deadlock).
+_worker_state = threading.local()
+
+
+def get_retrieval_pool() -> ThreadPoolExecutor:
+    """Get or create the process-wide retrieval thread pool."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ThreadPoolExecutor(
+                    max_workers=_POOL_SIZE,
+                    thread_name_prefix="retrieval",
+                    initializer=_mark_worker,
+                )
+    return _pool
+
+
+def _mark_worker():
+    _worker_state.in_pool = True
+
+
+class _Source:
+    __slots__ = ('name', 'future', 'value', 'error', 'deadline', 'default', 'required',
+                 'submitted', 'started', 'running', 'finished', 'resolved')
+
+    def __init__(self, name, default, required, deadline):
+        self.name = name
+        self.future = None
+        self.value = None
+        self.error = None
+        self.deadline = deadline
+        self.default = default
+        self.required = required
+        self.submitted = time.monotonic()
+        self.started = None
+        self.running = threading.Event()
+        self.finished = None
+        self.resolved = False
+
+
+class RetrievalExecutor:
+    """
+    Runs named, independent retrieval calls concurrently for one request.
+
+    Each source has its own deadline, measured from when a pool worker starts
+    running it — time spent queued behind other requests' sources doesn't
+    count against it. Queueing is bounded separately by queue_timeout
+    (defaults to default_timeout). A source that misses either limit or raises
+    yields its default with a warning (a started worker keeps running to
+    completion, but its result is discarded). Sources submitted with
+    required=True have no deadline and re-raise their exception from result().
+    """
+
+    def __init__(self, default_timeout: float = 2.0, queue_timeout: float = None):
+        self.default_timeout = default_timeout
+        self.queue_timeout = queue_timeout if queue_timeout is not None else default_timeout
+        self.timings: Dict[str, float] = {}
+        self.timed_out: List[str] = []
+        self._sources: Dict[str, _Source] = {}
+        self._inline = getattr(_worker_state, 'in_pool', False)
+
+    def submit(
+        self,
+        name: str,
+        fn: Callable,
+        *args,
+        timeout: float = None,
+        default: Any = None,
+        required: bool = False,
+        **kwargs,
+    ) -> None:
+        """
+        Start a retrieval source.
+
+        Args:
+            name: Unique source name (used for results and timings)
+            fn: Callable performing the lookup
+            timeout: Per-source deadline in seconds (defaults to default_timeout)
+            default: Value returned if the source times out or fails
+            required: Wait without deadline and propagate exceptions
+        """
+        deadline = None if required else (timeout if timeout is not None else self.default_timeout)
+        source = _Source(name, default, required, deadline)
+        self._sources[name] = source
+
+        def _run():
+            source.started = time.monotonic()
+            source.running.set()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                source.finished = time.monotonic()
+
+        if self._inline:
+            # Already on a pool worker — run synchronously (no deadline possible)
+            try:
+                source.value = _run()
+            except Exception as e:
+                source.error = e
+            return
+
+        source.future = get_retrieval_pool().submit(_run)
+
+    def result(self, name: str) -> Any:
+        """Wait for one source (up to its deadline) and return its value."""
+        source = self._sources[name]
+
+        if not source.resolved:
+            self._resolve(source)
+
+        if source.error is not None:
+            if source.required:
+                raise source.error
+            logger.warning(f"{LOG_PREFIX} Source '{name}' failed — using default: {source.error}")
+            return source.default
+        return source.value
+
+    def _resolve(self, source: _Source):
+        timed_out = False
+        if source.future is not None:
+            remaining = None
+            if source.deadline is not None:
+                queued_for = self.queue_timeout - (time.monotonic() - source.submitted)
+                if not source.running.wait(timeout=max(0.0, queued_for)) and source.future.cancel():
+                    # Never reached a worker — the pool is saturated by other requests
+                    timed_out = True
+                    source.value = source.default
+                    logger.warning(
+                        f"{LOG_PREFIX} Source '{source.name}' still queued after "
+                        f"{self.queue_timeout * 1000:.0f}ms — using default"
+                    )
+                else:
+                    source.running.wait()   # cancel() lost the race: it has just started
+                    remaining = max(0.0, source.started + source.deadline - time.monotonic())
+            if not timed_out:
+                try:
+                    source.value = source.future.result(timeout=remaining)
+                except FutureTimeoutError:
+                    timed_out = True
+                    source.value = source.default
+                    logger.warning(
+                        f"{LOG_PREFIX} Source '{source.name}' missed its "
+                        f"{source.deadline * 1000:.0f}ms deadline — using default"
+                    )
+                except Exception as e:
+                    source.error = e
+
+        end = time.monotonic() if timed_out or source.finished is None else source.finished
+        self.timings[source.name] = (end - source.submitted) * 1000
+        if timed_out:
+            self.timed_out.append(source.name)
+        source.resolved = True
+
+    def collect(self) -> Dict[str, Any]:
+        """Wait for every non-required source and return {name: value}."""
+        return {
+            name: self.result(name)
+            for name, source in self._sources.items()
+            if not source.required
+        }
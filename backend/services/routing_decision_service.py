@@ -3,6 +3,9 @@ Routing Decision Service — Logs routing decisions to SQLite.
 
 Lightweight service following CortexIterationService pattern.
 Handles logging, feedback updates, and reflection storage.
+
+Decisions and their feedback are written through the write-behind queue; the
+query methods flush it first.
 """
 
 import json
@@ -11,6 +14,7 @@ import logging
 from typing import Dict, Any, Optional, List
 
 from services.database_service import DatabaseService
+from services.write_behind_queue import flush_pending, write_behind
 
 logger = logging.getLogger(__name__)
 
@@ -55,38 +59,35 @@ class RoutingDecisionService:
         decision_id = str(uuid.uuid4())
 
         try:
-            with self.db_service.connection() as conn:
-                cursor = conn.cursor()
-                effort = routing_result.get('effort_estimate')
-                reasoning = f"[effort:{effort}]" if effort else None
-                cursor.execute("""
-                    INSERT INTO routing_decisions (
-                        id, topic, exchange_id, selected_mode,
-                        router_confidence, scores, tiebreaker_used,
-                        tiebreaker_candidates, margin, effective_margin,
-                        signal_snapshot, weight_snapshot, routing_time_ms,
-                        reasoning, previous_mode
-                    ) VALUES (
-                        ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
-                    )
-                """, (
-                    decision_id,
-                    topic,
-                    exchange_id,
-                    routing_result['mode'],
-                    routing_result.get('router_confidence'),
-                    json.dumps(routing_result.get('scores', {})),
-                    1 if routing_result.get('tiebreaker_used', False) else 0,
-                    json.dumps(routing_result.get('tiebreaker_candidates')),
-                    routing_result.get('margin'),
-                    routing_result.get('effective_margin'),
-                    json.dumps(routing_result.get('signal_snapshot', {})),
-                    json.dumps(routing_result.get('weight_snapshot')),
-                    routing_result.get('routing_time_ms'),
-                    reasoning,
-                    previous_mode,
-                ))
-                cursor.close()
+            effort = routing_result.get('effort_estimate')
+            reasoning = f"[effort:{effort}]" if effort else None
+            write_behind(self.db_service, """
+                INSERT INTO routing_decisions (
+                    id, topic, exchange_id, selected_mode,
+                    router_confidence, scores, tiebreaker_used,
+                    tiebreaker_candidates, margin, effective_margin,
+                    signal_snapshot, weight_snapshot, routing_time_ms,
+                    reasoning, previous_mode
+                ) VALUES (
+                    ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
+                )
+            """, (
+                decision_id,
+                topic,
+                exchange_id,
+                routing_result['mode'],
+                routing_result.get('router_confidence'),
+                json.dumps(routing_result.get('scores', {})),
+                1 if routing_result.get('tiebreaker_used', False) else 0,
+                json.dumps(routing_result.get('tiebreaker_candidates')),
+                routing_result.get('margin'),
+                routing_result.get('effective_margin'),
+                json.dumps(routing_result.get('signal_snapshot', {})),
+                json.dumps(routing_result.get('weight_snapshot')),
+                routing_result.get('routing_time_ms'),
+                reasoning,
+                previous_mode,
+            ))
 
             logger.debug(f"{LOG_PREFIX} Logged decision {decision_id} for topic '{topic}'")
             return decision_id
@@ -108,14 +109,12 @@ class RoutingDecisionService:
             feedback: Dict with misroute info, suggested_mode, reward
         """
         try:
-            with self.db_service.connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    UPDATE routing_decisions
-                    SET feedback = ?
-                    WHERE id = ?
-                """, (json.dumps(feedback), decision_id))
-                cursor.close()
+            # Queued behind the decision's INSERT, so it always finds the row
+            write_behind(self.db_service, """
+                UPDATE routing_decisions
+                SET feedback = ?
+                WHERE id = ?
+            """, (json.dumps(feedback), decision_id))
 
             logger.debug(f"{LOG_PREFIX} Updated feedback for {decision_id}")
 
@@ -135,6 +134,7 @@ class RoutingDecisionService:
             reflection: Dict with ambiguity analysis from reflection service
         """
         try:
+            flush_pending(self.db_service)
             with self.db_service.connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
@@ -165,6 +165,7 @@ class RoutingDecisionService:
             List of decision dicts
         """
         try:
+            flush_pending(self.db_service)
             with self.db_service.connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
@@ -222,6 +223,7 @@ class RoutingDecisionService:
             List of unreflected decision dicts
         """
         try:
+            flush_pending(self.db_service)
             with self.db_service.connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
@@ -270,6 +272,7 @@ class RoutingDecisionService:
             Previous mode string or None
         """
         try:
+            flush_pending(self.db_service)
             with self.db_service.connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
@@ -298,6 +301,7 @@ class RoutingDecisionService:
             Dict mapping mode to proportion (0.0-1.0)
         """
         try:
+            flush_pending(self.db_service)
             with self.db_service.connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
@@ -331,6 +335,7 @@ class RoutingDecisionService:
             Proportion of decisions that used tie-breaker (0.0-1.0)
         """
         try:
+            flush_pending(self.db_service)
             with self.db_service.connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
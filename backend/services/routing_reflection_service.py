@@ -83,28 +83,12 @@ class RoutingReflectionService:
             f"interval={self.min_interval_minutes}min)"
         )
 
-    def run(self, shared_state: Optional[dict] = None) -> None:
-        """Main service loop."""
-        logger.info(f"{LOG_PREFIX} Service started")
-
-        while True:
-            try:
-                time.sleep(self.check_interval)
-
-                if not self._are_workers_idle():
-                    continue
-
-                if not self._can_run_batch():
-                    continue
-
-                self._run_reflection_batch()
+    def run_once(self) -> None:
+        """Job entry point — runs only when the scheduler's idle gate passes."""
+        if not self._can_run_batch():
+            return
 
-            except KeyboardInterrupt:
-                logger.info(f"{LOG_PREFIX} Service shutting down...")
-                break
-            except Exception as e:
-                logger.error(f"{LOG_PREFIX} Error: {e}", exc_info=True)
-                time.sleep(60)
+        self._run_reflection_batch()
 
     def _are_workers_idle(self) -> bool:
         """Check if all worker queues are empty."""
@@ -324,8 +308,8 @@ class RoutingReflectionService:
         return reflection
 
 
-def routing_reflection_worker(shared_state=None):
-    """Module-level wrapper for threading."""
+def register_routing_reflection_job(scheduler) -> None:
+    """Register the idle-gated reflection batch on the job scheduler."""
     try:
         config = ConfigService.get_agent_config("mode-reflection")
         check_interval = config.get('check_interval', 300)
@@ -333,4 +317,7 @@ def routing_reflection_worker(shared_state=None):
         check_interval = 300
 
     service = RoutingReflectionService(check_interval=check_interval)
-    service.run(shared_state)
+    scheduler.add_job(
+        "routing-reflection", service.run_once,
+        interval=check_interval, idle_gate=service._are_workers_idle,
+    )
@@ -2,7 +2,7 @@
 Routing Stability Regulator — Single authority for mode router weight mutation.
 
 Follows TopicStabilityRegulatorService pattern:
-- Runs on 24h cycle (registered as service in run.py)
+- Runs on 24h cycle (registered as a job scheduler job in run.py)
 - Reads pressure signals from routing_decisions table
 - Computes: tie-breaker rate, mode entropy, misroute rate, reflection disagreement
 - Selects worst pressure, maps to single parameter adjustment
@@ -587,16 +587,17 @@ class RoutingStabilityRegulator:
         return self._load_config()
 
 
-def routing_stability_regulator_worker(shared_state=None):
-    """Worker entry point. Runs every 24 hours."""
-    logger.info(f"{LOG_PREFIX} Starting regulation service...")
+def _run_routing_regulation():
+    try:
+        regulator = RoutingStabilityRegulator()
+        regulator.run_regulation_cycle()
+    except Exception as e:
+        logger.error(f"{LOG_PREFIX} Regulation failed: {e}", exc_info=True)
 
-    while True:
-        try:
-            regulator = RoutingStabilityRegulator()
-            regulator.run_regulation_cycle()
-        except Exception as e:
-            logger.error(f"{LOG_PREFIX} Regulation failed: {e}", exc_info=True)
 
-        # Sleep 24 hours
-        time.sleep(86400)
+def register_routing_stability_regulator_job(scheduler) -> None:
+    """Register daily regulation on the job scheduler (first run at startup)."""
+    scheduler.add_job(
+        "routing-stability-regulator", _run_routing_regulation,
+        interval=86400, initial_delay=0,
+    )
@@ -5,12 +5,11 @@ Polls scheduled_items table every 60 seconds. Fires due items through
 the prompt queue — frontal cortex handles tone and framing naturally.
 
 SQLite's WAL mode provides implicit locking — no explicit row locks needed.
-Entry point: scheduler_worker(shared_state=None) registered in run.py.
+Entry point: register_scheduler_job(scheduler) called from run.py.
 """
 
 import logging
 import struct
-import time
 from datetime import datetime, timezone, timedelta
 
 logger = logging.getLogger(__name__)
@@ -64,25 +63,9 @@ def embed_scheduled_item(item_id: str, message: str, db=None) -> None:
         logger.warning(f"{LOG_PREFIX} Failed to embed scheduled item {item_id}: {e}")
 
 
-def scheduler_worker(shared_state=None):
-    """Module-level entry point for run.py."""
-    logging.basicConfig(level=logging.INFO)
-    logger.info(f"{LOG_PREFIX} Service started (poll interval: {_POLL_INTERVAL}s)")
-
-    next_tick = time.monotonic() + _POLL_INTERVAL
-    while True:
-        try:
-            now = time.monotonic()
-            sleep_secs = max(0, next_tick - now)
-            time.sleep(sleep_secs)
-            next_tick += _POLL_INTERVAL
-            _poll_and_fire()
-        except KeyboardInterrupt:
-            logger.info(f"{LOG_PREFIX} Shutting down")
-            break
-        except Exception as e:
-            logger.error(f"{LOG_PREFIX} Poll cycle error: {e}")
-            next_tick = time.monotonic() + _POLL_INTERVAL
+def register_scheduler_job(scheduler) -> None:
+    """Register the poll cycle on the job scheduler."""
+    scheduler.add_job("scheduled-items", _poll_and_fire, interval=_POLL_INTERVAL, latency_sensitive=True)
 
 
 def _poll_and_fire():
@@ -715,17 +715,9 @@ class SelfModelService:
             logger.debug(f"{LOG_PREFIX} Failed to resolve gap: {e}")
 
 
-# ── Background worker ───────────────────────────────────────────
+# ── Background job ───────────────────────────────────────────
 
-def self_model_worker(shared_state=None):
-    """Background thread: refresh self-model snapshot every 30s."""
+def register_self_model_job(scheduler) -> None:
+    """Register the self-model snapshot refresh (every 30s, first run at startup)."""
     service = SelfModelService()
-    logger.info(f"{LOG_PREFIX} Worker started (refresh every {REFRESH_INTERVAL}s)")
-
-    while True:
-        try:
-            service._refresh()
-        except Exception as e:
-            logger.warning(f"{LOG_PREFIX} Refresh failed: {e}")
-
-        time.sleep(REFRESH_INTERVAL)
+    scheduler.add_job("self-model", service._refresh, interval=REFRESH_INTERVAL, initial_delay=0)
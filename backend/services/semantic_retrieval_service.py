@@ -11,14 +11,14 @@ Semantic Retrieval Service
 
 Provides hybrid search combining vector similarity with semantic graph properties.
 Implements confidence filtering and spreading activation for enhanced retrieval.
+Vector scoring runs against the resident ConceptIndex rather than SQLite.
 """
 
-import json
 import logging
-import numpy as np
 import random
 from typing import List, Dict, Any, Optional
 from collections import deque
+from services.concept_index import get_concept_index
 from services.embedding_service import get_embedding_service
 from services.semantic_storage_service import SemanticStorageService
 from services.config_service import ConfigService
@@ -51,56 +51,42 @@ class SemanticRetrievalService:
         if query_embedding is None:
             query_embedding = self.embedding_service.generate_embedding(query)
 
-        # Get all concepts from storage
-        all_concepts = self.storage_service.get_all_concepts()
-
-        if not all_concepts:
+        # Score against the resident concept index (loaded once, updated by writers)
+        try:
+            index = get_concept_index()
+            index.ensure_loaded(self.db_service)
+            filtered_concepts = index.search(
+                query_embedding,
+                self._inference_weights(),
+                limit,
+                min_confidence=self.min_confidence_threshold,
+            )
+        except Exception as e:
+            logging.error(f"Concept index search failed: {e}")
             return []
 
-        # Perform hybrid search
-        scored_concepts = self._hybrid_search(query_embedding, all_concepts)
-
-        # Apply confidence filtering - mimics "can't remember" experience
-        confident_concepts = [
-            concept for concept in scored_concepts
-            if concept.get('confidence', 0) >= self.min_confidence_threshold
-        ]
-
-        # If all concepts are below threshold, return empty (can't remember)
-        if not confident_concepts:
+        # Empty when every concept is below the confidence threshold ("can't remember")
+        if not filtered_concepts:
             return []
 
-        # Sort by hybrid score and limit results
-        confident_concepts.sort(key=lambda x: x.get('hybrid_score', 0), reverse=True)
-
-        filtered_concepts = confident_concepts[:limit]
-
         # Track access for utility calculation
-        if filtered_concepts:
-            concept_ids = [c['id'] for c in filtered_concepts]
-            self._track_access(concept_ids)
+        concept_ids = [c['id'] for c in filtered_concepts]
+        self._track_access(concept_ids)
 
         return filtered_concepts
 
-    def _hybrid_search(self, query_embedding: np.ndarray, concepts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _inference_weights(self) -> Dict[str, float]:
         """
-        Perform hybrid search combining multiple scoring factors.
+        Hybrid scoring weights (from config).
 
-        Scoring factors (from config):
+        Defaults:
         - Vector similarity: weight = 5
         - Strength: weight = 3
         - Activation score: weight = 2
         - Utility score: weight = 2
         - Confidence: weight = 1
-
-        Args:
-            query_embedding: Query vector
-            concepts: List of concept dictionaries
-
-        Returns:
-            List of concepts with added hybrid_score field
         """
-        weights = self.config.get('inference_weights', {
+        return self.config.get('inference_weights', {
             'vector_similarity': 5,
             'strength': 3,
             'activation_score': 2,
@@ -108,80 +94,6 @@ class SemanticRetrievalService:
             'confidence': 1
         })
 
-        scored_concepts = []
-
-        for concept in concepts:
-            # Get concept embedding
-            concept_embedding = concept.get('embedding')
-            if concept_embedding is None:
-                # Skip concepts without embeddings
-                continue
-
-            # Calculate vector similarity (cosine similarity)
-            vector_similarity = self._cosine_similarity(query_embedding, concept_embedding)
-
-            # Get semantic properties (normalized 0-1)
-            strength = concept.get('strength', 0.5)
-            activation_score = concept.get('activation_score', 0.0)
-            utility_score = concept.get('utility_score', 0.0)
-            confidence = concept.get('confidence', 0.5)
-
-            # Calculate weighted hybrid score
-            hybrid_score = (
-                weights['vector_similarity'] * vector_similarity +
-                weights['strength'] * strength +
-                weights['activation_score'] * activation_score +
-                weights['utility_score'] * utility_score +
-                weights['confidence'] * confidence
-            )
-
-            # Normalize by total weight
-            total_weight = sum(weights.values())
-            hybrid_score = hybrid_score / total_weight
-
-            # Add score to concept
-            concept_copy = concept.copy()
-            concept_copy['hybrid_score'] = hybrid_score
-            concept_copy['vector_similarity'] = vector_similarity
-
-            scored_concepts.append(concept_copy)
-
-        return scored_concepts
-
-    def _cosine_similarity(self, vec1: np.ndarray, vec2: np.ndarray) -> float:
-        """
-        Calculate cosine similarity between two vectors.
-
-        Args:
-            vec1: First vector
-            vec2: Second vector
-
-        Returns:
-            Cosine similarity score (0-1)
-        """
-        # SQLite may return embeddings as strings via JSON storage
-        if isinstance(vec1, str):
-            vec1 = json.loads(vec1)
-        if isinstance(vec2, str):
-            vec2 = json.loads(vec2)
-        vec1 = np.array(vec1, dtype=np.float64)
-        vec2 = np.array(vec2, dtype=np.float64)
-
-        # Calculate cosine similarity
-        dot_product = np.dot(vec1, vec2)
-        norm1 = np.linalg.norm(vec1)
-        norm2 = np.linalg.norm(vec2)
-
-        if norm1 == 0 or norm2 == 0:
-            return 0.0
-
-        similarity = dot_product / (norm1 * norm2)
-
-        # Clamp to [0, 1] range
-        similarity = max(0.0, min(1.0, similarity))
-
-        return float(similarity)
-
     def spreading_activation(self, seed_concepts: List[str], max_depth: int = 2) -> List[Dict[str, Any]]:
         """
         Perform spreading activation from seed concepts.
@@ -301,22 +213,10 @@ class SemanticRetrievalService:
             return
 
         try:
-            with self.db_service.connection() as conn:
-                cursor = conn.cursor()
-
-                # Batch update access tracking
-                for concept_id in concept_ids:
-                    cursor.execute("""
-                        UPDATE semantic_concepts
-                        SET
-                            access_count = access_count + 1,
-                            last_accessed_at = datetime('now'),
-                            updated_at = datetime('now')
-                        WHERE id = ? AND deleted_at IS NULL
-                    """, (concept_id,))
-
-                cursor.close()
-                logging.debug(f"Tracked access for {len(concept_ids)} concepts")
+            # Coalesced and applied off the request path (see services.access_tracker)
+            from services.access_tracker import record_concept_access
+            record_concept_access(self.db_service, concept_ids)
+            logging.debug(f"Tracked access for {len(concept_ids)} concepts")
 
         except Exception as e:
             logging.error(f"Failed to track access: {e}")
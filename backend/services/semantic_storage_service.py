@@ -9,6 +9,7 @@ import struct
 import uuid
 from datetime import datetime
 from typing import Optional, List, Dict, Any
+from services.concept_index import get_concept_index
 from services.database_service import DatabaseService
 
 
@@ -63,6 +64,17 @@ class SemanticStorageService:
         except Exception as e:
             logging.warning(f"Failed to store concept embedding: {e}")
 
+    def _index_concept(self, concept_id: str, embedding):
+        """Add a freshly committed concept to the resident ConceptIndex."""
+        if embedding is None:
+            return
+        try:
+            concept = self.get_concept(concept_id)
+            if concept:
+                get_concept_index().upsert(concept, _pack_embedding(embedding))
+        except Exception as e:
+            logging.warning(f"Failed to index concept {concept_id}: {e}")
+
     def store_concept(self, concept_data: dict) -> str:
         """
         Store a new concept in the database.
@@ -117,8 +129,9 @@ class SemanticStorageService:
 
                 cursor.close()
 
-                logging.info(f"Stored concept {concept_id}: '{concept_data['concept_name']}' ({concept_data['concept_type']})")
-                return str(concept_id)
+            logging.info(f"Stored concept {concept_id}: '{concept_data['concept_name']}' ({concept_data['concept_type']})")
+            self._index_concept(concept_id, embedding)
+            return str(concept_id)
 
         except Exception as e:
             logging.error(f"Failed to store concept: {e}")
@@ -257,8 +270,15 @@ class SemanticStorageService:
 
                 cursor.close()
 
-                logging.info(f"Strengthened concept {concept_id}: {current_strength:.2f} -> {new_strength:.2f}")
-                return True
+            get_concept_index().update_fields(
+                concept_id,
+                strength=new_strength,
+                source_episodes=json.dumps(source_episodes, default=_json_default),
+                consolidation_count=new_consolidation_count,
+                decay_resistance=new_decay_resistance,
+            )
+            logging.info(f"Strengthened concept {concept_id}: {current_strength:.2f} -> {new_strength:.2f}")
+            return True
 
         except Exception as e:
             logging.error(f"Failed to strengthen concept {concept_id}: {e}")
@@ -353,7 +353,9 @@ class SparkStateService:
         """Check if a welcome was ever sent, using the persisted interaction_log."""
         try:
             from services.database_service import get_shared_db_service
+            from services.write_behind_queue import flush_pending
             db = get_shared_db_service()
+            flush_pending(db)
             with db.connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
@@ -15,7 +15,8 @@ Design principles:
   cycles won't create duplicates.
 - Slugified trait keys: topic names are slugified and capped at 40 chars.
 - Write serialization: TemporalObservationBuffer accumulates observations in-memory,
-  flushes to SQLite on a single writer thread (avoids busy locks in WAL mode).
+  then hands each batch to the shared write-behind queue (one writer thread for
+  all append-only tables — avoids busy locks in WAL mode).
 - Aggregate-first reads: mining queries read temporal_aggregate (bounded ~17k rows),
   not raw temporal_observations.
 - Laplace-smoothed predictions: avoids overconfident predictions on small samples.
@@ -29,6 +30,8 @@ import time as _time
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 
+from services.write_behind_queue import flush_pending, write_behind_statements
+
 logger = logging.getLogger(__name__)
 
 LOG_PREFIX = "[TEMPORAL]"
@@ -86,6 +89,23 @@ WEEKEND_DAYS = {5, 6}
 
 # ── Observation Buffer (thread-safe write serialization) ────────────
 
+_INSERT_OBSERVATION_SQL = """
+    INSERT INTO temporal_observations
+        (observation_type, observed_value, day_of_week, hour_bucket,
+         device_class, location_hash)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+_UPSERT_AGGREGATE_SQL = """
+    INSERT INTO temporal_aggregate
+        (observation_type, observed_value, day_of_week,
+         hour_bucket, device_class, count, last_seen)
+    VALUES (?, ?, ?, ?, ?, 1, ?)
+    ON CONFLICT(observation_type, observed_value,
+                day_of_week, hour_bucket, device_class)
+    DO UPDATE SET count = count + 1, last_seen = ?
+"""
+
 class TemporalObservationBuffer:
     """Thread-safe write buffer for ambient observations.
 
@@ -125,8 +145,8 @@ class TemporalObservationBuffer:
     def _flush_locked(self, db_service=None):
         """Write buffer to SQLite. Must be called under lock.
 
-        Single transaction: INSERT raw rows + UPSERT aggregate counts.
-        Uses parameterized prepared statements.
+        Single transaction: INSERT raw rows + UPSERT aggregate counts, queued
+        together on the write-behind queue (or written now when it is off).
         """
         if not self._buffer:
             return
@@ -144,45 +164,23 @@ class TemporalObservationBuffer:
                 return
 
         try:
-            with db_service.connection() as conn:
-                cursor = conn.cursor()
-
+            now_iso = datetime.utcnow().isoformat()
+            write_behind_statements(db_service, [
                 # 1. INSERT raw observations
-                cursor.executemany(
-                    """
-                    INSERT INTO temporal_observations
-                        (observation_type, observed_value, day_of_week, hour_bucket,
-                         device_class, location_hash)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                    """,
-                    [
-                        (o['observation_type'], o['observed_value'], o['day_of_week'],
-                         o['hour_bucket'], o.get('device_class', ''),
-                         o.get('location_hash', ''))
-                        for o in batch
-                    ]
-                )
-
+                (_INSERT_OBSERVATION_SQL, [
+                    (o['observation_type'], o['observed_value'], o['day_of_week'],
+                     o['hour_bucket'], o.get('device_class', ''),
+                     o.get('location_hash', ''))
+                    for o in batch
+                ]),
                 # 2. UPSERT aggregate counts
-                now_iso = datetime.utcnow().isoformat()
-                for o in batch:
-                    cursor.execute(
-                        """
-                        INSERT INTO temporal_aggregate
-                            (observation_type, observed_value, day_of_week,
-                             hour_bucket, device_class, count, last_seen)
-                        VALUES (?, ?, ?, ?, ?, 1, ?)
-                        ON CONFLICT(observation_type, observed_value,
-                                    day_of_week, hour_bucket, device_class)
-                        DO UPDATE SET count = count + 1, last_seen = ?
-                        """,
-                        (o['observation_type'], o['observed_value'], o['day_of_week'],
-                         o['hour_bucket'], o.get('device_class', ''),
-                         now_iso, now_iso)
-                    )
-
-                conn.commit()
-                cursor.close()
+                (_UPSERT_AGGREGATE_SQL, [
+                    (o['observation_type'], o['observed_value'], o['day_of_week'],
+                     o['hour_bucket'], o.get('device_class', ''),
+                     now_iso, now_iso)
+                    for o in batch
+                ]),
+            ])
 
             self._last_flush_time = _time.time()
             logger.debug(f"{LOG_PREFIX} Flushed {len(batch)} observations to DB")
@@ -217,6 +215,8 @@ class TemporalPatternService:
         """
         start = _time.monotonic()
         cutoff = datetime.utcnow() - timedelta(days=lookback_days)
+        # interaction_log and temporal observations are written behind
+        flush_pending(self.db)
 
         patterns = []
 
@@ -475,6 +475,7 @@ class TemporalPatternService:
             'write_errors_total': observation_buffer.write_errors_count,
         }
         try:
+            flush_pending(self.db)
             with self.db.connection() as conn:
                 cursor = conn.cursor()
 
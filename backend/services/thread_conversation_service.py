@@ -2,8 +2,25 @@
 Thread Conversation Service - MemoryStore-backed conversation storage per thread.
 
 Replaces TopicConversationService's file-based storage with MemoryStore lists.
-Each thread has a conversation list (thread_conv:{thread_id}) and an
-exchange count index (thread_conv_index:{thread_id}).
+Each thread has a conversation list (thread_conv:{thread_id}), an exchange
+count index (thread_conv_index:{thread_id}) and a position index
+(thread_conv_pos:{thread_id}) mapping exchange id → absolute sequence number.
+The list position of an exchange is its sequence minus the number of exchanges
+trimmed off the head so far (the "_base" field), so looking one up by id is
+O(1) and trimming only drops the trimmed ids. Entries the index does not know
+(pushed directly by older code) are still found by a linear fallback.
+
+Exchanges are stored as typed values (rpush_obj/lset_obj) so updates skip the
+JSON round-trip; entries written as JSON strings by older callers still decode.
+Read-modify-write updates run as WATCH/MULTI transactions and retry when a
+concurrent writer touched the conversation in between.
+
+Change feed for the episodic observer: every thread keeps running signal
+counters (thread_conv_signals:{thread_id}) — enriched exchanges, gists, facts,
+traits and per-emotion counts — updated by delta in the same transaction as
+the memory chunk, trim or removal that changed them. Such threads are added to
+the thread_conv_dirty set, so the observer only re-evaluates threads whose
+signals moved instead of re-reading every conversation.
 """
 
 import json
@@ -14,6 +31,50 @@ from datetime import datetime
 from typing import Optional, List
 
 from services.memory_client import MemoryClientService
+from services.memory_store import WatchError
+
+
+DIRTY_THREADS_KEY = "thread_conv_dirty"
+
+
+def chunk_signals(chunk: Optional[dict]) -> Optional[dict]:
+    """Density inputs one exchange's memory chunk contributes, or None if unenriched."""
+    if not chunk:
+        return None
+    emotions = set()
+    emotion = chunk.get('emotion', {})
+    user_emotion = emotion.get('user', {}) if isinstance(emotion, dict) else {}
+    if isinstance(user_emotion, dict):
+        for emo_type, score in user_emotion.items():
+            if isinstance(score, (int, float)) and score > 2:
+                emotions.add(emo_type)
+    return {
+        'gists': len(chunk.get('gists', [])),
+        'facts': len(chunk.get('facts', [])),
+        'traits': len(chunk.get('user_traits', [])),
+        'emotions': emotions,
+    }
+
+
+def empty_signals() -> dict:
+    return {'enriched': 0, 'gists': 0, 'facts': 0, 'traits': 0, 'emotions': {}}
+
+
+def add_chunk_signals(signals: dict, chunk: Optional[dict], sign: int = 1) -> None:
+    """Add (sign=1) or remove (sign=-1) one exchange's chunk from running signals."""
+    contribution = chunk_signals(chunk)
+    if contribution is None:
+        return
+    signals['enriched'] += sign
+    for field in ('gists', 'facts', 'traits'):
+        signals[field] += sign * contribution[field]
+    emotions = signals['emotions']
+    for emo_type in contribution['emotions']:
+        count = emotions.get(emo_type, 0) + sign
+        if count > 0:
+            emotions[emo_type] = count
+        else:
+            emotions.pop(emo_type, None)
 
 
 class ThreadConversationService:
@@ -31,12 +92,110 @@ class ThreadConversationService:
     def _index_key(self, thread_id: str) -> str:
         return f"thread_conv_index:{thread_id}"
 
-    def _refresh_ttl(self, thread_id: str):
-        """Refresh TTL on all conversation keys."""
-        pipe = self.store.pipeline()
+    def _signals_key(self, thread_id: str) -> str:
+        return f"thread_conv_signals:{thread_id}"
+
+    def _pos_key(self, thread_id: str) -> str:
+        return f"thread_conv_pos:{thread_id}"
+
+    @staticmethod
+    def _exchange_id(exchange: dict) -> Optional[str]:
+        return exchange.get("id") or exchange.get("prompt", {}).get("id")
+
+    @staticmethod
+    def _decode(item) -> Optional[dict]:
+        """Exchange dict from a list entry (typed value or legacy JSON string)."""
+        if isinstance(item, str):
+            try:
+                item = json.loads(item)
+            except json.JSONDecodeError:
+                return None
+        return item if isinstance(item, dict) else None
+
+    def _latest_exchange(self, conv_key: str) -> Optional[dict]:
+        return self._decode(self.store.lindex_obj(conv_key, -1))
+
+    def _locate(self, reader, thread_id: str, exchange_id: str):
+        """(list index, exchange) for an exchange id, or None. O(1) via the position index."""
+        conv_key = self._conv_key(thread_id)
+        pos_key = self._pos_key(thread_id)
+        seq = reader.hget(pos_key, exchange_id)
+        if seq is not None:
+            index = int(seq) - int(reader.hget(pos_key, "_base") or 0)
+            if index >= 0:
+                exchange = self._decode(reader.lindex_obj(conv_key, index))
+                if exchange and self._exchange_id(exchange) == exchange_id:
+                    return index, exchange
+
+        # Not indexed (legacy entry) or index out of step — linear fallback
+        for index, item in enumerate(reader.lrange_obj(conv_key, 0, -1)):
+            exchange = self._decode(item)
+            if exchange is not None and self._exchange_id(exchange) == exchange_id:
+                return index, exchange
+        return None
+
+    def _update_exchange(self, thread_id: str, locate, update) -> bool:
+        """
+        Atomically rewrite one exchange and refresh TTLs.
+
+        locate(reader) → (index, exchange) to change, or None; update(exchange)
+        mutates it in place. Retries if the conversation changes before the write.
+        """
+        conv_key = self._conv_key(thread_id)
+        signals_key = self._signals_key(thread_id)
+        with self.store.pipeline() as pipe:
+            while True:
+                try:
+                    pipe.watch(conv_key, signals_key, self._pos_key(thread_id))
+                    found = locate(pipe)
+                    if found is None:
+                        return False
+                    index, exchange = found
+                    old_chunk = exchange.get("memory_chunk")
+                    update(exchange)
+                    new_chunk = exchange.get("memory_chunk")
+
+                    signals = None
+                    if new_chunk != old_chunk:
+                        # Store still holds the pre-update exchange here
+                        signals = self._read_signals(pipe, thread_id)
+                        add_chunk_signals(signals, old_chunk, -1)
+                        add_chunk_signals(signals, new_chunk, 1)
+
+                    pipe.multi()
+                    pipe.lset_obj(conv_key, index, exchange)
+                    if signals is not None:
+                        pipe.set_obj(signals_key, signals)
+                        pipe.sadd(DIRTY_THREADS_KEY, thread_id)
+                    self._queue_ttl_refresh(pipe, thread_id)
+                    pipe.execute()
+                    return True
+                except WatchError:
+                    continue
+
+    def _queue_ttl_refresh(self, pipe, thread_id: str):
         pipe.expire(self._conv_key(thread_id), self.TTL_SECONDS)
         pipe.expire(self._index_key(thread_id), self.TTL_SECONDS)
-        pipe.execute()
+        pipe.expire(self._signals_key(thread_id), self.TTL_SECONDS)
+        pipe.expire(self._pos_key(thread_id), self.TTL_SECONDS)
+
+    def _read_signals(self, reader, thread_id: str) -> dict:
+        """Running signals for a thread, rebuilt from its exchanges if missing."""
+        signals = reader.get_obj(self._signals_key(thread_id))
+        if isinstance(signals, dict):
+            return signals
+        signals = empty_signals()
+        for item in reader.lrange_obj(self._conv_key(thread_id), 0, -1):
+            exchange = self._decode(item)
+            if exchange is not None:
+                add_chunk_signals(signals, exchange.get("memory_chunk"))
+        return signals
+
+    def _update_latest(self, thread_id: str, update) -> bool:
+        def _locate(reader):
+            exchange = self._decode(reader.lindex_obj(self._conv_key(thread_id), -1))
+            return (-1, exchange) if exchange else None
+        return self._update_exchange(thread_id, _locate, update)
 
     def add_exchange(self, thread_id: str, topic: str, prompt_data: dict) -> str:
         """
@@ -68,63 +227,78 @@ class ThreadConversationService:
         }
 
         conv_key = self._conv_key(thread_id)
-        pipe = self.store.pipeline()
-        pipe.rpush(conv_key, json.dumps(exchange))
-        pipe.incr(self._index_key(thread_id))
-        pipe.expire(conv_key, self.TTL_SECONDS)
-        pipe.expire(self._index_key(thread_id), self.TTL_SECONDS)
-        pipe.execute()
-
-        # Trim to max exchanges
-        self.store.ltrim(conv_key, -self.MAX_EXCHANGES, -1)
+        signals_key = self._signals_key(thread_id)
+        pos_key = self._pos_key(thread_id)
+        with self.store.pipeline() as pipe:
+            while True:
+                try:
+                    pipe.watch(conv_key, signals_key, pos_key)
+                    length = pipe.llen(conv_key)
+                    base = int(pipe.hget(pos_key, "_base") or 0)
+
+                    # Exchanges about to be trimmed take their index entries
+                    # and signals with them
+                    overflow = length + 1 - self.MAX_EXCHANGES
+                    signals = None
+                    dropped_ids = []
+                    if overflow > 0:
+                        dropped = [e for e in map(self._decode, pipe.lrange_obj(conv_key, 0, overflow - 1)) if e]
+                        dropped_ids = [eid for eid in map(self._exchange_id, dropped) if eid]
+                        dropped_chunks = [e["memory_chunk"] for e in dropped if e.get("memory_chunk")]
+                        if dropped_chunks:
+                            signals = self._read_signals(pipe, thread_id)
+                            for chunk in dropped_chunks:
+                                add_chunk_signals(signals, chunk, -1)
+
+                    pipe.multi()
+                    pipe.rpush_obj(conv_key, exchange)
+                    pipe.hset(pos_key, exchange_id, base + length)
+                    pipe.incr(self._index_key(thread_id))
+                    if overflow > 0:
+                        pipe.ltrim(conv_key, -self.MAX_EXCHANGES, -1)  # Trim to max exchanges
+                        pipe.hset(pos_key, "_base", base + overflow)
+                        if dropped_ids:
+                            pipe.hdel(pos_key, *dropped_ids)
+                    if signals is not None:
+                        pipe.set_obj(signals_key, signals)
+                        pipe.sadd(DIRTY_THREADS_KEY, thread_id)
+                    self._queue_ttl_refresh(pipe, thread_id)
+                    pipe.execute()
+                    break
+                except WatchError:
+                    continue
 
         logging.debug(f"[THREAD_CONV] Added exchange {exchange_id[:8]} to thread {thread_id}")
         return exchange_id
 
     def add_response(self, thread_id: str, response_message: str, generation_time: float) -> None:
         """Add a response to the most recent exchange."""
-        conv_key = self._conv_key(thread_id)
-        raw = self.store.lindex(conv_key, -1)
-        if not raw:
-            logging.warning(f"[THREAD_CONV] No exchange found in thread {thread_id}")
-            return
-
-        exchange = json.loads(raw)
         timestamp = datetime.now().strftime('%Y-%m-%d %H:%M')
-        exchange["response"] = {
-            "message": response_message,
-            "time": timestamp,
-            "generation_time": generation_time,
-        }
 
-        self.store.lset(conv_key, -1, json.dumps(exchange))
-        self._refresh_ttl(thread_id)
+        def _update(exchange):
+            exchange["response"] = {
+                "message": response_message,
+                "time": timestamp,
+                "generation_time": generation_time,
+            }
+
+        if not self._update_latest(thread_id, _update):
+            logging.warning(f"[THREAD_CONV] No exchange found in thread {thread_id}")
 
     def add_response_error(self, thread_id: str, error_message: str) -> None:
         """Record an error for the most recent exchange."""
-        conv_key = self._conv_key(thread_id)
-        raw = self.store.lindex(conv_key, -1)
-        if not raw:
-            return
-
-        exchange = json.loads(raw)
         timestamp = datetime.now().strftime('%Y-%m-%d %H:%M')
-        exchange["response"] = {
-            "error": error_message,
-            "time": timestamp,
-        }
 
-        self.store.lset(conv_key, -1, json.dumps(exchange))
-        self._refresh_ttl(thread_id)
+        def _update(exchange):
+            exchange["response"] = {
+                "error": error_message,
+                "time": timestamp,
+            }
+
+        self._update_latest(thread_id, _update)
 
     def add_steps_to_exchange(self, thread_id: str, next_actions: list) -> None:
         """Add steps to the most recent exchange."""
-        conv_key = self._conv_key(thread_id)
-        raw = self.store.lindex(conv_key, -1)
-        if not raw:
-            return
-
-        exchange = json.loads(raw)
         steps = []
         for action in next_actions:
             step = {
@@ -138,9 +312,10 @@ class ThreadConversationService:
                 step["query"] = action["query"]
             steps.append(step)
 
-        exchange["steps"] = steps
-        self.store.lset(conv_key, -1, json.dumps(exchange))
-        self._refresh_ttl(thread_id)
+        def _update(exchange):
+            exchange["steps"] = steps
+
+        self._update_latest(thread_id, _update)
 
     def add_memory_chunk(self, thread_id: str, exchange_id: str, memory_chunk: dict) -> bool:
         """Add or merge a memory chunk to a specific exchange by ID.
@@ -152,21 +327,20 @@ class ThreadConversationService:
         Returns:
             True if the exchange was found and updated, False if not found.
         """
-        conv_key = self._conv_key(thread_id)
-        all_raw = self.store.lrange(conv_key, 0, -1)
-
-        for i, raw in enumerate(all_raw):
-            exchange = json.loads(raw)
-            if exchange.get("id") == exchange_id or exchange.get("prompt", {}).get("id") == exchange_id:
-                existing = exchange.get("memory_chunk") or {}
-                if existing.get("gists"):
-                    # Merge gists from both encodes (user message + assistant response)
-                    merged_gists = existing["gists"] + memory_chunk.get("gists", [])
-                    memory_chunk = {**memory_chunk, "gists": merged_gists}
-                exchange["memory_chunk"] = memory_chunk
-                self.store.lset(conv_key, i, json.dumps(exchange))
-                self._refresh_ttl(thread_id)
-                return True
+        def _update(exchange):
+            chunk = memory_chunk
+            existing = exchange.get("memory_chunk") or {}
+            if existing.get("gists"):
+                # Merge gists from both encodes (user message + assistant response)
+                merged_gists = existing["gists"] + chunk.get("gists", [])
+                chunk = {**chunk, "gists": merged_gists}
+            exchange["memory_chunk"] = chunk
+
+        def _locate(reader):
+            return self._locate(reader, thread_id, exchange_id)
+
+        if self._update_exchange(thread_id, _locate, _update):
+            return True
 
         logging.warning(f"[THREAD_CONV] Exchange {exchange_id[:8]} not found in thread {thread_id}")
         return False
@@ -174,24 +348,20 @@ class ThreadConversationService:
     def get_conversation_history(self, thread_id: str) -> list:
         """Get all exchanges for a thread."""
         conv_key = self._conv_key(thread_id)
-        all_raw = self.store.lrange(conv_key, 0, -1)
-
         exchanges = []
-        for raw in all_raw:
-            try:
-                exchanges.append(json.loads(raw))
-            except (json.JSONDecodeError, TypeError):
-                continue
+        for item in self.store.lrange_obj(conv_key, 0, -1):
+            exchange = self._decode(item)
+            if exchange is not None:
+                exchanges.append(exchange)
         return exchanges
 
     def get_latest_exchange_id(self, thread_id: str) -> str:
         """Get the ID of the most recent exchange."""
         conv_key = self._conv_key(thread_id)
-        raw = self.store.lindex(conv_key, -1)
-        if not raw:
+        exchange = self._latest_exchange(conv_key)
+        if not exchange:
             return "unknown"
 
-        exchange = json.loads(raw)
         return exchange.get("id", exchange.get("prompt", {}).get("id", "unknown"))
 
     def get_active_steps(self, thread_id: str) -> list:
@@ -208,6 +378,23 @@ class ThreadConversationService:
                     active_steps.append(step)
         return active_steps
 
+    def get_signals(self, thread_id: str) -> dict:
+        """Running density signals for a thread (see chunk_signals)."""
+        return self._read_signals(self.store, thread_id)
+
+    def mark_dirty(self, *thread_ids: str) -> None:
+        """Queue threads for re-evaluation by the episodic observer."""
+        if thread_ids:
+            self.store.sadd(DIRTY_THREADS_KEY, *thread_ids)
+
+    def pop_dirty_threads(self) -> set:
+        """Atomically take every thread whose signals changed since the last call."""
+        pipe = self.store.pipeline()
+        pipe.smembers(DIRTY_THREADS_KEY)
+        pipe.delete(DIRTY_THREADS_KEY)
+        members, _ = pipe.execute()
+        return members
+
     def get_exchange_count(self, thread_id: str) -> int:
         """Get exchange count (O(1) via index key)."""
         count = self.store.get(self._index_key(thread_id))
@@ -216,25 +403,46 @@ class ThreadConversationService:
     def remove_exchanges(self, thread_id: str, exchange_ids: list) -> None:
         """Remove specific exchanges by ID (for post-episodic cleanup)."""
         conv_key = self._conv_key(thread_id)
-        all_raw = self.store.lrange(conv_key, 0, -1)
-
+        signals_key = self._signals_key(thread_id)
+        pos_key = self._pos_key(thread_id)
         ids_to_remove = set(exchange_ids)
-        kept = []
-        for raw in all_raw:
-            try:
-                exchange = json.loads(raw)
-                eid = exchange.get("id") or exchange.get("prompt", {}).get("id")
-                if eid not in ids_to_remove:
-                    kept.append(raw)
-            except (json.JSONDecodeError, TypeError):
-                kept.append(raw)
-
-        removed_count = len(all_raw) - len(kept)
-        if removed_count > 0:
-            pipe = self.store.pipeline()
-            pipe.delete(conv_key)
-            for item in kept:
-                pipe.rpush(conv_key, item)
-            pipe.expire(conv_key, self.TTL_SECONDS)
-            pipe.execute()
-            logging.info(f"[THREAD_CONV] Removed {removed_count} exchanges from thread {thread_id}")
+
+        with self.store.pipeline() as pipe:
+            while True:
+                try:
+                    pipe.watch(conv_key, signals_key, pos_key)
+                    all_items = pipe.lrange_obj(conv_key, 0, -1)
+
+                    # Positions shift, so the index is rebuilt from the survivors
+                    kept = []
+                    positions = {}
+                    signals = empty_signals()
+                    for item in all_items:
+                        exchange = self._decode(item)
+                        if exchange is not None:
+                            eid = self._exchange_id(exchange)
+                            if eid in ids_to_remove:
+                                continue
+                            if eid:
+                                positions[eid] = len(kept)
+                            add_chunk_signals(signals, exchange.get("memory_chunk"))
+                        kept.append(item)
+
+                    removed_count = len(all_items) - len(kept)
+                    if removed_count == 0:
+                        return
+
+                    pipe.multi()
+                    pipe.delete(conv_key, pos_key)
+                    if kept:
+                        pipe.rpush_obj(conv_key, *kept)
+                    pipe.hset(pos_key, mapping={"_base": 0, **positions})
+                    pipe.set_obj(signals_key, signals)
+                    pipe.sadd(DIRTY_THREADS_KEY, thread_id)
+                    self._queue_ttl_refresh(pipe, thread_id)
+                    pipe.execute()
+                    break
+                except WatchError:
+                    continue
+
+        logging.info(f"[THREAD_CONV] Removed {removed_count} exchanges from thread {thread_id}")
@@ -7,7 +7,6 @@ Expires them, persists to SQLite, and triggers episodic summarization.
 
 import time
 import logging
-from typing import Optional
 
 from .memory_client import MemoryClientService
 from .config_service import ConfigService
@@ -34,22 +33,7 @@ class ThreadExpiryService:
             f"(interval={check_interval}s, hard_expiry={hard_expiry_seconds}s)"
         )
 
-    def run(self, shared_state: Optional[dict] = None) -> None:
-        """Main service loop."""
-        logger.info("[THREAD EXPIRY] Service started")
-
-        while True:
-            try:
-                time.sleep(self.check_interval)
-                self._run_expiry_cycle()
-            except KeyboardInterrupt:
-                logger.info("[THREAD EXPIRY] Service shutting down...")
-                break
-            except Exception as e:
-                logger.error(f"[THREAD EXPIRY] Error: {e}", exc_info=True)
-                time.sleep(60)
-
-    def _run_expiry_cycle(self):
+    def run_expiry_cycle(self):
         """Scan for and expire stale threads."""
         try:
             store = MemoryClientService.create_connection()
@@ -211,11 +195,8 @@ class ThreadExpiryService:
             logger.debug(f"[THREAD EXPIRY] Failed to enqueue episodic job: {e}")
 
 
-def thread_expiry_worker(shared_state=None):
-    """
-    Module-level wrapper for threading.
-    Instantiates the service inside the child process.
-    """
+def register_thread_expiry_job(scheduler) -> None:
+    """Register the periodic expiry scan on the job scheduler."""
     try:
         config = ConfigService.resolve_agent_config("frontal-cortex")
         thread_config = config.get("thread", {})
@@ -228,4 +209,6 @@ def thread_expiry_worker(shared_state=None):
         check_interval=300,
         hard_expiry_seconds=hard_expiry_seconds,
     )
-    service.run(shared_state)
+    scheduler.add_job(
+        "thread-expiry", service.run_expiry_cycle, interval=service.check_interval, latency_sensitive=True,
+    )
@@ -3,11 +3,16 @@ Deterministic topic classification using sentence embeddings.
 
 Topics are semantic attractors in embedding space.
 Classification is structural cognition, not stochastic generation.
+
+Topic centroids are held in a process-wide matrix (TopicCentroidCache) that is
+loaded once from SQLite and updated in place by _create_topic/_update_topic,
+so classify() is a single matrix-vector product instead of a DB read per message.
 """
 
 import json
 import logging
 import struct
+import threading
 import time
 import uuid
 import numpy as np
@@ -65,6 +70,147 @@ def generate_embedding(text: str) -> np.ndarray:
         return np.zeros(EMBEDDING_DIM)
 
 
+class TopicCentroidCache:
+    """
+    Resident topic centroid matrix (names, counts, saliences, N×768 float32).
+
+    Rows are L2-normalized centroids, so one matrix-vector product yields the
+    cosine similarity of a message to every topic. Bound to a database path;
+    a different DatabaseService (or invalidate()) triggers a reload.
+    """
+
+    _INITIAL_CAPACITY = 128
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._db_path = None
+        self._loaded = False
+        self._reset(EMBEDDING_DIM, 0)
+
+    def _reset(self, dimensions: int, capacity: int):
+        self._size = 0
+        self._names: List[str] = []
+        self._positions: Dict[str, int] = {}
+        self._rowids: List[Optional[int]] = []
+        self._last_updated: List = []
+        self._matrix = np.zeros((capacity, dimensions), dtype=np.float32)
+        self._counts = np.zeros(capacity, dtype=np.int64)
+        self._saliences = np.zeros(capacity, dtype=np.float32)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def is_loaded_for(self, db) -> bool:
+        return self._loaded and self._db_path == getattr(db, 'db_path', None)
+
+    def load(self, db, topics: List[Dict]) -> None:
+        """Replace the cache contents with rows from _fetch_all_topics()."""
+        with self._lock:
+            dimensions = len(topics[0]['rolling_embedding']) if topics else EMBEDDING_DIM
+            self._reset(dimensions, max(self._INITIAL_CAPACITY, len(topics)))
+            for topic in topics:
+                self._append(topic)
+            self._db_path = getattr(db, 'db_path', None)
+            self._loaded = True
+
+    def invalidate(self) -> None:
+        """Force a reload from SQLite on next classify()."""
+        with self._lock:
+            self._loaded = False
+
+    def _grow(self):
+        capacity = max(self._INITIAL_CAPACITY, len(self._counts) * 2)
+        matrix = np.zeros((capacity, self._matrix.shape[1]), dtype=np.float32)
+        matrix[:self._size] = self._matrix[:self._size]
+        counts = np.zeros(capacity, dtype=np.int64)
+        counts[:self._size] = self._counts[:self._size]
+        saliences = np.zeros(capacity, dtype=np.float32)
+        saliences[:self._size] = self._saliences[:self._size]
+        self._matrix, self._counts, self._saliences = matrix, counts, saliences
+
+    def _append(self, topic: Dict):
+        if self._size == len(self._counts):
+            self._grow()
+        pos = self._size
+        self._size += 1
+        self._names.append(topic['name'])
+        self._positions[topic['name']] = pos
+        self._rowids.append(topic.get('rowid'))
+        self._last_updated.append(topic['last_updated'])
+        self._matrix[pos] = np.asarray(topic['rolling_embedding'], dtype=np.float32)
+        self._counts[pos] = topic['message_count'] or 0
+        self._saliences[pos] = topic['avg_salience'] or 0.0
+
+    def upsert(self, topic: Dict) -> None:
+        """Insert a new topic or overwrite an existing row in place."""
+        with self._lock:
+            if not self._loaded:
+                return
+            pos = self._positions.get(topic['name'])
+            if pos is None:
+                self._append(topic)
+                return
+            if topic.get('rowid') is not None:
+                self._rowids[pos] = topic['rowid']
+            self._last_updated[pos] = topic['last_updated']
+            self._matrix[pos] = np.asarray(topic['rolling_embedding'], dtype=np.float32)
+            self._counts[pos] = topic['message_count']
+            self._saliences[pos] = topic['avg_salience']
+
+    def get(self, name: str) -> Optional[Dict]:
+        """Return a copy of the cached topic (including its centroid), or None."""
+        with self._lock:
+            pos = self._positions.get(name)
+            if pos is None:
+                return None
+            return self._topic_at(pos, with_embedding=True)
+
+    def _topic_at(self, pos: int, with_embedding: bool = False) -> Dict:
+        topic = {
+            'name': self._names[pos],
+            'avg_salience': float(self._saliences[pos]),
+            'last_updated': self._last_updated[pos],
+            'message_count': int(self._counts[pos]),
+            'rowid': self._rowids[pos],
+        }
+        if with_embedding:
+            topic['rolling_embedding'] = self._matrix[pos].copy()
+        return topic
+
+    def top_k(self, embedding: np.ndarray, k: int, recent_topic: str = None,
+              recency_bonus: float = 0.0) -> List[Tuple[Dict, float]]:
+        """
+        Most similar topics to an (L2-normalized) embedding.
+
+        Returns:
+            [(topic_dict, similarity), ...] sorted by similarity descending,
+            with recency_bonus added to recent_topic before ranking
+        """
+        with self._lock:
+            n = self._size
+            if n == 0 or k <= 0:
+                return []
+            sims = self._matrix[:n] @ np.asarray(embedding, dtype=np.float32)
+            if recent_topic is not None and recent_topic in self._positions:
+                sims[self._positions[recent_topic]] += recency_bonus
+            k = min(k, n)
+            if k < n:
+                top = np.argpartition(-sims, k - 1)[:k]
+            else:
+                top = np.arange(n)
+            top = top[np.argsort(-sims[top], kind='stable')]
+            return [(self._topic_at(i), float(sims[i])) for i in top]
+
+
+# Process-wide centroid cache
+_TOPIC_CACHE = TopicCentroidCache()
+
+
+def get_topic_cache() -> TopicCentroidCache:
+    """Shared TopicCentroidCache (invalidate after out-of-band topic deletes)."""
+    return _TOPIC_CACHE
+
+
 class TopicClassifierService:
     """
     Deterministic topic classification using embeddings.
@@ -172,14 +318,14 @@ class TopicClassifierService:
         # Estimate salience (cheap heuristic)
         current_salience = self._estimate_salience(message_text)
 
-        # Fetch all existing topics
+        # Ensure the centroid matrix is resident (one DB read per process)
         t1 = time.time()
-        existing_topics = self._fetch_all_topics()
+        cache = self._get_cache()
         fetch_time = time.time() - t1
 
         logger.info(f"[TOPIC CLASSIFIER] Timing: embed={embedding_time:.3f}s, fetch={fetch_time:.3f}s")
 
-        if not existing_topics:
+        if not len(cache):
             # No topics exist - create first one
             topic_name = self._generate_topic_name(message_text)
             self._create_topic(topic_name, current_embedding, current_salience)
@@ -201,27 +347,22 @@ class TopicClassifierService:
                 'message_embedding': current_embedding.tolist() if hasattr(current_embedding, 'tolist') else list(current_embedding),
             }
 
-        # Stage 1: Calculate similarities to all topics
+        # Stage 1: One matrix-vector product against all centroids (both sides are
+        # L2-normalized, so dot product = cosine similarity); recency bonus applied
+        # to the recently-active topic before top-k selection
         t2 = time.time()
-        similarities = []
-        for topic in existing_topics:
-            topic_embedding = np.array(topic['rolling_embedding'])
-            # Both vectors are L2-normalized, so dot product = cosine similarity
-            similarity = float(np.dot(current_embedding, topic_embedding))
-            similarities.append((topic, similarity))
+        top_k = cache.top_k(
+            current_embedding,
+            self.TOP_K_CANDIDATES,
+            recent_topic=recent_topic,
+            recency_bonus=self.RECENCY_BONUS,
+        )
         similarity_time = time.time() - t2
 
-        # Apply recency bonus to the recently-active topic
-        if recent_topic:
-            similarities = [
-                (topic, sim + self.RECENCY_BONUS if topic['name'] == recent_topic else sim)
-                for topic, sim in similarities
-            ]
-
         # Check threshold: Is ANY topic plausible?
-        best_similarity = max(sim for _, sim in similarities)
+        best_similarity = top_k[0][1]
 
-        logger.info(f"[TOPIC CLASSIFIER] Calculated {len(similarities)} similarities in {similarity_time:.3f}s"
+        logger.info(f"[TOPIC CLASSIFIER] Calculated {len(cache)} similarities in {similarity_time:.3f}s"
                      f"{f' (recency bonus applied to {recent_topic})' if recent_topic else ''}")
 
         # Adaptive boundary detection
@@ -289,11 +430,7 @@ class TopicClassifierService:
                 'message_embedding': current_embedding.tolist() if hasattr(current_embedding, 'tolist') else list(current_embedding),
             }
 
-        # Stage 2: Rank top-k candidates by switch_score
-        # Sort by similarity (descending)
-        similarities.sort(key=lambda x: x[1], reverse=True)
-        top_k = similarities[:self.TOP_K_CANDIDATES]
-
+        # Stage 2: Rank top-k candidates (already sorted by similarity) by switch_score
         # Calculate switch scores for top-k
         now = datetime.now(timezone.utc)
         scored_candidates = []
@@ -352,6 +489,13 @@ class TopicClassifierService:
             'message_embedding': current_embedding.tolist() if hasattr(current_embedding, 'tolist') else list(current_embedding),
         }
 
+    def _get_cache(self) -> TopicCentroidCache:
+        """Return the shared centroid cache, loading it from SQLite if needed."""
+        cache = get_topic_cache()
+        if not cache.is_loaded_for(self.db):
+            cache.load(self.db, self._fetch_all_topics())
+        return cache
+
     def _normalize(self, embedding: np.ndarray) -> np.ndarray:
         """
         L2-normalize embedding vector.
@@ -398,10 +542,10 @@ class TopicClassifierService:
         the binary blob back into a Python list of floats.
 
         Returns:
-            List of topic dicts with rolling_embedding as numpy array
+            List of topic dicts with rolling_embedding as a list of floats
         """
         query = """
-            SELECT t.name, v.embedding, t.avg_salience, t.last_updated, t.message_count
+            SELECT t.name, v.embedding, t.avg_salience, t.last_updated, t.message_count, t.rowid
             FROM topics t
             JOIN topics_vec v ON v.rowid = t.rowid
             ORDER BY t.last_updated DESC
@@ -430,7 +574,8 @@ class TopicClassifierService:
                     'rolling_embedding': embedding,
                     'avg_salience': row[2],
                     'last_updated': row[3],
-                    'message_count': row[4]
+                    'message_count': row[4],
+                    'rowid': row[5] if len(row) > 5 else None,
                 })
 
             return topics
@@ -506,6 +651,7 @@ class TopicClassifierService:
             # Store embedding in companion vec table
             cursor.execute("SELECT rowid FROM topics WHERE name = ?", (name,))
             row = cursor.fetchone()
+            rowid = None
             if row:
                 rowid = row[0]
                 blob = _pack_embedding(embedding)
@@ -518,6 +664,15 @@ class TopicClassifierService:
 
             conn.commit()
 
+        get_topic_cache().upsert({
+            'name': name,
+            'rolling_embedding': embedding,
+            'avg_salience': salience,
+            'last_updated': datetime.now(timezone.utc),
+            'message_count': 1,
+            'rowid': rowid,
+        })
+
         logger.info(f"[TOPIC CLASSIFIER] Created topic '{name}'")
 
     def _update_topic(self, name: str, new_embedding: np.ndarray, new_salience: float, old_count: int):
@@ -534,37 +689,45 @@ class TopicClassifierService:
             new_salience: New message salience
             old_count: Previous message count
         """
-        # Fetch current rolling embedding from topics_vec
-        query_fetch = """
-            SELECT v.embedding, t.avg_salience, t.rowid
-            FROM topics t
-            JOIN topics_vec v ON v.rowid = t.rowid
-            WHERE t.name = ?
-        """
+        cache = get_topic_cache()
+        cached = cache.get(name)
 
         with self.db.connection() as conn:
             cursor = conn.cursor()
-            cursor.execute(query_fetch, (name,))
-            row = cursor.fetchone()
 
-            if not row:
-                logger.error(f"[TOPIC CLASSIFIER] Topic '{name}' not found for update")
-                return
-
-            # Unpack binary blob from sqlite-vec
-            embedding_blob = row[0]
-            if isinstance(embedding_blob, bytes):
-                dim = len(embedding_blob) // 4
-                old_embedding = np.array(
-                    struct.unpack(f'{dim}f', embedding_blob), dtype=np.float32
-                )
-            elif isinstance(embedding_blob, str):
-                old_embedding = np.array(json.loads(embedding_blob))
+            if cached is not None and cached.get('rowid') is not None:
+                # Centroid is resident — no blob read needed
+                old_embedding = cached['rolling_embedding']
+                old_salience = cached['avg_salience']
+                topic_rowid = cached['rowid']
             else:
-                old_embedding = np.array(embedding_blob)
+                # Fetch current rolling embedding from topics_vec
+                cursor.execute("""
+                    SELECT v.embedding, t.avg_salience, t.rowid
+                    FROM topics t
+                    JOIN topics_vec v ON v.rowid = t.rowid
+                    WHERE t.name = ?
+                """, (name,))
+                row = cursor.fetchone()
+
+                if not row:
+                    logger.error(f"[TOPIC CLASSIFIER] Topic '{name}' not found for update")
+                    return
+
+                # Unpack binary blob from sqlite-vec
+                embedding_blob = row[0]
+                if isinstance(embedding_blob, bytes):
+                    dim = len(embedding_blob) // 4
+                    old_embedding = np.array(
+                        struct.unpack(f'{dim}f', embedding_blob), dtype=np.float32
+                    )
+                elif isinstance(embedding_blob, str):
+                    old_embedding = np.array(json.loads(embedding_blob))
+                else:
+                    old_embedding = np.array(embedding_blob)
 
-            old_salience = row[1]
-            topic_rowid = row[2]
+                old_salience = row[1]
+                topic_rowid = row[2]
 
             # Running average for embedding (capped to prevent centroid dilution)
             n = min(old_count, self.ROLLING_AVG_CAP)
@@ -590,6 +753,12 @@ class TopicClassifierService:
                 name
             ))
 
+            if cursor.rowcount == 0:
+                # Topic was removed out-of-band (e.g. privacy delete) — resync
+                logger.warning(f"[TOPIC CLASSIFIER] Topic '{name}' vanished, reloading centroid cache")
+                cache.invalidate()
+                return
+
             # Update embedding in companion vec table
             blob = _pack_embedding(new_avg_embedding)
             if blob:
@@ -601,4 +770,13 @@ class TopicClassifierService:
 
             conn.commit()
 
+        cache.upsert({
+            'name': name,
+            'rolling_embedding': new_avg_embedding,
+            'avg_salience': new_avg_salience,
+            'last_updated': datetime.now(timezone.utc),
+            'message_count': old_count + 1,
+            'rowid': topic_rowid,
+        })
+
         logger.info(f"[TOPIC CLASSIFIER] Updated topic '{name}' (count: {old_count} -> {old_count + 1})")
@@ -649,23 +649,21 @@ class TopicStabilityRegulator:
         }
 
 
-def topic_stability_regulator_worker(shared_state=None):
-    """
-    Worker entry point for scheduled regulation.
-
-    Runs every 24 hours.
-    """
+def _run_topic_regulation():
     logger.info("[STABILITY REGULATOR WORKER] Starting regulation cycle...")
-
     try:
         regulator = TopicStabilityRegulator()
         regulator.run_regulation_cycle()
-
     except Exception as e:
         logger.error(
             f"[STABILITY REGULATOR WORKER] Regulation failed: {e}",
             exc_info=True
         )
 
-    # Sleep 24 hours
-    time.sleep(86400)
+
+def register_topic_stability_regulator_job(scheduler) -> None:
+    """Register daily regulation on the job scheduler (first run at startup)."""
+    scheduler.add_job(
+        "topic-stability-regulator", _run_topic_regulation,
+        interval=86400, initial_delay=0,
+    )
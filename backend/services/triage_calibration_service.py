@@ -8,6 +8,9 @@ The calibration data feeds into the routing stability regulator as a pressure si
 
 Key design: >=2 negative user signals required to label a decision as incorrect.
 A single confusing follow-up is noise, not evidence of routing failure.
+
+Per-message writes (decision, outcome, signals) go through the write-behind
+queue in order; the nightly calibration flushes it before reading.
 """
 
 import json
@@ -18,6 +21,8 @@ import uuid
 from datetime import datetime, timezone, timedelta
 from typing import Optional
 
+from services.write_behind_queue import flush_pending, write_behind
+
 logger = logging.getLogger(__name__)
 
 LOG_PREFIX = "[TRIAGE CALIBRATION]"
@@ -72,7 +77,8 @@ class TriageCalibrationService:
             if isinstance(tool_selected, list):
                 tool_selected = json.dumps(tool_selected)
 
-            db.execute(
+            write_behind(
+                db,
                 """
                 INSERT INTO triage_calibration_events
                     (id, exchange_id, topic, triage_branch, triage_mode, tool_selected,
@@ -116,7 +122,9 @@ class TriageCalibrationService:
             if isinstance(tools_used, list):
                 tools_used = json.dumps(tools_used)
 
-            db.execute(
+            # Queued behind the decision's INSERT, so it always finds the row
+            write_behind(
+                db,
                 """
                 UPDATE triage_calibration_events
                 SET outcome_mode = ?,
@@ -164,7 +172,8 @@ class TriageCalibrationService:
         try:
             # SQLite does not support boolean OR in UPDATE SET like PostgreSQL.
             # Use MAX to simulate OR: MAX(existing, new_value) where values are 0/1.
-            db.execute(
+            write_behind(
+                db,
                 """
                 UPDATE triage_calibration_events
                 SET signal_rephrase = MAX(signal_rephrase, ?),
@@ -202,6 +211,7 @@ class TriageCalibrationService:
         stats = {}
 
         try:
+            flush_pending(db)
             # 1. Query uncalibrated events from last 24h
             yesterday = datetime.now(timezone.utc) - timedelta(hours=24)
             rows = db.fetch_all(
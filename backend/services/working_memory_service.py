@@ -5,7 +5,6 @@ MemoryStore-based FIFO buffer of the last N raw turns for immediate context.
 Unlike gists (compressed summaries), this stores verbatim user/assistant turns.
 """
 
-import json
 import time
 import logging
 from typing import List, Dict
@@ -49,15 +48,15 @@ class WorkingMemoryService:
         """
         memory_key = self._get_memory_key(identifier)
 
-        turn_data = json.dumps({
+        turn_data = {
             'role': role,
             'content': content,
             'timestamp': time.time()
-        })
+        }
 
         # RPUSH + LTRIM for FIFO eviction + safety TTL
         pipe = self.store.pipeline()
-        pipe.rpush(memory_key, turn_data)
+        pipe.rpush_obj(memory_key, turn_data)
         pipe.ltrim(memory_key, -self.max_entries, -1)
         pipe.expire(memory_key, 86400)  # 24-hour safety TTL, refreshed each append
         results = pipe.execute()
@@ -84,19 +83,11 @@ class WorkingMemoryService:
         memory_key = self._get_memory_key(identifier)
 
         if n is not None:
-            entries = n * 2
-            raw_entries = self.store.lrange(memory_key, -entries, -1)
+            entries = self.store.lrange_obj(memory_key, -n * 2, -1)
         else:
-            raw_entries = self.store.lrange(memory_key, 0, -1)
+            entries = self.store.lrange_obj(memory_key, 0, -1)
 
-        turns = []
-        for entry in raw_entries:
-            try:
-                turns.append(json.loads(entry))
-            except (json.JSONDecodeError, TypeError):
-                continue
-
-        return turns
+        return [entry for entry in entries if isinstance(entry, dict)]
 
     def get_formatted_context(self, identifier: str, n: int = None) -> str:
         """
@@ -65,20 +65,27 @@ class WorldStateService:
         Returns:
             str: Formatted world state block (empty string if nothing is salient)
         """
-        items = []
+        from services.retrieval_executor import RetrievalExecutor
+
+        # Collectors are independent queries — run them concurrently
+        collectors = RetrievalExecutor()
 
         # 1. Active ACT steps (always high salience when present)
         if thread_id:
-            items.extend(self._get_active_steps(thread_id))
+            collectors.submit('active_steps', self._get_active_steps, thread_id, default=[])
 
         # 2. Scheduled items (temporal + optional semantic)
-        items.extend(self._get_salient_scheduled_items(message_embedding))
+        collectors.submit('scheduled', self._get_salient_scheduled_items, message_embedding, default=[])
 
         # 3. Persistent tasks (temporal + optional semantic)
-        items.extend(self._get_salient_tasks(message_embedding))
+        collectors.submit('tasks', self._get_salient_tasks, message_embedding, default=[])
 
         # 4. Lists (temporal + semantic)
-        items.extend(self._get_salient_lists(message_embedding))
+        collectors.submit('lists', self._get_salient_lists, message_embedding, default=[])
+
+        items = []
+        for collected in collectors.collect().values():
+            items.extend(collected)
 
         if not items:
             return ""
@@ -0,0 +1,364 @@
+"""
+Write-Behind Queue — group-commit writer for append-only audit tables.
+
+interaction_log, routing_decisions, cortex_iterations, triage_calibration_events
+and temporal_observations used to commit one row per call on the caller's
+thread: one transaction, one WAL sync and one turn of the SQLite writer lock
+per event, several times per user message. Those writes are only read by
+background analysis and dashboards, so they can land a few hundred ms later.
+
+Callers hand statements to write_behind() / write_behind_many() /
+write_behind_statements(). When the queue is enabled for the caller's
+database, they are appended to an in-memory FIFO and the call returns
+immediately. A single flusher thread drains the FIFO every flush interval (or
+as soon as max_batch_rows are pending) and writes the whole drain as one job
+on the database writer thread (one transaction), running consecutive rows of
+the same statement as one executemany(). Follow-up UPDATEs on the same rows
+(feedback, outcomes) go through the same FIFO, so they always apply after
+their INSERT.
+
+- Bounded memory: once max_pending_rows are queued, the producer flushes on
+  its own thread (caller-runs back-pressure) instead of growing the queue.
+- Failures: if the batch transaction fails, each statement is retried on its
+  own; rows that still fail are logged, counted and dropped.
+- Shutdown: close() (registered with atexit) stops the flusher and writes
+  everything still queued.
+- Delete-all: suspended() drops everything queued and discards new rows until
+  the block exits, so no queued row is committed after the tables are cleared.
+- Readers that need their own writes (InteractionLogService queries) call
+  flush_pending() first.
+- Metrics: write_behind.* counters/gauges and the write_behind.flush latency
+  histogram in the metrics registry; get_write_behind_stats() for /metrics.
+
+When disabled (or for any other database, e.g. in tests) both helpers write
+synchronously, exactly as before.
+
+Configured in connections.json under database.write_behind. Entry point:
+enable_write_behind() called once at startup from run.py.
+"""
+
+import atexit
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+LOG_PREFIX = "[WRITE BEHIND]"
+
+_FLUSH_INTERVAL = 0.25
+_MAX_BATCH_ROWS = 500
+_MAX_PENDING_ROWS = 10000
+
+
+def _metrics():
+    from services.metrics_registry import get_metrics_registry
+    return get_metrics_registry()
+
+
+class WriteBehindQueue:
+    """Single-writer FIFO of (sql, rows) groups for one DatabaseService."""
+
+    def __init__(
+        self,
+        db_service,
+        flush_interval: float = _FLUSH_INTERVAL,
+        max_batch_rows: int = _MAX_BATCH_ROWS,
+        max_pending_rows: int = _MAX_PENDING_ROWS,
+    ):
+        self.db_service = db_service
+        self.flush_interval = flush_interval
+        self.max_batch_rows = max(1, int(max_batch_rows))
+        self.max_pending_rows = max(self.max_batch_rows, int(max_pending_rows))
+
+        self._entries: deque = deque()
+        self._pending = 0
+        self._cond = threading.Condition()
+        # Held for drain + write so concurrent flushes commit in FIFO order
+        self._write_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self._suspended = False
+
+        self.rows_enqueued = 0
+        self.rows_written = 0
+        self.failed_rows = 0
+        self.rows_discarded = 0
+        self.flushes = 0
+        self.backpressure_flushes = 0
+        self.max_pending_seen = 0
+
+    # ── Producer side ──────────────────────────────────────────
+
+    def accepts(self, db_service) -> bool:
+        """True when writes for db_service should go through this queue."""
+        return not self._closed and getattr(db_service, 'db_path', None) == self.db_service.db_path
+
+    def append(self, sql: str, params: Sequence) -> None:
+        """Queue one row."""
+        self.append_many(sql, [params])
+
+    def append_many(self, sql: str, rows: List[Sequence]) -> None:
+        """Queue several rows of one statement; they are committed together."""
+        self.append_statements([(sql, rows)])
+
+    def append_statements(self, statements: List[Tuple[str, List[Sequence]]]) -> None:
+        """Queue (sql, rows) groups atomically; they land in the same transaction."""
+        statements = [(sql, rows) for sql, rows in statements if rows]
+        if not statements:
+            return
+        count = sum(len(rows) for _, rows in statements)
+        with self._cond:
+            if self._suspended:
+                self.rows_discarded += count
+                return
+            self._entries.extend(statements)
+            self._pending += count
+            self.rows_enqueued += count
+            pending = self._pending
+            self.max_pending_seen = max(self.max_pending_seen, pending)
+            if pending >= self.max_batch_rows:
+                self._cond.notify()
+        registry = _metrics()
+        registry.increment('write_behind.rows_enqueued', count)
+        registry.set_gauge('write_behind.pending', pending)
+
+        if pending >= self.max_pending_rows:
+            # Writer can't keep up — make the producer pay for the write
+            self.backpressure_flushes += 1
+            registry.increment('write_behind.backpressure_flushes')
+            self.flush()
+
+    # ── Writer side ────────────────────────────────────────────
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, daemon=True, name="write-behind")
+        self._thread.start()
+        logger.info(
+            f"{LOG_PREFIX} Enabled (flush every {self.flush_interval}s or "
+            f"{self.max_batch_rows} rows, max {self.max_pending_rows} pending)"
+        )
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                if not self._closed and self._pending < self.max_batch_rows:
+                    self._cond.wait(self.flush_interval)
+                if self._closed:
+                    return
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"{LOG_PREFIX} Flush loop error: {e}")
+
+    def flush(self) -> int:
+        """Write everything queued so far and wait for the commit. Returns rows written."""
+        with self._write_lock:
+            with self._cond:
+                if not self._entries:
+                    return 0
+                entries = list(self._entries)
+                self._entries.clear()
+                self._pending = 0
+
+            start = time.perf_counter()
+            written = self._write(entries)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self.flushes += 1
+            self.rows_written += written
+
+        registry = _metrics()
+        registry.increment('write_behind.flushes')
+        registry.increment('write_behind.rows_written', written)
+        registry.observe('write_behind.flush', elapsed_ms)
+        with self._cond:
+            registry.set_gauge('write_behind.pending', self._pending)
+        return written
+
+    def _write(self, entries: List[Tuple[str, List[Sequence]]]) -> int:
+        groups = _coalesce(entries)
+
+        def write_batch(conn):
+            for sql, rows in groups:
+                conn.executemany(sql, rows)
+
+        try:
+            self.db_service.write(write_batch, label="write-behind batch")
+            return sum(len(rows) for _, rows in groups)
+        except Exception as e:
+            logger.warning(f"{LOG_PREFIX} Batch of {len(groups)} statement groups failed ({e}), retrying row by row")
+
+        written = 0
+        for sql, rows in groups:
+            for row in rows:
+                try:
+                    self.db_service.execute(sql, row)
+                    written += 1
+                except Exception as e:
+                    self.failed_rows += 1
+                    _metrics().increment('write_behind.failed_rows')
+                    logger.error(f"{LOG_PREFIX} Dropped row: {e} — {sql.split('(')[0].strip()}")
+        return written
+
+    def close(self) -> None:
+        """Stop the flusher and write whatever is still queued."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        written = self.flush()
+        if written:
+            logger.info(f"{LOG_PREFIX} Flushed {written} rows on shutdown")
+
+    @contextmanager
+    def suspended(self):
+        """Discard queued rows and drop new ones until the block exits.
+
+        Holds the write lock, so an in-flight flush finishes first and no
+        flush can commit while the caller clears the tables.
+        """
+        with self._write_lock:
+            with self._cond:
+                self._suspended = True
+                discarded = self._pending
+                self._entries.clear()
+                self._pending = 0
+                self.rows_discarded += discarded
+            if discarded:
+                logger.info(f"{LOG_PREFIX} Discarded {discarded} queued rows")
+            try:
+                yield
+            finally:
+                with self._cond:
+                    self._suspended = False
+        _metrics().set_gauge('write_behind.pending', self.pending())
+
+    def pending(self) -> int:
+        with self._cond:
+            return self._pending
+
+    def stats(self) -> dict:
+        with self._cond:
+            pending = self._pending
+        return {
+            'pending': pending,
+            'max_pending_seen': self.max_pending_seen,
+            'max_pending_rows': self.max_pending_rows,
+            'rows_enqueued': self.rows_enqueued,
+            'rows_written': self.rows_written,
+            'failed_rows': self.failed_rows,
+            'rows_discarded': self.rows_discarded,
+            'flushes': self.flushes,
+            'backpressure_flushes': self.backpressure_flushes,
+            'avg_rows_per_flush': round(self.rows_written / self.flushes, 1) if self.flushes else 0.0,
+        }
+
+
+def _coalesce(entries: Iterable[Tuple[str, List[Sequence]]]) -> List[Tuple[str, List[Sequence]]]:
+    """Merge runs of the same statement so each run is one executemany()."""
+    groups: List[Tuple[str, List[Sequence]]] = []
+    for sql, rows in entries:
+        if groups and groups[-1][0] == sql:
+            groups[-1][1].extend(rows)
+        else:
+            groups.append((sql, list(rows)))
+    return groups
+
+
+# ── Module-level queue ─────────────────────────────────────────
+
+_queue: Optional[WriteBehindQueue] = None
+
+
+def get_write_behind_queue() -> Optional[WriteBehindQueue]:
+    """The active queue, or None when write-behind is disabled."""
+    return _queue
+
+
+def enable_write_behind(db_service=None) -> Optional[WriteBehindQueue]:
+    """
+    Start the write-behind queue for the shared database if enabled in connections.json.
+
+    Must run after the schema is in place (the flusher writes straight into it).
+    """
+    global _queue
+    if _queue is not None:
+        return _queue
+
+    from services.config_service import ConfigService
+    config = ConfigService.connections().get("database", {}).get("write_behind", {})
+    if not config.get("enabled", False):
+        return None
+
+    if db_service is None:
+        from services.database_service import get_shared_db_service
+        db_service = get_shared_db_service()
+
+    queue = WriteBehindQueue(
+        db_service,
+        flush_interval=config.get("flush_interval_seconds", _FLUSH_INTERVAL),
+        max_batch_rows=config.get("max_batch_rows", _MAX_BATCH_ROWS),
+        max_pending_rows=config.get("max_pending_rows", _MAX_PENDING_ROWS),
+    )
+    queue.start()
+    atexit.register(queue.close)
+    _queue = queue
+    return queue
+
+
+def write_behind(db_service, sql: str, params: Sequence) -> None:
+    """Queue one row for db_service, or write it now when write-behind is off."""
+    queue = _queue
+    if queue is not None and queue.accepts(db_service):
+        queue.append(sql, params)
+    else:
+        with db_service.connection() as conn:
+            conn.execute(sql, params)
+
+
+def write_behind_many(db_service, sql: str, rows: List[Sequence]) -> None:
+    """Queue several rows of one statement, or write them now in one transaction."""
+    write_behind_statements(db_service, [(sql, rows)])
+
+
+def write_behind_statements(db_service, statements: List[Tuple[str, List[Sequence]]]) -> None:
+    """Queue (sql, rows) groups to commit together, or write them now in one transaction."""
+    queue = _queue
+    if queue is not None and queue.accepts(db_service):
+        queue.append_statements(statements)
+        return
+    statements = [(sql, rows) for sql, rows in statements if rows]
+    if statements:
+        with db_service.connection() as conn:
+            for sql, rows in statements:
+                conn.executemany(sql, rows)
+
+
+def flush_pending(db_service=None) -> int:
+    """Write queued rows now so a following read sees them. Cheap when idle."""
+    queue = _queue
+    if queue is None or (db_service is not None and not queue.accepts(db_service)):
+        return 0
+    return queue.flush()
+
+
+def suspend_write_behind(db_service=None):
+    """Context manager: drop queued rows and hold back new ones (no-op when off)."""
+    queue = _queue
+    if queue is None or (db_service is not None and not queue.accepts(db_service)):
+        return nullcontext()
+    return queue.suspended()
+
+
+def get_write_behind_stats() -> dict:
+    """Queue depth and throughput counters ({'enabled': False} when off)."""
+    queue = _queue
+    if queue is None:
+        return {'enabled': False}
+    return {'enabled': True, **queue.stats()}
@@ -27,6 +27,18 @@ def _no_capability_gap_writes():
         yield
 
 
+@pytest.fixture(autouse=True)
+def _fresh_config_cache():
+    """Start every test with an empty ConfigService file/resolution cache.
+
+    Resolved agent configs are memoized process-wide; without this, a config
+    resolved under one test's patches would be served to the next test.
+    """
+    from services.config_service import ConfigService
+    ConfigService.clear_cache()
+    yield
+
+
 @pytest.fixture
 def mock_store():
     """Isolated MemoryStore — same implementation used in production."""
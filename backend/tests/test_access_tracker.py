@@ -0,0 +1,126 @@
+"""Tests for AccessTracker — coalesced retrieval access writes."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+import services.access_tracker as access_tracker
+from services.access_tracker import AccessTracker, record_concept_access, record_episode_access
+from services.database_service import DatabaseService
+
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = DatabaseService(str(tmp_path / "access.db"))
+    with db.connection() as conn:
+        conn.execute("""
+            CREATE TABLE episodes (
+                id TEXT PRIMARY KEY, salience INTEGER, access_count INTEGER DEFAULT 0,
+                activation_score REAL DEFAULT 1.0, last_accessed_at TEXT, updated_at TEXT,
+                salience_factors TEXT DEFAULT '{}'
+            )
+        """)
+        conn.execute("""
+            CREATE TABLE semantic_concepts (
+                id TEXT PRIMARY KEY, access_count INTEGER DEFAULT 0,
+                last_accessed_at TEXT, updated_at TEXT, deleted_at TEXT
+            )
+        """)
+        conn.executemany(
+            "INSERT INTO episodes (id, salience, salience_factors) VALUES (?, ?, ?)",
+            [('e1', 5, '{}'), ('e2', 9, json.dumps({'source': 'tool_reflection', 'retrieval_count': 2}))],
+        )
+        conn.executemany(
+            "INSERT INTO semantic_concepts (id, deleted_at) VALUES (?, ?)",
+            [('c1', None), ('c2', '2026-01-01')],
+        )
+    yield db
+    db.close_pool()
+
+
+def _episode(db, episode_id):
+    with db.connection() as conn:
+        return dict(conn.execute("SELECT * FROM episodes WHERE id = ?", (episode_id,)).fetchone())
+
+
+def _concept_hits(db):
+    with db.connection() as conn:
+        return dict(conn.execute("SELECT id, access_count FROM semantic_concepts").fetchall())
+
+
+class TestAccumulation:
+
+    def test_repeated_hits_coalesce_into_one_row(self, db):
+        tracker = AccessTracker(db, flush_interval=3600)
+        tracker.record_episodes(['e1', 'e2'], salience_boost=2.0)
+        tracker.record_episodes(['e1'], salience_boost=2.0)
+        tracker.record_concepts(['c1', 'c1', 'c2'])
+
+        assert _episode(db, 'e1')['access_count'] == 0
+        assert tracker.pending() == 4
+        assert tracker.flush() == 4
+
+        e1 = _episode(db, 'e1')
+        assert e1['access_count'] == 2
+        assert e1['salience'] == 9
+        assert e1['activation_score'] == pytest.approx(2.2)
+        assert e1['last_accessed_at'] is not None
+        assert json.loads(e1['salience_factors']) == {}
+
+        e2 = _episode(db, 'e2')
+        assert e2['salience'] == 10   # capped
+        assert json.loads(e2['salience_factors'])['retrieval_count'] == 3
+
+        assert _concept_hits(db) == {'c1': 2, 'c2': 0}   # deleted concept untouched
+
+    def test_backpressure_flushes_on_recording_thread(self, db):
+        tracker = AccessTracker(db, flush_interval=3600, max_pending_ids=2)
+        tracker.record_episodes(['e1', 'e2'], salience_boost=0.0)
+
+        assert tracker.pending() == 0
+        assert tracker.stats()['backpressure_flushes'] == 1
+        assert _episode(db, 'e2')['access_count'] == 1
+
+    def test_close_applies_pending_hits(self, db):
+        tracker = AccessTracker(db, flush_interval=3600)
+        tracker.start()
+        tracker.record_concepts(['c1'])
+
+        tracker.close()
+        assert _concept_hits(db)['c1'] == 1
+        assert not tracker.accepts(db)
+
+    def test_suspended_drops_pending_and_new_hits(self, db):
+        tracker = AccessTracker(db, flush_interval=3600)
+        tracker.record_concepts(['c1'])
+
+        with tracker.suspended():
+            tracker.record_concepts(['c1'])
+        assert tracker.pending() == 0
+        assert tracker.flush() == 0
+        assert _concept_hits(db)['c1'] == 0
+
+
+class TestHelpers:
+
+    def test_synchronous_when_disabled(self, db):
+        with patch.object(access_tracker, '_tracker', None):
+            record_episode_access(db, ['e1', 'e1'], salience_boost=1.0)
+            record_concept_access(db, ['c1'])
+
+        assert _episode(db, 'e1')['access_count'] == 2
+        assert _episode(db, 'e1')['salience'] == 7
+        assert _concept_hits(db)['c1'] == 1
+
+    def test_routes_to_tracker_for_same_database(self, db):
+        tracker = AccessTracker(db, flush_interval=3600)
+        with patch.object(access_tracker, '_tracker', tracker):
+            record_concept_access(DatabaseService(db.db_path), ['c1'])
+            assert _concept_hits(db)['c1'] == 0
+            assert access_tracker.flush_access_tracking(db) == 1
+
+        assert _concept_hits(db)['c1'] == 1
@@ -1,5 +1,6 @@
 """Tests for ActLoopService — fatigue model, concurrent execution, net value, telemetry."""
 
+import threading
 import time
 import pytest
 from unittest.mock import patch, MagicMock
@@ -30,6 +31,16 @@ def _make_result(action_type='recall', status='success', result='found 3 items',
     }
 
 
+def _dispatch_by_type(delays, fail=None):
+    """Dispatcher side_effect keyed by action type (safe under concurrent dispatch)."""
+    def dispatch(topic, action):
+        time.sleep(delays.get(action['type'], 0))
+        if fail and action['type'] in fail:
+            raise fail[action['type']]
+        return _make_result(action['type'])
+    return dispatch
+
+
 # ── Fatigue Accumulation ────────────────────────────────────
 
 
@@ -163,10 +174,7 @@ class TestConcurrentExecution:
     def test_multiple_actions_return_in_order(self, mock_dispatcher_cls):
         """Multiple actions return results preserving original order."""
         mock_dispatcher = MagicMock()
-        mock_dispatcher.dispatch_action.side_effect = [
-            _make_result('recall', result='recall result'),
-            _make_result('associate', result='assoc result'),
-        ]
+        mock_dispatcher.dispatch_action.side_effect = _dispatch_by_type({'recall': 0.05})
         mock_dispatcher_cls.return_value = mock_dispatcher
 
         svc = ActLoopService(_make_config())
@@ -179,14 +187,243 @@ class TestConcurrentExecution:
         assert results[0]['action_type'] == 'recall'
         assert results[1]['action_type'] == 'associate'
 
+    @patch('services.act_dispatcher_service.ActDispatcherService')
+    def test_independent_actions_overlap(self, mock_dispatcher_cls):
+        """Independent reads run concurrently — both must be in flight at once."""
+        both_started = threading.Barrier(2, timeout=2)
+
+        def dispatch(topic, action):
+            both_started.wait()
+            return _make_result(action['type'])
+
+        mock_dispatcher = MagicMock()
+        mock_dispatcher.dispatch_action.side_effect = dispatch
+        mock_dispatcher_cls.return_value = mock_dispatcher
+
+        svc = ActLoopService(_make_config())
+        results = svc.execute_actions('test-topic', [
+            {'type': 'recall', 'query': 'a'},
+            {'type': 'introspect'},
+        ])
+
+        assert [r['status'] for r in results] == ['success', 'success']
+
+    @patch('services.act_dispatcher_service.ActDispatcherService')
+    def test_chained_output_waits_for_producer(self, mock_dispatcher_cls):
+        """A param left empty for output chaining waits for the action that fills it."""
+        seen = {}
+
+        def dispatch(topic, action):
+            if action['type'] == 'emit_card':
+                time.sleep(0.05)
+                return _make_result('emit_card', result={'card_emitted': True, 'tool_name': 'weather'})
+            seen['tool_name'] = action.get('tool_name')
+            return _make_result(action['type'])
+
+        mock_dispatcher = MagicMock()
+        mock_dispatcher.dispatch_action.side_effect = dispatch
+        mock_dispatcher_cls.return_value = mock_dispatcher
+
+        svc = ActLoopService(_make_config())
+        svc.execute_actions('test-topic', [
+            {'type': 'emit_card', 'tool_name': 'weather'},
+            {'type': 'recall', 'query': 'x'},
+            {'type': 'weather_tool', 'tool_name': ''},
+        ])
+
+        assert seen['tool_name'] == 'weather'
+
+    @patch('services.act_dispatcher_service.ActDispatcherService')
+    def test_serial_and_same_tool_actions_keep_order(self, mock_dispatcher_cls):
+        """Stateful skills and repeated calls to one tool run in batch order."""
+        order = []
+
+        def dispatch(topic, action):
+            time.sleep(0.02 if action.get('n') == 1 else 0)
+            order.append((action['type'], action.get('n')))
+            return _make_result(action['type'])
+
+        mock_dispatcher = MagicMock()
+        mock_dispatcher.dispatch_action.side_effect = dispatch
+        mock_dispatcher_cls.return_value = mock_dispatcher
+
+        svc = ActLoopService(_make_config())
+        svc.execute_actions('test-topic', [
+            {'type': 'search_tool', 'n': 1},
+            {'type': 'search_tool', 'n': 2},
+        ])
+        svc.execute_actions('test-topic', [
+            {'type': 'list', 'n': 1},
+            {'type': 'recall', 'n': 2},
+        ])
+
+        assert order == [('search_tool', 1), ('search_tool', 2), ('list', 1), ('recall', 2)]
+
+    @patch('services.act_loop_service._ACTION_TIMEOUT_GRACE', 0.05)
+    @patch('services.act_dispatcher_service.ActDispatcherService')
+    def test_hung_action_reported_as_timeout(self, mock_dispatcher_cls):
+        """A dispatch that never returns yields a timeout result instead of blocking."""
+        release = threading.Event()
+
+        def dispatch(topic, action):
+            if action['type'] == 'introspect':
+                release.wait(2)
+            return _make_result(action['type'])
+
+        mock_dispatcher = MagicMock()
+        mock_dispatcher.dispatch_action.side_effect = dispatch
+        mock_dispatcher_cls.return_value = mock_dispatcher
+
+        svc = ActLoopService(_make_config(), per_action_timeout=0.05)
+        results = svc.execute_actions('test-topic', [
+            {'type': 'recall', 'query': 'a'},
+            {'type': 'introspect'},
+        ])
+        release.set()
+
+        assert results[0]['status'] == 'success'
+        assert results[1]['status'] == 'timeout'
+
+    @patch('services.act_dispatcher_service.ActDispatcherService')
+    def test_tool_output_chains_into_later_tool(self, mock_dispatcher_cls):
+        """A tool's dict result fills a later tool's empty param (tool outputs are open-ended)."""
+        seen = []
+
+        def dispatch(topic, action):
+            if action['type'] == 'search_tool':
+                time.sleep(0.05)
+                return _make_result('search_tool', result={'location': 'Paris'})
+            seen.append(action.get('location'))
+            return _make_result(action['type'])
+
+        mock_dispatcher = MagicMock()
+        mock_dispatcher.dispatch_action.side_effect = dispatch
+        mock_dispatcher_cls.return_value = mock_dispatcher
+
+        svc = ActLoopService(_make_config())
+        svc.execute_actions('test-topic', [
+            {'type': 'search_tool'},
+            {'type': 'weather_tool', 'location': ''},
+        ])
+
+        assert seen == ['Paris']
+
+    @patch('services.act_dispatcher_service.ActDispatcherService')
+    def test_independent_outputs_are_not_chained(self, mock_dispatcher_cls):
+        """Outputs of an independent sibling never leak into a later action, however fast it finishes."""
+        seen = []
+
+        def dispatch(topic, action):
+            if action['type'] == 'recall':
+                return _make_result('recall', result={'location': 'Paris'})
+            if action.get('n') == 1:
+                time.sleep(0.05)  # recall is long done by the time n=2 starts
+            else:
+                seen.append(action.get('location'))
+            return _make_result(action['type'])
+
+        mock_dispatcher = MagicMock()
+        mock_dispatcher.dispatch_action.side_effect = dispatch
+        mock_dispatcher_cls.return_value = mock_dispatcher
+
+        svc = ActLoopService(_make_config())
+        svc.execute_actions('test-topic', [
+            {'type': 'recall', 'query': 'x'},  # declares no chain outputs
+            {'type': 'weather_tool', 'n': 1},
+            {'type': 'weather_tool', 'n': 2, 'location': ''},  # waits for n=1 only
+        ])
+
+        assert seen == ['']
+
+    @patch('services.act_dispatcher_service.ActDispatcherService')
+    def test_transitive_dependency_outputs_are_chained(self, mock_dispatcher_cls):
+        """An action sees outputs from dependencies of its dependencies."""
+        seen = {}
+
+        def dispatch(topic, action):
+            if action['type'] == 'emit_card':
+                return _make_result('emit_card', result={'tool_name': 'weather', 'city': 'Oslo'})
+            seen[action.get('n')] = action.get('city')
+            return _make_result(action['type'])
+
+        mock_dispatcher = MagicMock()
+        mock_dispatcher.dispatch_action.side_effect = dispatch
+        mock_dispatcher_cls.return_value = mock_dispatcher
+
+        svc = ActLoopService(_make_config())
+        svc.execute_actions('test-topic', [
+            {'type': 'emit_card', 'tool_name': 'weather'},
+            {'type': 'weather_tool', 'tool_name': '', 'city': '', 'n': 1},   # chains from emit_card
+            {'type': 'weather_tool', 'tool_name': 'weather', 'city': '', 'n': 2},  # same tool → after n=1
+        ])
+
+        assert seen == {1: 'Oslo', 2: 'Oslo'}
+
+    @patch('services.act_loop_service._ACTION_TIMEOUT_GRACE', 0.05)
+    @patch('services.act_dispatcher_service.ActDispatcherService')
+    def test_hung_action_retires_shared_pool(self, mock_dispatcher_cls):
+        """A worker stuck past the grace period doesn't shrink later loops' pool."""
+        from services.act_loop_service import get_act_pool
+        release = threading.Event()
+
+        def dispatch(topic, action):
+            if action['type'] == 'introspect':
+                release.wait(2)
+            return _make_result(action['type'])
+
+        mock_dispatcher = MagicMock()
+        mock_dispatcher.dispatch_action.side_effect = dispatch
+        mock_dispatcher_cls.return_value = mock_dispatcher
+
+        before = get_act_pool()
+        svc = ActLoopService(_make_config(), per_action_timeout=0.05)
+        svc.execute_actions('test-topic', [
+            {'type': 'recall', 'query': 'a'},
+            {'type': 'introspect'},
+        ])
+        release.set()
+
+        assert get_act_pool() is not before
+
+    @patch('services.act_loop_service._ACTION_TIMEOUT_GRACE', 0.05)
+    @patch('services.act_dispatcher_service.ActDispatcherService')
+    def test_queued_action_behind_hung_worker_is_requeued(self, mock_dispatcher_cls):
+        """An action that never started isn't reported as timed out; it runs on the fresh pool."""
+        from concurrent.futures import ThreadPoolExecutor
+        release = threading.Event()
+        dispatched = []
+
+        def dispatch(topic, action):
+            dispatched.append(action['type'])
+            if action['type'] == 'recall':
+                release.wait(2)
+            return _make_result(action['type'])
+
+        mock_dispatcher = MagicMock()
+        mock_dispatcher.dispatch_action.side_effect = dispatch
+        mock_dispatcher_cls.return_value = mock_dispatcher
+
+        pools = [ThreadPoolExecutor(max_workers=1), ThreadPoolExecutor(max_workers=2)]
+        svc = ActLoopService(_make_config(), per_action_timeout=0.05)
+        with patch('services.act_loop_service.get_act_pool', side_effect=pools):
+            results = svc.execute_actions('test-topic', [
+                {'type': 'recall', 'query': 'a'},
+                {'type': 'introspect'},   # queued behind recall on the one-worker pool
+            ])
+        release.set()
+        pools[1].shutdown()
+
+        assert results[0]['status'] == 'timeout'
+        assert results[1]['status'] == 'success'
+        assert dispatched.count('introspect') == 1
+
     @patch('services.act_dispatcher_service.ActDispatcherService')
     def test_sequential_error_propagates(self, mock_dispatcher_cls):
-        """If a sequential action throws, the error propagates up."""
+        """If an action throws, the error propagates up."""
         mock_dispatcher = MagicMock()
-        mock_dispatcher.dispatch_action.side_effect = [
-            _make_result('recall'),
-            Exception("connection failed"),
-        ]
+        mock_dispatcher.dispatch_action.side_effect = _dispatch_by_type(
+            {}, fail={'associate': Exception("connection failed")},
+        )
         mock_dispatcher_cls.return_value = mock_dispatcher
 
         svc = ActLoopService(_make_config())
@@ -150,3 +150,123 @@ class TestPrivacyAPI:
             call_args = mock_log.log_event.call_args
             # event_type passed as keyword arg
             assert call_args.kwargs.get("event_type") == "privacy_delete_all"
+
+    def test_delete_all_rewrites_memory_store_snapshot(self, client, tmp_path):
+        """DELETE /privacy/delete-all leaves no deleted keys in the on-disk snapshot or journal."""
+        import os
+        from services.memory_store import MemoryStore
+        from services.memory_store_persistence import JOURNAL_FILE, MemoryStorePersistence
+
+        store = MemoryStore()
+        persistence = MemoryStorePersistence(store, directory=str(tmp_path), flush_interval=3600)
+        persistence.start()
+        store.set('working_memory:t1', 'private turn')
+        persistence.snapshot()
+        store.set('working_memory:t2', 'another turn')
+        persistence.flush()
+
+        mock_conn_ctx = MagicMock()
+        mock_conn_ctx.__enter__ = MagicMock(return_value=MagicMock())
+        mock_conn_ctx.__exit__ = MagicMock(return_value=False)
+        mock_db = MagicMock()
+        mock_db.connection.return_value = mock_conn_ctx
+
+        with patch('services.memory_client.MemoryClientService.create_connection', return_value=store), \
+             patch('services.database_service.get_shared_db_service', return_value=mock_db), \
+             patch('services.memory_store_persistence.get_persistence', return_value=persistence), \
+             patch('services.interaction_log_service.InteractionLogService'):
+            response = client.delete('/privacy/delete-all', headers={"X-Confirm-Delete": "yes"})
+
+        assert response.status_code == 200
+        # Journal is empty, so a reload sees only what the snapshot holds
+        assert os.path.getsize(os.path.join(str(tmp_path), JOURNAL_FILE)) == 0
+        reloaded = MemoryStore()
+        MemoryStorePersistence(reloaded, directory=str(tmp_path)).load()
+        assert reloaded.keys('working_memory:*') == []
+
+    def test_delete_all_drops_queued_write_behind_rows(self, client, tmp_path):
+        """Rows still queued for the audit tables are not committed after delete-all."""
+        import services.write_behind_queue as wbq
+        from services.database_service import DatabaseService
+
+        db = DatabaseService(str(tmp_path / "delete.db"))
+        with db.connection() as conn:
+            conn.execute("CREATE TABLE interaction_log (id TEXT PRIMARY KEY, event_type TEXT)")
+            conn.execute("INSERT INTO interaction_log VALUES ('old', 'user_input')")
+        queue = wbq.WriteBehindQueue(db, flush_interval=3600)
+        queue.append("INSERT INTO interaction_log (id, event_type) VALUES (?, ?)", ('queued', 'user_input'))
+
+        mock_store = MagicMock()
+        mock_store.keys.return_value = []
+        try:
+            with patch.object(wbq, '_queue', queue), \
+                 patch('services.memory_client.MemoryClientService.create_connection', return_value=mock_store), \
+                 patch('services.database_service.get_shared_db_service', return_value=db), \
+                 patch('services.interaction_log_service.InteractionLogService'):
+                response = client.delete('/privacy/delete-all', headers={"X-Confirm-Delete": "yes"})
+
+            assert response.status_code == 200
+            queue.flush()
+            with db.connection() as conn:
+                assert conn.execute("SELECT COUNT(*) FROM interaction_log").fetchone()[0] == 0
+            assert queue.stats()['rows_discarded'] == 1
+        finally:
+            db.close_pool()
+
+    # ------------------------------------------------------------------
+    # GET /privacy/export, POST /privacy/import
+    # ------------------------------------------------------------------
+
+    @pytest.fixture
+    def real_db(self, tmp_path):
+        from services.database_service import DatabaseService
+        db = DatabaseService(str(tmp_path / "privacy.db"))
+        with db.connection() as conn:
+            conn.execute("CREATE TABLE episodes (id TEXT PRIMARY KEY, gist TEXT)")
+            conn.executemany("INSERT INTO episodes VALUES (?, ?)", [(f"e{i}", "g") for i in range(3)])
+        yield db
+        db.close_pool()
+
+    def test_export_streams_gzip_ndjson(self, client, real_db):
+        """GET /privacy/export returns gzip NDJSON with a download filename."""
+        import gzip
+        import json
+
+        mock_store = MagicMock()
+        mock_store.export_matching.return_value = {}
+
+        with patch('services.database_service.get_shared_db_service', return_value=real_db), \
+             patch('services.memory_client.MemoryClientService.create_connection', return_value=mock_store):
+            response = client.get('/privacy/export')
+            body = response.get_data()
+
+        assert response.status_code == 200
+        assert "chalie-export.ndjson.gz" in response.headers["Content-Disposition"]
+        records = [json.loads(line) for line in gzip.decompress(body).splitlines()]
+        assert records[0]["type"] == "header"
+        assert sum(r["type"] == "row" for r in records) == 3
+        assert records[-1] == {"type": "end", "rows": 3}
+
+    def test_export_rejects_bad_resume_token(self, client):
+        """GET /privacy/export?resume=garbage returns 400 before streaming."""
+        response = client.get('/privacy/export?resume=garbage')
+        assert response.status_code == 400
+
+    def test_import_restores_export(self, client, real_db):
+        """POST /privacy/import upserts rows from an export body."""
+        from services.export_service import ExportService
+        payload = b"".join(ExportService(real_db).stream(["episodes"], compression="none"))
+        with real_db.connection() as conn:
+            conn.execute("DELETE FROM episodes")
+
+        with patch('services.database_service.get_shared_db_service', return_value=real_db):
+            response = client.post('/privacy/import', data=payload)
+
+        assert response.status_code == 200
+        assert response.get_json()["tables"] == {"episodes": 3}
+
+    def test_import_rejects_non_export_body(self, client, real_db):
+        """POST /privacy/import with a foreign body returns 400."""
+        with patch('services.database_service.get_shared_db_service', return_value=real_db):
+            response = client.post('/privacy/import', data=b'{"hello": 1}\n')
+        assert response.status_code == 400
@@ -0,0 +1,233 @@
+"""Tests for ConceptIndex — vectorised hybrid scoring and incremental updates."""
+
+import pytest
+import numpy as np
+from unittest.mock import MagicMock, patch
+
+from services.concept_index import ConceptIndex
+
+
+pytestmark = pytest.mark.unit
+
+WEIGHTS = {
+    'vector_similarity': 5,
+    'strength': 3,
+    'activation_score': 2,
+    'utility_score': 2,
+    'confidence': 1,
+}
+
+
+def _make_db_mock(rows):
+    """Mock DB whose cursor returns the given rows for every query."""
+    mock_db = MagicMock()
+    mock_db.db_path = '/tmp/test-concepts.db'
+    cursor = MagicMock()
+    cursor.fetchall.return_value = rows
+    conn = MagicMock()
+    conn.cursor.return_value = cursor
+    ctx = MagicMock()
+    ctx.__enter__ = MagicMock(return_value=conn)
+    ctx.__exit__ = MagicMock(return_value=False)
+    mock_db.connection.return_value = ctx
+    return mock_db
+
+
+def _concept_row(concept_id, embedding, strength=0.5, activation=0.5,
+                 utility=0.5, confidence=0.8, reliability='reliable'):
+    """24-column row matching ConceptIndex.load() SELECT order."""
+    blob = np.asarray(embedding, dtype=np.float32).tobytes()
+    return (
+        concept_id, f'name-{concept_id}', 'knowledge', 'definition',
+        3, 'domain', strength, activation,
+        0, 0, confidence, '[]',
+        'unverified', '{}', '[]',
+        None, None, None,
+        utility, 0.5, None, None,
+        reliability, blob,
+    )
+
+
+def _unit(*values):
+    v = np.zeros(8, dtype=np.float32)
+    v[:len(values)] = values
+    return v / np.linalg.norm(v)
+
+
+class TestConceptIndex:
+
+    def test_search_ranks_by_vector_similarity(self):
+        index = ConceptIndex()
+        index.load(_make_db_mock([
+            _concept_row('a', _unit(1, 0)),
+            _concept_row('b', _unit(0, 1)),
+            _concept_row('c', _unit(1, 1)),
+        ]))
+
+        results = index.search(_unit(1, 0), WEIGHTS, limit=3)
+
+        assert [c['id'] for c in results] == ['a', 'c', 'b']
+        assert results[0]['vector_similarity'] == pytest.approx(1.0, abs=1e-5)
+        assert results[0]['embedding'] is None
+
+    def test_hybrid_score_matches_formula(self):
+        index = ConceptIndex()
+        index.load(_make_db_mock([
+            _concept_row('a', _unit(1, 0), strength=0.9, activation=0.4,
+                         utility=0.3, confidence=0.7),
+        ]))
+
+        result = index.search(_unit(1, 0), WEIGHTS, limit=1)[0]
+
+        expected = (5 * 1.0 + 3 * 0.9 + 2 * 0.4 + 2 * 0.3 + 1 * 0.7) / 13
+        assert result['hybrid_score'] == pytest.approx(expected, abs=1e-5)
+
+    def test_negative_similarity_clamped_to_zero(self):
+        index = ConceptIndex()
+        index.load(_make_db_mock([_concept_row('a', _unit(-1, 0))]))
+
+        result = index.search(_unit(1, 0), WEIGHTS, limit=1)[0]
+
+        assert result['vector_similarity'] == 0.0
+
+    def test_confidence_threshold_filters_before_top_k(self):
+        index = ConceptIndex()
+        index.load(_make_db_mock([
+            _concept_row('weak', _unit(1, 0), confidence=0.1),
+            _concept_row('ok', _unit(0, 1), confidence=0.9),
+        ]))
+
+        results = index.search(_unit(1, 0), WEIGHTS, limit=1, min_confidence=0.4)
+
+        assert [c['id'] for c in results] == ['ok']
+
+    def test_all_below_threshold_returns_empty(self):
+        index = ConceptIndex()
+        index.load(_make_db_mock([_concept_row('a', _unit(1, 0), confidence=0.1)]))
+
+        assert index.search(_unit(1, 0), WEIGHTS, limit=5, min_confidence=0.4) == []
+
+    def test_upsert_ignored_before_load(self):
+        index = ConceptIndex()
+        index.upsert({'id': 'a', 'confidence': 0.9}, _unit(1, 0))
+
+        assert len(index) == 0
+
+    def test_upsert_appends_and_grows(self):
+        index = ConceptIndex()
+        index.load(_make_db_mock([]))
+
+        for i in range(300):
+            index.upsert({'id': f'c{i}', 'confidence': 0.9, 'strength': 0.5}, _unit(1, i % 7))
+
+        assert len(index) == 300
+        assert index.search(_unit(1, 0), WEIGHTS, limit=1)[0]['id'] in {f'c{i}' for i in range(0, 300, 7)}
+
+    def test_update_fields_changes_ranking(self):
+        index = ConceptIndex()
+        index.load(_make_db_mock([
+            _concept_row('a', _unit(1, 0), strength=0.1),
+            _concept_row('b', _unit(1, 0), strength=0.2),
+        ]))
+
+        index.update_fields('a', strength=5.0)
+
+        assert index.search(_unit(1, 0), WEIGHTS, limit=1)[0]['id'] == 'a'
+
+    def test_remove_keeps_remaining_rows_addressable(self):
+        index = ConceptIndex()
+        index.load(_make_db_mock([
+            _concept_row('a', _unit(1, 0)),
+            _concept_row('b', _unit(0, 1)),
+            _concept_row('c', _unit(0, 0, 1)),
+        ]))
+
+        index.remove('a')
+
+        assert len(index) == 2
+        assert index.search(_unit(0, 0, 1), WEIGHTS, limit=1)[0]['id'] == 'c'
+
+    def test_refresh_scalars_updates_strength(self):
+        index = ConceptIndex()
+        index.load(_make_db_mock([_concept_row('a', _unit(1, 0), strength=0.9)]))
+
+        refreshed = index.refresh_scalars(_make_db_mock([
+            ('a', 0.2, 0.5, 0.5, 0.8, 'reliable', None),
+        ]))
+
+        assert refreshed == 1
+        assert index.search(_unit(1, 0), WEIGHTS, limit=1)[0]['strength'] == 0.2
+
+    def test_refresh_scalars_drops_deleted_concepts(self):
+        index = ConceptIndex()
+        index.load(_make_db_mock([
+            _concept_row('a', _unit(1, 0)),
+            _concept_row('b', _unit(0, 1)),
+        ]))
+
+        # 'a' was soft-deleted by some other writer — only 'b' comes back
+        index.refresh_scalars(_make_db_mock([
+            ('b', 0.5, 0.5, 0.5, 0.8, 'reliable', None),
+        ]))
+
+        assert len(index) == 1
+        assert [c['id'] for c in index.search(_unit(1, 0), WEIGHTS, limit=5)] == ['b']
+
+    def test_missing_signals_use_scorer_defaults(self):
+        index = ConceptIndex()
+        index.load(_make_db_mock([]))
+
+        index.upsert({'id': 'a'}, _unit(1, 0))
+        index.upsert({'id': 'b', 'strength': 0.0, 'confidence': 0.0}, _unit(1, 0))
+
+        by_id = {c['id']: c for c in index.search(_unit(1, 0), WEIGHTS, limit=2)}
+        # strength/confidence default to 0.5 (as before the index); explicit 0.0 is kept
+        assert by_id['a']['hybrid_score'] == pytest.approx((5 + 3 * 0.5 + 0.5) / 13)
+        assert by_id['b']['hybrid_score'] == pytest.approx(5 / 13)
+
+    def test_ensure_loaded_reuses_index(self):
+        index = ConceptIndex()
+        db = _make_db_mock([_concept_row('a', _unit(1, 0))])
+
+        index.ensure_loaded(db)
+        index.ensure_loaded(db)
+
+        assert db.connection.call_count == 1
+
+    def test_invalidate_forces_reload(self):
+        index = ConceptIndex()
+        db = _make_db_mock([_concept_row('a', _unit(1, 0))])
+
+        index.ensure_loaded(db)
+        index.invalidate()
+        index.ensure_loaded(db)
+
+        assert db.connection.call_count == 2
+
+    def test_search_not_blocked_by_stale_reload(self):
+        import threading
+        index = ConceptIndex()
+        index.load(_make_db_mock([_concept_row('a', _unit(1, 0))]))
+        index._loaded_at -= 10_000   # stale
+
+        entered, release = threading.Event(), threading.Event()
+        slow_db = _make_db_mock([_concept_row('b', _unit(0, 1))])
+
+        def blocking_connection():
+            entered.set()
+            release.wait(2)
+            return _make_db_mock([_concept_row('b', _unit(0, 1))]).connection()
+
+        slow_db.connection.side_effect = blocking_connection
+        reloader = threading.Thread(target=index.ensure_loaded, args=(slow_db,))
+        reloader.start()
+        assert entered.wait(2)
+
+        # Mid-reload: a second caller neither reloads nor waits; search serves the old rows
+        index.ensure_loaded(slow_db)
+        assert [c['id'] for c in index.search(_unit(1, 0), WEIGHTS, limit=5)] == ['a']
+
+        release.set()
+        reloader.join(2)
+        assert [c['id'] for c in index.search(_unit(0, 1), WEIGHTS, limit=5)] == ['b']
+        assert slow_db.connection.call_count == 1
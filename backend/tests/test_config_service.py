@@ -228,3 +228,100 @@ class TestGetAllAgents:
             result = ConfigService.get_all_agents()
 
         assert result == []
+
+
+@pytest.mark.unit
+class TestFileCache:
+    """Tests for the parsed-file cache behind load_json/load_text."""
+
+    def test_load_json_parses_once(self, tmp_path):
+        """Repeated loads of an unchanged file are served from cache."""
+        test_file = tmp_path / "config.json"
+        test_file.write_text(json.dumps({"model": "a"}))
+
+        with patch('builtins.open', wraps=open) as mock_open:
+            ConfigService.load_json(str(test_file))
+            ConfigService.load_json(str(test_file))
+
+        assert mock_open.call_count == 1
+
+    def test_load_json_returns_independent_copies(self, tmp_path):
+        """Mutating a returned config must not leak into the cache."""
+        test_file = tmp_path / "config.json"
+        test_file.write_text(json.dumps({"model": "a", "tags": ["x"]}))
+
+        first = ConfigService.load_json(str(test_file))
+        first["model"] = "mutated"
+        first["tags"].append("y")
+
+        assert ConfigService.load_json(str(test_file)) == {"model": "a", "tags": ["x"]}
+
+    def test_load_json_view_is_read_only(self, tmp_path):
+        test_file = tmp_path / "config.json"
+        test_file.write_text(json.dumps({"model": "a"}))
+
+        view = ConfigService.load_json_view(str(test_file))
+
+        with pytest.raises(TypeError):
+            view["model"] = "b"
+
+    def test_changed_file_is_reloaded(self, tmp_path):
+        """A new mtime/size is picked up once the stat interval elapses."""
+        test_file = tmp_path / "prompt.md"
+        test_file.write_text("v1")
+        assert ConfigService.load_text(str(test_file)) == "v1"
+        generation = ConfigService.generation()
+
+        test_file.write_text("version two")
+        with patch('services.config_service._STAT_INTERVAL', 0):
+            assert ConfigService.load_text(str(test_file)) == "version two"
+
+        assert ConfigService.generation() > generation
+
+    def test_clear_cache_forces_reparse(self, tmp_path):
+        test_file = tmp_path / "prompt.md"
+        test_file.write_text("v1")
+        ConfigService.load_text(str(test_file))
+
+        test_file.write_text("v2")
+        ConfigService.clear_cache()
+
+        assert ConfigService.load_text(str(test_file)) == "v2"
+
+
+@pytest.mark.unit
+class TestResolvedConfigMemo:
+    """Tests for provider-resolved config memoization."""
+
+    def _resolve(self, generation):
+        agent_json = {"temperature": 0.7}
+        providers = {"p": {"platform": "ollama", "model": "m"}}
+        with patch.object(ConfigService, 'get_agent_config', return_value=dict(agent_json)) as mock_get, \
+             patch('services.provider_cache_service.ProviderCacheService.get_job_assignment',
+                   return_value="p"), \
+             patch('services.provider_cache_service.ProviderCacheService.get_generation',
+                   return_value=generation), \
+             patch.object(ConfigService, 'get_providers', return_value=providers):
+            result = ConfigService.resolve_agent_config("memo-agent")
+        return result, mock_get.call_count
+
+    def test_memoized_within_provider_generation(self):
+        self._resolve(generation=1)
+        result, loads = self._resolve(generation=1)
+
+        assert loads == 0
+        assert result["platform"] == "ollama"
+
+    def test_provider_generation_change_re_resolves(self):
+        self._resolve(generation=1)
+        _, loads = self._resolve(generation=2)
+
+        assert loads == 1
+
+    def test_memoized_result_is_mutable_copy(self):
+        first, _ = self._resolve(generation=1)
+        first["format"] = ""
+
+        second, _ = self._resolve(generation=1)
+
+        assert "format" not in second
@@ -53,6 +53,31 @@ class TestContextAssemblyService:
         assert isinstance(result['total_tokens_est'], int)
         assert result['total_tokens_est'] >= 0
 
+    def test_slow_source_dropped_after_deadline(self):
+        """A source that misses retrieval_source_timeout falls back to empty."""
+        import time as _time
+        svc = ContextAssemblyService({'max_context_tokens': 100_000, 'retrieval_source_timeout': 0.05})
+        timings = {}
+
+        def slow_episodes(*args, **kwargs):
+            _time.sleep(0.5)
+            return 'late episodes'
+
+        with patch.object(svc, '_get_working_memory', return_value='wm'), \
+             patch.object(svc, '_get_moments', return_value=''), \
+             patch.object(svc, '_get_facts', return_value='facts'), \
+             patch.object(svc, '_get_gists', return_value='gists'), \
+             patch.object(svc, '_get_episodes', side_effect=slow_episodes), \
+             patch.object(svc, '_get_procedural_hints', return_value=''), \
+             patch.object(svc, '_get_concepts', return_value=''), \
+             patch.object(svc, '_get_self_awareness', return_value=''):
+
+            result = svc.assemble(prompt='hello', topic='test', timings=timings)
+
+        assert result['episodes'] == ''
+        assert result['facts'] == 'facts'
+        assert set(timings) >= {'working_memory', 'facts', 'episodes', 'concepts'}
+
     # ── Working memory ────────────────────────────────────────────────
 
     def test_working_memory_included_in_output(self):
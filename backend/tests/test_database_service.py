@@ -0,0 +1,186 @@
+"""Tests for DatabaseService — statement cache, serialized writer, reader pool, thread connections."""
+
+import sqlite3
+import threading
+
+import pytest
+
+import services.database_service as database_service
+from services.database_service import (
+    DatabaseService, _ReaderPool, _StatementCache, _statement_label, text,
+)
+
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def db(tmp_path):
+    svc = DatabaseService(str(tmp_path / "test.db"))
+    with svc.connection() as conn:
+        conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT, score REAL)")
+    yield svc
+    svc.close_pool()
+
+
+class TestStatementCache:
+
+    def test_compiles_named_params_in_order(self):
+        cache = _StatementCache()
+        sql, names = cache.compile("UPDATE t SET a = :a, b = :b WHERE id = :id AND a > :a")
+
+        assert sql == "UPDATE t SET a = ?, b = ? WHERE id = ? AND a > ?"
+        assert names == ('a', 'b', 'id', 'a')
+
+    def test_repeat_lookups_hit(self):
+        cache = _StatementCache()
+        for _ in range(4):
+            cache.compile("SELECT * FROM t WHERE id = :id")
+
+        stats = cache.stats()
+        assert stats['hits'] == 3
+        assert stats['misses'] == 1
+        assert stats['hit_rate'] == pytest.approx(0.75)
+
+    def test_evicts_least_recently_used(self):
+        cache = _StatementCache(maxsize=2)
+        cache.compile("SELECT :a")
+        cache.compile("SELECT :b")
+        cache.compile("SELECT :a")   # refresh a
+        cache.compile("SELECT :c")   # evicts b
+
+        assert cache.stats()['size'] == 2
+        cache.compile("SELECT :a")
+        assert cache.stats()['hits'] == 2
+
+
+class TestSessionProxy:
+
+    def test_named_params_bind_through_cache(self, db):
+        with db.get_session() as session:
+            for i in range(3):
+                session.execute(
+                    text("INSERT INTO items (id, name, score) VALUES (:id, :name, :score)"),
+                    {'score': i * 0.5, 'id': i, 'name': f"item-{i}"},
+                )
+
+        with db.get_session() as session:
+            row = session.execute(
+                text("SELECT name, score FROM items WHERE id = :id"), {'id': 2},
+            ).fetchone()
+
+        assert row['name'] == 'item-2'
+        assert row['score'] == pytest.approx(1.0)
+
+    def test_missing_param_raises(self, db):
+        with pytest.raises(KeyError):
+            with db.get_session() as session:
+                session.execute("SELECT * FROM items WHERE id = :id", {'other': 1})
+
+    def test_positional_params_bypass_cache(self, db):
+        with db.get_session() as session:
+            session.execute("INSERT INTO items (id, name) VALUES (?, ?)", (7, 'seven'))
+            count = session.execute("SELECT COUNT(*) FROM items").scalar()
+
+        assert count == 1
+
+
+class TestWriter:
+
+    def test_jobs_run_in_order_on_one_thread(self, db):
+        threads = []
+
+        def insert(i):
+            def job(conn):
+                threads.append(threading.current_thread().name)
+                conn.execute("INSERT INTO items (id, name) VALUES (?, ?)", (i, f"item-{i}"))
+                return i
+            return job
+
+        futures = [db.submit_write(insert(i)) for i in range(20)]
+        assert [f.result(timeout=5) for f in futures] == list(range(20))
+        assert set(threads) == {'db-writer'}
+        assert [r['id'] for r in db.fetch_all("SELECT id FROM items ORDER BY rowid")] == list(range(20))
+
+    def test_failed_job_rolls_back_and_raises(self, db):
+        def job(conn):
+            conn.execute("INSERT INTO items (id, name) VALUES (1, 'a')")
+            conn.execute("INSERT INTO items (id, name) VALUES (1, 'dup')")
+
+        with pytest.raises(sqlite3.IntegrityError):
+            db.write(job)
+        assert db.fetch_all("SELECT * FROM items") == []
+
+    def test_execute_returns_rowcount_and_records_timings(self, db):
+        db.executemany("INSERT INTO items (id, name) VALUES (?, ?)", [(1, 'a'), (2, 'b')])
+        assert db.execute("UPDATE items SET score = 1.0 WHERE id > ?", (0,)) == 2
+
+        stats = database_service.get_database_stats()['writers'][db.db_path]
+        assert stats['statements']['UPDATE ITEMS']['count'] == 1
+        assert stats['statements']['INSERT ITEMS']['count'] == 1
+
+    def test_write_inside_open_transaction_joins_it(self, db):
+        with db.connection() as conn:
+            conn.execute("INSERT INTO items (id, name) VALUES (1, 'a')")
+            db.execute("UPDATE items SET name = 'b' WHERE id = 1")   # would deadlock on the writer
+            conn.rollback()
+
+        assert db.fetch_all("SELECT * FROM items") == []
+
+    def test_statement_label(self):
+        assert _statement_label("  INSERT OR REPLACE INTO t (a) VALUES (?)") == "INSERT T"
+        assert _statement_label("DELETE FROM x WHERE id = ?") == "DELETE X"
+
+
+class TestReaderPool:
+
+    def test_reads_are_read_only(self, db):
+        with db.read() as conn:
+            with pytest.raises(sqlite3.OperationalError):
+                conn.execute("INSERT INTO items (id) VALUES (1)")
+
+    def test_fetch_all_sees_own_transaction_fetch_all_ro_does_not(self, db):
+        with db.connection() as conn:
+            conn.execute("INSERT INTO items (id, name) VALUES (1, 'a')")
+            assert db.fetch_all_ro("SELECT * FROM items") == []
+            assert len(db.fetch_all("SELECT * FROM items")) == 1
+        assert len(db.fetch_all_ro("SELECT * FROM items")) == 1
+
+    def test_pool_is_bounded(self, db):
+        pool = _ReaderPool(db.db_path, size=1)
+        first = pool.acquire()
+        acquired = threading.Event()
+
+        def reader():
+            conn = pool.acquire()
+            acquired.set()
+            pool.release(conn)
+
+        t = threading.Thread(target=reader)
+        t.start()
+        assert not acquired.wait(0.1)
+        pool.release(first)
+        assert acquired.wait(5)
+        t.join()
+        assert pool.stats()['open'] == 1
+        assert pool.stats()['waits'] == 1
+        pool.close()
+
+
+class TestThreadConnections:
+
+    def test_connections_of_exited_threads_are_closed(self, db):
+        opened = []
+
+        def worker():
+            with db.connection() as conn:
+                conn.execute("SELECT 1")
+                opened.append(conn)
+
+        t = threading.Thread(target=worker)
+        t.start()
+        t.join()
+
+        database_service._reap_thread_connections()
+        with pytest.raises(sqlite3.ProgrammingError):
+            opened[0].execute("SELECT 1")
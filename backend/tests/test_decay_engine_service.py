@@ -1,9 +1,14 @@
 """Tests for DecayEngineService — periodic decay across all memory types."""
 
+import json
+import math
+import sqlite3
+
 import pytest
 from unittest.mock import patch, MagicMock
 
-from services.decay_engine_service import DecayEngineService
+from services.database_service import DatabaseService
+from services.decay_engine_service import DecayEngineService, register_decay_functions
 
 
 pytestmark = pytest.mark.unit
@@ -158,3 +163,123 @@ class TestDecayEngineService:
             result = svc._apply_identity_inertia()
 
         assert result == 0
+
+
+# ── Set-based decay against a real SQLite database ────────────────────
+
+
+def _legacy_activation(activation, hours, source, durability, reliability, base_rate=0.05):
+    """The per-row Python formula the set-based UPDATE replaced."""
+    rate = base_rate
+    if source == 'tool_reflection':
+        if durability == 'transient':
+            rate = base_rate * 2.0
+        elif durability == 'evolving':
+            rate = base_rate * 1.5
+    if durability == 'cron_tool':
+        rate = base_rate * 3.0
+    rate *= {'uncertain': 1.5, 'contradicted': 2.0, 'superseded': 3.0}.get(reliability, 1.0)
+    return max(0.1, activation * math.exp(-rate * hours))
+
+
+@pytest.fixture
+def decay_db(tmp_path):
+    db = DatabaseService(str(tmp_path / "decay.db"))
+    with db.connection() as conn:
+        conn.execute("""
+            CREATE TABLE episodes (
+                id TEXT PRIMARY KEY, created_at TEXT, last_accessed_at TEXT, deleted_at TEXT,
+                activation_score REAL, salience_factors TEXT DEFAULT '{}', reliability TEXT
+            )
+        """)
+        conn.execute("""
+            CREATE TABLE semantic_concepts (
+                id TEXT PRIMARY KEY, strength REAL, decay_resistance REAL, reliability TEXT,
+                last_accessed_at TEXT, updated_at TEXT, deleted_at TEXT
+            )
+        """)
+    with patch('services.database_service.get_lightweight_db_service', return_value=db):
+        yield db
+    db.close_pool()
+
+
+@pytest.fixture
+def engine():
+    with patch(
+        'services.decay_engine_service.ConfigService.get_agent_config',
+        return_value={'decay_chunk_rows': 2},
+    ):
+        return DecayEngineService()
+
+
+def _insert_episode(db, episode_id, hours_ago, activation=1.0, factors=None, reliability=None, deleted=False):
+    with db.connection() as conn:
+        conn.execute(
+            "INSERT INTO episodes (id, created_at, deleted_at, activation_score, salience_factors, reliability) "
+            "VALUES (?, datetime('now', ?), ?, ?, ?, ?)",
+            (episode_id, f'-{hours_ago} hours', '2026-01-01' if deleted else None,
+             activation, json.dumps(factors or {}), reliability),
+        )
+
+
+def _activation(db, episode_id):
+    with db.connection() as conn:
+        return conn.execute("SELECT activation_score FROM episodes WHERE id = ?", (episode_id,)).fetchone()[0]
+
+
+class TestSetBasedDecay:
+
+    def test_episodic_matches_per_row_formula(self, decay_db, engine):
+        cases = {
+            'plain': (None, None, None),
+            'transient': ('tool_reflection', 'transient', None),
+            'evolving': ('tool_reflection', 'evolving', 'uncertain'),
+            'cron': (None, 'cron_tool', None),
+            'contradicted': (None, None, 'contradicted'),
+        }
+        for episode_id, (source, durability, reliability) in cases.items():
+            factors = {k: v for k, v in (('source', source), ('durability', durability)) if v}
+            _insert_episode(decay_db, episode_id, 10, factors=factors, reliability=reliability)
+
+        assert engine._decay_episodic() == len(cases)
+
+        for episode_id, (source, durability, reliability) in cases.items():
+            expected = _legacy_activation(1.0, 10, source, durability, reliability)
+            assert _activation(decay_db, episode_id) == pytest.approx(expected, rel=1e-3)
+
+    def test_episodic_skips_recent_deleted_and_floored_rows(self, decay_db, engine):
+        _insert_episode(decay_db, 'recent', 0.5)
+        _insert_episode(decay_db, 'deleted', 10, deleted=True)
+        _insert_episode(decay_db, 'floored', 10, activation=0.1)
+        _insert_episode(decay_db, 'old', 1000)
+
+        assert engine._decay_episodic() == 1
+        assert _activation(decay_db, 'recent') == 1.0
+        assert _activation(decay_db, 'deleted') == 1.0
+        assert _activation(decay_db, 'old') == 0.1
+
+    def test_semantic_applies_resistance_and_reliability(self, decay_db, engine):
+        with decay_db.connection() as conn:
+            conn.executemany(
+                "INSERT INTO semantic_concepts (id, strength, decay_resistance, reliability, last_accessed_at) "
+                "VALUES (?, 1.0, ?, ?, datetime('now', '-2 hours'))",
+                [('a', 0.5, None), ('b', 0.0, 'superseded'), ('c', None, 'uncertain')],
+            )
+
+        with patch('services.concept_index.get_concept_index'):
+            assert engine._decay_semantic() == 3
+
+        with decay_db.connection() as conn:
+            strengths = dict(conn.execute("SELECT id, strength FROM semantic_concepts").fetchall())
+        assert strengths['a'] == pytest.approx(1.0 - 0.03 * 0.5)
+        assert strengths['b'] == pytest.approx(1.0 - 0.03 * 3.0)
+        assert strengths['c'] == pytest.approx(1.0 - 0.03 * 0.5 * 1.5)
+
+    def test_registered_functions(self):
+        conn = sqlite3.connect(':memory:')
+        register_decay_functions(conn)
+        row = conn.execute(
+            "SELECT exp(0), exp(NULL), reliability_multiplier(NULL), reliability_multiplier('superseded'), "
+            "durability_multiplier('tool_reflection', 'transient'), durability_multiplier('chat', 'transient')"
+        ).fetchone()
+        assert row == (1.0, None, 1.0, 3.0, 2.0, 1.0)
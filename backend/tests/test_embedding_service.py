@@ -0,0 +1,224 @@
+"""Tests for EmbeddingService — two-tier cache, batch cache lookups, micro-batching, backends."""
+
+import threading
+
+import numpy as np
+import pytest
+from unittest.mock import MagicMock, patch
+
+import services.embedding_service as embedding_module
+from services.embedding_service import (
+    EmbeddingBatcher, EmbeddingCache, EmbeddingService, OnnxEmbeddingModel,
+    _cache_key, _get_model,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def _fake_vector(text: str) -> np.ndarray:
+    vec = np.zeros(8, dtype=np.float32)
+    vec[len(text) % 8] = 1.0
+    return vec
+
+
+@pytest.fixture
+def fake_model():
+    model = MagicMock()
+    model.encode.side_effect = lambda texts, **kw: (
+        _fake_vector(texts) if isinstance(texts, str)
+        else np.stack([_fake_vector(t) for t in texts])
+    )
+    return model
+
+
+@pytest.fixture
+def service(mock_store, fake_model):
+    with patch.object(embedding_module, '_get_st_model', return_value=fake_model), \
+         patch.object(embedding_module, '_get_store', return_value=mock_store), \
+         patch.object(embedding_module, '_l1_cache', None), \
+         patch.object(embedding_module, '_batcher', None):
+        yield EmbeddingService(config={
+            'embedding_cache': {'max_entries': 3},
+            'embedding_batching': {'window_ms': 0},
+        })
+
+
+class TestEmbeddingCache:
+    def test_lru_evicts_oldest_and_counts(self):
+        cache = EmbeddingCache(max_entries=2, dtype='float16')
+        cache.put('a', np.ones(4))
+        cache.put('b', np.ones(4))
+        assert cache.get('a') is not None   # 'a' is now most recent
+        cache.put('c', np.ones(4))
+
+        assert cache.get('b') is None
+        stats = cache.stats()
+        assert stats['entries'] == 2
+        assert stats['evictions'] == 1
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+        assert stats['bytes'] == 2 * 4 * 2
+
+    def test_entries_are_read_only(self):
+        cache = EmbeddingCache(max_entries=2)
+        vec = cache.put('a', np.ones(4, dtype=np.float32))
+        assert vec.dtype == np.float16
+        assert not vec.flags.writeable
+
+
+class TestSingleEmbedding:
+    def test_second_call_served_from_l1(self, service, fake_model):
+        first = service.generate_embedding_np("hello")
+        second = service.generate_embedding_np("hello")
+
+        assert fake_model.encode.call_count == 1
+        assert second.dtype == np.float32
+        np.testing.assert_allclose(first, second)
+        second[0] = 5.0   # callers get their own writable copy
+        np.testing.assert_allclose(service.generate_embedding_np("hello"), first)
+
+    def test_l2_hit_promotes_into_l1(self, service, fake_model, mock_store):
+        mock_store.set_obj(_cache_key("warm"), _fake_vector("warm"))
+
+        assert service.generate_embedding("warm") == _fake_vector("warm").tolist()
+        assert fake_model.encode.call_count == 0
+        assert service._l1.stats()['l2_hits'] == 1
+        assert _cache_key("warm") in service._l1._entries
+
+    def test_l2_keeps_float32_while_l1_is_narrowed(self, service, mock_store):
+        service.generate_embedding_np("precise")
+
+        stored = mock_store.get_obj(_cache_key("precise"))
+        assert stored.dtype == np.float32
+        assert service._l1._entries[_cache_key("precise")].dtype == np.float16
+
+    def test_l2_hit_returns_float32_values(self, service, mock_store):
+        vec = np.full(8, 0.1234567, dtype=np.float32)
+        mock_store.set_obj(_cache_key("fine"), vec)
+
+        np.testing.assert_array_equal(service.generate_embedding_np("fine"), vec)
+
+
+class TestBatchEmbedding:
+    def test_only_misses_are_encoded_in_one_call(self, service, fake_model):
+        service.generate_embedding_np("cached")
+        fake_model.encode.reset_mock()
+
+        result = service.generate_embeddings_batch(["cached", "ab", "abc", "ab"])
+
+        fake_model.encode.assert_called_once()
+        assert fake_model.encode.call_args.args[0] == ["ab", "abc"]
+        assert len(result) == 4
+        for text, vec in zip(["cached", "ab", "abc", "ab"], result):
+            np.testing.assert_allclose(vec, _fake_vector(text))
+
+    def test_batch_results_populate_cache(self, service, fake_model):
+        service.generate_embeddings_batch(["x", "yy"])
+        fake_model.encode.reset_mock()
+
+        service.generate_embeddings_batch(["x", "yy"])
+        fake_model.encode.assert_not_called()
+
+
+class TestEmbeddingBatcher:
+    def test_concurrent_requests_share_one_encode(self, fake_model):
+        batcher = EmbeddingBatcher('test-model', window_ms=200, max_batch=4)
+        results = {}
+
+        def worker(text):
+            results[text] = batcher.encode([text])[0]
+
+        with patch.object(embedding_module, '_get_st_model', return_value=fake_model):
+            threads = [threading.Thread(target=worker, args=(t,)) for t in ("a", "bb", "ccc", "bb")]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join(timeout=5)
+
+        assert fake_model.encode.call_count == 1
+        assert sorted(fake_model.encode.call_args.args[0]) == ["a", "bb", "ccc"]
+        for text, vec in results.items():
+            np.testing.assert_allclose(vec, _fake_vector(text))
+
+    def test_encode_error_reaches_every_caller(self, fake_model):
+        fake_model.encode.side_effect = RuntimeError("model down")
+        batcher = EmbeddingBatcher('test-model', window_ms=1)
+
+        with patch.object(embedding_module, '_get_st_model', return_value=fake_model):
+            with pytest.raises(RuntimeError, match="model down"):
+                batcher.encode(["x"])
+
+
+class _FakeTokenizer:
+    """Whitespace tokenizer: token id = word length, padded with 0."""
+
+    def __call__(self, texts, padding, truncation, max_length, return_tensors):
+        rows = [[len(w) for w in t.split()][:max_length] for t in texts]
+        width = max(len(r) for r in rows)
+        ids = np.array([r + [0] * (width - len(r)) for r in rows], dtype=np.int64)
+        return {'input_ids': ids, 'attention_mask': (ids > 0).astype(np.int64)}
+
+
+def _fake_session():
+    session = MagicMock()
+    session.get_inputs.return_value = [MagicMock(), MagicMock()]
+    session.get_inputs.return_value[0].name = 'input_ids'
+    session.get_inputs.return_value[1].name = 'attention_mask'
+    # Token embedding = [id, 1]; padding positions get garbage that must be masked out
+    session.run.side_effect = lambda _, feed: [np.stack(
+        [feed['input_ids'], np.ones_like(feed['input_ids'])], axis=-1
+    ).astype(np.float32) + (feed['attention_mask'] == 0)[..., None] * 100.0]
+    return session
+
+
+class TestOnnxEmbeddingModel:
+    def test_mean_pools_over_attention_mask(self):
+        model = OnnxEmbeddingModel(_fake_session(), _FakeTokenizer())
+
+        out = model.encode(["ab abcd", "abc"])
+
+        np.testing.assert_allclose(out, [[3.0, 1.0], [3.0, 1.0]])
+
+    def test_normalizes_and_keeps_input_order_across_batches(self):
+        session = _fake_session()
+        model = OnnxEmbeddingModel(session, _FakeTokenizer())
+
+        out = model.encode(["a", "abcdef abcdef", "ab"], normalize_embeddings=True, batch_size=2)
+
+        assert session.run.call_count == 2
+        np.testing.assert_allclose(np.linalg.norm(out, axis=1), 1.0, rtol=1e-6)
+        expected = np.array([[1, 1], [6, 1], [2, 1]], dtype=np.float32)
+        expected /= np.linalg.norm(expected, axis=1, keepdims=True)
+        np.testing.assert_allclose(out, expected, rtol=1e-6)
+
+    def test_single_string_returns_vector(self):
+        model = OnnxEmbeddingModel(_fake_session(), _FakeTokenizer())
+        assert model.encode("abc").shape == (2,)
+
+
+class TestBackendSelection:
+    def test_onnx_backend_falls_back_to_torch_when_unavailable(self, fake_model):
+        with patch.object(embedding_module, '_get_st_model', return_value=fake_model), \
+             patch.object(embedding_module, '_onnx_model', None), \
+             patch.object(embedding_module, '_load_onnx_model', side_effect=FileNotFoundError("missing")) as load:
+            assert _get_model('m', {'type': 'onnx'}) is fake_model
+            assert _get_model('m', {'type': 'onnx'}) is fake_model
+
+        load.assert_called_once()   # failed load is remembered
+
+    def test_service_routes_encodes_through_onnx_backend(self, mock_store, fake_model):
+        onnx_model = MagicMock()
+        onnx_model.encode.side_effect = fake_model.encode.side_effect
+        with patch.object(embedding_module, '_onnx_model', onnx_model), \
+             patch.object(embedding_module, '_get_st_model') as st, \
+             patch.object(embedding_module, '_get_store', return_value=mock_store), \
+             patch.object(embedding_module, '_l1_cache', None), \
+             patch.object(embedding_module, '_batcher', None):
+            service = EmbeddingService(config={
+                'embedding_backend': {'type': 'onnx'},
+                'embedding_batching': {'window_ms': 0},
+            })
+            np.testing.assert_allclose(service.generate_embedding_np("abc"), _fake_vector("abc"))
+
+        onnx_model.encode.assert_called_once()
+        st.assert_not_called()
@@ -263,3 +263,104 @@ class TestFts5AliasRegression:
         with pytest.raises(sqlite3.OperationalError, match="no such column"):
             conn.execute(bad_query, ("watering",)).fetchall()
 
+
+
+# ── Filtered vector search ────────────────────────────────────────────────────
+
+class _FakeVecCursor:
+    """
+    Stands in for a DictCursor over episodes + episodes_vec (sqlite-vec cannot
+    be loaded everywhere). Episodes are given in ascending distance order as
+    (topic, deleted) tuples; rowid is position + 1.
+    """
+
+    def __init__(self, episodes):
+        self.episodes = episodes
+        self.knn_ks = []
+        self.exact_scans = 0
+        self._rows = []
+
+    def execute(self, sql, params):
+        import json
+        if 'COUNT(*)' in sql:
+            n = sum(1 for topic, deleted in self.episodes if topic == params[0] and not deleted)
+            self._rows = [{'n': n}]
+        elif 'FROM episodes_vec WHERE embedding MATCH' in sql:
+            k = params[1]
+            self.knn_ks.append(k)
+            self._rows = [{'rowid': i + 1, 'distance': float(i)}
+                          for i in range(min(k, len(self.episodes)))]
+        elif 'json_each' in sql:
+            wanted = json.loads(params[0])
+            topic = params[1] if len(params) > 1 else None
+            self._rows = [
+                {'_rowid': rowid, 'id': str(rowid)}
+                for rowid in reversed(wanted)
+                if not self.episodes[rowid - 1][1]
+                and (topic is None or self.episodes[rowid - 1][0] == topic)
+            ]
+        elif 'vec_distance_l2' in sql:
+            self.exact_scans += 1
+            _, topic, limit = params
+            self._rows = [
+                {'id': str(i + 1), 'vector_distance': float(i)}
+                for i, (t, deleted) in enumerate(self.episodes)
+                if t == topic and not deleted
+            ][:limit]
+        else:
+            raise AssertionError(f"unexpected SQL: {sql}")
+
+    def fetchone(self):
+        return self._rows[0]
+
+    def fetchall(self):
+        return list(self._rows)
+
+
+class TestFilteredVectorSearch:
+
+    def _svc(self, mock_db_rows):
+        db, _ = mock_db_rows
+        return EpisodicRetrievalService(db, config={})
+
+    def test_small_topic_uses_exact_scan(self, mock_db_rows):
+        cursor = _FakeVecCursor([('a', False)] * 50 + [('b', False)] * 5)
+        rows = self._svc(mock_db_rows)._vector_search(cursor, b'', 'b', 3)
+
+        assert [r['id'] for r in rows] == ['51', '52', '53']
+        assert cursor.knn_ks == []
+
+    @patch('services.episodic_retrieval_service._EXACT_SCAN_MAX_ROWS', 0)
+    def test_sparse_topic_widens_k_until_enough_survive(self, mock_db_rows):
+        # Every 50th episode is on-topic — a fixed top-k would find at most one
+        episodes = [('rare' if i % 50 == 49 else 'common', False) for i in range(1000)]
+        cursor = _FakeVecCursor(episodes)
+        rows = self._svc(mock_db_rows)._vector_search(cursor, b'', 'rare', 5)
+
+        assert [r['id'] for r in rows] == ['50', '100', '150', '200', '250']
+        assert cursor.knn_ks == [40, 160, 640]
+        assert [r['vector_distance'] for r in rows] == sorted(r['vector_distance'] for r in rows)
+
+    def test_unfiltered_search_skips_deleted(self, mock_db_rows):
+        cursor = _FakeVecCursor([('a', i < 10) for i in range(100)])
+        rows = self._svc(mock_db_rows)._vector_search(cursor, b'', None, 5)
+
+        assert [r['id'] for r in rows] == ['11', '12', '13', '14', '15']
+        assert cursor.knn_ks == [13, 52]
+
+    @patch('services.episodic_retrieval_service._EXACT_SCAN_MAX_ROWS', 0)
+    @patch('services.episodic_retrieval_service._KNN_MAX_K', 64)
+    def test_falls_back_to_exact_scan_at_k_cap(self, mock_db_rows):
+        episodes = [('common', False)] * 500 + [('rare', False)] * 3
+        cursor = _FakeVecCursor(episodes)
+        rows = self._svc(mock_db_rows)._vector_search(cursor, b'', 'rare', 3)
+
+        assert [r['id'] for r in rows] == ['501', '502', '503']
+        assert cursor.exact_scans == 1
+
+    def test_exhausted_store_returns_what_exists(self, mock_db_rows):
+        cursor = _FakeVecCursor([('a', False), ('a', True)])
+        rows = self._svc(mock_db_rows)._vector_search(cursor, b'', None, 5)
+
+        assert [r['id'] for r in rows] == ['1']
+        assert cursor.knn_ks == [13]
@@ -0,0 +1,306 @@
+"""Tests for ExportService — keyset-paged NDJSON export, resume tokens and bulk import."""
+
+import gzip
+import io
+import json
+
+import pytest
+
+from services.database_service import DatabaseService
+from services.export_service import (
+    ExportError, ExportService, MEMORY_STORE_STAGE, USER_DATA_TABLES, decode_value,
+    encode_value, import_ndjson, make_resume_token, parse_resume_token, resolve_compression,
+)
+
+
+pytestmark = pytest.mark.unit
+
+SCHEMA = [
+    "CREATE TABLE episodes (id TEXT PRIMARY KEY, gist TEXT, salience REAL)",
+    # Plain table standing in for the sqlite-vec companion (same rowid/embedding shape)
+    "CREATE TABLE episodes_vec (embedding BLOB)",
+    "CREATE TABLE lists (id INTEGER PRIMARY KEY, name TEXT, payload BLOB)",
+]
+
+
+def _make_db(path, rows=0):
+    db = DatabaseService(str(path))
+    with db.connection() as conn:
+        for sql in SCHEMA:
+            conn.execute(sql)
+        conn.executemany(
+            "INSERT INTO episodes (id, gist, salience) VALUES (?, ?, ?)",
+            [(f"ep-{i}", f"gist {i}", i / 10) for i in range(rows)],
+        )
+        conn.executemany(
+            "INSERT INTO episodes_vec (rowid, embedding) VALUES (?, ?)",
+            [(i + 1, bytes([i % 256]) * 16) for i in range(0, rows, 2)],
+        )
+        if rows:
+            conn.execute("INSERT INTO lists (id, name, payload) VALUES (7, 'groceries', x'00ff')")
+    return db
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = _make_db(tmp_path / "source.db", rows=25)
+    yield db
+    db.close_pool()
+
+
+def _records(exporter, tables, **kwargs):
+    return [json.loads(line) for chunk in exporter.iter_ndjson(tables, **kwargs)
+            for line in chunk.decode().splitlines()]
+
+
+class TestEncoding:
+
+    def test_binary_round_trips_through_base64(self):
+        assert decode_value(encode_value(b"\x00\x01\xff")) == b"\x00\x01\xff"
+        assert encode_value("text") == "text"
+        assert decode_value(None) is None
+
+    def test_resume_token_round_trip(self):
+        assert parse_resume_token(make_resume_token("episodes", 42)) == {"table": "episodes", "after": 42}
+
+    @pytest.mark.parametrize("token", ["", "not-base64!", "eyJ2IjogOX0"])
+    def test_malformed_resume_token_rejected(self, token):
+        with pytest.raises(ExportError):
+            parse_resume_token(token)
+
+    def test_unknown_compression_rejected(self):
+        with pytest.raises(ExportError):
+            resolve_compression("brotli")
+        assert resolve_compression(None) == "gzip"
+
+
+class TestExport:
+
+    def test_pages_every_row_without_cap(self, db):
+        records = _records(ExportService(db, page_rows=4), ["episodes", "lists"])
+        rows = [r for r in records if r["type"] == "row" and r["table"] == "episodes"]
+
+        assert len(rows) == 25
+        assert [r["rowid"] for r in rows] == list(range(1, 26))
+        assert records[0]["type"] == "header" and records[-1] == {"type": "end", "rows": 26}
+        # One checkpoint per page (7 for episodes, 1 for lists) plus the final stage marker
+        assert sum(r["type"] == "checkpoint" for r in records) == 9
+
+    def test_embeddings_and_binary_columns_exported(self, db):
+        records = _records(ExportService(db), ["episodes", "lists"])
+        table = next(r for r in records if r["type"] == "table" and r["table"] == "episodes")
+        first = next(r for r in records if r["type"] == "row" and r["rowid"] == 1)
+        second = next(r for r in records if r["type"] == "row" and r["rowid"] == 2)
+        listing = next(r for r in records if r["type"] == "row" and r["table"] == "lists")
+
+        assert table["embeddings"] is True
+        assert decode_value(first["embedding"]) == bytes([0]) * 16
+        assert "embedding" not in second
+        assert decode_value(listing["values"][2]) == b"\x00\xff"
+
+    def test_missing_tables_are_skipped(self, db):
+        records = _records(ExportService(db), ["episodes", "no_such_table"])
+        assert records[0]["tables"] == ["episodes"]
+        assert not any(r.get("table") == "no_such_table" for r in records)
+
+    def test_resume_continues_after_checkpoint(self, db):
+        exporter = ExportService(db, page_rows=10)
+        first = _records(exporter, ["episodes", "lists"])
+        token = [r for r in first if r["type"] == "checkpoint"][1]["resume"]   # after rowid 20
+
+        resumed = _records(exporter, ["episodes", "lists"], resume=token)
+        rows = [(r["table"], r["rowid"]) for r in resumed if r["type"] == "row"]
+
+        assert rows == [("episodes", i) for i in range(21, 26)] + [("lists", 7)]
+        # The table record is repeated so a resumed stream is self-describing
+        assert [r["table"] for r in resumed if r["type"] == "table"] == ["episodes", "lists"]
+
+    def test_resume_at_memory_store_stage_skips_tables(self, db):
+        class Store:
+            def export_matching(self, patterns):
+                return {"fact:1": {"type": "string", "value": "x"}}
+
+        token = make_resume_token(MEMORY_STORE_STAGE, 0)
+        records = _records(ExportService(db), ["episodes"], resume=token,
+                           memory_store=Store(), store_patterns=["fact:*"])
+
+        assert not any(r["type"] == "row" for r in records)
+        assert next(r for r in records if r["type"] == "memory_store")["entries"] == {
+            "fact:1": {"type": "string", "value": "x"}
+        }
+
+    def test_resume_token_for_unlisted_table_rejected(self, db):
+        with pytest.raises(ExportError):
+            list(ExportService(db).iter_records(["episodes"], resume=make_resume_token("providers", 0)))
+
+    def test_no_read_transaction_held_between_pages(self, db):
+        stream = ExportService(db, page_rows=5).iter_ndjson(["episodes"])
+        next(stream)
+        next(stream)   # mid-table
+        # A writer can checkpoint and truncate the WAL while the export is paused
+        with db.connection() as conn:
+            conn.execute("UPDATE episodes SET salience = 0")
+        with db.connection() as conn:
+            busy, _, _ = conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchone()
+        assert busy == 0
+        stream.close()
+
+
+class TestImport:
+
+    def _export_bytes(self, db, compression="gzip"):
+        return b"".join(ExportService(db, page_rows=7).stream(["episodes", "lists"], compression=compression))
+
+    @pytest.mark.parametrize("compression", ["gzip", "none"])
+    def test_round_trip_into_empty_database(self, db, tmp_path, compression):
+        payload = self._export_bytes(db, compression)
+        if compression == "gzip":
+            assert payload[:2] == b"\x1f\x8b"
+            assert gzip.decompress(payload).startswith(b'{"type":"header"')
+
+        target = _make_db(tmp_path / "target.db")
+        try:
+            result = import_ndjson(target, io.BytesIO(payload), batch_rows=4)
+            assert result["tables"] == {"episodes": 25, "lists": 1}
+            assert result["embeddings"] == 13
+            assert result["embedding_errors"] == {}
+
+            with target.connection() as conn:
+                assert conn.execute("SELECT COUNT(*) FROM episodes").fetchone()[0] == 25
+                assert conn.execute("SELECT id, gist, salience FROM episodes WHERE rowid = 3").fetchone()[:] == (
+                    "ep-2", "gist 2", 0.2
+                )
+                assert conn.execute("SELECT embedding FROM episodes_vec WHERE rowid = 3").fetchone()[0] == bytes([2]) * 16
+                assert conn.execute("SELECT payload FROM lists WHERE id = 7").fetchone()[0] == b"\x00\xff"
+        finally:
+            target.close_pool()
+
+    def test_refuses_non_empty_tables(self, db, tmp_path):
+        payload = self._export_bytes(db)
+        target = _make_db(tmp_path / "target.db")
+        try:
+            with target.connection() as conn:
+                conn.execute("INSERT INTO episodes (id, gist) VALUES ('local', 'mine')")
+            result = import_ndjson(target, io.BytesIO(payload))
+
+            assert result["non_empty_tables"] == ["episodes"]
+            assert result["tables"] == {"lists": 1}
+            with target.connection() as conn:
+                assert [tuple(r) for r in conn.execute("SELECT rowid, id, gist FROM episodes")] == [
+                    (1, "local", "mine")
+                ]
+        finally:
+            target.close_pool()
+
+    def test_resumed_stream_continues_its_own_table(self, db, tmp_path):
+        exporter = ExportService(db, page_rows=10)
+        first = _records(exporter, ["episodes"])
+        token = [r for r in first if r["type"] == "checkpoint"][0]["resume"]   # after rowid 10
+        # Interrupted download, then the resumed tail appended to it
+        payload = b"".join(exporter.iter_ndjson(["episodes"])) + b"".join(
+            line for line in exporter.iter_ndjson(["episodes"], resume=token)
+        )
+
+        target = _make_db(tmp_path / "target.db")
+        try:
+            result = import_ndjson(target, io.BytesIO(payload))
+            assert result["non_empty_tables"] == []
+            with target.connection() as conn:
+                assert conn.execute("SELECT COUNT(*) FROM episodes").fetchone()[0] == 25
+        finally:
+            target.close_pool()
+
+    def test_resumed_part_imports_as_separate_call(self, db, tmp_path):
+        exporter = ExportService(db, page_rows=10)
+        full = [line for chunk in exporter.iter_ndjson(["episodes", "lists"])
+                for line in chunk.decode().splitlines(keepends=True)]
+        # Download interrupted right after the second checkpoint (rowid 20)
+        cut = [i for i, line in enumerate(full) if json.loads(line)["type"] == "checkpoint"][1]
+        token = json.loads(full[cut])["resume"]
+        first_part = "".join(full[:cut + 1]).encode()
+        second_part = b"".join(exporter.iter_ndjson(["episodes", "lists"], resume=token))
+
+        target = _make_db(tmp_path / "target.db")
+        try:
+            assert import_ndjson(target, io.BytesIO(first_part))["tables"] == {"episodes": 20}
+            result = import_ndjson(target, io.BytesIO(second_part))
+
+            assert result["non_empty_tables"] == []
+            assert result["tables"] == {"episodes": 5, "lists": 1}
+            with target.connection() as conn:
+                assert conn.execute("SELECT COUNT(*) FROM episodes").fetchone()[0] == 25
+        finally:
+            target.close_pool()
+
+    def test_resumed_part_refuses_rows_past_resume_point(self, db, tmp_path):
+        token = make_resume_token("episodes", 20)
+        payload = b"".join(ExportService(db, page_rows=10).iter_ndjson(["episodes"], resume=token))
+
+        target = _make_db(tmp_path / "target.db")
+        try:
+            with target.connection() as conn:
+                conn.execute("INSERT INTO episodes (rowid, id, gist) VALUES (30, 'local', 'mine')")
+            result = import_ndjson(target, io.BytesIO(payload))
+
+            assert result["non_empty_tables"] == ["episodes"]
+            with target.connection() as conn:
+                assert conn.execute("SELECT COUNT(*) FROM episodes").fetchone()[0] == 1
+        finally:
+            target.close_pool()
+
+    def test_only_user_data_tables_are_imported(self, tmp_path):
+        source = _make_db(tmp_path / "source.db", rows=2)
+        target = _make_db(tmp_path / "target.db")
+        try:
+            for db in (source, target):
+                with db.connection() as conn:
+                    conn.execute("CREATE TABLE providers (id INTEGER PRIMARY KEY, api_key TEXT)")
+            with source.connection() as conn:
+                conn.execute("INSERT INTO providers (api_key) VALUES ('sk-attacker')")
+            payload = b"".join(ExportService(source).stream(["episodes", "providers"]))
+
+            result = import_ndjson(target, io.BytesIO(payload))
+
+            assert "providers" not in USER_DATA_TABLES
+            assert result["skipped_tables"] == ["providers"]
+            with target.connection() as conn:
+                assert conn.execute("SELECT COUNT(*) FROM providers").fetchone()[0] == 0
+        finally:
+            source.close_pool()
+            target.close_pool()
+
+    def test_embedding_failures_are_reported(self, db, tmp_path):
+        target = DatabaseService(str(tmp_path / "target.db"))
+        try:
+            with target.connection() as conn:
+                conn.execute("CREATE TABLE episodes (id TEXT PRIMARY KEY, gist TEXT, salience REAL)")
+                conn.execute("CREATE TABLE episodes_vec (embedding BLOB CHECK (length(embedding) > 100))")
+            result = import_ndjson(target, io.BytesIO(self._export_bytes(db)), batch_rows=4)
+
+            assert result["tables"]["episodes"] == 25
+            assert result["embeddings"] == 0
+            assert result["embeddings_skipped"] == 13
+            assert "CHECK constraint failed" in result["embedding_errors"]["episodes"]
+            with target.connection() as conn:
+                assert conn.execute("SELECT COUNT(*) FROM episodes_vec").fetchone()[0] == 0
+        finally:
+            target.close_pool()
+
+    def test_unknown_tables_and_columns_ignored(self, db, tmp_path):
+        target = DatabaseService(str(tmp_path / "narrow.db"))
+        try:
+            with target.connection() as conn:
+                conn.execute("CREATE TABLE episodes (id TEXT PRIMARY KEY, gist TEXT)")
+            result = import_ndjson(target, io.BytesIO(self._export_bytes(db)))
+
+            assert result["tables"] == {"episodes": 25}
+            assert result["skipped_tables"] == ["lists"]
+            assert result["embeddings"] == 0
+            assert result["embeddings_skipped"] == 13
+            assert result["embedding_errors"] == {"episodes": "no episodes_vec table"}
+        finally:
+            target.close_pool()
+
+    def test_rejects_foreign_stream(self, db):
+        with pytest.raises(ExportError):
+            import_ndjson(db, io.BytesIO(b'{"exported_at": "2026-01-01", "tables": {}}\n'))
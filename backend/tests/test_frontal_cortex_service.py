@@ -132,3 +132,43 @@ class TestOnboardingSchedule:
     def test_name_is_first_trait(self):
         """The 'name' trait should be the first one elicited."""
         assert _ONBOARDING_SCHEDULE[0]['trait'] == 'name'
+
+
+class TestResponseFieldStreamer:
+    """Tests for ResponseFieldStreamer — incremental 'response' extraction."""
+
+    def _stream(self, chunks):
+        from services.frontal_cortex_service import ResponseFieldStreamer
+        deltas = []
+        streamer = ResponseFieldStreamer(deltas.append)
+        for chunk in chunks:
+            streamer.feed(chunk)
+        return deltas
+
+    def test_extracts_response_value_across_chunks(self):
+        deltas = self._stream(['{"mod', 'ifiers": [], "resp', 'onse": "Hel', 'lo there", "mode": "RESPOND"}'])
+        assert ''.join(deltas) == 'Hello there'
+        assert len(deltas) == 2
+
+    def test_decodes_escapes_split_across_chunks(self):
+        deltas = self._stream(['{"response": "a\\', 'nb \\"q\\" \\u00', 'e9 \\$5"}'])
+        assert ''.join(deltas) == 'a\nb "q" é $5'
+
+    def test_decodes_surrogate_pair(self):
+        deltas = self._stream(['{"response": "hi \\ud83d', '\\ude00"}'])
+        assert ''.join(deltas) == 'hi \U0001F600'
+
+    def test_stops_at_closing_quote(self):
+        deltas = self._stream(['{"response": "done", "actions": ["response\\": \\"x"]}'])
+        assert ''.join(deltas) == 'done'
+
+    def test_code_fenced_json(self):
+        deltas = self._stream(['```json\n{"response": ', '"fenced"}\n```'])
+        assert ''.join(deltas) == 'fenced'
+
+    def test_prose_passes_through(self):
+        deltas = self._stream(['  Just ', 'plain text'])
+        assert ''.join(deltas) == 'Just plain text'
+
+    def test_no_response_key_emits_nothing(self):
+        assert self._stream(['{"mode": "ACT", "actions": []}']) == []
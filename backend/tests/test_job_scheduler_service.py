@@ -0,0 +1,228 @@
+"""Tests for JobScheduler — hierarchical timer wheel, overlap prevention, idle gating, stats."""
+
+import threading
+import time
+
+import pytest
+from unittest.mock import patch
+
+from services.job_scheduler_service import JobScheduler, TimerWheel
+
+
+pytestmark = pytest.mark.unit
+
+
+class TestTimerWheel:
+
+    def test_fires_at_exact_tick(self):
+        wheel = TimerWheel(slots=8, levels=3)
+        wheel.add('a', 5)
+
+        assert wheel.advance(4) == []
+        assert wheel.advance(5) == ['a']
+        assert len(wheel) == 0
+
+    def test_cascades_from_higher_levels(self):
+        """Delays past level 0 are re-filed downward and still fire on time."""
+        wheel = TimerWheel(slots=8, levels=3)
+        for expires in (9, 63, 70, 200):
+            wheel.add(expires, expires)
+
+        fired = {}
+        for tick in range(1, 260):
+            for job in wheel.advance(tick):
+                fired[job] = tick
+
+        assert fired == {9: 9, 63: 63, 70: 70, 200: 200}
+
+    def test_delay_beyond_range_is_parked_then_fires(self):
+        wheel = TimerWheel(slots=4, levels=2)  # range: 16 ticks
+        wheel.add('far', 40)
+
+        fired_at = None
+        for tick in range(1, 50):
+            if wheel.advance(tick):
+                fired_at = tick
+
+        assert fired_at == 40
+
+    def test_past_deadline_fires_next_tick(self):
+        wheel = TimerWheel(slots=8, levels=2)
+        wheel.advance(10)
+        wheel.add('late', 3)
+
+        assert wheel.advance(11) == ['late']
+
+    def test_next_tick_skips_empty_slots(self):
+        wheel = TimerWheel(slots=64, levels=2)
+        assert wheel.next_tick() is None
+
+        wheel.add('a', 20)
+        assert wheel.next_tick() == 20
+
+        wheel.add('b', 500)
+        wheel.advance(20)
+        assert wheel.next_tick() == 64  # cascade boundary for the level-1 timer
+
+
+def _advance(scheduler, seconds):
+    """Move the scheduler's clock forward and dispatch whatever came due."""
+    scheduler._origin -= seconds
+    return scheduler.run_pending()
+
+
+def _drain(scheduler):
+    scheduler._pool.shutdown(wait=True)
+    scheduler._latency_pool.shutdown(wait=True)
+
+
+class TestJobScheduler:
+
+    def test_periodic_job_runs_each_interval(self):
+        scheduler = JobScheduler()
+        calls = []
+        scheduler.add_job('tick', lambda: calls.append(1), interval=10)
+
+        assert _advance(scheduler, 5) == 0
+        assert _advance(scheduler, 5) == 1
+        assert _advance(scheduler, 10) == 1
+        _drain(scheduler)
+
+        assert len(calls) == 2
+        stats = scheduler.get_stats()['tick']
+        assert stats['runs'] == 2
+        assert stats['failures'] == 0
+
+    def test_initial_delay_zero_runs_on_first_tick(self):
+        scheduler = JobScheduler()
+        calls = []
+        scheduler.add_job('now', lambda: calls.append(1), interval=3600, initial_delay=0)
+
+        _advance(scheduler, 1)
+        _drain(scheduler)
+
+        assert calls == [1]
+
+    def test_overlapping_run_is_skipped(self):
+        scheduler = JobScheduler()
+        release = threading.Event()
+        started = threading.Event()
+
+        def slow():
+            started.set()
+            release.wait(5)
+
+        scheduler.add_job('slow', slow, interval=1)
+        _advance(scheduler, 1)
+        assert started.wait(2)
+
+        assert _advance(scheduler, 1) == 0  # still running → skipped
+        release.set()
+        _drain(scheduler)
+
+        stats = scheduler.get_stats()['slow']
+        assert stats['runs'] == 1
+        assert stats['skipped_overlap'] == 1
+
+    def test_latency_sensitive_job_runs_while_slow_jobs_fill_pool(self):
+        scheduler = JobScheduler(pool_size=2)
+        release = threading.Event()
+        started = threading.Semaphore(0)
+        fired = threading.Event()
+
+        def slow():
+            started.release()
+            release.wait(5)
+
+        for i in range(3):
+            scheduler.add_job(f'llm-{i}', slow, interval=1)
+        scheduler.add_job('scheduled-items', fired.set, interval=1, latency_sensitive=True)
+        try:
+            _advance(scheduler, 1)
+            assert started.acquire(timeout=2) and started.acquire(timeout=2)
+
+            # Both shared workers are held (the third slow job is queued);
+            # the reminder poll still runs on the reserved lane
+            assert fired.wait(2)
+            assert scheduler.get_stats()['scheduled-items']['latency_sensitive'] is True
+        finally:
+            release.set()
+            _drain(scheduler)
+
+    def test_idle_gate_skips_when_busy(self):
+        scheduler = JobScheduler()
+        calls = []
+        idle = {'value': False}
+        scheduler.add_job('gated', lambda: calls.append(1), interval=5,
+                          idle_gate=lambda: idle['value'])
+
+        _advance(scheduler, 5)
+        time.sleep(0.05)
+        idle['value'] = True
+        _advance(scheduler, 5)
+        _drain(scheduler)
+
+        assert calls == [1]
+        assert scheduler.get_stats()['gated']['skipped_busy'] == 1
+
+    def test_failure_is_recorded_and_job_keeps_running(self):
+        scheduler = JobScheduler()
+
+        def boom():
+            raise RuntimeError("bad")
+
+        scheduler.add_job('boom', boom, interval=1)
+        _advance(scheduler, 1)
+        time.sleep(0.05)
+        _advance(scheduler, 1)
+        _drain(scheduler)
+
+        stats = scheduler.get_stats()['boom']
+        assert stats['runs'] == 2
+        assert stats['failures'] == 2
+        assert 'RuntimeError: bad' in stats['last_error']
+
+    def test_jitter_spreads_interval(self):
+        scheduler = JobScheduler()
+        with patch('services.job_scheduler_service.random.uniform', return_value=0.3):
+            scheduler.add_job('jittered', lambda: None, interval=100, jitter=0.3)
+
+        assert _advance(scheduler, 100) == 0
+        assert _advance(scheduler, 30) == 1
+        _drain(scheduler)
+
+    def test_removed_job_never_fires(self):
+        scheduler = JobScheduler()
+        calls = []
+        scheduler.add_job('gone', lambda: calls.append(1), interval=1)
+
+        assert scheduler.remove_job('gone') is True
+        _advance(scheduler, 5)
+        _drain(scheduler)
+
+        assert calls == []
+        assert 'gone' not in scheduler.get_stats()
+
+    def test_re_adding_replaces_previous_job(self):
+        scheduler = JobScheduler()
+        calls = []
+        scheduler.add_job('job', lambda: calls.append('old'), interval=1)
+        scheduler.add_job('job', lambda: calls.append('new'), interval=1)
+
+        _advance(scheduler, 1)
+        _drain(scheduler)
+
+        assert calls == ['new']
+
+    def test_run_loop_wakes_for_new_job_and_stops(self):
+        scheduler = JobScheduler(tick=0.01)
+        done = threading.Event()
+        thread = threading.Thread(target=scheduler.run, daemon=True)
+        thread.start()
+
+        scheduler.add_job('soon', done.set, interval=60, initial_delay=0.02)
+
+        assert done.wait(2)
+        scheduler.stop()
+        thread.join(2)
+        assert not thread.is_alive()
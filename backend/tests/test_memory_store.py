@@ -0,0 +1,290 @@
+"""Tests for MemoryStore — list semantics and blocking pops."""
+
+import threading
+import time
+
+import pytest
+
+from services.memory_store import MemoryStore
+
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def store():
+    return MemoryStore()
+
+
+class TestLists:
+
+    def test_push_order_matches_redis(self, store):
+        store.rpush('l', 'a', 'b')
+        store.lpush('l', 'x', 'y')
+
+        assert store.lrange('l', 0, -1) == ['y', 'x', 'a', 'b']
+        assert store.lpop('l') == 'y'
+        assert store.rpop('l') == 'b'
+
+    @pytest.mark.parametrize('start,stop', [
+        (0, -1), (0, 2), (-3, -1), (2, 4), (1, 100), (-100, 1), (4, 2), (0, -10), (7, 9),
+    ])
+    def test_lrange_and_ltrim_match_slice_semantics(self, store, start, stop):
+        items = [str(i) for i in range(8)]
+        store.rpush('l', *items)
+
+        n = len(items)
+        lo = max(0, n + start) if start < 0 else start
+        hi = n + stop if stop < 0 else stop
+        expected = items[lo:hi + 1] if hi >= 0 else []
+
+        assert store.lrange('l', start, stop) == expected
+        store.ltrim('l', start, stop)
+        assert store.lrange('l', 0, -1) == expected
+
+    def test_lindex_and_lset(self, store):
+        store.rpush('l', 'a', 'b', 'c')
+        store.lset('l', -1, 'z')
+
+        assert store.lindex('l', -1) == 'z'
+        assert store.lindex('l', 5) is None
+        with pytest.raises(Exception):
+            store.lset('missing', 0, 'x')
+
+
+class TestBlockingPops:
+
+    def test_returns_immediately_when_item_present(self, store):
+        store.rpush('q', 'a', 'b')
+
+        assert store.brpop('q', timeout=1) == ('q', 'b')
+        assert store.blpop(['empty', 'q'], timeout=1) == ('q', 'a')
+
+    def test_push_wakes_blocked_popper_without_polling(self, store):
+        result = {}
+
+        def consumer():
+            result['value'] = store.brpop('q', timeout=5)
+            result['at'] = time.monotonic()
+
+        thread = threading.Thread(target=consumer)
+        thread.start()
+        time.sleep(0.05)
+        pushed_at = time.monotonic()
+        store.rpush('q', 'hello')
+        thread.join(2)
+
+        assert result['value'] == ('q', 'hello')
+        assert result['at'] - pushed_at < 0.05
+
+    def test_blpop_watches_every_key(self, store):
+        result = {}
+        thread = threading.Thread(target=lambda: result.update(v=store.blpop(['a', 'b'], timeout=5)))
+        thread.start()
+        time.sleep(0.02)
+        store.lpush('b', 'x')
+        thread.join(2)
+
+        assert result['v'] == ('b', 'x')
+        assert store._list_waiters == {}
+
+    def test_timeout_returns_none_and_unregisters(self, store):
+        start = time.monotonic()
+        assert store.blpop('q', timeout=0.05) is None
+        assert time.monotonic() - start >= 0.05
+        assert store._list_waiters == {}
+
+    def test_each_item_goes_to_one_waiter(self, store):
+        results = []
+        lock = threading.Lock()
+
+        def consumer():
+            value = store.brpop('q', timeout=2)
+            with lock:
+                results.append(value)
+
+        threads = [threading.Thread(target=consumer) for _ in range(3)]
+        for t in threads:
+            t.start()
+        time.sleep(0.05)
+        store.rpush('q', '1', '2', '3')
+        for t in threads:
+            t.join(3)
+
+        assert sorted(v for _, v in results) == ['1', '2', '3']
+
+
+class TestTypedValues:
+
+    def test_get_obj_returns_copy(self, store):
+        value = {'a': [1, 2], 'b': {'c': 'd'}}
+        store.set_obj('k', value)
+        value['a'].append(3)
+
+        got = store.get_obj('k')
+        assert got == {'a': [1, 2], 'b': {'c': 'd'}}
+        got['b']['c'] = 'mutated'
+        assert store.get_obj('k')['b']['c'] == 'd'
+
+    def test_arrays_are_stored_read_only(self, store):
+        np = pytest.importorskip('numpy')
+        vec = np.arange(4, dtype=np.float32)
+        store.set_obj('v', vec)
+        vec[0] = 99
+
+        got = store.get_obj('v')
+        assert got[0] == 0
+        assert not got.flags.writeable
+
+    def test_string_api_sees_json(self, store):
+        store.set_obj('k', {'x': 1})
+        store.rpush_obj('l', {'y': 2})
+
+        assert store.get('k') == '{"x": 1}'
+        assert store.lrange('l', 0, -1) == ['{"y": 2}']
+
+    def test_typed_list_ops(self, store):
+        store.rpush_obj('l', {'n': 1}, {'n': 2})
+        store.lset_obj('l', -1, {'n': 3})
+
+        assert store.lindex_obj('l', -1) == {'n': 3}
+        assert store.lrange_obj('l', 0, -1) == [{'n': 1}, {'n': 3}]
+
+    def test_unsupported_type_raises(self, store):
+        with pytest.raises(TypeError):
+            store.set_obj('k', object())
+
+
+class TestKeyIndex:
+
+    def test_keys_prefix_and_glob(self, store):
+        store.set('thread_conv:a', '1')
+        store.rpush('thread_conv:b', 'x')
+        store.set('thread_conv_index:a', '1')
+        store.hset('thread:a', 'f', 'v')
+
+        assert store.keys('thread_conv:*') == ['thread_conv:a', 'thread_conv:b']
+        assert store.keys('thread_conv?index:*') == ['thread_conv_index:a']
+        assert set(store.keys('*:a')) == {'thread_conv:a', 'thread_conv_index:a', 'thread:a'}
+
+    def test_deleted_and_expired_keys_are_not_listed(self, store):
+        store.set('k:1', 'v')
+        store.set('k:2', 'v', ex=1)
+        store.set('k:3', 'v')
+        store.delete('k:3')
+        store._strings['k:2'] = ('v', time.time() - 1)
+
+        assert store.keys('k:*') == ['k:1']
+
+    def test_scan_cursor_resumes(self, store):
+        expected = {f'fact:{i:03d}' for i in range(250)}
+        for key in expected:
+            store.set(key, 'v')
+        store.set('other', 'v')
+
+        seen, cursor, calls = [], 0, 0
+        while True:
+            cursor, batch = store.scan(cursor, match='fact:*', count=100)
+            seen.extend(batch)
+            calls += 1
+            if cursor == 0:
+                break
+
+        assert calls == 3
+        assert sorted(seen) == sorted(expected)
+        assert set(store.scan_iter(match='fact:*', count=7)) == expected
+
+    def test_reaper_removes_only_due_keys(self, store):
+        store.set('a', 'v', ex=60)
+        store.set('b', 'v', ex=60)
+        store.set('c', 'v')
+        store._strings['a'] = ('v', time.time() - 1)
+        store.expire('b', 3600)
+
+        assert store._reap_expired() == 1
+        assert store.keys('*') == ['b', 'c']
+        assert len(store._index) == 2
+
+
+class TestPipelines:
+
+    def test_results_and_errors_in_order(self, store):
+        store.set('s', 'not-a-number')
+        pipe = store.pipeline()
+        pipe.rpush('l', 'a', 'b').ltrim('l', -1, -1).expire('l', 60)
+        pipe.incr('s')
+        results = pipe.execute()
+
+        assert results[:3] == [2, True, True]
+        assert isinstance(results[3], ValueError)
+        assert store.lrange('l', 0, -1) == ['b']
+
+    def test_batch_is_atomic(self, store):
+        store.set('a', '0')
+        store.set('b', '0')
+        torn = []
+
+        def reader():
+            for _ in range(2000):
+                pipe = store.pipeline()
+                pipe.get('a').get('b')
+                a, b = pipe.execute()
+                if a != b:
+                    torn.append((a, b))
+
+        t = threading.Thread(target=reader)
+        t.start()
+        for _ in range(2000):
+            pipe = store.pipeline()
+            pipe.incr('a').incr('b')
+            pipe.execute()
+        t.join()
+
+        assert torn == []
+
+    def test_watch_detects_concurrent_change(self, store):
+        from services.memory_store import WatchError
+        store.set('k', '1')
+
+        with store.pipeline() as pipe:
+            pipe.watch('k')
+            assert pipe.get('k') == '1'  # immediate while watching
+            store.set('k', '2')          # another writer
+            pipe.multi()
+            pipe.set('k', '3')
+            with pytest.raises(WatchError):
+                pipe.execute()
+
+        assert store.get('k') == '2'
+        assert store._watched == {}
+
+    @pytest.mark.parametrize('expire', [
+        lambda store: store._reap_expired(),
+        lambda store: store.get('k'),
+        lambda store: store.ttl('k'),
+    ], ids=['reaper', 'lazy-get', 'lazy-ttl'])
+    def test_watch_detects_expiry(self, store, expire):
+        from services.memory_store import WatchError
+        store.set('k', '1', ex=60)
+
+        with store.pipeline() as pipe:
+            pipe.watch('k')
+            store._strings['k'] = ('1', time.time() - 1)   # TTL ran out
+            expire(store)
+            pipe.multi()
+            pipe.set('k', '2')
+            with pytest.raises(WatchError):
+                pipe.execute()
+
+        assert store.get('k') is None
+
+    def test_watch_commits_when_unchanged(self, store):
+        store.set('k', '1')
+        with store.pipeline() as pipe:
+            pipe.watch('k')
+            value = int(pipe.get('k'))
+            pipe.multi()
+            pipe.set('k', str(value + 1))
+            assert pipe.execute() == [True]
+
+        assert store.get('k') == '2'
@@ -0,0 +1,148 @@
+"""Tests for MemoryStore snapshot + journal persistence."""
+
+import os
+import time
+
+import pytest
+
+from services.memory_store import MemoryStore
+from services.memory_store_persistence import JOURNAL_FILE, MemoryStorePersistence, _DEFAULT_PREFIXES
+
+
+pytestmark = pytest.mark.unit
+
+PREFIXES = ('keep:',)
+
+
+def _attach(tmp_path, store=None):
+    persistence = MemoryStorePersistence(
+        store or MemoryStore(), directory=str(tmp_path), prefixes=PREFIXES, flush_interval=3600,
+    )
+    persistence.start()
+    return persistence
+
+
+class TestJournal:
+
+    def test_flushed_writes_survive_restart(self, tmp_path):
+        p = _attach(tmp_path)
+        p.store.set('keep:s', 'v', ex=600)
+        p.store.rpush('keep:l', 'a', 'b')
+        p.store.hset('keep:h', mapping={'f': 1})
+        p.store.zadd('keep:z', {'m': 2.0})
+        p.store.set_obj('keep:o', {'x': [1, 2]})
+        p.store.set('skip:s', 'v')
+        p.flush()
+
+        restored = _attach(tmp_path).store
+        assert restored.get('keep:s') == 'v'
+        assert 0 < restored.ttl('keep:s') <= 600
+        assert restored.lrange('keep:l', 0, -1) == ['a', 'b']
+        assert restored.hgetall('keep:h') == {'f': '1'}
+        assert restored.zrange('keep:z', 0, -1, withscores=True) == [('m', 2.0)]
+        assert restored.get_obj('keep:o') == {'x': [1, 2]}
+        assert restored.get('skip:s') is None
+
+    def test_delete_is_journaled(self, tmp_path):
+        p = _attach(tmp_path)
+        p.store.set('keep:s', 'v')
+        p.flush()
+        p.store.delete('keep:s')
+        p.flush()
+
+        assert _attach(tmp_path).store.get('keep:s') is None
+
+    def test_expired_keys_are_not_restored(self, tmp_path):
+        p = _attach(tmp_path)
+        p.store.set('keep:s', 'v', ex=1)
+        p.flush()
+        time.sleep(1.1)
+
+        assert _attach(tmp_path).store.get('keep:s') is None
+
+    def test_torn_tail_is_dropped(self, tmp_path):
+        p = _attach(tmp_path)
+        p.store.set('keep:a', '1')
+        p.flush()
+        p.store.set('keep:b', '2')
+        p.flush()
+
+        journal = os.path.join(str(tmp_path), JOURNAL_FILE)
+        size = os.path.getsize(journal)
+        with open(journal, 'r+b') as f:
+            f.truncate(size - 3)
+
+        restored = _attach(tmp_path).store
+        assert restored.get('keep:a') == '1'
+        assert restored.get('keep:b') is None
+
+
+class TestSnapshot:
+
+    def test_snapshot_truncates_journal_and_restores(self, tmp_path):
+        p = _attach(tmp_path)
+        for i in range(50):
+            p.store.set(f'keep:{i}', str(i))
+        p.flush()
+        p.snapshot()
+
+        assert os.path.getsize(os.path.join(str(tmp_path), JOURNAL_FILE)) == 0
+
+        p.store.set('keep:after', 'x')
+        p.flush()
+
+        restored = _attach(tmp_path).store
+        assert restored.get('keep:49') == '49'
+        assert restored.get('keep:after') == 'x'
+
+    def test_close_snapshots_unflushed_writes(self, tmp_path):
+        p = _attach(tmp_path)
+        p.store.set('keep:s', 'v')
+        p.close()
+
+        assert _attach(tmp_path).store.get('keep:s') == 'v'
+
+    def test_crash_between_snapshot_and_truncate_does_not_roll_back(self, tmp_path):
+        p = _attach(tmp_path)
+        p.store.set('keep:a', 'old')
+        p.flush()
+        journal = os.path.join(str(tmp_path), JOURNAL_FILE)
+        with open(journal, 'rb') as f:
+            stale_journal = f.read()
+
+        p.store.set('keep:a', 'new')
+        p.snapshot()
+        # Simulate a crash after the snapshot rename but before the truncate
+        with open(journal, 'wb') as f:
+            f.write(stale_journal)
+
+        assert _attach(tmp_path).store.get('keep:a') == 'new'
+
+    def test_journal_after_restart_replays_over_snapshot(self, tmp_path):
+        p = _attach(tmp_path)
+        p.store.set('keep:a', '1')
+        p.snapshot()
+        p.store.set('keep:a', '2')
+        p.flush()
+
+        restarted = _attach(tmp_path)
+        assert restarted.store.get('keep:a') == '2'
+        restarted.store.set('keep:a', '3')
+        restarted.flush()
+
+        assert _attach(tmp_path).store.get('keep:a') == '3'
+
+    def test_snapshot_replaces_deleted_keys_on_disk(self, tmp_path):
+        p = _attach(tmp_path)
+        p.store.set('keep:secret', 'working memory')
+        p.snapshot()
+        p.store.delete('keep:secret')
+        p.snapshot()
+
+        # Journal is empty, so a reload sees only what the snapshot holds
+        assert os.path.getsize(os.path.join(str(tmp_path), JOURNAL_FILE)) == 0
+        assert _attach(tmp_path).store.get('keep:secret') is None
+
+
+def test_reflex_keys_persist_by_default():
+    assert any('reflex:pending:t1'.startswith(p) for p in _DEFAULT_PREFIXES)
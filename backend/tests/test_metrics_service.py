@@ -0,0 +1,100 @@
+"""Tests for MetricsService and MetricsRegistry — counters, histograms, bounded traces."""
+
+import random
+
+import pytest
+
+from services.metrics_registry import Histogram, MetricsRegistry, _BUCKET_COUNT
+from services.metrics_service import MetricsService
+
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def metrics():
+    svc = MetricsService()
+    svc.registry = MetricsRegistry(max_traces=3)
+    return svc
+
+
+class TestHistogram:
+
+    def test_percentiles_within_bucket_error(self):
+        hist = Histogram()
+        values = [random.uniform(1, 500) for _ in range(5000)]
+        for v in values:
+            hist.record(v)
+
+        ordered = sorted(values)
+        p50, p95, p99 = hist.quantiles([0.5, 0.95, 0.99])
+
+        assert p50 == pytest.approx(ordered[2499], rel=0.07)
+        assert p95 == pytest.approx(ordered[4749], rel=0.07)
+        assert p99 == pytest.approx(ordered[4949], rel=0.07)
+
+    def test_memory_is_fixed(self):
+        hist = Histogram()
+        for v in range(100000):
+            hist.record(v * 0.37)
+
+        assert len(hist.counts) == _BUCKET_COUNT
+        assert hist.count == 100000
+
+    def test_extreme_values_clamped_to_observed_range(self):
+        hist = Histogram()
+        hist.record(0.0)
+        hist.record(10 ** 9)
+
+        summary = hist.summary()
+        assert summary['min_ms'] == 0.0
+        assert summary['p99_ms'] <= 10 ** 9
+        assert summary['count'] == 2
+
+    def test_empty_summary(self):
+        assert Histogram().summary()['p50_ms'] == 0.0
+
+
+class TestMetricsService:
+
+    def test_record_timing_updates_trace_and_histogram(self, metrics):
+        trace_id = metrics.start_trace()
+        metrics.record_timing(trace_id, 'classification', 12.5)
+
+        trace = metrics.get_trace(trace_id)
+        assert trace['timings'] == {'classification': 12.5}
+        assert metrics.get_latency_summary()['classification']['count'] == 1
+
+    def test_spans_nest_under_open_span(self, metrics):
+        trace_id = metrics.start_trace()
+        with metrics.span(trace_id, 'generation'):
+            metrics.record_timing(trace_id, 'llm_call', 5.0)
+        metrics.record_timings(trace_id, {'gists': 1.0}, prefix='context.', parent='context_assembly')
+
+        spans = {s['name']: s['parent'] for s in metrics.get_trace(trace_id)['spans']}
+        assert spans == {'llm_call': 'generation', 'generation': None,
+                         'context.gists': 'context_assembly'}
+
+    def test_trace_ring_is_bounded(self, metrics):
+        ids = [metrics.start_trace() for _ in range(5)]
+
+        assert metrics.get_trace(ids[0]) is None
+        assert metrics.get_trace(ids[-1]) is not None
+
+        # Timings for an evicted trace still feed the histogram
+        metrics.record_timing(ids[0], 'late', 1.0)
+        assert metrics.get_latency_summary()['late']['count'] == 1
+
+    def test_dashboard_reports_counters_and_percentiles(self, metrics):
+        metrics.record_counter('requests_total')
+        metrics.record_counter('requests_total', 2)
+        metrics.set_gauge('prompt_queue_depth', 4)
+        metrics.record_timing(None, 'context_assembly', 30.0)
+
+        data = metrics.get_dashboard_data()
+
+        assert data['counters']['requests_total'] == 3
+        assert data['counters']['errors_total'] == 0
+        assert data['gauges'] == {'prompt_queue_depth': 4}
+        assert set(data['timing_averages']) == {'context_assembly'}
+        assert data['timing_averages']['context_assembly']['p50_ms'] == pytest.approx(30.0, rel=0.07)
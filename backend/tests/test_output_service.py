@@ -78,26 +78,24 @@ class TestOutputService:
         keys = [c[0][0] for c in rpush_calls]
         assert "notifications:recent" in keys
 
-    def test_enqueue_text_stores_output_with_setex(self, service, mock_store):
-        """Output is persisted in MemoryStore under output:{id} with setex."""
+    def test_enqueue_text_stores_output_object(self, service, mock_store):
+        """Output is persisted in MemoryStore under output:{id} as a native object."""
         metadata = {"uuid": "xyz-789"}
         output_id = service.enqueue_text("t", "msg", "RESPOND", 0.9, 0.1, metadata)
 
-        setex_calls = mock_store.setex.call_args_list
-        assert len(setex_calls) == 1
-        key, ttl, data = setex_calls[0][0]
+        set_calls = mock_store.set_obj.call_args_list
+        assert len(set_calls) == 1
+        key, stored = set_calls[0][0]
         assert key == f"output:{output_id}"
-        assert ttl == 3600
-        parsed = json.loads(data)
-        assert parsed["type"] == "TEXT"
-        assert parsed["topic"] == "t"
+        assert set_calls[0][1] == {"ex": 3600}
+        assert stored["type"] == "TEXT"
+        assert stored["topic"] == "t"
 
     def test_enqueue_text_sets_one_hour_ttl(self, service, mock_store):
         """The stored output key has a 3600-second (1 hour) TTL."""
         output_id = service.enqueue_text("t", "msg", "RESPOND", 0.9, 0.1, {"uuid": "u"})
 
-        _key, ttl, _data = mock_store.setex.call_args[0]
-        assert ttl == 3600
+        assert mock_store.set_obj.call_args[1]["ex"] == 3600
 
     # ------------------------------------------------------------------ #
     # enqueue_proactive
@@ -237,7 +235,7 @@ class TestOutputService:
             "metadata": {"actions": ["search"]},
         }
         mock_store.brpop.return_value = ("output-queue", "out-1")
-        mock_store.get.return_value = json.dumps(output_data)
+        mock_store.get_obj.return_value = output_data
 
         result = service.dequeue(output_type="ACT", timeout=5)
 
@@ -248,15 +246,15 @@ class TestOutputService:
 
     def test_dequeue_requeues_mismatched_type(self, service, mock_store):
         """When dequeued output type does not match, it is re-queued via lpush."""
-        text_output = json.dumps({"id": "out-2", "type": "TEXT", "topic": "t", "metadata": {}})
-        act_output = json.dumps({"id": "out-3", "type": "ACT", "topic": "t", "metadata": {}})
+        text_output = {"id": "out-2", "type": "TEXT", "topic": "t", "metadata": {}}
+        act_output = {"id": "out-3", "type": "ACT", "topic": "t", "metadata": {}}
 
         # First brpop returns TEXT (wrong type), second returns ACT (correct)
         mock_store.brpop.side_effect = [
             ("output-queue", "out-2"),
             ("output-queue", "out-3"),
         ]
-        mock_store.get.side_effect = [text_output, act_output]
+        mock_store.get_obj.side_effect = [text_output, act_output]
 
         result = service.dequeue(output_type="ACT", timeout=1)
 
@@ -302,3 +300,58 @@ class TestOutputService:
                 break
         else:
             pytest.fail("ltrim was not called on notifications:recent")
+
+
+@pytest.mark.unit
+class TestResponseStream:
+    """Tests for ResponseStream — delta publishing on the sse:{uuid} channel."""
+
+    def _published(self, store):
+        return [json.loads(c[0][1]) for c in store.publish.call_args_list]
+
+    def test_first_delta_published_immediately(self):
+        from services.output_service import ResponseStream
+        store = MagicMock()
+        stream = ResponseStream(store, "abc-123")
+
+        stream.write("Hel")
+
+        store.publish.assert_called_once()
+        assert store.publish.call_args[0][0] == "sse:abc-123"
+        assert self._published(store) == [{"type": "delta", "text": "Hel", "offset": 0, "index": 0}]
+
+    def test_deltas_coalesced_within_window_and_flushed_on_close(self):
+        from services.output_service import ResponseStream
+        store = MagicMock()
+        stream = ResponseStream(store, "abc-123")
+        stream.FLUSH_INTERVAL = 60
+
+        stream.write("Hel")
+        stream.write("lo ")
+        stream.write("there")
+        stream.close()
+
+        events = self._published(store)
+        assert [e["text"] for e in events] == ["Hel", "lo there"]
+        assert events[1]["offset"] == 3
+        assert events[1]["index"] == 1
+
+    def test_offset_counts_utf16_units(self):
+        from services.output_service import ResponseStream
+        store = MagicMock()
+        stream = ResponseStream(store, "abc-123")
+        stream.FLUSH_INTERVAL = 0
+
+        stream.write("\U0001F600")
+        stream.write("x")
+
+        assert self._published(store)[1]["offset"] == 2
+
+    def test_publish_failure_is_swallowed(self):
+        from services.output_service import ResponseStream
+        store = MagicMock()
+        store.publish.side_effect = ConnectionError("down")
+        stream = ResponseStream(store, "abc-123")
+
+        stream.write("text")
+        stream.close()
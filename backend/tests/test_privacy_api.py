@@ -149,7 +149,8 @@ class TestExportData:
         """export_data() must query all documented user-data tables."""
         import inspect
         from api.privacy import export_data
-        src = inspect.getsource(export_data)
+        from services.export_service import USER_DATA_TABLES
+        assert 'USER_DATA_TABLES' in inspect.getsource(export_data)
 
         required_tables = [
             'episodes', 'semantic_concepts', 'semantic_relationships',
@@ -158,18 +159,20 @@ class TestExportData:
             'cognitive_reflexes', 'curiosity_threads',
         ]
         for table in required_tables:
-            assert table in src, f"Expected table '{table}' in export_data table list"
+            assert table in USER_DATA_TABLES, f"Expected table '{table}' in USER_DATA_TABLES"
 
     def test_export_excludes_sensitive_tables(self):
-        """export_data() must NOT query tool_configs or providers (contain API keys)."""
+        """Export and import must NOT touch credential or configuration tables."""
         import inspect
         from api.privacy import export_data
+        from services.export_service import USER_DATA_TABLES
         src = inspect.getsource(export_data)
 
-        for sensitive in ['tool_configs', 'providers']:
+        for sensitive in ['tool_configs', 'providers', 'settings', 'master_account', 'schema_migrations']:
             assert sensitive not in src, (
                 f"Sensitive table '{sensitive}' must not appear in export_data"
             )
+            assert sensitive not in USER_DATA_TABLES
 
     def test_export_store_patterns_are_meaningful(self):
         """export_data() should export working_memory, facts, gists, identity."""
@@ -187,4 +190,4 @@ class TestExportData:
         src = inspect.getsource(export_data)
 
         assert 'Content-Disposition' in src
-        assert 'chalie-export.json' in src
+        assert 'chalie-export.ndjson' in src
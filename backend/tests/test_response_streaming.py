@@ -0,0 +1,128 @@
+"""Tests for token streaming — provider on_token plumbing and /ws delta buffering."""
+
+import pytest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from services.llm_service import (
+    FallbackLLMService,
+    LLMResponse,
+    NonRetryableError,
+    OpenAIService,
+)
+
+
+pytestmark = pytest.mark.unit
+
+
+def _openai_chunk(content=None, finish_reason=None, usage=None):
+    choices = [] if content is None and finish_reason is None else [
+        SimpleNamespace(delta=SimpleNamespace(content=content), finish_reason=finish_reason)
+    ]
+    return SimpleNamespace(model='gpt-test', choices=choices, usage=usage)
+
+
+class TestOpenAIStreaming:
+
+    @patch('services.llm_service._resolve_api_key', return_value='test-key')
+    def test_stream_forwards_tokens_and_returns_full_text(self, mock_key):
+        chunks = [
+            _openai_chunk('Hel'),
+            _openai_chunk('lo'),
+            _openai_chunk(None, finish_reason='stop'),
+            _openai_chunk(usage=SimpleNamespace(prompt_tokens=5, completion_tokens=2)),
+        ]
+        tokens = []
+        svc = OpenAIService({'api_key': 'test', 'model': 'gpt-test'})
+
+        with patch('openai.OpenAI') as MockClient:
+            MockClient.return_value.chat.completions.create.return_value = iter(chunks)
+            result = svc.send_message("sys", "user", stream=True, on_token=tokens.append)
+
+        assert tokens == ['Hel', 'lo']
+        assert result.text == 'Hello'
+        assert result.tokens_input == 5
+        assert result.tokens_output == 2
+        kwargs = MockClient.return_value.chat.completions.create.call_args.kwargs
+        assert kwargs['stream'] is True
+
+    @patch('services.llm_service._resolve_api_key', return_value='test-key')
+    def test_failure_after_partial_output_is_not_retried(self, mock_key):
+        def broken_stream():
+            yield _openai_chunk('partial')
+            raise ConnectionError("reset")
+
+        svc = OpenAIService({'api_key': 'test', 'model': 'gpt-test'})
+
+        with patch('openai.OpenAI') as MockClient, patch('time.sleep'):
+            MockClient.return_value.chat.completions.create.side_effect = lambda **kw: broken_stream()
+            with pytest.raises(NonRetryableError):
+                svc.send_message("sys", "user", stream=True, on_token=lambda t: None)
+
+        assert MockClient.return_value.chat.completions.create.call_count == 1
+
+
+class TestFallbackStreaming:
+
+    def test_no_fallback_after_partial_output(self):
+        def primary_send(system_prompt, user_message, stream=False, on_token=None):
+            on_token("partial")
+            raise ConnectionError("reset")
+
+        primary = MagicMock()
+        primary.send_message.side_effect = primary_send
+        fallback = MagicMock()
+
+        svc = FallbackLLMService(primary, fallback)
+        with pytest.raises(ConnectionError):
+            svc.send_message("sys", "user", stream=True, on_token=lambda t: None)
+
+        fallback.send_message.assert_not_called()
+
+    def test_fallback_streams_when_primary_failed_before_output(self):
+        primary = MagicMock()
+        primary.send_message.side_effect = ConnectionError("down")
+        fallback = MagicMock()
+        fallback.send_message.return_value = LLMResponse(text="ok", model="test")
+        on_token = MagicMock()
+
+        svc = FallbackLLMService(primary, fallback)
+        svc.send_message("sys", "user", stream=True, on_token=on_token)
+
+        assert fallback.send_message.call_args.kwargs['on_token'] is on_token
+
+
+class TestCatchupDeltaMerge:
+
+    @pytest.fixture(autouse=True)
+    def _empty_buffer(self):
+        from api import websocket
+        websocket._catchup_buffer.clear()
+        yield
+        websocket._catchup_buffer.clear()
+
+    def _delta(self, stream_id, text, offset, seq):
+        return {"type": "delta", "text": text, "offset": offset, "index": 0,
+                "stream_id": stream_id, "seq": seq}
+
+    def test_deltas_merge_into_single_replay_entry(self):
+        from api.websocket import _buffer_event, _get_catchup_events
+
+        _buffer_event(self._delta("r1", "Hel", 0, 1))
+        _buffer_event({"type": "card", "seq": 2})
+        _buffer_event(self._delta("r1", "lo", 3, 3))
+
+        events = _get_catchup_events(0)
+        deltas = [e for e in events if e["type"] == "delta"]
+        assert len(deltas) == 1
+        assert deltas[0]["text"] == "Hello"
+        assert deltas[0]["offset"] == 0
+        assert deltas[0]["seq"] == 3
+
+    def test_separate_streams_kept_apart(self):
+        from api.websocket import _buffer_event, _get_catchup_events
+
+        _buffer_event(self._delta("r1", "a", 0, 1))
+        _buffer_event(self._delta("r2", "b", 0, 2))
+
+        assert [e["text"] for e in _get_catchup_events(0)] == ["a", "b"]
@@ -0,0 +1,110 @@
+"""Tests for RetrievalExecutor — concurrent fan-out, deadlines, timings."""
+
+import threading
+import time
+import pytest
+
+from services.retrieval_executor import _POOL_SIZE, RetrievalExecutor, get_retrieval_pool
+
+
+pytestmark = pytest.mark.unit
+
+
+def _slow(value, delay):
+    time.sleep(delay)
+    return value
+
+
+class TestRetrievalExecutor:
+
+    def test_sources_run_concurrently(self):
+        executor = RetrievalExecutor(default_timeout=2.0)
+        start = time.monotonic()
+
+        executor.submit('a', _slow, 'A', 0.2)
+        executor.submit('b', _slow, 'B', 0.2)
+        executor.submit('c', _slow, 'C', 0.2)
+        results = executor.collect()
+
+        assert results == {'a': 'A', 'b': 'B', 'c': 'C'}
+        assert time.monotonic() - start < 0.5
+
+    def test_deadline_returns_default_and_records_timeout(self):
+        executor = RetrievalExecutor()
+
+        executor.submit('slow', _slow, 'late', 0.5, timeout=0.05, default='fallback')
+        executor.submit('fast', _slow, 'ok', 0.0)
+
+        assert executor.collect() == {'slow': 'fallback', 'fast': 'ok'}
+        assert executor.timed_out == ['slow']
+        assert executor.timings['slow'] < 400
+
+    def test_failure_returns_default(self):
+        def boom():
+            raise RuntimeError("db down")
+
+        executor = RetrievalExecutor()
+        executor.submit('broken', boom, default=[])
+
+        assert executor.result('broken') == []
+
+    def test_required_source_propagates_and_is_excluded_from_collect(self):
+        def boom():
+            raise ValueError("bad")
+
+        executor = RetrievalExecutor()
+        executor.submit('classification', boom, required=True)
+        executor.submit('gists', _slow, ['g'], 0.0)
+
+        assert executor.collect() == {'gists': ['g']}
+        with pytest.raises(ValueError):
+            executor.result('classification')
+
+    def test_timings_recorded_per_source(self):
+        executor = RetrievalExecutor()
+        executor.submit('a', _slow, 1, 0.05)
+        executor.collect()
+
+        assert executor.timings['a'] >= 40
+
+    def test_nested_fan_out_runs_inline_on_pool_worker(self):
+        def outer():
+            inner = RetrievalExecutor()
+            inner.submit('x', _slow, 'X', 0.0)
+            return inner._inline, inner.collect()
+
+        inline, results = get_retrieval_pool().submit(outer).result(timeout=2)
+
+        assert inline is True
+        assert results == {'x': 'X'}
+
+    def test_queue_wait_does_not_count_against_deadline(self):
+        release = threading.Event()
+        blockers = [get_retrieval_pool().submit(release.wait, 5) for _ in range(_POOL_SIZE)]
+        executor = RetrievalExecutor(default_timeout=0.2, queue_timeout=2.0)
+        try:
+            executor.submit('queued', _slow, 'ok', 0.05, default='fallback')
+            threading.Timer(0.4, release.set).start()
+
+            assert executor.result('queued') == 'ok'
+            assert executor.timed_out == []
+        finally:
+            release.set()
+            for f in blockers:
+                f.result(timeout=5)
+
+    def test_source_stuck_in_queue_returns_default_with_warning(self, caplog):
+        release = threading.Event()
+        blockers = [get_retrieval_pool().submit(release.wait, 5) for _ in range(_POOL_SIZE)]
+        executor = RetrievalExecutor(default_timeout=0.2, queue_timeout=0.1)
+        try:
+            executor.submit('queued', _slow, 'ok', 0.0, default='fallback')
+            with caplog.at_level('WARNING', logger='services.retrieval_executor'):
+                assert executor.result('queued') == 'fallback'
+
+            assert executor.timed_out == ['queued']
+            assert "still queued" in caplog.text
+        finally:
+            release.set()
+            for f in blockers:
+                f.result(timeout=5)
@@ -284,3 +284,25 @@ class TestSuggestionSeeded:
         spark_service.mark_suggestion_seeded()
         state = spark_service.get_state()
         assert state['first_suggestion_seeded'] is True
+
+
+class TestWelcomedCheck:
+    def test_sees_queued_welcome_event(self, mock_store, tmp_path):
+        import services.write_behind_queue as wbq
+        from services.database_service import DatabaseService
+
+        db = DatabaseService(str(tmp_path / "spark.db"))
+        with db.connection() as conn:
+            conn.execute("CREATE TABLE interaction_log (id TEXT PRIMARY KEY, event_type TEXT)")
+        queue = wbq.WriteBehindQueue(db, flush_interval=3600)
+        queue.append("INSERT INTO interaction_log (id, event_type) VALUES (?, ?)", ('w1', 'spark_welcome_sent'))
+
+        try:
+            with patch('services.spark_state_service.MemoryClientService') as mock_cls, \
+                 patch('services.database_service.get_shared_db_service', return_value=db), \
+                 patch.object(wbq, '_queue', queue):
+                mock_cls.create_connection.return_value = mock_store
+                from services.spark_state_service import SparkStateService
+                assert SparkStateService()._has_been_welcomed() is True
+        finally:
+            db.close_pool()
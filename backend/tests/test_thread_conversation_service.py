@@ -120,3 +120,84 @@ class TestRemoveExchanges:
         history = conv_service.get_conversation_history(THREAD_ID)
         assert len(history) == 1
         assert history[0]["prompt"]["message"] == "Keep"
+
+
+class TestSignalFeed:
+    CHUNK = {
+        "gists": [{"content": "a"}, {"content": "b"}],
+        "facts": [{"key": "k"}],
+        "emotion": {"user": {"joy": 4, "anger": 1}},
+    }
+
+    def test_memory_chunk_updates_signals_and_marks_dirty(self, conv_service):
+        eid = conv_service.add_exchange(THREAD_ID, "topic", {"message": "Hi"})
+        assert conv_service.pop_dirty_threads() == set()
+
+        conv_service.add_memory_chunk(THREAD_ID, eid, self.CHUNK)
+
+        signals = conv_service.get_signals(THREAD_ID)
+        assert signals["enriched"] == 1
+        assert signals["gists"] == 2
+        assert signals["facts"] == 1
+        assert signals["emotions"] == {"joy": 1}
+        assert conv_service.pop_dirty_threads() == {THREAD_ID}
+        assert conv_service.pop_dirty_threads() == set()
+
+    def test_second_encode_replaces_contribution(self, conv_service):
+        eid = conv_service.add_exchange(THREAD_ID, "topic", {"message": "Hi"})
+        conv_service.add_memory_chunk(THREAD_ID, eid, self.CHUNK)
+        conv_service.add_memory_chunk(THREAD_ID, eid, {"gists": [{"content": "c"}]})
+
+        signals = conv_service.get_signals(THREAD_ID)
+        assert signals["enriched"] == 1
+        assert signals["gists"] == 3   # merged
+        assert signals["facts"] == 0   # replaced
+        assert signals["emotions"] == {}
+
+    def test_removal_and_trim_subtract_signals(self, conv_service):
+        ids = [conv_service.add_exchange(THREAD_ID, "topic", {"message": str(i)}) for i in range(3)]
+        for eid in ids:
+            conv_service.add_memory_chunk(THREAD_ID, eid, self.CHUNK)
+
+        conv_service.remove_exchanges(THREAD_ID, [ids[0]])
+        assert conv_service.get_signals(THREAD_ID)["enriched"] == 2
+
+        for i in range(conv_service.MAX_EXCHANGES):
+            conv_service.add_exchange(THREAD_ID, "topic", {"message": f"more {i}"})
+        assert conv_service.get_signals(THREAD_ID) == {
+            "enriched": 0, "gists": 0, "facts": 0, "traits": 0, "emotions": {},
+        }
+
+    def test_signals_rebuilt_when_missing(self, conv_service, mock_store):
+        eid = conv_service.add_exchange(THREAD_ID, "topic", {"message": "Hi"})
+        conv_service.add_memory_chunk(THREAD_ID, eid, self.CHUNK)
+        mock_store.delete(conv_service._signals_key(THREAD_ID))
+
+        assert conv_service.get_signals(THREAD_ID)["gists"] == 2
+
+
+class TestPositionIndex:
+    def test_memory_chunk_found_after_trim(self, conv_service):
+        ids = [
+            conv_service.add_exchange(THREAD_ID, "topic", {"message": str(i)})
+            for i in range(conv_service.MAX_EXCHANGES + 5)
+        ]
+        assert conv_service.add_memory_chunk(THREAD_ID, ids[-3], {"gists": [{"content": "g"}]})
+        assert not conv_service.add_memory_chunk(THREAD_ID, ids[0], {"gists": []})
+
+        history = conv_service.get_conversation_history(THREAD_ID)
+        assert len(history) == conv_service.MAX_EXCHANGES
+        assert history[-3]["memory_chunk"]["gists"][0]["content"] == "g"
+
+    def test_index_rebuilt_after_removal(self, conv_service):
+        ids = [conv_service.add_exchange(THREAD_ID, "topic", {"message": str(i)}) for i in range(4)]
+        conv_service.remove_exchanges(THREAD_ID, ids[:2])
+
+        assert conv_service.add_memory_chunk(THREAD_ID, ids[3], {"gists": [{"content": "g"}]})
+        history = conv_service.get_conversation_history(THREAD_ID)
+        assert [e["id"] for e in history] == ids[2:]
+        assert history[1]["memory_chunk"]["gists"][0]["content"] == "g"
+
+    def test_unindexed_legacy_entry_is_found(self, conv_service, mock_store):
+        mock_store.rpush(conv_service._conv_key(THREAD_ID), json.dumps({"id": "legacy", "memory_chunk": {}}))
+        assert conv_service.add_memory_chunk(THREAD_ID, "legacy", {"gists": [{"content": "g"}]})
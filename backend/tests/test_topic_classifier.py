@@ -120,3 +120,71 @@ class TestTopicClassifier:
                          'classification_time', 'boundary_diagnostics',
                          'just_reset_from_silence', 'message_embedding'}
         assert expected_keys == set(result.keys())
+
+
+class TestTopicCentroidCache:
+
+    def test_topics_fetched_once_across_classifications(self):
+        """Second classify reuses the resident centroid matrix."""
+        topic_embedding = _random_unit_vector()
+        mock_db, cursor = _make_db_mock(fetchall_return=[
+            ('python-programming', topic_embedding.tolist(), 0.6,
+             datetime.now(timezone.utc) - timedelta(minutes=5), 10),
+        ])
+        svc = _make_classifier(mock_db)
+
+        with patch('services.topic_classifier_service.generate_embedding') as mock_embed:
+            mock_embed.return_value = topic_embedding
+            svc.classify("Python programming basics")
+            svc.classify("More Python programming")
+
+        assert cursor.fetchall.call_count == 1
+
+    def test_top_k_applies_recency_bonus(self):
+        from services.topic_classifier_service import TopicCentroidCache
+
+        emb_a = _random_unit_vector()
+        emb_b = _random_unit_vector()
+        now = datetime.now(timezone.utc)
+        cache = TopicCentroidCache()
+        cache.load(MagicMock(), [
+            {'name': 'a', 'rolling_embedding': emb_a.tolist(), 'avg_salience': 0.5,
+             'last_updated': now, 'message_count': 3},
+            {'name': 'b', 'rolling_embedding': emb_b.tolist(), 'avg_salience': 0.5,
+             'last_updated': now, 'message_count': 3},
+        ])
+
+        plain = cache.top_k(emb_a, 2)
+        boosted = cache.top_k(emb_a, 2, recent_topic='b', recency_bonus=5.0)
+
+        assert plain[0][0]['name'] == 'a'
+        assert plain[0][1] == pytest.approx(1.0, abs=1e-5)
+        assert boosted[0][0]['name'] == 'b'
+
+    def test_upsert_updates_in_place_and_appends(self):
+        from services.topic_classifier_service import TopicCentroidCache
+
+        now = datetime.now(timezone.utc)
+        cache = TopicCentroidCache()
+        cache.load(MagicMock(), [])
+        emb = _random_unit_vector()
+
+        cache.upsert({'name': 'a', 'rolling_embedding': emb, 'avg_salience': 0.5,
+                      'last_updated': now, 'message_count': 1, 'rowid': 7})
+        cache.upsert({'name': 'a', 'rolling_embedding': emb, 'avg_salience': 0.9,
+                      'last_updated': now, 'message_count': 2, 'rowid': 7})
+
+        assert len(cache) == 1
+        topic = cache.get('a')
+        assert topic['message_count'] == 2
+        assert topic['avg_salience'] == pytest.approx(0.9)
+        assert topic['rowid'] == 7
+
+    def test_upsert_ignored_until_loaded(self):
+        from services.topic_classifier_service import TopicCentroidCache
+
+        cache = TopicCentroidCache()
+        cache.upsert({'name': 'a', 'rolling_embedding': _random_unit_vector(),
+                      'avg_salience': 0.5, 'last_updated': None, 'message_count': 1})
+
+        assert len(cache) == 0
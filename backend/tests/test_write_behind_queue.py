@@ -0,0 +1,149 @@
+"""Tests for WriteBehindQueue — group commit, ordering, back-pressure, shutdown flush."""
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+import services.write_behind_queue as wbq
+from services.database_service import DatabaseService
+from services.write_behind_queue import WriteBehindQueue, write_behind
+
+
+pytestmark = pytest.mark.unit
+
+INSERT = "INSERT INTO events (id, kind) VALUES (?, ?)"
+UPDATE = "UPDATE events SET kind = ? WHERE id = ?"
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = DatabaseService(str(tmp_path / "wb.db"))
+    with db.connection() as conn:
+        conn.execute("CREATE TABLE events (id INTEGER PRIMARY KEY, kind TEXT NOT NULL)")
+    yield db
+    db.close_pool()
+
+
+def _rows(db):
+    with db.connection() as conn:
+        return [tuple(r) for r in conn.execute("SELECT id, kind FROM events ORDER BY id")]
+
+
+def _queue(db, **kwargs):
+    kwargs.setdefault('flush_interval', 3600)
+    return WriteBehindQueue(db, **kwargs)
+
+
+class TestGroupCommit:
+
+    def test_rows_are_invisible_until_flushed(self, db):
+        queue = _queue(db)
+        queue.append(INSERT, (1, 'a'))
+        queue.append_many(INSERT, [(2, 'b'), (3, 'c')])
+
+        assert _rows(db) == []
+        assert queue.flush() == 3
+        assert _rows(db) == [(1, 'a'), (2, 'b'), (3, 'c')]
+        assert queue.stats()['flushes'] == 1
+
+    def test_update_is_applied_after_its_insert(self, db):
+        queue = _queue(db)
+        queue.append(INSERT, (1, 'pending'))
+        queue.append(UPDATE, ('done', 1))
+        queue.append(INSERT, (2, 'x'))
+
+        queue.flush()
+        assert _rows(db) == [(1, 'done'), (2, 'x')]
+
+    def test_bad_row_is_dropped_without_losing_the_batch(self, db):
+        queue = _queue(db)
+        queue.append_many(INSERT, [(1, 'a'), (2, None), (3, 'c')])   # NOT NULL violation
+
+        assert queue.flush() == 2
+        assert _rows(db) == [(1, 'a'), (3, 'c')]
+        assert queue.stats()['failed_rows'] == 1
+
+
+class TestCoalesce:
+
+    def test_consecutive_statements_merge(self):
+        groups = wbq._coalesce([(INSERT, [(1,)]), (INSERT, [(2,)]), (UPDATE, [(3,)]), (INSERT, [(4,)])])
+        assert groups == [(INSERT, [(1,), (2,)]), (UPDATE, [(3,)]), (INSERT, [(4,)])]
+
+
+class TestBackPressure:
+
+    def test_producer_flushes_when_queue_is_full(self, db):
+        queue = _queue(db, max_batch_rows=2, max_pending_rows=3)
+        for i in range(3):
+            queue.append(INSERT, (i, 'x'))
+
+        assert len(_rows(db)) == 3
+        stats = queue.stats()
+        assert stats['pending'] == 0
+        assert stats['backpressure_flushes'] == 1
+        assert stats['max_pending_seen'] == 3
+
+
+class TestFlusherThread:
+
+    def test_background_flush_and_close_drains(self, db):
+        queue = _queue(db, flush_interval=0.01)
+        queue.start()
+        queue.append(INSERT, (1, 'a'))
+        for _ in range(200):
+            if queue.pending() == 0 and _rows(db):
+                break
+            time.sleep(0.01)
+        assert _rows(db) == [(1, 'a')]
+
+        queue.close()
+        assert not queue.accepts(db)
+
+    def test_close_flushes_pending_rows(self, db):
+        queue = _queue(db)
+        queue.start()
+        queue.append(INSERT, (1, 'a'))
+
+        queue.close()
+        assert _rows(db) == [(1, 'a')]
+
+
+class TestSuspend:
+
+    def test_suspended_discards_queued_and_new_rows(self, db):
+        queue = _queue(db)
+        queue.append(INSERT, (1, 'a'))
+
+        with queue.suspended():
+            queue.append(INSERT, (2, 'b'))
+            assert queue.pending() == 0
+        queue.append(INSERT, (3, 'c'))
+
+        queue.flush()
+        assert _rows(db) == [(3, 'c')]
+        assert queue.stats()['rows_discarded'] == 2
+
+
+class TestHelpers:
+
+    def test_write_behind_is_synchronous_when_disabled(self, db):
+        with patch.object(wbq, '_queue', None):
+            write_behind(db, INSERT, (1, 'a'))
+        assert _rows(db) == [(1, 'a')]
+
+    def test_write_behind_routes_to_queue_for_same_database(self, db, tmp_path):
+        queue = _queue(db)
+        other = DatabaseService(str(tmp_path / "other.db"))
+        with other.connection() as conn:
+            conn.execute("CREATE TABLE events (id INTEGER PRIMARY KEY, kind TEXT NOT NULL)")
+
+        with patch.object(wbq, '_queue', queue):
+            write_behind(DatabaseService(db.db_path), INSERT, (1, 'a'))
+            write_behind(other, INSERT, (2, 'b'))
+            assert _rows(db) == []
+            assert wbq.flush_pending(db) == 1
+
+        assert _rows(db) == [(1, 'a')]
+        assert _rows(other) == [(2, 'b')]
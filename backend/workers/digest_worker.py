@@ -28,6 +28,7 @@ from services.thread_service import get_thread_service
 from services.thread_conversation_service import ThreadConversationService
 from services.context_relevance_service import ContextRelevanceService
 from services.context_assembly_service import ContextAssemblyService
+from services.retrieval_executor import RetrievalExecutor
 from .memory_chunker_worker import memory_chunker_worker
 
 # Global session service instance (shared across worker invocations)
@@ -151,27 +152,39 @@ def enqueue_memory_chunker(topic: str, exchange_id: str, prompt_message: str, re
     memory_queue.enqueue(job_payload)
 
 
+# Pre-concatenated mode prompts, rebuilt only when a prompt file changes
+_prompt_map_cache = {'generation': None, 'prompt_map': None}
+
+
+def _get_cortex_prompt_map() -> dict:
+    """Mode → system prompt, concatenated once per ConfigService generation."""
+    if _prompt_map_cache['generation'] != ConfigService.generation():
+        soul_prompt = ConfigService.get_agent_prompt("soul")
+        identity_prompt = ConfigService.get_agent_prompt("identity-core")
+
+        # Mode-specific prompts: soul → identity → mode prompt (instincts + context + contract)
+        # Ordering: values first, then voice, then behavioral nudges closest to generation
+        respond_prompt = soul_prompt + "\n\n" + identity_prompt + "\n\n" + ConfigService.get_agent_prompt("frontal-cortex-respond")
+        clarify_prompt = soul_prompt + "\n\n" + identity_prompt + "\n\n" + ConfigService.get_agent_prompt("frontal-cortex-clarify")
+        # ACT does NOT get identity — reasoning stays pure
+        act_prompt = ConfigService.get_agent_prompt("frontal-cortex-act")
+
+        _prompt_map_cache['prompt_map'] = {
+            'RESPOND': respond_prompt,
+            'CLARIFY': clarify_prompt,
+            'ACT': act_prompt,
+        }
+        # Read after loading: first-time parses above bump the generation
+        _prompt_map_cache['generation'] = ConfigService.generation()
+    return dict(_prompt_map_cache['prompt_map'])
+
+
 def load_configs():
     """Load frontal cortex mode-specific prompts and configurations."""
-    soul_prompt = ConfigService.get_agent_prompt("soul")
-    identity_prompt = ConfigService.get_agent_prompt("identity-core")
-    cortex_config = ConfigService.resolve_agent_config("frontal-cortex")
-
-    # Mode-specific prompts: soul → identity → mode prompt (instincts + context + contract)
-    # Ordering: values first, then voice, then behavioral nudges closest to generation
-    respond_prompt = soul_prompt + "\n\n" + identity_prompt + "\n\n" + ConfigService.get_agent_prompt("frontal-cortex-respond")
-    clarify_prompt = soul_prompt + "\n\n" + identity_prompt + "\n\n" + ConfigService.get_agent_prompt("frontal-cortex-clarify")
-    # ACT does NOT get identity — reasoning stays pure
-    act_prompt = ConfigService.get_agent_prompt("frontal-cortex-act")
-
     return {
         'cortex': {
-            'config': cortex_config,
-            'prompt_map': {
-                'RESPOND': respond_prompt,
-                'CLARIFY': clarify_prompt,
-                'ACT': act_prompt,
-            }
+            'config': ConfigService.resolve_agent_config("frontal-cortex"),
+            'prompt_map': _get_cortex_prompt_map(),
         },
         'memory_chunker': {
             'config': ConfigService.resolve_agent_config("memory-chunker")
@@ -245,6 +258,19 @@ def _format_visual_context(image_contexts: list) -> str:
     return "\n\n".join(parts)
 
 
+def _record_assembly_timings(metadata: dict, total_ms: float, source_timings: dict):
+    """Record context assembly wall time and per-source timings on the request trace."""
+    trace_id = (metadata or {}).get('trace_id')
+    if not trace_id:
+        return
+    try:
+        metrics = MetricsService()
+        metrics.record_timing(trace_id, 'context_assembly', total_ms)
+        metrics.record_timings(trace_id, source_timings, prefix='context.', parent='context_assembly')
+    except Exception as e:
+        logging.debug(f"[DIGEST] Assembly timing record failed: {e}")
+
+
 def generate_for_mode(topic, text, mode, classification, thread_conv_service, cortex_config, cortex_prompt_map, metadata=None, act_history_context=None, thread_id=None, returning_from_silence=False, signals=None, message_embedding=None):
     """
     Generate response for a terminal mode (RESPOND, CLARIFY).
@@ -287,15 +313,19 @@ def generate_for_mode(topic, text, mode, classification, thread_conv_service, co
         logging.warning(f"[Mode:{mode}] Context relevance computation failed: {e}, proceeding without inclusion_map")
 
     assembled_context = None
+    retrieval_timings = {}
+    assembly_start = time.time()
     try:
         assembled_context = get_context_assembly_service().assemble(
             prompt=text,
             topic=topic,
             thread_id=thread_id,
             message_embedding=message_embedding,
+            timings=retrieval_timings,
         )
     except Exception as e:
         logging.warning(f"[Mode:{mode}] Context assembly failed: {e}")
+    _record_assembly_timings(metadata, (time.time() - assembly_start) * 1000, retrieval_timings)
 
     # Phase 2 — Ingestion detection: run contradiction check in parallel with
     # context assembly. Time-boxed to 600ms — skip if slow.
@@ -371,17 +401,33 @@ def generate_for_mode(topic, text, mode, classification, thread_conv_service, co
     cortex_service = FrontalCortexService(config)
     chat_history = thread_conv_service.get_conversation_history(thread_id) if thread_id else []
 
-    response_data = cortex_service.generate_response(
-        system_prompt_template=prompt,
-        original_prompt=text,
-        classification=classification,
-        chat_history=chat_history,
-        act_history=act_history_context or "(none)",
-        thread_id=thread_id,
-        returning_from_silence=returning_from_silence,
-        inclusion_map=inclusion_map,
-        assembled_context=assembled_context,
-    )
+    # Stream response text to the waiting WebSocket request as it is generated.
+    # The final message event (via OutputService.enqueue_text) stays authoritative.
+    response_stream = None
+    request_uuid = (metadata or {}).get('uuid')
+    if request_uuid and config.get('stream') and mode in ('RESPOND', 'CLARIFY'):
+        try:
+            from services.output_service import OutputService
+            response_stream = OutputService().open_response_stream(request_uuid)
+        except Exception as e:
+            logging.debug(f"[Mode:{mode}] Response streaming unavailable: {e}")
+
+    try:
+        response_data = cortex_service.generate_response(
+            system_prompt_template=prompt,
+            original_prompt=text,
+            classification=classification,
+            chat_history=chat_history,
+            act_history=act_history_context or "(none)",
+            thread_id=thread_id,
+            returning_from_silence=returning_from_silence,
+            inclusion_map=inclusion_map,
+            assembled_context=assembled_context,
+            on_delta=response_stream.write if response_stream else None,
+        )
+    finally:
+        if response_stream:
+            response_stream.close()
 
     # Router decided the mode, not the LLM
     response_data['mode'] = mode
@@ -2514,6 +2560,7 @@ def digest_worker(text: str, metadata: dict = None) -> str:
     # Initialize metrics
     metrics = MetricsService()
     trace_id = metrics.start_trace()
+    metadata['trace_id'] = trace_id
     metrics.record_counter('requests_total')
     request_start_time = time.time()
 
@@ -2635,38 +2682,40 @@ def digest_worker(text: str, metadata: dict = None) -> str:
     # PHASE B: RETRIEVAL (context assembly)
     # ═══════════════════════════════════════════════════════════
 
-    # Step 4: Inject cold-start gists if topic has none
-    if context_topic:
-        gist_storage.store_cold_start_gists(context_topic)
+    # Phase B sources are independent of each other, so they run concurrently
+    # on the shared retrieval pool, each bounded by its own deadline. Topic
+    # classification (which computes the message embedding) runs alongside
+    # them; its result is awaited in Phase C.
+    retrieval = RetrievalExecutor(
+        default_timeout=cortex_config.get('retrieval_source_timeout', 2.0)
+    )
+
+    topic_classifier = get_topic_classifier()
+    retrieval.submit(
+        'classification', topic_classifier.classify,
+        text, recent_topic=recent_topic, thread_id=thread_id, required=True,
+    )
+
+    def _load_gists(topic_name):
+        # Step 4: Inject cold-start gists if topic has none, then read them back
+        gist_storage.store_cold_start_gists(topic_name)
+        return gist_storage.get_latest_gists(topic_name)
 
     # Step 4a: Get context for frontal cortex
-    gists = []
     if context_topic:
-        gists = gist_storage.get_latest_gists(context_topic)
-        if gists:
-            gist_lines = ["Recent conversation context:"]
-            for gist in gists:
-                gist_lines.append(f"- [{gist['type']}] {gist['content']} (confidence: {gist['confidence']})")
-            gist_context = "\n".join(gist_lines)
-        else:
-            last_msg = gist_storage.get_last_message(context_topic)
-            if last_msg:
-                gist_context = f"Last exchange:\nUser: {last_msg['prompt']}\nAssistant: {last_msg['response']}"
-            else:
-                gist_context = "No previous conversation context available"
-    else:
-        gist_context = "No previous conversation context available"
-
-    world_state = (
-        world_state_service.get_world_state(
-            context_topic, thread_id=thread_id, message_embedding=None
+        retrieval.submit('gists', _load_gists, context_topic, default=[])
+        retrieval.submit(
+            'world_state', world_state_service.get_world_state,
+            context_topic, thread_id=thread_id, message_embedding=None, default="",
         )
-        if context_topic
-        else ""
-    )
+    retrieval.submit('working_memory', working_memory.get_recent_turns, thread_id, default=[])
+
+    phase_b = retrieval.collect()
+    gists = phase_b.get('gists') or []
+    world_state = phase_b.get('world_state') or ""
+    wm_turns = phase_b['working_memory'] or []
 
     # Step 4b: Calculate context warmth for cost scaling
-    wm_turns = working_memory.get_recent_turns(thread_id)
     context_warmth = calculate_context_warmth(
         working_memory_len=len(wm_turns),
         gists=gists,
@@ -2679,8 +2728,9 @@ def digest_worker(text: str, metadata: dict = None) -> str:
     # ═══════════════════════════════════════════════════════════
 
     # Step 6: Classify the prompt with deterministic embedding-based classifier
-    topic_classifier = get_topic_classifier()
-    classification_result = topic_classifier.classify(text, recent_topic=recent_topic, thread_id=thread_id)
+    # (started in Phase B — wait for it now)
+    classification_result = retrieval.result('classification')
+    metrics.record_timings(trace_id, retrieval.timings, prefix='retrieval.')
 
     # Extract for compatibility with handle_classification
     classification = {
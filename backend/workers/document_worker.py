@@ -87,31 +87,26 @@ def process_document_job(job_data: dict) -> str:
         return f"failed: {doc_id}"
 
 
-def document_purge_worker(shared_state):
-    """
-    Background service that purges expired documents every 6 hours.
+def _purge_expired_documents():
+    from services.document_service import DocumentService
+    from services.database_service import get_shared_db_service
+
+    service = DocumentService(get_shared_db_service())
+    count = service.purge_expired()
+    if count > 0:
+        logger.info(f"[DOC PURGE] Purged {count} expired documents")
+
 
-    Runs as a registered service in run.py.
+def register_document_purge_job(scheduler):
     """
-    import time
+    Register the expired-document purge on the job scheduler.
 
+    Runs every 6 hours, first 5 minutes after startup.
+    """
     CYCLE_SECONDS = 6 * 60 * 60  # 6 hours
     INITIAL_DELAY = 300  # 5 minutes after startup
 
-    logger.info("[DOC PURGE] Starting document purge worker")
-    time.sleep(INITIAL_DELAY)
-
-    while True:
-        try:
-            from services.document_service import DocumentService
-            from services.database_service import get_shared_db_service
-
-            service = DocumentService(get_shared_db_service())
-            count = service.purge_expired()
-            if count > 0:
-                logger.info(f"[DOC PURGE] Purged {count} expired documents")
-
-        except Exception as e:
-            logger.error(f"[DOC PURGE] Purge cycle failed: {e}")
-
-        time.sleep(CYCLE_SECONDS)
+    scheduler.add_job(
+        "document-purge", _purge_expired_documents,
+        interval=CYCLE_SECONDS, initial_delay=INITIAL_DELAY,
+    )
@@ -796,7 +796,7 @@ class ChalieApp {
     this.renderer.appendUserForm(text || '[Image attached]', exchangeTimestamp);
 
     // Create pending form and store reference for potential early resolution
-    const pendingForm = this.renderer.createPendingForm();
+    let pendingForm = this.renderer.createPendingForm();
     this._pendingForm = pendingForm;
 
     // After 2 seconds, upgrade the "..." dots to a brief placeholder phrase
@@ -806,11 +806,24 @@ class ChalieApp {
 
     let responseText = '';
     let responseMeta = {};
+    let streamedText = '';
 
     this.ws.send(text || '[Image attached]', source, {
       onStatus: (stage) => {
         this.presence.setState(stage);
       },
+      onDelta: (data) => {
+        // Streamed partial reply. offset makes replayed deltas idempotent.
+        clearTimeout(pendingUpgradeTimer);
+        streamedText = streamedText.slice(0, data.offset || 0) + data.text;
+        if (!pendingForm.isConnected) {
+          // ACT narration removed the thinking bubble — stream into a fresh one
+          pendingForm = this.renderer.createPendingForm();
+          this._pendingForm = pendingForm;
+        }
+        this.renderer.streamPendingForm(pendingForm, streamedText);
+        this.presence.setState('responding');
+      },
       onNarration: (data) => {
         // Live ACT narration: remove thinking dots, show narration bubble instead
         clearTimeout(pendingUpgradeTimer);
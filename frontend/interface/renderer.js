@@ -133,6 +133,23 @@ export class Renderer {
     return bubble;
   }
 
+  /**
+   * Show partial response text in a pending form while the reply streams in.
+   * Rendered as plain text; resolvePendingForm() swaps in the final markdown.
+   * @param {HTMLElement} form
+   * @param {string} text — full response text received so far
+   */
+  streamPendingForm(form, text) {
+    let textEl = form.querySelector('.speech-form__text--streaming');
+    if (!textEl) {
+      form.innerHTML = '';
+      textEl = this._createEl('div', 'speech-form__text speech-form__text--streaming');
+      form.appendChild(textEl);
+    }
+    textEl.textContent = text;
+    this._scrollToBottom();
+  }
+
   /**
    * Replace a pending form's thinking dots with actual content.
    * @param {HTMLElement} form
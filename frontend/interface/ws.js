@@ -2,7 +2,8 @@
  * WebSocket client — single bidirectional channel replacing both SSE streams.
  *
  * Handles:
- *   - Chat request/response (replaces POST-based SSEClient)
+ *   - Chat request/response (replaces POST-based SSEClient), including
+ *     streamed response deltas ahead of the final message
  *   - Drift events: cards, tasks, reminders, escalations (replaces EventSource)
  *   - Reconnect with sequence-based catch-up
  *   - Keepalive ping/pong
@@ -176,6 +177,7 @@ export class WSClient {
    * @param {"text"|"voice"} source
    * @param {{
    *   onStatus?:    (stage: string) => void,
+   *   onDelta?:     (data: object) => void,
    *   onMessage?:   (data: object) => void,
    *   onNarration?: (data: object) => void,
    *   onCard?:      (data: object) => void,
@@ -259,6 +261,9 @@ export class WSClient {
         case 'act_narration':
           this._chatCallbacks.onNarration?.(data);
           return;
+        case 'delta':
+          this._chatCallbacks.onDelta?.(data);
+          return;
         case 'message':
           this._chatCallbacks.onMessage?.(data);
           return;